@@ -0,0 +1,123 @@
+"""Benchmark per-file connection setup with and without a persistent event loop.
+
+Usage:
+    uv run python benchmarks/bench_event_loop.py [--files N] [--calls N] [--tls]
+
+A local keep-alive HTTP server stands in for the LLM endpoint. Like the Gemini
+client, the benchmark client caches one async HTTP session per event loop. Each
+"file" makes --calls requests through run_sync():
+
+    fresh       asyncio.run() per file (the previous behavior)
+    persistent  every file inside one persistent_loop() block
+
+The server counts accepted connections, so connections/file shows how many
+handshakes each file paid for (with --tls, a full TLS handshake each).
+"""
+
+import argparse
+import asyncio
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from contextlib import nullcontext
+from pathlib import Path
+
+import httpx
+
+from to_markdown.core.event_loop import persistent_loop, run_sync
+
+_RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: keep-alive\r\n\r\nok"
+
+
+class Server:
+    """Keep-alive HTTP server on a background thread that counts connections."""
+
+    def __init__(self, context: ssl.SSLContext | None) -> None:
+        self.connections = 0
+        self.port = 0
+        self._context = context
+        self._ready = threading.Event()
+        threading.Thread(target=asyncio.run, args=(self._serve(),), daemon=True).start()
+        self._ready.wait()
+
+    async def _serve(self) -> None:
+        server = await asyncio.start_server(self._handle, "127.0.0.1", 0, ssl=self._context)
+        self.port = server.sockets[0].getsockname()[1]
+        self._ready.set()
+        await server.serve_forever()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                writer.write(_RESPONSE)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        writer.close()
+
+
+def _self_signed_context(directory: Path) -> tuple[ssl.SSLContext, ssl.SSLContext]:
+    """Server and client TLS contexts for a throwaway localhost certificate."""
+    cert, key = directory / "cert.pem", directory / "key.pem"
+    subprocess.run(
+        [
+            *("openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1"),
+            *("-subj", "/CN=localhost", "-keyout", str(key), "-out", str(cert)),
+        ],
+        check=True,
+        capture_output=True,
+    )
+    server = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    server.load_cert_chain(cert, key)
+    client = ssl.create_default_context(cafile=str(cert))
+    client.check_hostname = False
+    return server, client
+
+
+def run(mode: str, url: str, verify: ssl.SSLContext | bool, files: int, calls: int) -> float:
+    """Simulate converting files in mode; return seconds per file."""
+    sessions: dict[int, httpx.AsyncClient] = {}
+
+    async def one_file() -> None:
+        loop = id(asyncio.get_running_loop())
+        if loop not in sessions:
+            sessions[loop] = httpx.AsyncClient(verify=verify)
+        for _ in range(calls):
+            (await sessions[loop].get(url)).raise_for_status()
+
+    started = time.perf_counter()
+    with persistent_loop() if mode == "persistent" else nullcontext():
+        for _ in range(files):
+            run_sync(one_file())
+    return (time.perf_counter() - started) / files
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=200, help="Files per mode")
+    parser.add_argument("--calls", type=int, default=2, help="LLM calls per file")
+    parser.add_argument("--tls", action="store_true", help="Serve HTTPS (needs openssl)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        server_context, verify = None, False
+        if args.tls:
+            server_context, verify = _self_signed_context(Path(directory))
+        server = Server(server_context)
+        scheme = "https" if args.tls else "http"
+        url = f"{scheme}://127.0.0.1:{server.port}/"
+
+        print(f"{args.files} files x {args.calls} calls, {scheme}")
+        print(f"  {'mode':<12} {'ms/file':>10} {'connections/file':>18}")
+        for mode in ("fresh", "persistent"):
+            before = server.connections
+            seconds = run(mode, url, verify, args.files, args.calls)
+            per_file = (server.connections - before) / args.files
+            print(f"  {mode:<12} {seconds * 1000:>10.2f} {per_file:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Benchmark extraction throughput (files/sec) for each Kreuzberg calling strategy.
+
+Usage:
+    uv run python benchmarks/bench_extraction.py [--files N] [--dir PATH] [--concurrency N]
+
+Strategies:
+    thread   asyncio.to_thread(extract_file_sync) with a fresh config per call (the
+             previous content_builder behavior)
+    adapter  extract_file_async() default path: worker thread, shared config
+    native   extract_file_async() with TO_MARKDOWN_KREUZBERG_ASYNC=1
+    bulk     extract_files(): one Kreuzberg batch call for all files
+
+Each strategy runs in its own subprocess with the extraction cache disabled, so one
+strategy's warm state (or a crash at interpreter shutdown) cannot skew another.
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+STRATEGIES = ("thread", "adapter", "native", "bulk")
+
+
+def make_corpus(directory: Path, count: int) -> list[Path]:
+    """Write count synthetic HTML documents of a few KB each."""
+    paths = []
+    for index in range(count):
+        sections = "".join(
+            f"<h2>Section {n}</h2><p>Document {index} paragraph {n}. {'lorem ipsum ' * 40}</p>"
+            for n in range(30)
+        )
+        path = directory / f"doc{index:04d}.html"
+        path.write_text(f"<html><body>{sections}</body></html>", encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+async def _gather_bounded(paths: list[Path], concurrency: int, extract) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(path: Path) -> None:
+        async with semaphore:
+            await extract(path)
+
+    await asyncio.gather(*(one(path) for path in paths))
+
+
+def run_strategy(strategy: str, paths: list[Path], concurrency: int) -> float:
+    """Extract every path with one strategy and return files per second."""
+    from kreuzberg import ExtractionConfig, extract_file_sync
+
+    from to_markdown.core.bulk_extraction import extract_files
+    from to_markdown.core.extraction import extract_file_async
+
+    def fresh_config(path: Path) -> object:
+        config = ExtractionConfig(output_format="markdown", enable_quality_processing=True)
+        return asyncio.to_thread(extract_file_sync, str(path), config=config)
+
+    def adapter(path: Path) -> object:
+        return extract_file_async(path, use_cache=False)
+
+    started = time.perf_counter()
+    if strategy == "bulk":
+        extract_files(paths, use_cache=False)
+    else:
+        extract = fresh_config if strategy == "thread" else adapter
+        asyncio.run(_gather_bounded(paths, concurrency, extract))
+    return len(paths) / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=200, help="Synthetic documents to create")
+    parser.add_argument("--dir", type=Path, help="Benchmark the files in this directory instead")
+    parser.add_argument("--concurrency", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--strategy", choices=STRATEGIES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = args.dir or Path(tmp)
+        if args.dir is not None:
+            paths = sorted(p for p in args.dir.iterdir() if p.is_file())
+        else:
+            paths = make_corpus(source, args.files)
+
+        if args.strategy:
+            rate = run_strategy(args.strategy, paths, args.concurrency)
+            print(f"{rate:.1f}", flush=True)
+            return
+
+        print(f"{len(paths)} files, concurrency {args.concurrency}, {os.cpu_count()} CPU(s)")
+        for strategy in STRATEGIES:
+            env = {**os.environ, "TO_MARKDOWN_KREUZBERG_ASYNC": str(int(strategy == "native"))}
+            command = [sys.executable, __file__, "--strategy", strategy, "--dir", str(source)]
+            command += ["--concurrency", str(args.concurrency)]
+            proc = subprocess.run(command, capture_output=True, text=True, env=env, check=False)
+            lines = proc.stdout.split()
+            rate = f"{lines[0]:>8} files/s" if lines else "       - files/s"
+            note = f"  (exit code {proc.returncode})" if proc.returncode else ""
+            print(f"  {strategy:<8} {rate}{note}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark compose_frontmatter() per-file cost against the previous yaml.dump emitter.
+
+Usage:
+    uv run python benchmarks/bench_frontmatter.py [--calls N]
+
+Also reports whether PyYAML was imported at all while composing typical frontmatter
+(it should only load for unusual values such as multi-line titles).
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from to_markdown.core.frontmatter import compose_frontmatter
+
+_METADATA = {
+    "title": "Quarterly Report (Draft), v2.1",
+    "authors": ["Alice", "Bob O'Neil"],
+    "creation_date": "2026-01-15",
+    "page_count": 12,
+    "word_count": 3400,
+    "format_type": "pdf",
+}
+
+
+def legacy_compose(metadata: dict, source_path: Path) -> str:
+    """The yaml.dump call compose_frontmatter() replaced (same schema)."""
+    import yaml
+
+    data = {
+        "title": metadata["title"],
+        "author": ", ".join(metadata["authors"]),
+        "created": metadata["creation_date"],
+        "pages": metadata["page_count"],
+        "words": metadata["word_count"],
+        "format": metadata["format_type"],
+        "extracted_at": "2026-01-15T10:00:00Z",
+    }
+    body = yaml.dump(data, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    return f"---\n{body}---\n"
+
+
+def per_call_us(function, calls: int) -> float:
+    """Mean microseconds per call."""
+    path = Path("report.pdf")
+    started = time.perf_counter()
+    for _ in range(calls):
+        function(_METADATA, path)
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20_000, help="Frontmatters per emitter")
+    args = parser.parse_args()
+
+    fast = per_call_us(compose_frontmatter, args.calls)
+    print(f"  PyYAML imported by the fast path: {'yaml' in sys.modules}")
+    legacy = per_call_us(legacy_compose, args.calls)
+    print(f"  {'emitter':<10} {'us/file':>9}")
+    print(f"  {'fast':<10} {fast:>9.1f}")
+    print(f"  {'yaml.dump':<10} {legacy:>9.1f}  ({legacy / fast:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
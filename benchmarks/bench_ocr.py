@@ -0,0 +1,101 @@
+"""Benchmark scanned-PDF OCR throughput (pages/sec) across OCR worker, thread, and DPI settings.
+
+Usage:
+    uv run python benchmarks/bench_ocr.py [--pages N] [--pdf PATH] [--workers 1,2]
+        [--threads 1,0] [--dpi 0,150,300]
+
+A thread count of 0 leaves Kreuzberg's thread pool at its default (all cores); a
+DPI of 0 uses adaptive DPI (low first, escalating only for poor pages). Each
+combination runs in its own subprocess with the extraction and OCR caches disabled,
+because the thread cap only applies before Kreuzberg's thread pool starts.
+"""
+
+import argparse
+import itertools
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+def make_scanned_pdf(path: Path, pages: int) -> Path:
+    """Write a PDF of image-only pages (no text layer), like a scanner produces."""
+    from fpdf import FPDF
+    from PIL import Image, ImageDraw
+
+    pdf = FPDF()
+    with tempfile.TemporaryDirectory() as tmp:
+        for number in range(1, pages + 1):
+            scan = Path(tmp) / f"page{number}.png"
+            image = Image.new("L", (1240, 1754), color=255)
+            draw = ImageDraw.Draw(image)
+            for line in range(40):
+                draw.text(
+                    (80, 80 + line * 40), f"Page {number} line {line}: quarterly report", fill=0
+                )
+            image.save(scan)
+            pdf.add_page()
+            pdf.image(str(scan), x=0, y=0, w=210)
+        pdf.output(str(path))
+    return path
+
+
+def run_setting(pdf: Path, workers: int, dpi: int) -> tuple[float, int]:
+    """Extract pdf once and return (OCR'd pages per second, OCR'd page count)."""
+    from to_markdown.core.extraction import extract_file
+    from to_markdown.core.ocr_settings import OcrSettings
+
+    settings = OcrSettings(workers=workers, dpi=dpi or None)
+    started = time.perf_counter()
+    result = extract_file(pdf, use_cache=False, ocr=settings)
+    elapsed = time.perf_counter() - started
+    pages = len(result.metadata.get("ocr_pages", []))
+    return pages / elapsed, pages
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(part) for part in value.split(",") if part]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=24, help="Synthetic scanned pages")
+    parser.add_argument("--pdf", type=Path, help="Benchmark this scanned PDF instead")
+    parser.add_argument("--workers", type=_int_list, default=[1, os.cpu_count() or 1])
+    parser.add_argument("--threads", type=_int_list, default=[1, 0])
+    parser.add_argument("--dpi", type=_int_list, default=[0, 150, 300])
+    parser.add_argument("--setting", type=_int_list, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.setting:
+        workers, dpi = args.setting
+        rate, pages = run_setting(args.pdf, workers, dpi)
+        print(f"{rate:.2f} {pages}", flush=True)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf = args.pdf or make_scanned_pdf(Path(tmp) / "scanned.pdf", args.pages)
+        print(f"{pdf.name}, {os.cpu_count()} CPU(s)")
+        print(f"  {'workers':>7} {'threads':>7} {'dpi':>8} {'pages/s':>9}")
+        for workers, threads, dpi in itertools.product(args.workers, args.threads, args.dpi):
+            env = dict(os.environ)
+            if threads:
+                env["RAYON_NUM_THREADS"] = str(threads)
+            command = [sys.executable, __file__, "--pdf", str(pdf), "--setting", f"{workers},{dpi}"]
+            proc = subprocess.run(command, capture_output=True, text=True, env=env, check=False)
+            fields = proc.stdout.split()
+            rate = f"{fields[0]:>9}" if fields else f"{'-':>9}"
+            note = ""
+            if len(fields) > 1 and fields[1] == "0":
+                note = "  (no pages OCR'd: is Tesseract language data installed?)"
+            if proc.returncode:
+                error = (proc.stderr.strip().splitlines() or [""])[-1]
+                note = f"  (exit code {proc.returncode}: {error[:60]})"
+            label = threads or "default"
+            print(f"  {workers:>7} {label:>7} {dpi or 'adaptive':>8} {rate}{note}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark sanitize_content() throughput (GB/s of UTF-8 input) on large documents.
+
+Usage:
+    uv run python benchmarks/bench_sanitize.py [--mb N] [--repeat N] [--no-legacy]
+
+Corpora:
+    ascii        clean ASCII prose (the common case: nothing to remove)
+    ascii-dirty  ASCII prose with a control character every few KB
+    latin1       accented prose with soft hyphens and controls
+    wide         prose with em dashes and CJK, zero-width and bidi characters
+
+Each corpus is also run through the previous character-by-character filter
+("legacy") for comparison; --no-legacy skips it on very large inputs.
+"""
+
+import argparse
+import time
+
+from to_markdown.core.sanitize import _ALL_INVISIBLE_CHARS, sanitize_content
+
+_LINES = {
+    "ascii": "The quarterly report covers revenue, margins, and headcount by region.\n",
+    "ascii-dirty": "The quarterly report covers revenue, margins,\x07 and headcount by region.\n",
+    "latin1": "Der Quartalsbericht f\u00fcr M\u00fcn\u00adchen: Ums\u00e4tze.\x01\n",
+    "wide": "Revenue \u2014 \u58f2\u4e0a\u9ad8 \u200bgrew 4%\u202e in the second quarter.\n",
+}
+
+
+def make_corpus(kind: str, megabytes: int) -> str:
+    """Repeat a sample line until the UTF-8 size reaches megabytes."""
+    line = _LINES[kind]
+    return line * (megabytes * 1024 * 1024 // len(line.encode("utf-8")))
+
+
+def legacy_sanitize(content: str) -> str:
+    """The character-by-character filter sanitize_content() replaced."""
+    return "".join(char for char in content if char not in _ALL_INVISIBLE_CHARS)
+
+
+def throughput(function, content: str, repeat: int) -> float:
+    """Best-of-repeat GB/s of UTF-8 input processed by function."""
+    size = len(content.encode("utf-8"))
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function(content)
+        best = min(best, time.perf_counter() - started)
+    return size / best / 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mb", type=int, default=256, help="Corpus size in MB")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per corpus (best is kept)")
+    parser.add_argument("--no-legacy", action="store_true", help="Skip the legacy filter")
+    args = parser.parse_args()
+
+    print(f"{args.mb} MB per corpus, best of {args.repeat}")
+    print(f"  {'corpus':<12} {'engine GB/s':>12} {'legacy GB/s':>12} {'removed':>10}")
+    for kind in _LINES:
+        content = make_corpus(kind, args.mb)
+        engine = throughput(sanitize_content, content, args.repeat)
+        legacy = "-" if args.no_legacy else f"{throughput(legacy_sanitize, content, 1):.3f}"
+        removed = sanitize_content(content).chars_removed
+        print(f"  {kind:<12} {engine:>12.3f} {legacy:>12} {removed:>10,}")
+        del content
+
+
+if __name__ == "__main__":
+    main()
@@ -7,15 +7,53 @@ from typing import Annotated
 
 import typer
 
-from to_markdown import __version__
 from to_markdown.core.cli_helpers import (
+    build_ocr_settings,
+    configure_llm_cache,
     configure_logging,
     get_store,
+    handle_cache_flags,
     load_dotenv,
     require_api_key,
+    validate_timeout,
+)
+from to_markdown.core.cli_options import (
+    BackgroundOption,
+    CacheStatsOption,
+    CancelOption,
+    CleanOption,
+    ClearCacheOption,
+    DeterministicOption,
+    ExcludeOption,
+    FailFastOption,
+    ForceOption,
+    ImagesOption,
+    IncludeOption,
+    IncrementalOption,
+    JobsOption,
+    NoCacheOption,
+    NoCleanOption,
+    NoLlmCacheOption,
+    NoRecursiveOption,
+    NoSanitizeOption,
+    OcrDpiOption,
+    OcrThreadsOption,
+    OcrWorkersOption,
+    OutputOption,
+    PruneOption,
+    QuietOption,
+    SetupOption,
+    StatusOption,
+    StreamOption,
+    SummaryOption,
+    TimeoutOption,
+    VerboseOption,
+    VersionOption,
+    WorkerOption,
 )
 from to_markdown.core.constants import (
     APP_NAME,
+    DEFAULT_BATCH_JOBS,
     EXIT_ALREADY_EXISTS,
     EXIT_ERROR,
     EXIT_SUCCESS,
@@ -35,12 +73,6 @@ app = typer.Typer(
 )
 
 
-def _version_callback(value: bool) -> None:
-    if value:
-        typer.echo(f"{APP_NAME} {__version__}")
-        raise typer.Exit(EXIT_SUCCESS)
-
-
 def _is_llm_available() -> bool:
     """Check if LLM features can be used (SDK installed + API key set)."""
     try:
@@ -56,99 +88,38 @@ def main(
         str | None,
         typer.Argument(help="File, directory, or glob pattern to convert to Markdown."),
     ] = None,
-    setup: Annotated[
-        bool,
-        typer.Option("--setup", help="Run interactive configuration wizard."),
-    ] = False,
-    output: Annotated[
-        Path | None,
-        typer.Option("--output", "-o", help="Output path (file or directory)."),
-    ] = None,
-    force: Annotated[
-        bool,
-        typer.Option("--force", "-f", help="Overwrite existing output file."),
-    ] = False,
-    clean: Annotated[
-        bool,
-        typer.Option(
-            "--clean",
-            "-c",
-            help=(
-                "Fix extraction artifacts via LLM (enabled by default when GEMINI_API_KEY is set)."
-            ),
-        ),
-    ] = False,
-    summary: Annotated[
-        bool,
-        typer.Option(
-            "--summary",
-            "-s",
-            help="Generate document summary via LLM (requires GEMINI_API_KEY).",
-        ),
-    ] = False,
-    images: Annotated[
-        bool,
-        typer.Option(
-            "--images",
-            "-i",
-            help="Describe images via LLM vision (requires GEMINI_API_KEY).",
-        ),
-    ] = False,
-    no_clean: Annotated[
-        bool,
-        typer.Option(
-            "--no-clean",
-            help="Disable automatic content cleaning (clean is on by default with API key).",
-        ),
-    ] = False,
-    no_sanitize: Annotated[
-        bool,
-        typer.Option(
-            "--no-sanitize",
-            help="Disable prompt injection sanitization.",
-        ),
-    ] = False,
-    no_recursive: Annotated[
-        bool,
-        typer.Option("--no-recursive", help="Disable recursive directory scanning."),
-    ] = False,
-    fail_fast: Annotated[
-        bool,
-        typer.Option("--fail-fast", help="Stop batch conversion on first error."),
-    ] = False,
-    background: Annotated[
-        bool,
-        typer.Option("--background", "--bg", help="Run conversion in background."),
-    ] = False,
-    status: Annotated[
-        str | None,
-        typer.Option("--status", help="Show task status (task ID or 'all')."),
-    ] = None,
-    cancel: Annotated[
-        str | None,
-        typer.Option("--cancel", help="Cancel a running background task."),
-    ] = None,
-    _worker: Annotated[
-        str | None,
-        typer.Option("--_worker", help="Internal worker flag.", hidden=True),
-    ] = None,
-    verbose: Annotated[
-        int,
-        typer.Option("--verbose", "-v", count=True, help="Increase verbosity (-v or -vv)."),
-    ] = 0,
-    quiet: Annotated[
-        bool,
-        typer.Option("--quiet", "-q", help="Suppress all non-error output."),
-    ] = False,
-    version: Annotated[
-        bool,
-        typer.Option(
-            "--version",
-            help="Show version and exit.",
-            callback=_version_callback,
-            is_eager=True,
-        ),
-    ] = False,
+    setup: SetupOption = False,
+    output: OutputOption = None,
+    force: ForceOption = False,
+    clean: CleanOption = False,
+    summary: SummaryOption = False,
+    images: ImagesOption = False,
+    no_clean: NoCleanOption = False,
+    no_sanitize: NoSanitizeOption = False,
+    stream: StreamOption = False,
+    deterministic: DeterministicOption = False,
+    no_recursive: NoRecursiveOption = False,
+    include: IncludeOption = None,
+    exclude: ExcludeOption = None,
+    incremental: IncrementalOption = False,
+    prune: PruneOption = False,
+    fail_fast: FailFastOption = False,
+    jobs: JobsOption = DEFAULT_BATCH_JOBS,
+    timeout: TimeoutOption = None,
+    ocr_workers: OcrWorkersOption = None,
+    ocr_threads: OcrThreadsOption = None,
+    ocr_dpi: OcrDpiOption = None,
+    no_cache: NoCacheOption = False,
+    no_llm_cache: NoLlmCacheOption = False,
+    clear_cache: ClearCacheOption = False,
+    cache_stats: CacheStatsOption = False,
+    background: BackgroundOption = False,
+    status: StatusOption = None,
+    cancel: CancelOption = None,
+    _worker: WorkerOption = None,
+    verbose: VerboseOption = 0,
+    quiet: QuietOption = False,
+    version: VersionOption = False,
 ) -> None:
     """Convert files to Markdown with YAML frontmatter.
 
@@ -156,11 +127,12 @@ def main(
     pattern (e.g., "docs/*.pdf"). Directories are scanned recursively by default.
     """
     configure_logging(verbose, quiet)
+    configure_llm_cache(enabled=not no_llm_cache)
     load_dotenv()
 
     # Compute effective clean: enabled by default when LLM available
     effective_clean = clean or (not no_clean and _is_llm_available())
-    if no_clean:
+    if no_clean or stream:
         effective_clean = False
 
     # Setup wizard (early return, no input_path required)
@@ -173,11 +145,22 @@ def main(
             run_setup()
         raise typer.Exit(EXIT_SUCCESS)
 
+    # Cache maintenance (early return, no input_path required)
+    if clear_cache or cache_stats:
+        handle_cache_flags(clear=clear_cache, stats=cache_stats)
+
     # input_path is required for all other modes
     if input_path is None:
         logger.error("Missing required argument: INPUT_PATH")
         raise typer.Exit(EXIT_ERROR)
 
+    if stream and (clean or summary or images):
+        logger.error("--stream cannot be combined with --clean, --summary, or --images")
+        raise typer.Exit(EXIT_ERROR)
+
+    validate_timeout(timeout)
+    ocr = build_ocr_settings(ocr_workers, ocr_threads, ocr_dpi)
+
     # Mutual exclusivity check
     bg_flags = sum(bool(x) for x in [background, status, cancel])
     if bg_flags > 1:
@@ -217,6 +200,16 @@ def main(
             images_flag=images,
             no_sanitize=no_sanitize,
             recursive=not no_recursive,
+            include=include,
+            exclude=exclude,
+            jobs=jobs,
+            use_cache=not no_cache,
+            stream=stream,
+            timeout=timeout,
+            ocr=ocr,
+            deterministic=deterministic,
+            incremental=incremental or prune,
+            prune=prune,
             store=store,
         )
         return
@@ -232,6 +225,8 @@ def main(
             input_path,
             output,
             recursive=not no_recursive,
+            include=include,
+            exclude=exclude,
             force=force,
             clean=effective_clean,
             summary=summary,
@@ -240,6 +235,14 @@ def main(
             fail_fast=fail_fast,
             quiet=quiet,
             verbose=verbose,
+            jobs=jobs,
+            use_cache=not no_cache,
+            stream=stream,
+            timeout=timeout,
+            ocr=ocr,
+            deterministic=deterministic,
+            incremental=incremental or prune,
+            prune=prune,
         )
         return  # run_batch raises typer.Exit
 
@@ -253,6 +256,11 @@ def main(
             summary=summary,
             images=images,
             sanitize=not no_sanitize,
+            use_cache=not no_cache,
+            stream=stream,
+            timeout=timeout,
+            ocr=ocr,
+            deterministic=deterministic,
         )
     except FileNotFoundError as exc:
         logger.error("%s", exc)
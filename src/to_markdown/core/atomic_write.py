@@ -0,0 +1,115 @@
+"""Atomic output files: write a temp file beside the target, then rename it into place.
+
+A crash or SIGTERM mid-write leaves at most a hidden temp file, never a truncated
+output. Overwrites use os.replace(); exclusive creates use os.link(), which fails if
+the target appeared in the meantime, so concurrent writers in a parallel batch
+cannot clobber each other's output. On filesystems without hard links, an exclusive
+create checks that the target is absent and then renames, leaving a narrow window
+in which a concurrent writer's output could be replaced.
+
+Durability is set by TO_MARKDOWN_FSYNC: "off" (default; rename atomicity only),
+"always" (fsync each file and its directory), or "batch" (one sync pass over all
+outputs when a batch finishes, see sync_batch_outputs()).
+"""
+
+import errno
+import logging
+import os
+import secrets
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TextIO
+
+from to_markdown.core.constants import OUTPUT_FSYNC_ENV, OUTPUT_FSYNC_MODES, OUTPUT_TEMP_SUFFIX
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def atomic_output(path: Path, *, overwrite: bool) -> Iterator[TextIO]:
+    """Yield a text file whose content replaces path only once the block succeeds.
+
+    Raises:
+        FileExistsError: If overwrite is False and path already exists.
+    """
+    temporary = path.with_name(f".{path.name}.{secrets.token_hex(4)}{OUTPUT_TEMP_SUFFIX}")
+    durable = fsync_mode() == "always"
+    try:
+        with open(temporary, "x", encoding="utf-8") as f:
+            yield f
+            f.flush()
+            if durable:
+                os.fsync(f.fileno())
+        _commit(temporary, path, overwrite=overwrite)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+    if durable:
+        _fsync_directory(path.parent)
+
+
+def fsync_mode() -> str:
+    """The TO_MARKDOWN_FSYNC mode; unknown values fall back to "off"."""
+    mode = os.environ.get(OUTPUT_FSYNC_ENV, "off").strip().lower()
+    if mode not in OUTPUT_FSYNC_MODES:
+        logger.warning("Ignoring %s=%r (expected off, always, or batch)", OUTPUT_FSYNC_ENV, mode)
+        return "off"
+    return mode
+
+
+def sync_batch_outputs(paths: Iterable[Path]) -> None:
+    """In "batch" fsync mode, flush every output (and its directory) to disk once.
+
+    Works on outputs written by worker processes too, since fsync applies to the
+    file, not to the descriptor that wrote it.
+    """
+    if fsync_mode() != "batch":
+        return
+    directories: set[Path] = set()
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError as exc:
+            logger.debug("Cannot sync %s: %s", path, exc)
+            continue
+        try:
+            os.fsync(fd)
+        except OSError as exc:
+            logger.debug("Cannot sync %s: %s", path, exc)
+        finally:
+            os.close(fd)
+        directories.add(Path(path).parent)
+    for directory in directories:
+        _fsync_directory(directory)
+
+
+def _commit(temporary: Path, path: Path, *, overwrite: bool) -> None:
+    if overwrite:
+        os.replace(temporary, path)
+        return
+    try:
+        os.link(temporary, path)
+    except FileExistsError:
+        raise
+    except OSError:
+        # No hard links on this filesystem. A placeholder would expose an empty output
+        if path.exists():
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), str(path)) from None
+        os.replace(temporary, path)
+    else:
+        temporary.unlink()
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist a rename by syncing the directory entry (not supported on Windows)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError as exc:
+        logger.debug("Cannot sync directory %s: %s", directory, exc)
+    finally:
+        os.close(fd)
@@ -12,6 +12,7 @@ import typer
 
 from to_markdown.core.constants import (
     APP_NAME,
+    DEFAULT_BATCH_JOBS,
     EXIT_BACKGROUND,
     EXIT_ERROR,
     EXIT_SUCCESS,
@@ -24,6 +25,7 @@ from to_markdown.core.constants import (
 from to_markdown.core.display import is_glob_pattern
 
 if TYPE_CHECKING:
+    from to_markdown.core.ocr_settings import OcrSettings
     from to_markdown.core.tasks import TaskStore
 
 logger = logging.getLogger(APP_NAME)
@@ -123,7 +125,17 @@ def handle_background(
     images_flag: bool,
     no_sanitize: bool = False,
     recursive: bool = True,
-    store: "TaskStore" | None = None,
+    include: list[str] | None = None,
+    exclude: list[str] | None = None,
+    jobs: int = DEFAULT_BATCH_JOBS,
+    use_cache: bool = True,
+    stream: bool = False,
+    timeout: float | None = None,
+    ocr: "OcrSettings | None" = None,
+    deterministic: bool = False,
+    incremental: bool = False,
+    prune: bool = False,
+    store: "TaskStore | None" = None,
 ) -> None:
     """Handle --background flag."""
     if store is None:
@@ -146,6 +158,18 @@ def handle_background(
             "is_batch": is_batch,
             "is_glob": is_glob,
             "recursive": recursive,
+            "include": include,
+            "exclude": exclude,
+            "jobs": jobs,
+            "use_cache": use_cache,
+            "stream": stream,
+            "timeout": timeout,
+            "ocr_workers": ocr.workers if ocr else None,
+            "ocr_threads": ocr.threads if ocr else None,
+            "ocr_dpi": ocr.dpi if ocr else None,
+            "deterministic": deterministic,
+            "incremental": incremental,
+            "prune": prune,
         }
     )
 
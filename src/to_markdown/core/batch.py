@@ -1,20 +1,32 @@
-"""Batch processing: file discovery and multi-file conversion loop."""
+"""Batch processing: multi-file conversion loop and aggregated results."""
 
-import asyncio
-import glob as glob_module
+import contextlib
 import logging
+import os
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from to_markdown.core.constants import (
-    DEFAULT_OUTPUT_EXTENSION,
+    BATCH_JOBS_AUTO,
+    DEFAULT_BATCH_JOBS,
     EXIT_ERROR,
     EXIT_PARTIAL,
     EXIT_SUCCESS,
+    MANIFEST_UNCHANGED_REASON,
+    OUTPUT_EXISTS_REASON,
     PARALLEL_LLM_MAX_CONCURRENCY,
 )
+from to_markdown.core.discovery import _resolve_batch_output, discover_files, resolve_glob  # noqa: F401
 from to_markdown.core.extraction import UnsupportedFormatError
-from to_markdown.core.pipeline import OutputExistsError, convert_file, convert_file_async
+from to_markdown.core.pipeline import OutputExistsError, convert_file
+from to_markdown.core.progress import _make_progress, _NoProgress, _RichProgress  # noqa: F401
+from to_markdown.core.watchdog import ExtractionTimeoutError
+
+if TYPE_CHECKING:
+    from to_markdown.core.batch_stages import PipelineStats
+    from to_markdown.core.ocr_settings import OcrSettings
 
 logger = logging.getLogger(__name__)
 
@@ -26,64 +38,38 @@ class BatchResult:
     succeeded: list[Path] = field(default_factory=list)
     failed: list[tuple[Path, str]] = field(default_factory=list)
     skipped: list[tuple[Path, str]] = field(default_factory=list)
+    timed_out: list[tuple[Path, str]] = field(default_factory=list)
+    removed: list[Path] = field(default_factory=list)
+    ocr_cache_hits: int = 0
+    ocr_cache_misses: int = 0
+    llm_cache_hits: int = 0
+    llm_cache_misses: int = 0
+    pipeline_stats: "PipelineStats | None" = None
 
     @property
     def total(self) -> int:
-        return len(self.succeeded) + len(self.failed) + len(self.skipped)
+        return len(self.succeeded) + len(self.failed) + len(self.skipped) + len(self.timed_out)
 
     @property
     def exit_code(self) -> int:
-        if not self.succeeded and not self.failed and not self.skipped:
-            return EXIT_ERROR
-        if not self.succeeded:
-            return EXIT_ERROR
-        if self.failed:
-            return EXIT_PARTIAL
-        return EXIT_SUCCESS
-
-
-def discover_files(source: Path, *, recursive: bool = True) -> list[Path]:
-    """Discover convertible files in a directory.
-
-    Skips hidden files/dirs (starting with '.') and files without extensions.
-    Returns sorted list for deterministic processing order.
-    """
-    files: list[Path] = []
-    iterator = source.rglob("*") if recursive else source.glob("*")
-
-    for path in iterator:
-        if not path.is_file():
-            continue
-        # Skip hidden files and files in hidden directories
-        if any(part.startswith(".") for part in path.relative_to(source).parts):
-            continue
-        # Skip files without extensions
-        if not path.suffix:
-            continue
-        files.append(path)
-
-    return sorted(files)
-
-
-def resolve_glob(pattern: str) -> list[Path]:
-    """Resolve a glob pattern to a sorted list of file paths."""
-    matches = [Path(p) for p in glob_module.glob(pattern) if Path(p).is_file()]
-    return sorted(matches)
+        if self.failed or self.timed_out:
+            return EXIT_PARTIAL if self.succeeded else EXIT_ERROR
+        # An incremental re-run over an unchanged tree converts nothing, and that is success
+        reasons = {reason.split(":")[0] for _, reason in self.skipped}
+        up_to_date = MANIFEST_UNCHANGED_REASON in reasons and OUTPUT_EXISTS_REASON not in reasons
+        return EXIT_SUCCESS if self.succeeded or up_to_date else EXIT_ERROR
 
+    @property
+    def ocr_cache_hit_rate(self) -> float:
+        """Fraction of page-image OCR served from the cache (0.0 when no OCR ran)."""
+        lookups = self.ocr_cache_hits + self.ocr_cache_misses
+        return self.ocr_cache_hits / lookups if lookups else 0.0
 
-def _resolve_batch_output(
-    input_path: Path,
-    output_dir: Path,
-    batch_root: Path | None,
-) -> Path:
-    """Resolve output path for a file in a batch, preserving directory structure."""
-    if batch_root is not None:
-        try:
-            relative = input_path.parent.relative_to(batch_root)
-            return output_dir / relative / (input_path.stem + DEFAULT_OUTPUT_EXTENSION)
-        except ValueError:
-            pass
-    return output_dir / (input_path.stem + DEFAULT_OUTPUT_EXTENSION)
+    @property
+    def llm_cache_hit_rate(self) -> float:
+        """Fraction of LLM calls served from the response cache (0.0 when none ran)."""
+        lookups = self.llm_cache_hits + self.llm_cache_misses
+        return self.llm_cache_hits / lookups if lookups else 0.0
 
 
 def convert_batch(
@@ -98,6 +84,12 @@ def convert_batch(
     sanitize: bool = True,
     fail_fast: bool = False,
     quiet: bool = False,
+    jobs: int = DEFAULT_BATCH_JOBS,
+    use_cache: bool = True,
+    stream: bool = False,
+    timeout: float | None = None,
+    ocr: "OcrSettings | None" = None,
+    deterministic: bool = False,
 ) -> BatchResult:
     """Convert multiple files to Markdown with progress reporting.
 
@@ -112,47 +104,141 @@ def convert_batch(
         sanitize: If True, apply prompt injection sanitization to output.
         fail_fast: If True, stop on first error.
         quiet: If True, suppress progress output.
+        jobs: Number of worker processes. 1 converts serially in this process;
+            0 uses one worker per CPU core.
+        use_cache: If False, bypass the on-disk extraction cache.
+        stream: If True, write each output chunk by chunk (no LLM features).
+        timeout: Per-file extraction deadline in seconds. Extraction then runs in a
+            killable child process; files over the deadline land in timed_out.
+        ocr: OCR workers, threads, and DPI for pages that need OCR.
+        deterministic: If True, unchanged sources produce byte-identical outputs.
+
+    Files whose extension or leading bytes mark them as unsupported are skipped
+    up front, without an extraction attempt.
 
     Returns:
-        BatchResult with succeeded, failed, and skipped lists.
+        BatchResult with succeeded, failed, skipped, and timed_out lists.
     """
+    from to_markdown.core.atomic_write import sync_batch_outputs
+    from to_markdown.core.cache_lookups import counting_lookups
+    from to_markdown.core.sniffing import partition_convertible
+
+    files, unsupported = partition_convertible(files)
+    options = {
+        "force": force,
+        "clean": clean,
+        "summary": summary,
+        "images": images,
+        "sanitize": sanitize,
+        "use_cache": use_cache,
+        "stream": stream,
+        "timeout": timeout,
+        "ocr": ocr,
+        "deterministic": deterministic,
+    }
+    workers = min(resolve_jobs(jobs), len(files))
+    with counting_lookups() as lookups:
+        if workers > 1:
+            from to_markdown.core.parallel import convert_batch_parallel
+
+            result = convert_batch_parallel(
+                files,
+                output_dir,
+                batch_root=batch_root,
+                options=options,
+                fail_fast=fail_fast,
+                quiet=quiet,
+                workers=workers,
+            )
+        else:
+            result = _convert_serial(files, output_dir, batch_root, options, fail_fast, quiet)
+    result.skipped[:0] = unsupported
+    _record_cache_lookups(result, lookups)
+    sync_batch_outputs(result.succeeded)
+    return result
+
+
+def _convert_serial(
+    files: list[Path],
+    output_dir: Path | None,
+    batch_root: Path | None,
+    options: dict,
+    fail_fast: bool,
+    quiet: bool,
+) -> BatchResult:
+    """Convert files one by one in this process, prefetching their extractions."""
+    from to_markdown.core.bulk_extraction import prefetch_extractions
+    from to_markdown.core.event_loop import persistent_loop
+
     result = BatchResult()
+    outputs = [
+        _resolve_batch_output(f, output_dir, batch_root) if output_dir is not None else None
+        for f in files
+    ]
+    prefetched = prefetch_extractions(
+        files,
+        outputs,
+        images=options["images"],
+        use_cache=options["use_cache"],
+        force=options["force"],
+        timeout=options["timeout"],
+        ocr=options["ocr"],
+        bulk=not (options["stream"] or fail_fast),
+    )
 
     progress_ctx = _make_progress(quiet, len(files))
-    with progress_ctx as update_fn:
-        for file_path in files:
+    # One event loop for the whole batch, so LLM connections are kept alive across files
+    with progress_ctx as update_fn, contextlib.closing(prefetched), persistent_loop():
+        for file_path, out, extracted in zip(files, outputs, prefetched, strict=True):
             update_fn(file_path.name)
-            out = None
-            if output_dir is not None:
-                out = _resolve_batch_output(file_path, output_dir, batch_root)
-
             try:
-                converted = convert_file(
-                    file_path,
-                    output_path=out,
-                    force=force,
-                    clean=clean,
-                    summary=summary,
-                    images=images,
-                    sanitize=sanitize,
-                )
-                result.succeeded.append(converted)
-                logger.info("Converted: %s", file_path.name)
-            except UnsupportedFormatError as exc:
-                result.skipped.append((file_path, str(exc)))
-                logger.debug("Skipped (unsupported): %s", file_path.name)
-            except OutputExistsError as exc:
-                result.skipped.append((file_path, f"Output exists: {exc}"))
-                logger.debug("Skipped (exists): %s", file_path.name)
+                if isinstance(extracted, Exception):
+                    raise extracted
+                converted = convert_file(file_path, output_path=out, extracted=extracted, **options)
             except Exception as exc:
-                result.failed.append((file_path, str(exc)))
-                logger.warning("Failed: %s - %s", file_path.name, exc)
-                if fail_fast:
+                if _record_error(result, file_path, exc) and fail_fast:
                     break
+            else:
+                result.succeeded.append(converted)
+                logger.info("Converted: %s", file_path.name)
 
     return result
 
 
+def _record_cache_lookups(result: BatchResult, lookups: Mapping[str, int]) -> None:
+    """Record the OCR and LLM cache lookups this run counted (see counting_lookups())."""
+    result.ocr_cache_hits = lookups.get("ocr_hits", 0)
+    result.ocr_cache_misses = lookups.get("ocr_misses", 0)
+    result.llm_cache_hits = lookups.get("llm_hits", 0)
+    result.llm_cache_misses = lookups.get("llm_misses", 0)
+
+
+def resolve_jobs(jobs: int) -> int:
+    """Resolve the requested worker count (BATCH_JOBS_AUTO = one per CPU core)."""
+    if jobs <= BATCH_JOBS_AUTO:
+        return os.cpu_count() or DEFAULT_BATCH_JOBS
+    return jobs
+
+
+def _record_error(result: BatchResult, file_path: Path, exc: BaseException) -> bool:
+    """Record a per-file conversion error. Returns True if it counts as a failure."""
+    if isinstance(exc, ExtractionTimeoutError):
+        result.timed_out.append((file_path, str(exc)))
+        logger.warning("Timed out: %s - %s", file_path.name, exc)
+        return True
+    if isinstance(exc, UnsupportedFormatError):
+        result.skipped.append((file_path, str(exc)))
+        logger.debug("Skipped (unsupported): %s", file_path.name)
+        return False
+    if isinstance(exc, OutputExistsError):
+        result.skipped.append((file_path, f"{OUTPUT_EXISTS_REASON}: {exc}"))
+        logger.debug("Skipped (exists): %s", file_path.name)
+        return False
+    result.failed.append((file_path, str(exc)))
+    logger.warning("Failed: %s - %s", file_path.name, exc)
+    return True
+
+
 async def convert_batch_async(
     files: list[Path],
     output_dir: Path | None = None,
@@ -164,100 +250,39 @@ async def convert_batch_async(
     images: bool = False,
     sanitize: bool = True,
     fail_fast: bool = False,
+    extract_workers: int = BATCH_JOBS_AUTO,
+    llm_workers: int = PARALLEL_LLM_MAX_CONCURRENCY,
+    use_cache: bool = True,
+    timeout: float | None = None,
+    ocr: "OcrSettings | None" = None,
 ) -> BatchResult:
     """Async version of convert_batch() for use inside a running event loop (e.g. MCP).
 
-    Same behavior as convert_batch() but calls convert_file_async() directly,
-    avoiding the asyncio.run() call that would crash inside FastMCP's event loop.
-    No progress bar (MCP always passes quiet=True).
-    """
-    result = BatchResult()
-    semaphore = asyncio.Semaphore(PARALLEL_LLM_MAX_CONCURRENCY)
-    should_stop = False
-
-    async def process_file(file_path: Path):
-        nonlocal should_stop
-        if should_stop:
-            return
-
-        async with semaphore:
-            if should_stop:
-                return
-
-            out = None
-            if output_dir is not None:
-                out = _resolve_batch_output(file_path, output_dir, batch_root)
-
-            try:
-                converted = await convert_file_async(
-                    file_path,
-                    output_path=out,
-                    force=force,
-                    clean=clean,
-                    summary=summary,
-                    images=images,
-                    sanitize=sanitize,
-                )
-                result.succeeded.append(converted)
-                logger.info("Converted: %s", file_path.name)
-            except UnsupportedFormatError as exc:
-                result.skipped.append((file_path, str(exc)))
-                logger.debug("Skipped (unsupported): %s", file_path.name)
-            except OutputExistsError as exc:
-                result.skipped.append((file_path, f"Output exists: {exc}"))
-                logger.debug("Skipped (exists): %s", file_path.name)
-            except Exception as exc:
-                result.failed.append((file_path, str(exc)))
-                logger.warning("Failed: %s - %s", file_path.name, exc)
-                if fail_fast:
-                    should_stop = True
-
-    await asyncio.gather(*(process_file(f) for f in files))
-    return result
-
+    Files flow through a staged pipeline (extract -> LLM -> write) with bounded
+    queues, so extraction of one file overlaps LLM calls for another. No progress
+    bar (MCP always passes quiet=True).
 
-class _NoProgress:
-    """Null progress context for quiet mode."""
-
-    def __enter__(self):
-        return lambda _name: None
-
-    def __exit__(self, *_args):
-        pass
-
-
-class _RichProgress:
-    """Rich progress bar wrapper for batch conversion."""
-
-    def __init__(self, total: int) -> None:
-        self._total = total
-        self._progress = None
-        self._task_id = None
-
-    def __enter__(self):
-        from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn
-
-        self._progress = Progress(
-            TextColumn("[bold blue]{task.description}"),
-            BarColumn(),
-            MofNCompleteColumn(),
-            TextColumn("[dim]{task.fields[filename]}"),
-        )
-        self._progress.__enter__()
-        self._task_id = self._progress.add_task("Converting", total=self._total, filename="")
-        return self._update
-
-    def _update(self, filename: str) -> None:
-        if self._progress is not None and self._task_id is not None:
-            self._progress.update(self._task_id, advance=1, filename=filename)
-
-    def __exit__(self, *args):
-        if self._progress is not None:
-            self._progress.__exit__(*args)
-
-
-def _make_progress(quiet: bool, total: int) -> _NoProgress | _RichProgress:
-    """Create appropriate progress context based on quiet flag."""
-    if quiet:
-        return _NoProgress()
-    return _RichProgress(total)
+    Args:
+        extract_workers: Concurrent extractions (0 = one per CPU core).
+        llm_workers: Files concurrently in the LLM stage (sized to API quota).
+        timeout: Per-file extraction deadline in seconds (killable child processes).
+        ocr: OCR workers, threads, and DPI for pages that need OCR.
+    """
+    from to_markdown.core.batch_stages import run_staged_batch
+
+    return await run_staged_batch(
+        files,
+        output_dir,
+        batch_root=batch_root,
+        force=force,
+        clean=clean,
+        summary=summary,
+        images=images,
+        sanitize=sanitize,
+        fail_fast=fail_fast,
+        extract_workers=extract_workers,
+        llm_workers=llm_workers,
+        use_cache=use_cache,
+        timeout=timeout,
+        ocr=ocr,
+    )
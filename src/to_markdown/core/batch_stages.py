@@ -0,0 +1,248 @@
+"""Staged async batch engine: bounded extract -> LLM -> write queues.
+
+Extraction (CPU-bound, runs in threads) and LLM enrichment (I/O-bound, Gemini) are
+sized independently, so file N+1 is extracted while file N waits on the API.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from to_markdown.core.batch import (
+    BatchResult,
+    _record_error,
+    _resolve_batch_output,
+    resolve_jobs,
+)
+from to_markdown.core.constants import BATCH_QUEUE_DEPTH_PER_WORKER, BATCH_WRITE_WORKERS
+from to_markdown.core.content_builder import enrich_content_async, extract_content_async
+from to_markdown.core.pipeline import _resolve_output_path, check_output_available, write_output
+from to_markdown.core.watchdog import ExtractionWatchdog
+
+if TYPE_CHECKING:
+    from to_markdown.core.ocr_settings import OcrSettings
+
+logger = logging.getLogger(__name__)
+
+# Sentinel telling a stage worker that its inbox is drained
+_DONE = object()
+
+
+@dataclass
+class StageStats:
+    """Throughput and queue statistics for one pipeline stage."""
+
+    name: str
+    workers: int
+    queue_capacity: int
+    items: int = 0
+    busy_seconds: float = 0.0
+    max_queue_depth: int = 0
+
+    def utilization(self, wall_seconds: float) -> float:
+        """Fraction of available worker time spent processing items."""
+        capacity = self.workers * wall_seconds
+        return self.busy_seconds / capacity if capacity > 0 else 0.0
+
+
+@dataclass
+class PipelineStats:
+    """Per-stage statistics for a staged batch run."""
+
+    stages: list[StageStats] = field(default_factory=list)
+    wall_seconds: float = 0.0
+
+    def summary_lines(self) -> list[str]:
+        """Human-readable one-line summary per stage."""
+        return [
+            f"{stage.name}: {stage.items} item(s), {stage.workers} worker(s), "
+            f"{stage.utilization(self.wall_seconds):.0%} busy, "
+            f"queue peak {stage.max_queue_depth}/{stage.queue_capacity}"
+            for stage in self.stages
+        ]
+
+
+def _make_stage(name: str, workers: int) -> tuple[StageStats, asyncio.Queue]:
+    """Create a stage's stats record and its bounded inbox queue."""
+    capacity = workers * BATCH_QUEUE_DEPTH_PER_WORKER
+    return StageStats(name=name, workers=workers, queue_capacity=capacity), asyncio.Queue(capacity)
+
+
+async def _put(queue: asyncio.Queue, item: object, stats: StageStats) -> None:
+    """Enqueue an item and record the stage's peak inbox depth."""
+    await queue.put(item)
+    stats.max_queue_depth = max(stats.max_queue_depth, queue.qsize())
+
+
+async def _run_stage(
+    stats: StageStats,
+    inbox: asyncio.Queue,
+    handler: Callable[[tuple], Awaitable[tuple | None]],
+    on_error: Callable[[Path, BaseException], None],
+    stop: asyncio.Event,
+    downstream: tuple[StageStats, asyncio.Queue] | None = None,
+) -> None:
+    """Run a stage's workers until the inbox is drained, then signal downstream."""
+
+    async def worker() -> None:
+        while True:
+            item = await inbox.get()
+            if item is _DONE:
+                return
+            if stop.is_set():
+                continue  # fail_fast: drain without processing
+            started = time.perf_counter()
+            try:
+                output = await handler(item)
+            except Exception as exc:
+                on_error(item[0], exc)
+                continue
+            finally:
+                stats.busy_seconds += time.perf_counter() - started
+                stats.items += 1
+            if downstream is not None:
+                await _put(downstream[1], output, downstream[0])
+
+    await asyncio.gather(*(worker() for _ in range(stats.workers)))
+    if downstream is not None:
+        for _ in range(downstream[0].workers):
+            await downstream[1].put(_DONE)
+
+
+async def run_staged_batch(
+    files: list[Path],
+    output_dir: Path | None,
+    *,
+    batch_root: Path | None,
+    force: bool,
+    clean: bool,
+    summary: bool,
+    images: bool,
+    sanitize: bool,
+    fail_fast: bool,
+    extract_workers: int,
+    llm_workers: int,
+    use_cache: bool,
+    timeout: float | None = None,
+    ocr: "OcrSettings | None" = None,
+) -> BatchResult:
+    """Convert files through bounded extract, LLM, and write stages.
+
+    Args:
+        extract_workers: Concurrent extractions (0 = one per CPU core).
+        llm_workers: Files concurrently in the LLM stage (clean/images/summary).
+        timeout: Per-file extraction deadline; each extract worker then owns a
+            watchdog child process that is killed when a file overruns it.
+        ocr: OCR workers, threads, and DPI for pages that need OCR.
+
+    Returns:
+        BatchResult with pipeline_stats populated.
+    """
+    from to_markdown.core.atomic_write import sync_batch_outputs
+    from to_markdown.core.batch import _record_cache_lookups
+    from to_markdown.core.cache_lookups import counting_lookups
+    from to_markdown.core.sniffing import partition_convertible
+
+    files, unsupported = partition_convertible(files)
+    result = BatchResult(skipped=unsupported)
+    stop = asyncio.Event()
+
+    extract_stats, extract_queue = _make_stage("extract", resolve_jobs(extract_workers))
+    llm_stats, llm_queue = _make_stage("llm", max(llm_workers, 1))
+    write_stats, write_queue = _make_stage("write", BATCH_WRITE_WORKERS)
+
+    def on_error(file_path: Path, exc: BaseException) -> None:
+        if _record_error(result, file_path, exc) and fail_fast:
+            stop.set()
+
+    async def feed() -> None:
+        for file_path in files:
+            if stop.is_set():
+                break
+            out = None
+            if output_dir is not None:
+                out = _resolve_batch_output(file_path, output_dir, batch_root)
+            input_path = file_path.resolve()
+            resolved = _resolve_output_path(input_path, out)
+            try:
+                check_output_available(resolved, force=force)
+            except Exception as exc:
+                on_error(file_path, exc)
+                continue
+            await _put(extract_queue, (file_path, input_path, resolved), extract_stats)
+        for _ in range(extract_stats.workers):
+            await extract_queue.put(_DONE)
+
+    watchdogs: asyncio.Queue[ExtractionWatchdog] = asyncio.Queue()
+    if timeout is not None:
+        for _ in range(extract_stats.workers):
+            watchdogs.put_nowait(ExtractionWatchdog(timeout))
+
+    async def extract(item: tuple) -> tuple:
+        file_path, input_path, resolved = item
+        raw = None
+        if timeout is not None:
+            watchdog = await watchdogs.get()
+            try:
+                raw = await asyncio.to_thread(
+                    watchdog.extract,
+                    input_path,
+                    extract_images=images,
+                    use_cache=use_cache,
+                    ocr=ocr,
+                )
+            finally:
+                watchdogs.put_nowait(watchdog)
+        extracted = await extract_content_async(
+            input_path,
+            images=images,
+            sanitize=sanitize,
+            use_cache=use_cache,
+            extracted=raw,
+            ocr=ocr,
+        )
+        return file_path, resolved, extracted
+
+    async def enrich(item: tuple) -> tuple:
+        file_path, resolved, extracted = item
+        markdown = await enrich_content_async(
+            extracted, clean=clean, summary=summary, images=images
+        )
+        return file_path, resolved, markdown
+
+    async def write(item: tuple) -> None:
+        file_path, resolved, markdown = item
+        converted = await asyncio.to_thread(write_output, resolved, markdown, force=force)
+        result.succeeded.append(converted)
+        logger.info("Converted: %s", file_path.name)
+
+    started = time.perf_counter()
+    try:
+        with counting_lookups() as lookups:
+            await asyncio.gather(
+                feed(),
+                _run_stage(
+                    extract_stats, extract_queue, extract, on_error, stop, (llm_stats, llm_queue)
+                ),
+                _run_stage(
+                    llm_stats, llm_queue, enrich, on_error, stop, (write_stats, write_queue)
+                ),
+                _run_stage(write_stats, write_queue, write, on_error, stop),
+            )
+    finally:
+        while not watchdogs.empty():
+            watchdogs.get_nowait().close()
+
+    _record_cache_lookups(result, lookups)
+    await asyncio.to_thread(sync_batch_outputs, result.succeeded)
+    result.pipeline_stats = PipelineStats(
+        stages=[extract_stats, llm_stats, write_stats],
+        wall_seconds=time.perf_counter() - started,
+    )
+    for line in result.pipeline_stats.summary_lines():
+        logger.info("Pipeline %s", line)
+    return result
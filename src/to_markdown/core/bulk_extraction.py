@@ -0,0 +1,190 @@
+"""Bulk extraction: many files per Kreuzberg batch call, and batch-loop prefetching."""
+
+import contextlib
+import logging
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from kreuzberg import batch_extract_files_sync
+from kreuzberg.exceptions import KreuzbergError
+
+from to_markdown.core.constants import (
+    BULK_EXTRACTION_WINDOW,
+    BULK_EXTRACTION_WINDOW_BYTES,
+    KREUZBERG_BATCH_ERROR_PREFIX,
+)
+from to_markdown.core.extraction import (
+    ExtractionResult,
+    _build_config,
+    _cache_lookup,
+    _cache_store,
+    _finish,
+    _is_pdf,
+)
+
+if TYPE_CHECKING:
+    from to_markdown.core.ocr_settings import OcrSettings
+
+logger = logging.getLogger(__name__)
+
+
+def extract_files(
+    paths: Sequence[Path],
+    *,
+    extract_images: bool = False,
+    use_cache: bool = True,
+    ocr: "OcrSettings | None" = None,
+) -> list[ExtractionResult | None]:
+    """Extract several files with Kreuzberg's batch API.
+
+    Cached results are served without re-extraction; the rest go to one batch call
+    per config (PDFs need per-page output). Returns one entry per path, in order.
+    An entry is None when that file could not be extracted in bulk (missing file,
+    unsupported format, parse error): callers fall back to extract_file() for it,
+    which raises the matching typed error.
+
+    Args:
+        paths: Files to extract.
+        extract_images: If True, also extract images from each document.
+        use_cache: If False, bypass the extraction cache (neither read nor write).
+        ocr: OCR workers, threads, and DPI for pages that need OCR.
+    """
+    results: list[ExtractionResult | None] = [None] * len(paths)
+    keys: dict[int, str | None] = {}
+    pending: dict[bool, list[int]] = {}
+    for index, file_path in enumerate(paths):
+        path = Path(file_path)
+        if not path.is_file():
+            continue
+        try:
+            keys[index], results[index] = _cache_lookup(
+                path, extract_images=extract_images, use_cache=use_cache, ocr=ocr
+            )
+        except OSError as exc:
+            logger.debug("Cache lookup failed for %s: %s", path.name, exc)
+            continue
+        if results[index] is None:
+            pending.setdefault(_is_pdf(path), []).append(index)
+
+    for is_pdf, indexes in pending.items():
+        config = _build_config(is_pdf=is_pdf, extract_images=extract_images)
+        try:
+            raws = batch_extract_files_sync([str(paths[i]) for i in indexes], config)
+        except KreuzbergError as exc:
+            logger.warning("Batch extraction failed, extracting per file: %s", exc)
+            continue
+        for index, raw in zip(indexes, raws, strict=True):
+            if _is_failed(raw):
+                continue
+            path = Path(paths[index])
+            result = _finish(path, raw, extract_images=extract_images, use_cache=use_cache, ocr=ocr)
+            _cache_store(keys[index], result)
+            results[index] = result
+
+    logger.info("Bulk-extracted %d of %d file(s)", sum(r is not None for r in results), len(paths))
+    return results
+
+
+def prefetch_extractions(
+    files: list[Path],
+    outputs: list[Path | None],
+    *,
+    images: bool,
+    use_cache: bool,
+    force: bool,
+    timeout: float | None = None,
+    ocr: "OcrSettings | None" = None,
+    bulk: bool = True,
+) -> Iterator[ExtractionResult | Exception | None]:
+    """Yield each file's extraction ahead of its conversion, in file order.
+
+    Without a timeout, files are extracted through Kreuzberg's batch API in windows
+    of up to BULK_EXTRACTION_WINDOW files and BULK_EXTRACTION_WINDOW_BYTES source
+    bytes (None = extract per file). With one, each file is extracted in a watchdog
+    child process and its error, e.g. ExtractionTimeoutError, is yielded in place of
+    a result. Files whose output already exists yield None unextracted.
+
+    Args:
+        bulk: If False, nothing is extracted ahead: without a timeout every file
+            yields None. For --stream (whole results held in memory would defeat
+            it) and --fail-fast (files after a failure would be extracted for nothing).
+    """
+    from to_markdown.core.pipeline import _resolve_output_path
+
+    wanted = [
+        force or not _resolve_output_path(path.resolve(), out).exists()
+        for path, out in zip(files, outputs, strict=True)
+    ]
+    if timeout is not None:
+        yield from _watchdog_extractions(files, wanted, images, use_cache, timeout, ocr)
+        return
+
+    if not bulk:
+        yield from (None for _ in files)
+        return
+
+    for window in _windows(files, wanted):
+        indexes = [i for i in window if wanted[i]]
+        extracted = extract_files(
+            [files[i].resolve() for i in indexes],
+            extract_images=images,
+            use_cache=use_cache,
+            ocr=ocr,
+        )
+        by_index = dict(zip(indexes, extracted, strict=True))
+        for i in window:
+            yield by_index.get(i)
+
+
+def _windows(files: list[Path], wanted: list[bool]) -> Iterator[range]:
+    """Consecutive index ranges whose wanted files fit one bulk extraction window.
+
+    A file larger than BULK_EXTRACTION_WINDOW_BYTES gets a window of its own.
+    """
+    start, count, size = 0, 0, 0
+    for index, path in enumerate(files):
+        if not wanted[index]:
+            continue
+        file_size = 0
+        # Missing files are reported by the per-file fallback
+        with contextlib.suppress(OSError):
+            file_size = path.stat().st_size
+        if count and (
+            count >= BULK_EXTRACTION_WINDOW or size + file_size > BULK_EXTRACTION_WINDOW_BYTES
+        ):
+            yield range(start, index)
+            start, count, size = index, 0, 0
+        count += 1
+        size += file_size
+    if start < len(files):
+        yield range(start, len(files))
+
+
+def _watchdog_extractions(
+    files: list[Path],
+    wanted: list[bool],
+    images: bool,
+    use_cache: bool,
+    timeout: float,
+    ocr: "OcrSettings | None",
+) -> Iterator[ExtractionResult | Exception | None]:
+    from to_markdown.core.watchdog import ExtractionWatchdog
+
+    with ExtractionWatchdog(timeout) as watchdog:
+        for path, extract in zip(files, wanted, strict=True):
+            if not extract:
+                yield None
+                continue
+            try:
+                yield watchdog.extract(
+                    path.resolve(), extract_images=images, use_cache=use_cache, ocr=ocr
+                )
+            except Exception as exc:
+                yield exc
+
+
+def _is_failed(raw: object) -> bool:
+    """Kreuzberg reports per-file batch failures as an error string, not an exception."""
+    metadata = raw.metadata if isinstance(raw.metadata, dict) else {}
+    return not metadata and raw.content.startswith(KREUZBERG_BATCH_ERROR_PREFIX)
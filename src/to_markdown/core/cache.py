@@ -0,0 +1,62 @@
+"""Content-addressed on-disk extraction cache (SQLite, safe across processes).
+
+The store itself is ExtractionCache (core/cache_db.py). This module holds the
+process-wide instance in the data directory and the helpers callers use.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from to_markdown.core.cache_db import CACHE_ERRORS, ExtractionCache  # noqa: F401
+from to_markdown.core.cache_keys import cache_key
+from to_markdown.core.constants import CACHE_DB_FILENAME, DATA_DIR_ENV, TASK_STORE_DIR
+
+if TYPE_CHECKING:
+    from to_markdown.core.extraction import ExtractionResult
+
+logger = logging.getLogger(__name__)
+
+
+def lookup_extraction(
+    path: Path, *, extract_images: bool, **ocr_settings: object
+) -> tuple[str, "ExtractionResult | None"]:
+    """Return (cache key, cached result or None) for extracting path with these settings."""
+    key = cache_key(path, extract_images=extract_images, force_ocr=False, **ocr_settings)
+    cached = get_default_cache().get(key)
+    if cached is not None:
+        logger.info("Extraction cache hit: %s", path.name)
+    return key, cached
+
+
+def warn_cache_unavailable(exc: BaseException) -> None:
+    """Report a cache failure; the caller goes on uncached. Warns once per process."""
+    global _warned_unavailable
+    if _warned_unavailable:
+        logger.debug("Cache unavailable: %s", exc)
+        return
+    _warned_unavailable = True
+    logger.warning("Cache unavailable, continuing without it: %s", exc)
+
+
+def _default_cache_path() -> Path:
+    data_dir = os.environ.get(DATA_DIR_ENV)
+    base = Path(data_dir) if data_dir else Path(TASK_STORE_DIR).expanduser()
+    return base / CACHE_DB_FILENAME
+
+
+# Module-level singleton, re-created if the data directory changes
+_default_cache: ExtractionCache | None = None
+_warned_unavailable = False
+
+
+def get_default_cache() -> ExtractionCache:
+    """Get or create the default ExtractionCache in the to-markdown data directory."""
+    global _default_cache
+    path = _default_cache_path()
+    if _default_cache is None or _default_cache.db_path != path:
+        if _default_cache is not None:
+            _default_cache.close()
+        _default_cache = ExtractionCache(path)
+    return _default_cache
@@ -0,0 +1,293 @@
+"""SQLite store behind the on-disk cache: size-bounded LRU entries and hit counters."""
+
+import base64
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from to_markdown.core.cache_lookups import record_lookup
+from to_markdown.core.constants import (
+    CACHE_ACCESS_FLUSH_LOOKUPS,
+    CACHE_ACCESS_FLUSH_SECONDS,
+    CACHE_BUSY_TIMEOUT_SECONDS,
+    CACHE_EVICT_TARGET_RATIO,
+    CACHE_MAX_BYTES,
+)
+
+if TYPE_CHECKING:
+    from to_markdown.core.extraction import ExtractionResult
+
+logger = logging.getLogger(__name__)
+
+_CREATE_TABLES_SQL = (
+    """\
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    payload BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+)""",
+    "CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)",
+    "CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)",
+)
+
+_OUTCOMES = ("hits", "misses")  # Counter suffixes, per entry kind
+_TOTAL_BYTES = "bytes"  # Counter holding SUM(size), so puts never scan the table
+
+# Raised by an unusable cache (bad data directory, read-only disk, lock timeout).
+# Callers catch these, report them with warn_cache_unavailable(), and run uncached.
+CACHE_ERRORS = (sqlite3.Error, OSError)
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of cache size and hit/miss counters."""
+
+    entries: int
+    size_bytes: int
+    hits: int
+    misses: int
+    ocr_hits: int = 0
+    ocr_misses: int = 0
+    llm_hits: int = 0
+    llm_misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 when unused)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def ocr_hit_rate(self) -> float:
+        """Fraction of page-image OCR lookups served from the cache (0.0 when unused)."""
+        lookups = self.ocr_hits + self.ocr_misses
+        return self.ocr_hits / lookups if lookups else 0.0
+
+    @property
+    def llm_hit_rate(self) -> float:
+        """Fraction of LLM calls served from the cache (0.0 when unused)."""
+        lookups = self.llm_hits + self.llm_misses
+        return self.llm_hits / lookups if lookups else 0.0
+
+
+class ExtractionCache:
+    """Size-bounded LRU cache of serialized extraction results.
+
+    Entries are keyed by a hash of the source file bytes plus the effective
+    extraction settings, so renamed or moved files still hit and edited files miss.
+    OCR text for individual page images and LLM responses share the table and its
+    size bound, keyed by a hash of their inputs (see ocr_cache_key() and
+    smart/response_cache.py). SQLite in WAL mode serializes concurrent writers
+    from several processes.
+
+    A hit only reads. Its LRU refresh and the hit/miss counts are written in
+    batches (on the next put, every CACHE_ACCESS_FLUSH_LOOKUPS lookups, or after
+    CACHE_ACCESS_FLUSH_SECONDS), so parallel workers do not queue for the write
+    lock on every lookup. These writes are best effort.
+    """
+
+    def __init__(self, db_path: Path, *, max_bytes: int = CACHE_MAX_BYTES) -> None:
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._touched: dict[str, float] = {}  # Unwritten LRU refreshes
+        self._counts: Counter[str] = Counter()  # Unwritten hit/miss counts
+        self._flushed = time.monotonic()
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(db_path), timeout=CACHE_BUSY_TIMEOUT_SECONDS, check_same_thread=False
+        )
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            for statement in _CREATE_TABLES_SQL:
+                self._conn.execute(statement)
+            # One scan to seed the running total in a cache from an older version
+            self._conn.execute(
+                "INSERT OR IGNORE INTO counters (name, value) "
+                "SELECT ?, COALESCE(SUM(size), 0) FROM entries",
+                (_TOTAL_BYTES,),
+            )
+            self._conn.commit()
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+
+    def get(self, key: str) -> "ExtractionResult | None":
+        """Return the cached result for key (refreshing its LRU position), or None."""
+        payload = self._lookup(key, "")
+        return _deserialize(payload) if payload is not None else None
+
+    def put(self, key: str, result: "ExtractionResult") -> None:
+        """Store a result, evicting least-recently-used entries over the size bound."""
+        self._store(key, _serialize(result))
+
+    def get_ocr_text(self, key: str) -> str | None:
+        """Return cached OCR text for a page image key, or None (counted separately)."""
+        payload = self._lookup(key, "ocr_")
+        return payload.decode("utf-8") if payload is not None else None
+
+    def put_ocr_text(self, key: str, text: str) -> None:
+        """Store OCR text for a page image key."""
+        self._store(key, text.encode("utf-8"))
+
+    def get_llm_response(self, key: str, *, max_age: float) -> str | None:
+        """Return an LLM response stored under key at most max_age seconds ago, or None.
+
+        Expired responses are deleted and count as misses (counted separately).
+        """
+        payload = self._lookup(key, "llm_", max_age=max_age)
+        return json.loads(payload)["text"] if payload is not None else None
+
+    def put_llm_response(self, key: str, text: str) -> None:
+        """Store an LLM response, stamped with the time for get_llm_response()."""
+        self._store(key, json.dumps({"created": time.time(), "text": text}).encode("utf-8"))
+
+    def stats(self) -> CacheStats:
+        """Return current entry count, total payload size, and hit/miss counters."""
+        with self._lock:
+            self._flush_accesses()
+            (entries,) = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+            counters = dict(self._conn.execute("SELECT name, value FROM counters").fetchall())
+        names = [f"{kind}{outcome}" for kind in ("", "ocr_", "llm_") for outcome in _OUTCOMES]
+        size = counters.get(_TOTAL_BYTES, 0)
+        return CacheStats(entries, size, **{name: counters.get(name, 0) for name in names})
+
+    def clear(self) -> int:
+        """Remove all entries and reset counters. Returns the number of entries removed."""
+        with self._lock, self._conn:
+            self._touched.clear()
+            self._counts.clear()
+            removed = self._conn.execute("DELETE FROM entries").rowcount
+            self._conn.execute("DELETE FROM counters")
+        self._conn.execute("VACUUM")
+        return removed
+
+    def close(self) -> None:
+        """Write pending access stats and close the database connection."""
+        with self._lock:
+            self._flush_accesses()
+        self._conn.close()
+
+    def _lookup(self, key: str, kind: str, *, max_age: float | None = None) -> bytes | None:
+        """Fetch a payload; queue its LRU refresh and the {kind}hits/misses count."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT payload FROM entries WHERE key = ?", (key,)).fetchone()
+            if row and max_age is not None and now - json.loads(row[0])["created"] > max_age:
+                with self._conn:
+                    self._remove([key])
+                row = None
+            outcome = f"{kind}{'misses' if row is None else 'hits'}"
+            self._counts[outcome] += 1
+            record_lookup(outcome)
+            if row is not None:
+                self._touched[key] = now
+            if (
+                sum(self._counts.values()) >= CACHE_ACCESS_FLUSH_LOOKUPS
+                or time.monotonic() - self._flushed >= CACHE_ACCESS_FLUSH_SECONDS
+            ):
+                self._flush_accesses()
+        return row[0] if row is not None else None
+
+    def _store(self, key: str, payload: bytes) -> None:
+        if len(payload) > self.max_bytes:
+            logger.debug("Not caching %d-byte entry (exceeds cache size)", len(payload))
+            return
+        with self._lock:
+            self._flush_accesses()
+            with self._conn:
+                self._remove([key])
+                self._conn.execute(
+                    "INSERT INTO entries (key, payload, size, last_access) VALUES (?, ?, ?, ?)",
+                    (key, payload, len(payload), time.time()),
+                )
+                self._bump(_TOTAL_BYTES, len(payload))
+                self._evict()
+
+    def _flush_accesses(self) -> None:
+        """Write queued LRU refreshes and hit/miss counts (lock held; failures dropped)."""
+        touched, counts = self._touched, self._counts
+        self._touched, self._counts = {}, Counter()
+        self._flushed = time.monotonic()
+        if not counts:
+            return
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    "UPDATE entries SET last_access = MAX(last_access, ?) WHERE key = ?",
+                    [(accessed, key) for key, accessed in touched.items()],
+                )
+                for name, value in counts.items():
+                    self._bump(name, value)
+        except sqlite3.Error as exc:
+            logger.debug("Cache access stats not written: %s", exc)
+
+    def _bump(self, counter: str, delta: int = 1) -> None:
+        self._conn.execute(
+            "INSERT INTO counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (counter, delta),
+        )
+
+    def _remove(self, keys: list[str]) -> None:
+        """Delete entries (inside a transaction), keeping the running total in step."""
+        freed = 0
+        for key in keys:
+            row = self._conn.execute(
+                "DELETE FROM entries WHERE key = ? RETURNING size", (key,)
+            ).fetchone()
+            freed += row[0] if row else 0
+        if freed:
+            self._bump(_TOTAL_BYTES, -freed)
+
+    def _evict(self) -> None:
+        """Delete oldest entries until the running total is under the eviction target."""
+        total = self._conn.execute(
+            "SELECT value FROM counters WHERE name = ?", (_TOTAL_BYTES,)
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        target = int(self.max_bytes * CACHE_EVICT_TARGET_RATIO)
+        cursor = self._conn.execute("SELECT key, size FROM entries ORDER BY last_access ASC")
+        doomed: list[str] = []
+        for key, size in cursor.fetchall():
+            if total <= target:
+                break
+            doomed.append(key)
+            total -= size
+        self._remove(doomed)
+        logger.debug("Evicted %d cache entries", len(doomed))
+
+
+def _serialize(result: "ExtractionResult") -> bytes:
+    images = [
+        {**image, "data": base64.b64encode(image.get("data") or b"").decode("ascii")}
+        for image in result.images
+    ]
+    data = {
+        "content": result.content,
+        "metadata": result.metadata,
+        "tables": result.tables,
+        "images": images,
+    }
+    return json.dumps(data, default=str).encode("utf-8")
+
+
+def _deserialize(payload: bytes) -> "ExtractionResult":
+    from to_markdown.core.extraction import ExtractionResult
+
+    data = json.loads(payload)
+    images = [{**image, "data": base64.b64decode(image["data"])} for image in data["images"]]
+    return ExtractionResult(
+        content=data["content"],
+        metadata=data["metadata"],
+        tables=data["tables"],
+        images=images,
+    )
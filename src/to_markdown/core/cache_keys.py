@@ -0,0 +1,34 @@
+"""Cache keys: content hashes of source files and page images plus their settings."""
+
+import hashlib
+from pathlib import Path
+
+from to_markdown.core.constants import CACHE_HASH_BLOCK_SIZE, CACHE_SCHEMA_VERSION
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 of a file's bytes, read in blocks."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while block := f.read(CACHE_HASH_BLOCK_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def cache_key(path: Path, **settings: object) -> str:
+    """Build a cache key from file content and the settings that affect extraction."""
+    from kreuzberg import __version__ as kreuzberg_version
+
+    parts = [f"v{CACHE_SCHEMA_VERSION}", f"kreuzberg={kreuzberg_version}", file_digest(path)]
+    parts.extend(f"{name}={settings[name]}" for name in sorted(settings))
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+
+def ocr_cache_key(image: bytes, **settings: object) -> str:
+    """Build a cache key from page image bytes and the settings that affect OCR."""
+    from kreuzberg import __version__ as kreuzberg_version
+
+    parts = [f"ocr-v{CACHE_SCHEMA_VERSION}", f"kreuzberg={kreuzberg_version}"]
+    parts.append(hashlib.sha256(image).hexdigest())
+    parts.extend(f"{name}={settings[name]}" for name in sorted(settings))
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
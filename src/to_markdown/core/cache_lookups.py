@@ -0,0 +1,43 @@
+"""Per-run counts of cache lookups, for the batch "N of M reused" summary.
+
+The cache database keeps lifetime counters shared by every process on the
+machine, so diffing them would also count other batches, background tasks, or
+an MCP server working at the same time. Instead, counting_lookups() collects the
+lookups made in its own context: the threads and asyncio tasks it starts inherit
+the counter. Work done in child processes (--jobs workers, parallel page OCR,
+the --timeout watchdog child) counts its own lookups and hands them back with
+its result, where merge_lookups() adds them to the parent's counter.
+"""
+
+import threading
+from collections import Counter
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_counts: ContextVar["Counter[str] | None"] = ContextVar("cache_lookups", default=None)
+_lock = threading.Lock()  # Threads of one run share its counter
+
+
+@contextmanager
+def counting_lookups() -> Iterator["Counter[str]"]:
+    """Count cache lookups (e.g. "ocr_hits", "llm_misses") made within the block."""
+    counts: Counter[str] = Counter()
+    token = _counts.set(counts)
+    try:
+        yield counts
+    finally:
+        _counts.reset(token)
+
+
+def record_lookup(name: str) -> None:
+    """Count one lookup outcome in the current run, if one is counting."""
+    merge_lookups({name: 1})
+
+
+def merge_lookups(counts: Mapping[str, int]) -> None:
+    """Add lookups counted elsewhere (a child process) to the current run."""
+    current = _counts.get()
+    if current is not None and counts:
+        with _lock:
+            current.update(counts)
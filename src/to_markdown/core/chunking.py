@@ -0,0 +1,199 @@
+"""Structure-aware Markdown chunking for per-chunk LLM calls (--clean).
+
+Content is split into blocks at paragraph breaks (see ContentAnalysis). A code
+fence and everything up to its closing fence, blank lines included, stays one
+block. Blocks are packed into chunks of at most a token budget, measured with
+CHARS_PER_TOKEN_ESTIMATE:
+
+- A heading never ends a chunk; it moves to the next chunk with its section.
+- Once a chunk is half full, a new chunk starts at the next heading.
+- An oversized block is split at line boundaries (table rows, list items), then
+  at spaces, and cut mid-word only as a last resort. An oversized code block
+  cannot be split safely, so it is passed through verbatim.
+
+Chunks are spans of the original content. join_chunks() puts each chunk's
+replacement back with the original whitespace between chunks.
+"""
+
+import re
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+
+from to_markdown.core.constants import CHARS_PER_TOKEN_ESTIMATE, PARAGRAPH_SEPARATOR
+from to_markdown.core.content_analysis import find_paragraph_breaks
+
+_FENCE = re.compile(r"^ {0,3}(`{3,}|~{3,})", re.MULTILINE)
+_HEADING = re.compile(r" {0,3}#{1,6}(?:[ \t]|$)", re.MULTILINE)
+
+_CODE = "code"
+_HEADING_KIND = "heading"
+_TEXT = "text"
+
+# Split points for an oversized block, most to least preferred
+_SPLIT_SEPARATORS = ("\n", " ")
+
+
+@dataclass(frozen=True)
+class Chunk:
+    """A span of content sent to the LLM as one unit.
+
+    Attributes:
+        start: Offset of the chunk's first character.
+        end: Offset just past the chunk's last character.
+        verbatim: Pass the chunk through unchanged (an oversized code block).
+    """
+
+    start: int
+    end: int
+    verbatim: bool = False
+
+
+@dataclass(frozen=True)
+class _Block:
+    start: int
+    end: int
+    kind: str
+
+    @property
+    def size(self) -> int:
+        return self.end - self.start
+
+
+def chunk_markdown(
+    content: str, max_tokens: int, paragraph_breaks: tuple[int, ...] | None = None
+) -> list[Chunk]:
+    """Split content into chunks of at most max_tokens estimated tokens.
+
+    Args:
+        content: Markdown content.
+        max_tokens: Token budget per chunk.
+        paragraph_breaks: Precomputed paragraph break offsets for content
+            (from ContentAnalysis); computed if omitted.
+
+    Returns:
+        Non-overlapping chunks in order. Content within budget is one chunk.
+    """
+    max_chars = max_tokens * CHARS_PER_TOKEN_ESTIMATE
+    if len(content) <= max_chars:
+        return [Chunk(0, len(content))]
+    if paragraph_breaks is None:
+        paragraph_breaks = find_paragraph_breaks(content)
+
+    chunks: list[Chunk] = []
+    group: list[_Block] = []
+
+    def flush() -> None:
+        if group:
+            chunks.append(Chunk(group[0].start, group[-1].end))
+            group.clear()
+
+    for block in _blocks(content, paragraph_breaks):
+        if block.size > max_chars:
+            flush()
+            chunks.extend(_split_oversized(content, block, max_chars))
+            continue
+        if group and _starts_new_chunk(group, block, max_chars):
+            carried: list[_Block] = []
+            while len(group) > 1 and group[-1].kind == _HEADING_KIND:
+                carried.insert(0, group.pop())
+            flush()
+            group.extend(carried)
+            if group and block.end - group[0].start > max_chars:
+                flush()
+        group.append(block)
+    flush()
+    return chunks
+
+
+def join_chunks(content: str, chunks: Sequence[Chunk], texts: Sequence[str]) -> str:
+    """Replace each chunk of content with its text, keeping the whitespace between chunks."""
+    parts: list[str] = []
+    position = 0
+    for chunk, text in zip(chunks, texts, strict=True):
+        parts.append(content[position : chunk.start])
+        parts.append(text)
+        position = chunk.end
+    parts.append(content[position:])
+    return "".join(parts)
+
+
+def _starts_new_chunk(group: list[_Block], block: _Block, max_chars: int) -> bool:
+    """Whether block should start a new chunk instead of joining group."""
+    if block.end - group[0].start > max_chars:
+        return True
+    half_full = 2 * (group[-1].end - group[0].start) >= max_chars
+    return half_full and block.kind == _HEADING_KIND and group[-1].kind != _HEADING_KIND
+
+
+def _blocks(content: str, paragraph_breaks: tuple[int, ...]) -> list[_Block]:
+    """Paragraphs of content, with open code fences merged up to their closing fence.
+
+    A fence that is never closed is not treated as a fence.
+    """
+    blocks: list[_Block] = []
+    fence: str | None = None  # Marker of the fence left open so far
+    unmerged: list[_Block] = []  # Paragraphs merged into the open fence's block
+    for start, end in _paragraphs(content, paragraph_breaks):
+        paragraph = _Block(start, end, _kind(content, start))
+        if fence is None:
+            blocks.append(paragraph)
+            unmerged = [paragraph]
+        else:
+            blocks[-1] = _Block(blocks[-1].start, end, _CODE)
+            unmerged.append(paragraph)
+        fence = _scan_fences(content, start, end, fence)
+    if fence is not None:
+        blocks[-1:] = unmerged
+    return blocks
+
+
+def _paragraphs(content: str, paragraph_breaks: tuple[int, ...]) -> Iterator[tuple[int, int]]:
+    """Spans of the non-blank paragraphs, without blank lines left by runs of breaks."""
+    start = 0
+    for end in (*paragraph_breaks, len(content)):
+        while start < end and content[start] == "\n":
+            start += 1
+        if start < end and not content[start:end].isspace():
+            yield start, end
+        start = end + len(PARAGRAPH_SEPARATOR)
+
+
+def _kind(content: str, start: int) -> str:
+    if _FENCE.match(content, start):
+        return _CODE
+    if _HEADING.match(content, start):
+        return _HEADING_KIND
+    return _TEXT
+
+
+def _scan_fences(content: str, start: int, end: int, fence: str | None) -> str | None:
+    """Fence still open after content[start:end], given the one open before it."""
+    for match in _FENCE.finditer(content, start, end):
+        marker = match.group(1)
+        if fence is None:
+            fence = marker
+        elif marker[0] == fence[0] and len(marker) >= len(fence):
+            fence = None
+    return fence
+
+
+def _split_oversized(content: str, block: _Block, max_chars: int) -> list[Chunk]:
+    """Split a block larger than max_chars at the most preferred separators."""
+    if block.kind == _CODE:
+        return [Chunk(block.start, block.end, verbatim=True)]
+    chunks: list[Chunk] = []
+    start = block.start
+    while block.end - start > max_chars:
+        limit = start + max_chars
+        for separator in _SPLIT_SEPARATORS:
+            cut = content.rfind(separator, start + 1, limit + 1)
+            if cut != -1:
+                chunks.append(Chunk(start, cut))
+                start = cut + len(separator)
+                break
+        else:
+            chunks.append(Chunk(start, limit))
+            start = limit
+    if start < block.end:  # A cut just before the end leaves nothing over
+        chunks.append(Chunk(start, block.end))
+    return chunks
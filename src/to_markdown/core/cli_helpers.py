@@ -6,9 +6,19 @@ from typing import TYPE_CHECKING
 
 import typer
 
-from to_markdown.core.constants import APP_NAME, EXIT_ERROR, GEMINI_API_KEY_ENV
+from to_markdown.core.constants import (
+    APP_NAME,
+    BYTES_PER_MEBIBYTE,
+    EXIT_ERROR,
+    EXIT_SUCCESS,
+    EXTRACTION_TIMEOUT_MIN_SECONDS,
+    GEMINI_API_KEY_ENV,
+    LLM_CACHE_DISABLED,
+    LLM_CACHE_ENV,
+)
 
 if TYPE_CHECKING:
+    from to_markdown.core.ocr_settings import OcrSettings
     from to_markdown.core.tasks import TaskStore
 
 logger = logging.getLogger(APP_NAME)
@@ -32,6 +42,12 @@ def configure_logging(verbose: int, quiet: bool) -> None:
     )
 
 
+def configure_llm_cache(*, enabled: bool) -> None:
+    """Apply --no-llm-cache here and, via the environment, in spawned workers."""
+    if not enabled:
+        os.environ[LLM_CACHE_ENV] = LLM_CACHE_DISABLED
+
+
 def load_dotenv() -> None:
     """Load .env file if python-dotenv is available."""
     try:
@@ -63,8 +79,55 @@ def require_api_key(summary: bool, images: bool) -> None:
         raise typer.Exit(EXIT_ERROR)
 
 
+def validate_timeout(timeout: float | None) -> None:
+    """Reject a --timeout below EXTRACTION_TIMEOUT_MIN_SECONDS."""
+    if timeout is not None and timeout < EXTRACTION_TIMEOUT_MIN_SECONDS:
+        logger.error("--timeout must be at least %d second(s)", EXTRACTION_TIMEOUT_MIN_SECONDS)
+        raise typer.Exit(EXIT_ERROR)
+
+
+def build_ocr_settings(
+    workers: int | None, threads: int | None, dpi: int | None
+) -> "OcrSettings | None":
+    """Validate --ocr-* flags and cap OCR threads for this run (None = all defaults).
+
+    The thread cap is applied before any extraction, so it also covers OCR in this
+    process and in every process it spawns.
+    """
+    from to_markdown.core.ocr_settings import OcrSettings, apply_ocr_threads
+
+    try:
+        settings = OcrSettings.from_options(workers, threads, dpi)
+    except ValueError as exc:
+        logger.error("%s", exc)
+        raise typer.Exit(EXIT_ERROR) from exc
+    apply_ocr_threads(threads)
+    return settings
+
+
 def get_store() -> "TaskStore":
     """Get the default TaskStore (lazy import)."""
     from to_markdown.core.background import get_store
 
     return get_store()
+
+
+def handle_cache_flags(*, clear: bool, stats: bool) -> None:
+    """Handle --clear-cache and --cache-stats (early exit)."""
+    from to_markdown.core.cache import get_default_cache
+
+    cache = get_default_cache()
+    if clear:
+        removed = cache.clear()
+        typer.echo(f"Cleared {removed} cached extraction(s).")
+    if stats:
+        current = cache.stats()
+        typer.echo(f"Cache:    {cache.db_path}")
+        typer.echo(f"Entries:  {current.entries}")
+        typer.echo(f"Size:     {current.size_bytes / BYTES_PER_MEBIBYTE:.1f} MiB")
+        typer.echo(f"Hits:     {current.hits}")
+        typer.echo(f"Misses:   {current.misses}")
+        typer.echo(f"Hit rate: {current.hit_rate:.1%}")
+        typer.echo(f"OCR hits: {current.ocr_hits} ({current.ocr_hit_rate:.1%})")
+        typer.echo(f"LLM hits: {current.llm_hits} ({current.llm_hit_rate:.1%})")
+    raise typer.Exit(EXIT_SUCCESS)
@@ -0,0 +1,223 @@
+"""Typer option declarations extracted from cli.py to stay under the 300-line limit."""
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from to_markdown import __version__
+from to_markdown.core.constants import APP_NAME, BATCH_JOBS_AUTO, EXIT_SUCCESS
+
+
+def _version_callback(value: bool) -> None:
+    if value:
+        typer.echo(f"{APP_NAME} {__version__}")
+        raise typer.Exit(EXIT_SUCCESS)
+
+
+# --- Conversion ---
+SetupOption = Annotated[
+    bool,
+    typer.Option("--setup", help="Run interactive configuration wizard."),
+]
+OutputOption = Annotated[
+    Path | None,
+    typer.Option("--output", "-o", help="Output path (file or directory)."),
+]
+ForceOption = Annotated[
+    bool,
+    typer.Option("--force", "-f", help="Overwrite existing output file."),
+]
+CleanOption = Annotated[
+    bool,
+    typer.Option(
+        "--clean",
+        "-c",
+        help="Fix extraction artifacts via LLM (enabled by default when GEMINI_API_KEY is set).",
+    ),
+]
+SummaryOption = Annotated[
+    bool,
+    typer.Option(
+        "--summary",
+        "-s",
+        help="Generate document summary via LLM (requires GEMINI_API_KEY).",
+    ),
+]
+ImagesOption = Annotated[
+    bool,
+    typer.Option(
+        "--images",
+        "-i",
+        help="Describe images via LLM vision (requires GEMINI_API_KEY).",
+    ),
+]
+NoCleanOption = Annotated[
+    bool,
+    typer.Option(
+        "--no-clean",
+        help="Disable automatic content cleaning (clean is on by default with API key).",
+    ),
+]
+NoSanitizeOption = Annotated[
+    bool,
+    typer.Option(
+        "--no-sanitize",
+        help="Disable prompt injection sanitization.",
+    ),
+]
+StreamOption = Annotated[
+    bool,
+    typer.Option(
+        "--stream",
+        help="Write output chunk by chunk to bound memory (disables LLM features).",
+    ),
+]
+DeterministicOption = Annotated[
+    bool,
+    typer.Option(
+        "--deterministic",
+        help="Record the source hash instead of a timestamp, so unchanged files "
+        "convert to identical output.",
+    ),
+]
+
+# --- Batch processing ---
+NoRecursiveOption = Annotated[
+    bool,
+    typer.Option("--no-recursive", help="Disable recursive directory scanning."),
+]
+IncrementalOption = Annotated[
+    bool,
+    typer.Option(
+        "--incremental",
+        help="Batch: convert only new or changed files, tracked by a manifest in the "
+        "output directory.",
+    ),
+]
+PruneOption = Annotated[
+    bool,
+    typer.Option(
+        "--prune",
+        help="With --incremental: delete outputs whose source file no longer exists.",
+    ),
+]
+FailFastOption = Annotated[
+    bool,
+    typer.Option("--fail-fast", help="Stop batch conversion on first error."),
+]
+JobsOption = Annotated[
+    int,
+    typer.Option(
+        "--jobs",
+        "-j",
+        min=BATCH_JOBS_AUTO,
+        metavar="N",
+        help="Parallel worker processes for batch mode (0 = one per CPU core).",
+    ),
+]
+IncludeOption = Annotated[
+    list[str] | None,
+    typer.Option(
+        "--include",
+        metavar="GLOB",
+        help="Only convert batch files matching this pattern (repeatable).",
+    ),
+]
+ExcludeOption = Annotated[
+    list[str] | None,
+    typer.Option(
+        "--exclude",
+        metavar="GLOB",
+        help="Skip batch files matching this pattern (repeatable).",
+    ),
+]
+
+TimeoutOption = Annotated[
+    float | None,
+    typer.Option(
+        "--timeout",
+        metavar="SECONDS",
+        help="Kill extractions that run longer than this (per file).",
+    ),
+]
+
+# --- OCR tuning ---
+OcrWorkersOption = Annotated[
+    int | None,
+    typer.Option(
+        "--ocr-workers",
+        metavar="N",
+        help="OCR worker processes per PDF (ignored with --jobs or --timeout).",
+    ),
+]
+OcrThreadsOption = Annotated[
+    int | None,
+    typer.Option("--ocr-threads", metavar="N", help="OCR threads per worker process."),
+]
+OcrDpiOption = Annotated[
+    int | None,
+    typer.Option(
+        "--ocr-dpi",
+        metavar="DPI",
+        help=(
+            "Fixed resolution page images are OCR'd at. Default: adaptive, 150 DPI first "
+            "and 300 only for pages with poor OCR; a fixed value disables this."
+        ),
+    ),
+]
+
+# --- Extraction cache ---
+NoCacheOption = Annotated[
+    bool,
+    typer.Option("--no-cache", help="Bypass the on-disk extraction cache."),
+]
+NoLlmCacheOption = Annotated[
+    bool,
+    typer.Option("--no-llm-cache", help="Bypass the on-disk LLM response cache."),
+]
+ClearCacheOption = Annotated[
+    bool,
+    typer.Option("--clear-cache", help="Delete all cached extraction results and exit."),
+]
+CacheStatsOption = Annotated[
+    bool,
+    typer.Option("--cache-stats", help="Show extraction cache size and hit/miss stats."),
+]
+
+# --- Background processing ---
+BackgroundOption = Annotated[
+    bool,
+    typer.Option("--background", "--bg", help="Run conversion in background."),
+]
+StatusOption = Annotated[
+    str | None,
+    typer.Option("--status", help="Show task status (task ID or 'all')."),
+]
+CancelOption = Annotated[
+    str | None,
+    typer.Option("--cancel", help="Cancel a running background task."),
+]
+WorkerOption = Annotated[
+    str | None,
+    typer.Option("--_worker", help="Internal worker flag.", hidden=True),
+]
+
+# --- Output verbosity ---
+VerboseOption = Annotated[
+    int,
+    typer.Option("--verbose", "-v", count=True, help="Increase verbosity (-v or -vv)."),
+]
+QuietOption = Annotated[
+    bool,
+    typer.Option("--quiet", "-q", help="Suppress all non-error output."),
+]
+VersionOption = Annotated[
+    bool,
+    typer.Option(
+        "--version",
+        help="Show version and exit.",
+        callback=_version_callback,
+        is_eager=True,
+    ),
+]
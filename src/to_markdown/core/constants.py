@@ -16,6 +16,29 @@ DEFAULT_OUTPUT_EXTENSION = ".md"
 
 # --- Batch Processing ---
 GLOB_CHARS = frozenset("*?[")
+DEFAULT_BATCH_JOBS = 1  # Serial, in-process conversion
+BATCH_JOBS_AUTO = 0  # --jobs 0: one worker process per CPU core
+BATCH_PROCESS_START_METHOD = "spawn"  # Safe with Rich's refresh thread (no fork)
+BATCH_WRITE_WORKERS = 1  # Async batch writer stage (disk writes are cheap)
+BATCH_QUEUE_DEPTH_PER_WORKER = 2  # Bounded inbox per stage = workers * depth
+OUTPUT_EXISTS_REASON = "Output exists"  # Skip reason prefix when not overwriting
+
+# --- Format Sniffing (batch discovery) ---
+SNIFF_HEAD_BYTES = 16  # Leading bytes read to match magic signatures
+SNIFF_BINARY_SIGNATURES = {  # Magic bytes of non-document binaries, skipped before extraction
+    b"\x7fELF": "ELF binary",
+    b"\xfe\xed\xfa\xce": "Mach-O binary",
+    b"\xfe\xed\xfa\xcf": "Mach-O binary",
+    b"\xce\xfa\xed\xfe": "Mach-O binary",
+    b"\xcf\xfa\xed\xfe": "Mach-O binary",
+    b"\xca\xfe\xba\xbe": "Java class or Mach-O universal binary",
+    b"\x00asm": "WebAssembly module",
+    b"SQLite format 3\x00": "SQLite database",
+}
+
+# --- Extraction Timeout ---
+EXTRACTION_TIMEOUT_MIN_SECONDS = 1  # Smallest --timeout accepted on the command line
+WATCHDOG_KILL_GRACE_SECONDS = 5  # Wait this long for a stopped/killed child to exit
 
 # --- LLM ---
 GEMINI_DEFAULT_MODEL = "gemini-2.5-flash"
@@ -27,11 +50,31 @@ LLM_RETRY_MAX_ATTEMPTS = 5
 LLM_RETRY_MIN_WAIT_SECONDS = 1
 LLM_RETRY_MAX_WAIT_SECONDS = 60
 HTTP_STATUS_RATE_LIMIT = 429  # Retry on 429 from Gemini API
+HTTP_STATUS_SERVICE_UNAVAILABLE = 503  # Overloaded: narrows the LLM concurrency window
+
+# --- LLM Circuit Breaker and Retry Budget (per process) ---
+LLM_CIRCUIT_FAILURE_THRESHOLD = 5  # Consecutive server errors that open the circuit
+LLM_CIRCUIT_COOLDOWN_SECONDS = 30  # Open this long before a probe; doubles per failed probe
+LLM_CIRCUIT_MAX_COOLDOWN_SECONDS = 300
+LLM_RETRY_BUDGET_ENV = "TO_MARKDOWN_LLM_RETRY_BUDGET"  # Seconds of retry backoff; 0 = no cap
+LLM_DEFAULT_RETRY_BUDGET_SECONDS = 300
+LLM_RETRY_BUDGET_REFILL_SECONDS = 3600  # A spent budget refills fully over this long
+
+# --- LLM Rate Limit (shared by all processes using the same data directory) ---
+LLM_RPM_ENV = "TO_MARKDOWN_LLM_RPM"  # Requests per minute; 0 disables the request budget
+LLM_TPM_ENV = "TO_MARKDOWN_LLM_TPM"  # Tokens per minute; 0 disables the token budget
+LLM_DEFAULT_RPM = 1000  # Gemini 2.5 Flash paid tier 1 (free tier: 10)
+LLM_DEFAULT_TPM = 1_000_000  # Gemini 2.5 Flash paid tier 1 (free tier: 250,000)
+LLM_RATE_BURST_SECONDS = 6  # Bucket capacity: this many seconds of budget at once
+LLM_IMAGE_TOKEN_ESTIMATE = 258  # Gemini bills a (small) image as 258 input tokens
+RATE_LIMIT_DB_FILENAME = "ratelimit.db"
 
 # --- LLM Token Limits ---
-MAX_CLEAN_TOKENS = 100_000
+CLEAN_OUTPUT_TOKEN_BUDGET = 8_192  # Target response per clean call: fast, far below the model cap
+CLEAN_CHUNK_TOKENS = CLEAN_OUTPUT_TOKEN_BUDGET * 3 // 4  # Input per chunk; room for added markup
 MAX_SUMMARY_TOKENS = 4_096
 CHARS_PER_TOKEN_ESTIMATE = 4
+PARAGRAPH_SEPARATOR = "\n\n"  # Block boundaries for LLM chunking (see core/chunking.py)
 
 # --- LLM Temperature ---
 CLEAN_TEMPERATURE = 0.1
@@ -73,6 +116,7 @@ Note: OCR-based formats (images, scanned PDFs) require Tesseract to be installed
 # --- Background Processing ---
 TASK_ID_LENGTH = 8  # First N hex chars of UUID4
 TASK_STORE_DIR = "~/.to-markdown"
+DATA_DIR_ENV = "TO_MARKDOWN_DATA_DIR"  # Overrides TASK_STORE_DIR (tasks + caches)
 TASK_DB_FILENAME = "tasks.db"
 TASK_LOG_DIR = "logs"
 TASK_RETENTION_HOURS = 24
@@ -219,6 +263,135 @@ SANITIZE_DIRECTIONAL_CHARS = frozenset(
 # --- OCR Fallback ---
 OCR_QUALITY_THRESHOLD = 0.3  # Below this quality score, retry with force_ocr
 OCR_MIN_CONTENT_LENGTH = 50  # Below this char count, retry with force_ocr
+OCR_MIN_PAGE_CONTENT_LENGTH = 20  # Below this char count, a PDF page is OCR'd
+OCR_MAX_GARBLED_RATIO = 0.1  # Above this unreadable-glyph ratio, a page's text is garbled
+OCR_PAGE_SEPARATOR = "\n\n"  # Joins page texts when OCR'd pages are merged back in
+OCR_THREADS_ENV = "RAYON_NUM_THREADS"  # Sizes Kreuzberg's OCR thread pool (read at pool start)
+OCR_MIN_DPI = 72  # Smallest --ocr-dpi accepted
+OCR_MAX_DPI = 1200  # Largest --ocr-dpi accepted (Tesseract gains nothing beyond this)
+# Without --ocr-dpi, OCR runs at the first DPI and escalates to the next only for output
+# whose quality score is below OCR_QUALITY_THRESHOLD or whose text is shorter than
+# OCR_MIN_PAGE_CONTENT_LENGTH; most clean scans never pay for the high-DPI pass
+OCR_ADAPTIVE_DPI_TIERS: tuple[int, ...] = (150, 300)
+
+# Embedded PDF image filters that OCR can read directly, mapped to MIME type
+OCR_IMAGE_MIME_TYPES: dict[str, str] = {
+    "DCTDecode": "image/jpeg",
+    "JPXDecode": "image/jp2",
+    "jpeg": "image/jpeg",
+    "jpg": "image/jpeg",
+    "png": "image/png",
+    "tiff": "image/tiff",
+}
+OCR_RAW_IMAGE_FORMAT = "FlateDecode"  # Raw pixel data, re-encoded as PNG before OCR
+
+# PDF colorspace -> (PNG color type, channels) for re-encoding raw 8-bit pixel data
+OCR_PNG_COLOR_TYPES: dict[str, tuple[int, int]] = {
+    "DeviceGray": (0, 1),
+    "DeviceRGB": (2, 3),
+}
+
+# --- Large PDF Parallel OCR ---
+LARGE_PDF_PAGES_ENV = "TO_MARKDOWN_LARGE_PDF_PAGES"
+LARGE_PDF_BYTES_ENV = "TO_MARKDOWN_LARGE_PDF_BYTES"
+LARGE_PDF_MIN_PAGES = 100  # At or above this page count, OCR page ranges in parallel
+LARGE_PDF_MIN_BYTES = 50 * 1024 * 1024  # At or above this file size (50 MiB), likewise
+LARGE_PDF_MIN_RANGE_PAGES = 4  # Smallest page range worth shipping to a worker process
+
+# --- Kreuzberg Adapter ---
+KREUZBERG_NATIVE_ASYNC_ENV = "TO_MARKDOWN_KREUZBERG_ASYNC"  # "1" = await Kreuzberg's async API
+KREUZBERG_BATCH_ERROR_PREFIX = "Error: "  # Batch API reports a failed file as content
+BULK_EXTRACTION_WINDOW = 16  # Files per Kreuzberg batch call in serial batch conversion
+BULK_EXTRACTION_WINDOW_BYTES = 64 * 1024 * 1024  # ...and source bytes per call (64 MiB)
+
+# --- Plain-Text Fast Path (no Kreuzberg) ---
+FAST_PATH_TEXT_EXTENSIONS = frozenset({".txt", ".text", ".log"})
+FAST_PATH_MARKDOWN_EXTENSIONS = frozenset({".md", ".markdown"})  # Passed through verbatim
+FAST_PATH_BLOCK_SIZE = 1024 * 1024  # 1 MiB reads while decoding
+FAST_PATH_MAX_BYTES = 50 * 1024 * 1024  # Larger files (e.g. logs) are truncated at 50 MiB
+FAST_PATH_MAX_LINES = 200_000  # ... or at this many lines, whichever comes first
+FAST_PATH_FALLBACK_ENCODING = "cp1252"  # For BOM-less files that are not valid UTF-8
+FAST_PATH_TRUNCATION_NOTICE = "\n\n[Truncated: {name} exceeds the {limit} limit]"
+
+# Source and data files: extension -> language tag of the code fence they are wrapped in
+FAST_PATH_CODE_LANGUAGES: dict[str, str] = {
+    ".py": "python",
+    ".pyi": "python",
+    ".js": "javascript",
+    ".mjs": "javascript",
+    ".jsx": "jsx",
+    ".ts": "typescript",
+    ".tsx": "tsx",
+    ".go": "go",
+    ".rs": "rust",
+    ".java": "java",
+    ".kt": "kotlin",
+    ".swift": "swift",
+    ".c": "c",
+    ".h": "c",
+    ".cpp": "cpp",
+    ".hpp": "cpp",
+    ".cs": "csharp",
+    ".rb": "ruby",
+    ".php": "php",
+    ".sh": "bash",
+    ".bash": "bash",
+    ".ps1": "powershell",
+    ".sql": "sql",
+    ".css": "css",
+    ".scss": "scss",
+    ".csv": "csv",
+    ".tsv": "tsv",
+    ".json": "json",
+    ".jsonl": "json",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".toml": "toml",
+    ".ini": "ini",
+    ".cfg": "ini",
+}
+
+# --- Streaming Output ---
+STREAM_CHUNK_CHARS = 1024 * 1024  # Target chunk size; chunks end on a line break if possible
+
+# --- Incremental Batch ---
+MANIFEST_FILENAME = ".to-markdown-manifest.json"  # Hidden, so discovery never converts it
+MANIFEST_SCHEMA_VERSION = 1  # Bump when the manifest layout changes
+MANIFEST_UNCHANGED_REASON = "Unchanged since last conversion"
+MANIFEST_SOURCE_IS_OUTPUT_REASON = "Output path is the source itself"
+
+# --- Frontmatter ---
+# Words a plain YAML 1.1 scalar would load as bool/null (compared lowercased): quote them
+FRONTMATTER_RESERVED_WORDS = frozenset({"yes", "no", "true", "false", "on", "off", "null"})
+
+# --- Output Writes ---
+OUTPUT_FSYNC_ENV = "TO_MARKDOWN_FSYNC"  # off (default), always (each file), batch (at batch end)
+OUTPUT_FSYNC_MODES = frozenset({"off", "always", "batch"})
+OUTPUT_TEMP_SUFFIX = ".tmp"  # Temp files are ".<name>.<random>.tmp" beside the target
+
+# --- Extraction Cache ---
+CACHE_DB_FILENAME = "cache.db"
+CACHE_SCHEMA_VERSION = 2  # Bump when cached ExtractionResult layout or semantics change
+CACHE_MAX_BYTES = 2 * 1024**3  # 2 GiB of serialized results before LRU eviction
+CACHE_EVICT_TARGET_RATIO = 0.9  # Evict down to 90% of the bound to avoid thrashing
+CACHE_HASH_BLOCK_SIZE = 1024 * 1024  # 1 MiB reads when hashing source files
+CACHE_BUSY_TIMEOUT_SECONDS = 30  # Wait this long for another process's write lock
+CACHE_ACCESS_FLUSH_LOOKUPS = 64  # Write hit LRU refreshes and counts after this many lookups
+CACHE_ACCESS_FLUSH_SECONDS = 5.0  # ...or once this long has passed since the last write
+BYTES_PER_MEBIBYTE = 1024 * 1024
+
+# --- LLM Response Cache (entries in the extraction cache database) ---
+LLM_CACHE_ENV = "TO_MARKDOWN_LLM_CACHE"  # "0" disables (set by --no-llm-cache)
+LLM_CACHE_DISABLED = "0"
+LLM_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60  # Responses older than 30 days are refetched
+LLM_CACHE_SCHEMA_VERSION = 1  # Bump when prompts' cache key inputs change meaning
 
 # --- Parallel LLM ---
-PARALLEL_LLM_MAX_CONCURRENCY = 5
+PARALLEL_LLM_MAX_CONCURRENCY = 5  # Files in the async LLM stage; initial AIMD request window
+
+# --- Adaptive LLM Concurrency (AIMD window on in-flight requests) ---
+LLM_MIN_CONCURRENCY_ENV = "TO_MARKDOWN_LLM_MIN_CONCURRENCY"
+LLM_MAX_CONCURRENCY_ENV = "TO_MARKDOWN_LLM_MAX_CONCURRENCY"
+LLM_DEFAULT_MIN_CONCURRENCY = 1
+LLM_DEFAULT_MAX_CONCURRENCY = 32
+LLM_CONCURRENCY_DECREASE_FACTOR = 0.5  # Window multiplier on a 429 or 503
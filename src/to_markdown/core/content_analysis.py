@@ -0,0 +1,75 @@
+"""One-shot post-extraction analysis: sanitized text plus the statistics derived from it.
+
+Sanitization, hashing, word and token counts, and paragraph boundaries are computed
+once per document, each with a single C-level scan. Chunking, frontmatter, and
+caching then reuse them instead of re-walking the content.
+"""
+
+import hashlib
+from dataclasses import dataclass, field
+
+from to_markdown.core.constants import CHARS_PER_TOKEN_ESTIMATE, PARAGRAPH_SEPARATOR
+
+
+@dataclass(frozen=True)
+class ContentAnalysis:
+    """Sanitized content and its statistics.
+
+    Attributes:
+        content: The content, sanitized if requested.
+        sanitized: Whether sanitization removed any characters.
+        sha256: Hex SHA-256 of the UTF-8 content (dedupe and cache keys).
+        words: Whitespace-separated word count.
+        tokens: Estimated LLM token count (CHARS_PER_TOKEN_ESTIMATE chars per token).
+        paragraph_breaks: Offsets of each PARAGRAPH_SEPARATOR, in order and
+            non-overlapping (the split points of content.split(PARAGRAPH_SEPARATOR)).
+        removed_by_category: Characters sanitization removed, per category.
+    """
+
+    content: str
+    sanitized: bool
+    sha256: str
+    words: int
+    tokens: int
+    paragraph_breaks: tuple[int, ...]
+    removed_by_category: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def is_blank(self) -> bool:
+        """True if the content is empty or whitespace only."""
+        return self.words == 0
+
+
+def analyze_content(content: str, *, sanitize: bool = True) -> ContentAnalysis:
+    """Sanitize content (optionally) and compute its statistics in one step."""
+    removed: dict[str, int] = {}
+    if sanitize:
+        from to_markdown.core.sanitize import sanitize_content
+
+        result = sanitize_content(content)
+        content, removed = result.content, result.removed_by_category
+
+    return ContentAnalysis(
+        content=content,
+        sanitized=bool(removed),
+        sha256=hashlib.sha256(content.encode("utf-8", "surrogatepass")).hexdigest(),
+        words=len(content.split()),
+        tokens=estimate_tokens(content),
+        paragraph_breaks=find_paragraph_breaks(content),
+        removed_by_category=removed,
+    )
+
+
+def estimate_tokens(content: str) -> int:
+    """Estimate the LLM token count of content (rounded up)."""
+    return -(-len(content) // CHARS_PER_TOKEN_ESTIMATE)
+
+
+def find_paragraph_breaks(content: str) -> tuple[int, ...]:
+    """Offsets of each paragraph separator, matching str.split(PARAGRAPH_SEPARATOR)."""
+    breaks = []
+    index = content.find(PARAGRAPH_SEPARATOR)
+    while index != -1:
+        breaks.append(index)
+        index = content.find(PARAGRAPH_SEPARATOR, index + len(PARAGRAPH_SEPARATOR))
+    return tuple(breaks)
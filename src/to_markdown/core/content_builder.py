@@ -2,10 +2,18 @@
 
 import asyncio
 import logging
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from to_markdown.core.extraction import extract_file
-from to_markdown.core.frontmatter import compose_frontmatter
+from to_markdown.core.content_analysis import analyze_content
+from to_markdown.core.event_loop import run_sync
+from to_markdown.core.extraction import ExtractionResult, extract_file_async
+from to_markdown.core.frontmatter import compose_frontmatter, source_digest
+
+if TYPE_CHECKING:
+    from to_markdown.core.content_analysis import ContentAnalysis
+    from to_markdown.core.ocr_settings import OcrSettings
 
 logger = logging.getLogger(__name__)
 
@@ -17,19 +25,29 @@ def build_content(
     summary: bool = False,
     images: bool = False,
     sanitize: bool = True,
+    use_cache: bool = True,
+    extracted: ExtractionResult | None = None,
+    ocr: "OcrSettings | None" = None,
+    deterministic: bool = False,
 ) -> str:
     """Build markdown content via async pipeline with sync boundary.
 
-    Delegates to build_content_async() and runs the event loop here.
-    This is the ONLY place asyncio.run() is called in the pipeline.
+    Delegates to build_content_async() and runs the event loop here, via
+    run_sync(): this is the ONLY sync-to-async boundary in the pipeline. Inside
+    event_loop.persistent_loop() successive calls share one loop (and the LLM
+    client's connections); otherwise each call gets a fresh loop.
     """
-    return asyncio.run(
+    return run_sync(
         build_content_async(
             input_path,
             clean=clean,
             summary=summary,
             images=images,
             sanitize=sanitize,
+            use_cache=use_cache,
+            extracted=extracted,
+            ocr=ocr,
+            deterministic=deterministic,
         )
     )
 
@@ -41,29 +59,96 @@ async def build_content_async(
     summary: bool = False,
     images: bool = False,
     sanitize: bool = True,
+    use_cache: bool = True,
+    extracted: ExtractionResult | None = None,
+    ocr: "OcrSettings | None" = None,
+    deterministic: bool = False,
 ) -> str:
     """Build markdown content with parallel LLM features.
 
     Clean and images run concurrently via asyncio.gather() when both are enabled.
-    Summary runs after clean (depends on cleaned content).
+    Summary runs after clean (depends on cleaned content). A pre-extracted result
+    (e.g. from bulk extraction) skips the extraction step. Deterministic output
+    records the source file hash instead of an extraction timestamp.
     """
-    logger.info("Extracting: %s", input_path.name)
-    result = await asyncio.to_thread(extract_file, input_path, extract_images=images)
+    content = await extract_content_async(
+        input_path,
+        images=images,
+        sanitize=sanitize,
+        use_cache=use_cache,
+        extracted=extracted,
+        ocr=ocr,
+        deterministic=deterministic,
+    )
+    return await enrich_content_async(content, clean=clean, summary=summary, images=images)
 
-    content = result.content
-    format_type = result.metadata.get("format_type", input_path.suffix.lstrip("."))
 
-    # Sanitize (sync, fast -- character-level filtering)
-    sanitized = False
-    if sanitize:
-        from to_markdown.core.sanitize import sanitize_content
+@dataclass(frozen=True)
+class ExtractedContent:
+    """Sanitized extraction output, ready for LLM enrichment and assembly.
+
+    The analysis (hash, word/token counts, paragraph offsets) is computed once at
+    extraction and reused by the LLM stages instead of rescanning the content.
+    """
+
+    content: str
+    format_type: str
+    frontmatter: str
+    images: list[dict] = field(default_factory=list)
+    analysis: "ContentAnalysis | None" = None
+
 
-        sanitize_result = sanitize_content(content)
-        content = sanitize_result.content
-        sanitized = sanitize_result.was_modified
+async def extract_content_async(
+    input_path: Path,
+    *,
+    images: bool = False,
+    sanitize: bool = True,
+    use_cache: bool = True,
+    extracted: ExtractionResult | None = None,
+    ocr: "OcrSettings | None" = None,
+    deterministic: bool = False,
+) -> ExtractedContent:
+    """Run the CPU-bound half of the pipeline: extract, sanitize, compose frontmatter."""
+    result = extracted
+    if result is None:
+        logger.info("Extracting: %s", input_path.name)
+        result = await extract_file_async(
+            input_path, extract_images=images, use_cache=use_cache, ocr=ocr
+        )
+
+    format_type = result.metadata.get("format_type", input_path.suffix.lstrip("."))
+
+    # Sanitize and compute content statistics once (sync, C-level scans)
+    analysis = analyze_content(result.content, sanitize=sanitize)
 
     logger.info("Composing frontmatter")
-    frontmatter = compose_frontmatter(result.metadata, input_path, sanitized=sanitized)
+    frontmatter = compose_frontmatter(
+        result.metadata,
+        input_path,
+        sanitized=analysis.sanitized,
+        words=analysis.words,
+        source_sha256=source_digest(input_path) if deterministic else None,
+    )
+
+    return ExtractedContent(
+        content=analysis.content,
+        format_type=format_type,
+        frontmatter=frontmatter,
+        images=result.images,
+        analysis=analysis,
+    )
+
+
+async def enrich_content_async(
+    extracted: ExtractedContent,
+    *,
+    clean: bool = False,
+    summary: bool = False,
+    images: bool = False,
+) -> str:
+    """Run the I/O-bound half of the pipeline: LLM features, then assemble markdown."""
+    content = extracted.content
+    format_type = extracted.format_type
 
     # Parallel LLM features: clean + images can run concurrently
     summary_section = ""
@@ -77,14 +162,16 @@ async def build_content_async(
         logger.info("Cleaning content via LLM")
         from to_markdown.smart.clean import clean_content_async
 
-        parallel_tasks.append(clean_content_async(content, format_type))
+        parallel_tasks.append(
+            clean_content_async(content, format_type, analysis=extracted.analysis)
+        )
         task_labels.append("clean")
 
-    if images and result.images:
-        logger.info("Describing %d images via LLM", len(result.images))
+    if images and extracted.images:
+        logger.info("Describing %d images via LLM", len(extracted.images))
         from to_markdown.smart.images import describe_images_async
 
-        parallel_tasks.append(describe_images_async(result.images))
+        parallel_tasks.append(describe_images_async(extracted.images))
         task_labels.append("images")
 
     if parallel_tasks:
@@ -100,12 +187,16 @@ async def build_content_async(
         logger.info("Generating summary via LLM")
         from to_markdown.smart.summary import format_summary_section, summarize_content_async
 
-        summary_text = await summarize_content_async(cleaned_content, format_type)
+        # The extraction analysis still describes the content unless clean rewrote it
+        analysis = extracted.analysis if cleaned_content is content else None
+        summary_text = await summarize_content_async(
+            cleaned_content, format_type, analysis=analysis
+        )
         if summary_text:
             summary_section = format_summary_section(summary_text) + "\n"
 
     # Assemble: frontmatter + [summary] + content + [images]
-    markdown = frontmatter + "\n"
+    markdown = extracted.frontmatter + "\n"
     if summary_section:
         markdown += summary_section
     markdown += cleaned_content
@@ -0,0 +1,81 @@
+"""Batch input discovery: directory scanning, glob resolution, include/exclude filters.
+
+Also maps each discovered input to its mirrored path under a batch output directory.
+"""
+
+import glob as glob_module
+from pathlib import Path
+
+from to_markdown.core.constants import DEFAULT_OUTPUT_EXTENSION
+
+
+def discover_files(
+    source: Path,
+    *,
+    recursive: bool = True,
+    include: list[str] | None = None,
+    exclude: list[str] | None = None,
+) -> list[Path]:
+    """Discover convertible files in a directory.
+
+    Skips hidden files/dirs (starting with '.') and files without extensions.
+    include/exclude are glob patterns (e.g. "*.pdf", "drafts/*") matched
+    case-insensitively against each file's path relative to source: a file must
+    match an include pattern (if any) and no exclude pattern.
+    Returns sorted list for deterministic processing order.
+    """
+    files: list[Path] = []
+    iterator = source.rglob("*") if recursive else source.glob("*")
+
+    for path in iterator:
+        if not path.is_file():
+            continue
+        relative = path.relative_to(source)
+        # Skip hidden files and files in hidden directories
+        if any(part.startswith(".") for part in relative.parts):
+            continue
+        # Skip files without extensions
+        if not path.suffix:
+            continue
+        if not _matches_filters(relative, include, exclude):
+            continue
+        files.append(path)
+
+    return sorted(files)
+
+
+def resolve_glob(
+    pattern: str, *, include: list[str] | None = None, exclude: list[str] | None = None
+) -> list[Path]:
+    """Resolve a glob pattern to a sorted list of file paths.
+
+    include/exclude filter the matches as in discover_files().
+    """
+    matches = [
+        Path(p)
+        for p in glob_module.glob(pattern)
+        if Path(p).is_file() and _matches_filters(Path(p), include, exclude)
+    ]
+    return sorted(matches)
+
+
+def _matches_filters(path: Path, include: list[str] | None, exclude: list[str] | None) -> bool:
+    """Check path against include (allowlist) and exclude (denylist) glob patterns."""
+    if include and not any(path.match(p, case_sensitive=False) for p in include):
+        return False
+    return not (exclude and any(path.match(p, case_sensitive=False) for p in exclude))
+
+
+def _resolve_batch_output(
+    input_path: Path,
+    output_dir: Path,
+    batch_root: Path | None,
+) -> Path:
+    """Resolve output path for a file in a batch, preserving directory structure."""
+    if batch_root is not None:
+        try:
+            relative = input_path.parent.relative_to(batch_root)
+            return output_dir / relative / (input_path.stem + DEFAULT_OUTPUT_EXTENSION)
+        except ValueError:
+            pass
+    return output_dir / (input_path.stem + DEFAULT_OUTPUT_EXTENSION)
@@ -1,12 +1,17 @@
 """Batch conversion CLI helpers extracted from cli.py."""
 
 import logging
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 
 from to_markdown.core.batch import BatchResult
-from to_markdown.core.constants import APP_NAME, EXIT_ERROR, GLOB_CHARS
+from to_markdown.core.constants import APP_NAME, DEFAULT_BATCH_JOBS, EXIT_ERROR, GLOB_CHARS
+
+if TYPE_CHECKING:
+    from to_markdown.core.ocr_settings import OcrSettings
 
 logger = logging.getLogger(APP_NAME)
 
@@ -23,11 +28,29 @@ def print_batch_summary(result: BatchResult, verbose: int) -> None:
         parts.append(f"{len(result.skipped)} skipped")
     if result.failed:
         parts.append(f"{len(result.failed)} failed")
+    if result.timed_out:
+        parts.append(f"{len(result.timed_out)} timed out")
+    if result.removed:
+        parts.append(f"{len(result.removed)} removed")
     typer.echo(", ".join(parts))
-
-    if verbose >= 1 and result.failed:
+    lookups = result.ocr_cache_hits + result.ocr_cache_misses
+    if lookups:
+        typer.echo(
+            f"OCR cache: {result.ocr_cache_hits} of {lookups} page image(s) reused "
+            f"({result.ocr_cache_hit_rate:.0%})"
+        )
+    lookups = result.llm_cache_hits + result.llm_cache_misses
+    if lookups:
+        typer.echo(
+            f"LLM cache: {result.llm_cache_hits} of {lookups} response(s) reused "
+            f"({result.llm_cache_hit_rate:.0%})"
+        )
+
+    if verbose >= 1:
         for path, error in result.failed:
             typer.echo(f"  FAILED: {path.name} - {error}", err=True)
+        for path, error in result.timed_out:
+            typer.echo(f"  TIMED OUT: {path.name} - {error}", err=True)
 
 
 def run_batch(
@@ -35,6 +58,8 @@ def run_batch(
     output: Path | None,
     *,
     recursive: bool,
+    include: list[str] | None = None,
+    exclude: list[str] | None = None,
     force: bool,
     clean: bool,
     summary: bool,
@@ -43,6 +68,14 @@ def run_batch(
     fail_fast: bool,
     quiet: bool,
     verbose: int,
+    jobs: int = DEFAULT_BATCH_JOBS,
+    use_cache: bool = True,
+    stream: bool = False,
+    timeout: float | None = None,
+    ocr: "OcrSettings | None" = None,
+    deterministic: bool = False,
+    incremental: bool = False,
+    prune: bool = False,
 ) -> None:
     """Run batch conversion for directory or glob input."""
     from to_markdown.core.batch import convert_batch, discover_files, resolve_glob
@@ -51,7 +84,7 @@ def run_batch(
     is_glob = is_glob_pattern(input_str)
 
     if is_glob:
-        files = resolve_glob(input_str)
+        files = resolve_glob(input_str, include=include, exclude=exclude)
         if not files:
             logger.error("No files matched pattern: %s", input_str)
             raise typer.Exit(EXIT_ERROR)
@@ -60,7 +93,7 @@ def run_batch(
         if not input_path.exists():
             logger.error("Directory not found: %s", input_path)
             raise typer.Exit(EXIT_ERROR)
-        files = discover_files(input_path, recursive=recursive)
+        files = discover_files(input_path, recursive=recursive, include=include, exclude=exclude)
         if not files:
             logger.error("No supported files found in: %s", input_path)
             raise typer.Exit(EXIT_ERROR)
@@ -71,7 +104,16 @@ def run_batch(
         logger.error("Output must be a directory for batch mode: %s", output)
         raise typer.Exit(EXIT_ERROR)
 
-    result = convert_batch(
+    convert = convert_batch
+    if incremental:
+        if output is None and batch_root is None:
+            logger.error("--incremental with a glob pattern requires -o (manifest location)")
+            raise typer.Exit(EXIT_ERROR)
+        from to_markdown.core.incremental import convert_incremental
+
+        convert = partial(convert_incremental, prune=prune)
+
+    result = convert(
         files,
         output_dir=output,
         batch_root=batch_root,
@@ -82,6 +124,12 @@ def run_batch(
         sanitize=sanitize,
         fail_fast=fail_fast,
         quiet=quiet,
+        jobs=jobs,
+        use_cache=use_cache,
+        stream=stream,
+        timeout=timeout,
+        ocr=ocr,
+        deterministic=deterministic,
     )
 
     if not quiet:
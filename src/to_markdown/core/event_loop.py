@@ -0,0 +1,55 @@
+"""Sync-to-async boundary: run pipeline coroutines, on one long-lived loop when possible.
+
+build_content() runs each file's coroutine through run_sync(). Outside a
+persistent_loop() block that is a plain asyncio.run(), so every file gets a fresh
+event loop. The Gemini client keys its async HTTP sessions by event loop, so
+a fresh loop per file means a new TLS connection per file, and the old sessions
+pile up. Inside persistent_loop(), all files on that thread share one
+asyncio.Runner, so keep-alive connections to the LLM endpoint are reused
+across the whole batch.
+"""
+
+import asyncio
+import atexit
+import threading
+from collections.abc import Coroutine, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+# One runner per thread: an asyncio.Runner must only be driven from its own thread
+_local = threading.local()
+
+
+def run_sync[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run coro to completion on this thread's persistent loop, or a fresh one."""
+    runner: asyncio.Runner | None = getattr(_local, "runner", None)
+    if runner is None:
+        return asyncio.run(coro)
+    return runner.run(coro)
+
+
+@contextmanager
+def persistent_loop() -> Iterator[None]:
+    """Run every run_sync() call on this thread in the block on one event loop.
+
+    Nested blocks reuse the outer loop. The loop (and its async generators and
+    default executor) is closed when the outermost block exits.
+    """
+    if getattr(_local, "runner", None) is not None:
+        yield
+        return
+    with asyncio.Runner() as runner:
+        _local.runner = runner
+        try:
+            yield
+        finally:
+            _local.runner = None
+
+
+def install_process_loop() -> None:
+    """Give this thread a persistent loop for the rest of the process (pool workers)."""
+    if getattr(_local, "runner", None) is not None:
+        return
+    runner = asyncio.Runner()
+    _local.runner = runner
+    atexit.register(runner.close)
@@ -1,13 +1,26 @@
 """Kreuzberg adapter: thin wrapper isolating the project from Kreuzberg API changes."""
 
+import asyncio
+import functools
 import logging
-from dataclasses import dataclass, field
+import os
+from dataclasses import dataclass, field, replace
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from kreuzberg import ExtractionConfig, ImageExtractionConfig, extract_file_sync
+import kreuzberg
+from kreuzberg import ExtractionConfig, ImageExtractionConfig, PageConfig, extract_file_sync
 from kreuzberg.exceptions import KreuzbergError, ValidationError
 
-from to_markdown.core.constants import OCR_MIN_CONTENT_LENGTH, OCR_QUALITY_THRESHOLD
+from to_markdown.core.constants import (
+    KREUZBERG_NATIVE_ASYNC_ENV,
+    OCR_MIN_CONTENT_LENGTH,
+    OCR_QUALITY_THRESHOLD,
+)
+from to_markdown.core.kreuzberg_results import image_dicts, table_dicts
+
+if TYPE_CHECKING:
+    from to_markdown.core.ocr_settings import OcrSettings
 
 logger = logging.getLogger(__name__)
 
@@ -26,16 +39,28 @@ class ExtractionResult:
 
     content: str
     metadata: dict = field(default_factory=dict)
-    tables: list = field(default_factory=list)
+    tables: list[dict] = field(default_factory=list)
     images: list[dict] = field(default_factory=list)
 
 
-def extract_file(file_path: Path, *, extract_images: bool = False) -> ExtractionResult:
+def extract_file(
+    file_path: Path,
+    *,
+    extract_images: bool = False,
+    use_cache: bool = True,
+    ocr: "OcrSettings | None" = None,
+) -> ExtractionResult:
     """Extract content and metadata from a file via Kreuzberg.
 
+    Plain-text, Markdown, source, and data files are decoded natively, without
+    Kreuzberg. Other results are served from the on-disk extraction cache when the
+    file content and extraction settings match a previous run.
+
     Args:
         file_path: Path to the file to extract.
         extract_images: If True, also extract images from the document.
+        use_cache: If False, bypass the extraction cache (neither read nor write).
+        ocr: OCR workers, threads, and DPI for pages that need OCR.
 
     Returns:
         ExtractionResult with content, metadata, tables, and optionally images.
@@ -45,52 +70,183 @@ def extract_file(file_path: Path, *, extract_images: bool = False) -> Extraction
         UnsupportedFormatError: If Kreuzberg cannot handle the file format.
         ExtractionError: If extraction fails for other reasons.
     """
+    path = _existing_path(file_path)
+    key, cached = _cache_lookup(path, extract_images=extract_images, use_cache=use_cache, ocr=ocr)
+    if cached is not None:
+        return cached
+
+    result = _extract_uncached(path, extract_images=extract_images, use_cache=use_cache, ocr=ocr)
+    _cache_store(key, result)
+    return result
+
+
+async def extract_file_async(
+    file_path: Path,
+    *,
+    extract_images: bool = False,
+    use_cache: bool = True,
+    ocr: "OcrSettings | None" = None,
+) -> ExtractionResult:
+    """Async counterpart of extract_file() for code running inside an event loop.
+
+    With TO_MARKDOWN_KREUZBERG_ASYNC=1, extraction awaits Kreuzberg's native async
+    API. Otherwise extract_file() runs in a worker thread: Kreuzberg 4.3's async
+    bindings can abort the interpreter at shutdown after repeated calls.
+
+    Raises:
+        The same exceptions as extract_file().
+    """
+    if os.environ.get(KREUZBERG_NATIVE_ASYNC_ENV) != "1":
+        return await asyncio.to_thread(
+            extract_file, file_path, extract_images=extract_images, use_cache=use_cache, ocr=ocr
+        )
+
+    path = _existing_path(file_path)
+    key, cached = await asyncio.to_thread(
+        _cache_lookup, path, extract_images=extract_images, use_cache=use_cache, ocr=ocr
+    )
+    if cached is not None:
+        return cached
+
+    try:
+        raw = await kreuzberg.extract_file(
+            str(path), config=_extraction_config(path, extract_images)
+        )
+    except KreuzbergError as exc:
+        raise _extraction_error(path, exc) from exc
+    # Sparse-page OCR in _finish() blocks, so results are finished off the event loop
+    result = await asyncio.to_thread(
+        _finish, path, raw, extract_images=extract_images, use_cache=use_cache, ocr=ocr
+    )
+    await asyncio.to_thread(_cache_store, key, result)
+    return result
+
+
+def _existing_path(file_path: Path) -> Path:
+    """Return file_path as a Path, raising FileNotFoundError if it does not exist."""
     path = Path(file_path)
     if not path.exists():
         msg = f"File not found: {path}"
         raise FileNotFoundError(msg)
+    return path
+
+
+def _extract_uncached(
+    path: Path, *, extract_images: bool, use_cache: bool, ocr: "OcrSettings | None" = None
+) -> ExtractionResult:
+    """Run Kreuzberg extraction (with sparse-page OCR fallback) for an existing file."""
+    try:
+        raw = extract_file_sync(str(path), config=_extraction_config(path, extract_images))
+    except KreuzbergError as exc:
+        raise _extraction_error(path, exc) from exc
+    return _finish(path, raw, extract_images=extract_images, use_cache=use_cache, ocr=ocr)
+
+
+def _is_pdf(path: Path) -> bool:
+    return path.suffix.lower() == ".pdf"
+
+
+def _extraction_config(path: Path, extract_images: bool) -> ExtractionConfig:
+    """Return the shared Kreuzberg config for extracting path."""
+    return _build_config(is_pdf=_is_pdf(path), extract_images=extract_images)
 
-    config = ExtractionConfig(
+
+@functools.cache
+def _build_config(*, is_pdf: bool, extract_images: bool) -> ExtractionConfig:
+    """Build a Kreuzberg config once per setting combination; configs are reused."""
+    return ExtractionConfig(
         output_format="markdown",
         enable_quality_processing=True,
         images=ImageExtractionConfig() if extract_images else None,
+        pages=PageConfig(extract_pages=True) if is_pdf else None,
     )
 
+
+def _extraction_error(path: Path, exc: KreuzbergError) -> ExtractionError:
+    """Map a Kreuzberg exception to the project's extraction error types."""
+    if isinstance(exc, ValidationError):
+        return UnsupportedFormatError(f"Unsupported format: {path.suffix or 'unknown'}")
+    return ExtractionError(f"Extraction failed for {path.name}: {exc}")
+
+
+def _cache_lookup(
+    path: Path, *, extract_images: bool, use_cache: bool, ocr: "OcrSettings | None" = None
+) -> tuple[str | None, ExtractionResult | None]:
+    """Return (cache key, result available without running Kreuzberg).
+
+    Text-like files take the native fast path and are never cached: decoding them is
+    cheaper than hashing them. The key is None when the result should not be stored.
+    """
+    from to_markdown.core.text_extraction import extract_text_file, is_fast_path
+
+    if is_fast_path(path) and (result := extract_text_file(path)) is not None:
+        return None, result
+    if not use_cache:
+        return None, None
+    from to_markdown.core.cache import CACHE_ERRORS, lookup_extraction, warn_cache_unavailable
+
+    settings = ocr.cache_settings() if ocr is not None else {}
     try:
-        result = extract_file_sync(str(path), config=config)
-    except ValidationError as exc:
-        msg = f"Unsupported format: {path.suffix or 'unknown'}"
-        raise UnsupportedFormatError(msg) from exc
-    except KreuzbergError as exc:
-        msg = f"Extraction failed for {path.name}: {exc}"
-        raise ExtractionError(msg) from exc
+        return lookup_extraction(path, extract_images=extract_images, **settings)
+    except CACHE_ERRORS as exc:
+        warn_cache_unavailable(exc)
+        return None, None
+
+
+def _cache_store(key: str | None, result: ExtractionResult) -> None:
+    """Store a fresh extraction result under key (no-op when caching is off)."""
+    if key is not None:
+        from to_markdown.core.cache import CACHE_ERRORS, get_default_cache, warn_cache_unavailable
+
+        try:
+            get_default_cache().put(key, result)
+        except CACHE_ERRORS as exc:
+            warn_cache_unavailable(exc)
+
 
-    # Auto-retry with OCR if PDF extraction returned sparse content
-    if _is_sparse_pdf_extraction(result, path):
+def _finish(
+    path: Path,
+    result: object,
+    *,
+    extract_images: bool,
+    use_cache: bool = True,
+    ocr: "OcrSettings | None" = None,
+) -> ExtractionResult:
+    """Normalize a raw Kreuzberg result, OCR'ing sparse PDF pages where needed."""
+    content = result.content
+    metadata = result.metadata if isinstance(result.metadata, dict) else {}
+    pages = getattr(result, "pages", None)
+
+    if _is_pdf(path) and isinstance(pages, list) and pages:
+        # OCR only the pages whose text layer is missing or garbled
+        from to_markdown.core.ocr import merge_pages, recover_sparse_pages
+
+        recovered = recover_sparse_pages(path, pages, use_cache=use_cache, settings=ocr)
+        if recovered:
+            content = merge_pages(pages, recovered)
+            metadata = {**metadata, "ocr_pages": sorted(recovered)}
+    elif _is_sparse_pdf_extraction(result, path):
+        # No per-page breakdown available: retry the whole document with OCR
         logger.warning(
             "Sparse PDF extraction detected (quality=%.1f, length=%d); retrying with OCR",
             _extraction_quality(result),
             len(result.content.strip()),
         )
-        retry_result = _retry_with_ocr(path, extract_images=extract_images)
+        retry_result = _retry_with_ocr(path, extract_images=extract_images, ocr=ocr)
         if retry_result is not None and len(retry_result.content.strip()) > len(
             result.content.strip()
         ):
             result = retry_result
+            content = result.content
             metadata = result.metadata if isinstance(result.metadata, dict) else {}
-            metadata = {**metadata, "ocr_fallback": True}
-            return ExtractionResult(
-                content=result.content,
-                metadata=metadata,
-                tables=result.tables if isinstance(result.tables, list) else [],
-                images=_extract_images_list(result, extract_images),
-            )
+            page_count = metadata.get("page_count") or 1
+            metadata = {**metadata, "ocr_pages": list(range(1, page_count + 1))}
 
     return ExtractionResult(
-        content=result.content,
-        metadata=result.metadata if isinstance(result.metadata, dict) else {},
-        tables=result.tables if isinstance(result.tables, list) else [],
-        images=_extract_images_list(result, extract_images),
+        content=content,
+        metadata=metadata,
+        tables=table_dicts(result),
+        images=image_dicts(result) if extract_images else [],
     )
 
 
@@ -106,41 +262,39 @@ def _is_sparse_pdf_extraction(result: object, path: Path) -> bool:
     Returns True if the file is a PDF and either the quality score is below
     threshold or the extracted content is shorter than the minimum length.
     """
-    if path.suffix.lower() != ".pdf":
+    if not _is_pdf(path):
         return False
     if _extraction_quality(result) < OCR_QUALITY_THRESHOLD:
         return True
     return len(result.content.strip()) < OCR_MIN_CONTENT_LENGTH
 
 
-def _retry_with_ocr(path: Path, *, extract_images: bool = False) -> object | None:
-    """Retry extraction with force_ocr=True. Returns raw Kreuzberg result or None."""
-    retry_config = ExtractionConfig(
-        output_format="markdown",
-        enable_quality_processing=True,
-        force_ocr=True,
-        images=ImageExtractionConfig() if extract_images else None,
-    )
-    try:
-        return extract_file_sync(str(path), config=retry_config)
-    except KreuzbergError as exc:
-        logger.warning("OCR retry failed: %s", exc)
-        return None
-
-
-def _extract_images_list(result: object, extract_images: bool) -> list[dict]:
-    """Build normalized image dicts from a Kreuzberg extraction result."""
-    if not extract_images or not hasattr(result, "images") or not result.images:
-        return []
-    return [
-        {
-            "data": img.data if hasattr(img, "data") else img.get("data", b""),
-            "format": img.format if hasattr(img, "format") else img.get("format", "png"),
-            "page_number": (
-                img.page_number if hasattr(img, "page_number") else img.get("page_number")
-            ),
-            "width": img.width if hasattr(img, "width") else img.get("width"),
-            "height": img.height if hasattr(img, "height") else img.get("height"),
-        }
-        for img in result.images
-    ]
+def _retry_with_ocr(
+    path: Path, *, extract_images: bool = False, ocr: "OcrSettings | None" = None
+) -> object | None:
+    """Retry extraction with force_ocr=True, escalating DPI while the result is sparse.
+
+    Returns the raw Kreuzberg result with the most content, or None if OCR failed.
+    """
+    from to_markdown.core.ocr_settings import OcrSettings
+
+    settings = ocr or OcrSettings()
+    best = None
+    for dpi in settings.dpi_tiers():
+        retry_config = ExtractionConfig(
+            output_format="markdown",
+            enable_quality_processing=True,
+            force_ocr=True,
+            ocr=replace(settings, dpi=dpi).kreuzberg_config(),
+            images=ImageExtractionConfig() if extract_images else None,
+        )
+        try:
+            result = extract_file_sync(str(path), config=retry_config)
+        except KreuzbergError as exc:
+            logger.warning("OCR retry failed: %s", exc)
+            break
+        if best is None or len(result.content.strip()) > len(best.content.strip()):
+            best = result
+        if not _is_sparse_pdf_extraction(result, path):
+            break
+    return best
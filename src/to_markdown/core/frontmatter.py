@@ -1,9 +1,20 @@
-"""YAML frontmatter composition from Kreuzberg extraction metadata."""
+"""YAML frontmatter composition from Kreuzberg extraction metadata.
 
+The frontmatter schema is a handful of scalar keys, so it is emitted directly:
+ints, bools, lists of ints, and printable strings are written without PyYAML.
+Anything else (multi-line or non-printable strings, other types) goes through
+the libyaml-accelerated dumper, which is only imported when needed.
+"""
+
+import re
 from datetime import UTC, datetime
 from pathlib import Path
 
-import yaml
+from to_markdown.core.constants import FRONTMATTER_RESERVED_WORDS
+
+# Strings safe to emit unquoted: start with a letter, no YAML indicators (: # etc.),
+# no trailing space. Numbers, dates, and timestamps start with a digit and get quoted.
+_PLAIN_SCALAR_RE = re.compile(r"[^\W\d_](?:[\w .,()/+&'-]*[\w.)'])?")
 
 
 def compose_frontmatter(
@@ -11,6 +22,8 @@ def compose_frontmatter(
     source_path: Path,
     *,
     sanitized: bool = False,
+    words: int | None = None,
+    source_sha256: str | None = None,
 ) -> str:
     """Compose YAML frontmatter from extraction metadata.
 
@@ -18,6 +31,10 @@ def compose_frontmatter(
         metadata: Metadata dict from Kreuzberg extraction.
         source_path: Path to the original source file.
         sanitized: Whether non-visible characters were stripped by content sanitization.
+        words: Word count of the extracted content, used when metadata has none.
+        source_sha256: Hash of the source file. When given (deterministic mode) it is
+            recorded in place of the extracted_at timestamp, so unchanged sources
+            produce identical frontmatter.
 
     Returns:
         YAML frontmatter string with leading and trailing ``---`` delimiters.
@@ -28,19 +45,63 @@ def compose_frontmatter(
     _add_if_present(data, "author", _normalize_author(metadata.get("authors")))
     _add_if_present(data, "created", _format_date(metadata.get("creation_date")))
     _add_if_present(data, "pages", metadata.get("page_count"))
-    _add_if_present(data, "words", metadata.get("word_count"))
+    _add_if_present(data, "words", metadata.get("word_count") or words)
 
     data["format"] = metadata.get("format_type", source_path.suffix.lstrip("."))
-    if metadata.get("ocr_fallback"):
-        data["ocr_fallback"] = True
+    _add_if_present(data, "ocr_pages", metadata.get("ocr_pages"))
+    _add_if_present(data, "truncated", metadata.get("truncated"))
     if sanitized:
         data["sanitized"] = True
-    data["extracted_at"] = datetime.now(tz=UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+    if source_sha256 is not None:
+        data["source_sha256"] = source_sha256
+    else:
+        data["extracted_at"] = datetime.now(tz=UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-    yaml_body = yaml.dump(data, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    yaml_body = "".join(_emit_entry(key, value) for key, value in data.items())
     return f"---\n{yaml_body}---\n"
 
 
+def source_digest(source_path: Path) -> str:
+    """SHA-256 of the source file, as recorded by deterministic frontmatter."""
+    from to_markdown.core.cache_keys import file_digest
+
+    return file_digest(source_path)
+
+
+def _emit_entry(key: str, value: object) -> str:
+    """Emit one top-level key as block YAML, as yaml.dump would."""
+    if isinstance(value, bool):
+        scalar = "true" if value else "false"
+    elif type(value) is int:
+        scalar = str(value)
+    elif isinstance(value, str) and (quoted := _quote_string(value)) is not None:
+        scalar = quoted
+    elif isinstance(value, list) and value and all(type(item) is int for item in value):
+        return f"{key}:\n" + "".join(f"- {item}\n" for item in value)
+    else:
+        return _yaml_dump({key: value})
+    return f"{key}: {scalar}\n"
+
+
+def _quote_string(value: str) -> str | None:
+    """Plain or single-quoted YAML for a printable string; None if it needs PyYAML."""
+    if _PLAIN_SCALAR_RE.fullmatch(value) and value.lower() not in FRONTMATTER_RESERVED_WORDS:
+        return value
+    if value.isprintable():
+        return "'" + value.replace("'", "''") + "'"
+    return None
+
+
+def _yaml_dump(data: dict) -> str:
+    """Fallback for values the fast emitter does not handle."""
+    import yaml
+
+    dumper = getattr(yaml, "CDumper", yaml.Dumper)
+    return yaml.dump(
+        data, Dumper=dumper, default_flow_style=False, sort_keys=False, allow_unicode=True
+    )
+
+
 def _add_if_present(data: dict, key: str, value: object) -> None:
     """Add a key-value pair to data only if value is truthy."""
     if value:
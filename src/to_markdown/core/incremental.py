@@ -0,0 +1,279 @@
+"""Incremental batch conversion: a source manifest decides which files to reconvert.
+
+The manifest (MANIFEST_FILENAME in the output directory) records each converted
+source's size, mtime, and SHA-256, plus the settings and tool versions of the run.
+A source is reconverted only when it is new, its content changed, its output is
+missing, or the settings or versions differ from the last run. Size and mtime are
+compared first, so unchanged files are not re-hashed.
+"""
+
+import json
+import logging
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from to_markdown import __version__
+from to_markdown.core.atomic_write import atomic_output
+from to_markdown.core.cache_keys import file_digest
+from to_markdown.core.constants import (
+    MANIFEST_FILENAME,
+    MANIFEST_SCHEMA_VERSION,
+    MANIFEST_SOURCE_IS_OUTPUT_REASON,
+    MANIFEST_UNCHANGED_REASON,
+)
+
+if TYPE_CHECKING:
+    from to_markdown.core.batch import BatchResult
+
+logger = logging.getLogger(__name__)
+
+# convert_batch() options that change what a source converts to, with their defaults
+_OUTPUT_OPTIONS = {
+    "clean": False,
+    "summary": False,
+    "images": False,
+    "sanitize": True,
+    "deterministic": False,
+}
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """A source as it was when last converted, and where its output went."""
+
+    size: int
+    mtime_ns: int
+    sha256: str
+    output: str
+
+
+class BatchManifest:
+    """Source manifest kept in a batch output directory.
+
+    Entries from a run with different settings are kept (so pruning still finds
+    their outputs) but never count as unchanged.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        settings: dict,
+        entries: dict[str, ManifestEntry] | None = None,
+        *,
+        stale: bool = False,
+    ) -> None:
+        self.path = path
+        self.settings = settings
+        self.entries = entries or {}
+        self.stale = stale
+
+    @classmethod
+    def load(cls, directory: Path, settings: dict) -> "BatchManifest":
+        """Load the manifest in directory; start empty if it is missing or unreadable."""
+        path = directory / MANIFEST_FILENAME
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            entries = {key: ManifestEntry(**value) for key, value in data["sources"].items()}
+        except FileNotFoundError:
+            return cls(path, settings)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as exc:
+            logger.warning("Ignoring unreadable manifest %s: %s", path, exc)
+            return cls(path, settings)
+        stale = data.get("schema") != MANIFEST_SCHEMA_VERSION or data.get("settings") != settings
+        if stale:
+            logger.info("Conversion settings or versions changed: reconverting all files")
+        return cls(path, settings, entries, stale=stale)
+
+    def is_unchanged(self, key: str, source: Path, output: Path) -> bool:
+        """True if source matches its entry and its output still exists."""
+        entry = self.entries.get(key)
+        if self.stale or entry is None or not output.exists():
+            return False
+        try:
+            stat = source.stat()
+            if stat.st_size != entry.size:
+                return False
+            if stat.st_mtime_ns == entry.mtime_ns:
+                return True
+            # Touched but possibly not edited: compare content
+            if file_digest(source) != entry.sha256:
+                return False
+        except OSError:
+            return False
+        self.entries[key] = replace(entry, mtime_ns=stat.st_mtime_ns)
+        return True
+
+    def owns(self, key: str, output: Path) -> bool:
+        """True if the manifest records output as written by an earlier run for key."""
+        entry = self.entries.get(key)
+        return entry is not None and self.output_path(entry).resolve() == output.resolve()
+
+    def output_path(self, entry: ManifestEntry) -> Path:
+        """Absolute path of an entry's output (stored relative to the manifest)."""
+        return self.path.parent / entry.output
+
+    def save(self) -> None:
+        """Write the manifest atomically, so an interrupted run never leaves it partial."""
+        data = {
+            "schema": MANIFEST_SCHEMA_VERSION,
+            "settings": self.settings,
+            "sources": {key: asdict(entry) for key, entry in sorted(self.entries.items())},
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_output(self.path, overwrite=True) as f:
+            f.write(json.dumps(data, indent=2) + "\n")
+
+
+def convert_incremental(
+    files: list[Path],
+    output_dir: Path | None = None,
+    *,
+    batch_root: Path | None = None,
+    prune: bool = False,
+    **options: object,
+) -> "BatchResult":
+    """Convert only new or changed files, tracked by a manifest in the output directory.
+
+    Unchanged files are listed in BatchResult.skipped with MANIFEST_UNCHANGED_REASON.
+    Files that are reconverted overwrite the output the manifest says an earlier
+    run wrote. Any other existing output is kept and reported as a normal batch
+    does, unless force=True, which also reconverts every file regardless of the
+    manifest. A source that would be its own output (a .md file with no output
+    directory) is skipped with MANIFEST_SOURCE_IS_OUTPUT_REASON.
+
+    Args:
+        files: List of file paths to consider.
+        output_dir: Output directory; holds the manifest. None = next to each source,
+            with the manifest in batch_root.
+        batch_root: Root of the batch input (for relative paths in the manifest).
+        prune: If True, delete outputs whose source no longer exists (listed in
+            BatchResult.removed).
+        **options: Other convert_batch() keyword arguments.
+
+    Raises:
+        ValueError: If there is neither an output directory nor a batch root.
+    """
+    from to_markdown.core.batch import BatchResult, _record_error, convert_batch
+    from to_markdown.core.pipeline import OutputExistsError
+
+    directory = output_dir or batch_root
+    if directory is None:
+        msg = "Incremental conversion needs an output directory (-o) or a directory input"
+        raise ValueError(msg)
+    force = options.pop("force", False)
+    manifest = BatchManifest.load(Path(directory), _settings(options))
+    manifest.stale = manifest.stale or bool(force)
+
+    result = BatchResult()
+    unchanged: list[Path] = []
+    pending: dict[str, tuple[Path, Path, ManifestEntry | None]] = {}
+    for source in files:
+        key = _source_key(source, batch_root)
+        output = _output_path(source, output_dir, batch_root)
+        if output == source.resolve():
+            result.skipped.append((source, MANIFEST_SOURCE_IS_OUTPUT_REASON))
+        elif manifest.is_unchanged(key, source, output):
+            unchanged.append(source)
+        elif not force and output.exists() and not manifest.owns(key, output):
+            msg = f"Output file already exists: {output} (use --force to overwrite)"
+            _record_error(result, source, OutputExistsError(msg))
+        else:
+            # Snapshot before converting: an edit made mid-conversion is seen next run
+            pending[key] = (source, output, _snapshot(source, output, manifest.path.parent))
+
+    sources = [source for source, _, _ in pending.values()]
+    if sources:
+        converted = convert_batch(sources, output_dir, batch_root=batch_root, force=True, **options)
+        converted.skipped[:0] = result.skipped
+        result = converted
+
+    written = {path.resolve() for path in result.succeeded}
+    for key, (_, output, snapshot) in pending.items():
+        if snapshot is not None and output.resolve() in written:
+            manifest.entries[key] = snapshot
+        else:
+            manifest.entries.pop(key, None)
+
+    result.skipped.extend((source, MANIFEST_UNCHANGED_REASON) for source in unchanged)
+    if prune:
+        _prune(manifest, batch_root, result)
+    if manifest.stale:
+        # Entries not refreshed this run describe outputs made with other settings
+        manifest.entries = {
+            key: manifest.entries[key] for key in pending if key in manifest.entries
+        }
+    manifest.save()
+    logger.info("Incremental: %d to convert, %d unchanged", len(pending), len(unchanged))
+    return result
+
+
+def _settings(options: dict) -> dict:
+    """Settings and versions that, when changed, invalidate every manifest entry."""
+    from kreuzberg import __version__ as kreuzberg_version
+
+    ocr = options.get("ocr")
+    settings = {name: bool(options.get(name, default)) for name, default in _OUTPUT_OPTIONS.items()}
+    return {
+        "to_markdown": __version__,
+        "kreuzberg": kreuzberg_version,
+        **settings,
+        "ocr_dpi": getattr(ocr, "dpi", None),
+    }
+
+
+def _source_key(source: Path, batch_root: Path | None) -> str:
+    """Manifest key: path relative to the batch root, else absolute."""
+    resolved = source.resolve()
+    if batch_root is not None:
+        try:
+            return resolved.relative_to(batch_root.resolve()).as_posix()
+        except ValueError:
+            pass
+    return str(resolved)
+
+
+def _source_path(key: str, batch_root: Path | None) -> Path:
+    path = Path(key)
+    if path.is_absolute() or batch_root is None:
+        return path
+    return batch_root / path
+
+
+def _output_path(source: Path, output_dir: Path | None, batch_root: Path | None) -> Path:
+    """The output path convert_batch() will write for source."""
+    from to_markdown.core.batch import _resolve_batch_output
+    from to_markdown.core.pipeline import _resolve_output_path
+
+    out = _resolve_batch_output(source, output_dir, batch_root) if output_dir else None
+    return _resolve_output_path(source.resolve(), out)
+
+
+def _snapshot(source: Path, output: Path, directory: Path) -> ManifestEntry | None:
+    """Current size, mtime, and hash of source; None if it cannot be read."""
+    try:
+        stat = source.stat()
+        digest = file_digest(source)
+    except OSError:
+        return None
+    try:
+        stored = output.resolve().relative_to(directory.resolve()).as_posix()
+    except ValueError:
+        stored = str(output.resolve())
+    return ManifestEntry(stat.st_size, stat.st_mtime_ns, digest, stored)
+
+
+def _prune(manifest: BatchManifest, batch_root: Path | None, result: "BatchResult") -> None:
+    """Delete outputs (and entries) of sources that no longer exist."""
+    for key, entry in list(manifest.entries.items()):
+        if _source_path(key, batch_root).exists():
+            continue
+        output = manifest.output_path(entry)
+        try:
+            output.unlink(missing_ok=True)
+        except OSError as exc:
+            logger.warning("Could not remove %s: %s", output, exc)
+            continue
+        del manifest.entries[key]
+        result.removed.append(output)
+        logger.info("Removed output of deleted source: %s", output)
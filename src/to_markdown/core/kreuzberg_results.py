@@ -0,0 +1,35 @@
+"""Normalize Kreuzberg result objects (tables, images) into plain dicts."""
+
+
+def table_dicts(result: object) -> list[dict]:
+    """Build normalized table dicts from a Kreuzberg extraction result."""
+    if not isinstance(getattr(result, "tables", None), list):
+        return []
+    return [
+        table
+        if isinstance(table, dict)
+        else {
+            "cells": getattr(table, "cells", []),
+            "markdown": getattr(table, "markdown", ""),
+            "page_number": getattr(table, "page_number", None),
+        }
+        for table in result.tables
+    ]
+
+
+def image_dicts(result: object) -> list[dict]:
+    """Build normalized image dicts from a Kreuzberg extraction result."""
+    if not hasattr(result, "images") or not result.images:
+        return []
+    return [
+        {
+            "data": img.data if hasattr(img, "data") else img.get("data", b""),
+            "format": img.format if hasattr(img, "format") else img.get("format", "png"),
+            "page_number": (
+                img.page_number if hasattr(img, "page_number") else img.get("page_number")
+            ),
+            "width": img.width if hasattr(img, "width") else img.get("width"),
+            "height": img.height if hasattr(img, "height") else img.get("height"),
+        }
+        for img in result.images
+    ]
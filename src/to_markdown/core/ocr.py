@@ -0,0 +1,266 @@
+"""Page-level OCR for PDFs whose text layer is missing or garbled on some pages.
+
+Only the sparse pages are OCR'd, from the page images embedded in the PDF; the
+recovered text is merged back in page order with the untouched text-layer pages.
+OCR text is cached per page image, so pages repeated across documents (letterhead,
+cover sheets, standard terms) are OCR'd once. Unless a DPI is fixed, images are OCR'd
+at a low DPI first and re-OCR'd at a higher one only when the result looks poor.
+"""
+
+import logging
+import unicodedata
+from dataclasses import replace
+from pathlib import Path
+
+from kreuzberg import (
+    ExtractionConfig,
+    ImageExtractionConfig,
+    PageConfig,
+    extract_bytes_sync,
+    extract_file_sync,
+)
+from kreuzberg.exceptions import KreuzbergError
+
+from to_markdown.core.constants import (
+    OCR_MAX_GARBLED_RATIO,
+    OCR_MIN_PAGE_CONTENT_LENGTH,
+    OCR_PAGE_SEPARATOR,
+    OCR_QUALITY_THRESHOLD,
+)
+from to_markdown.core.extraction import _extraction_quality
+from to_markdown.core.ocr_images import ocr_ready_bytes
+from to_markdown.core.ocr_settings import OcrSettings
+
+logger = logging.getLogger(__name__)
+
+# Unicode categories that indicate a broken font encoding: control, private use, unassigned
+_GARBLED_CATEGORIES = frozenset({"Cc", "Co", "Cn"})
+
+
+def find_sparse_pages(pages: list[dict]) -> list[int]:
+    """Return page numbers whose text layer is missing, too short, or garbled.
+
+    Kreuzberg's ``is_blank`` flag is ignored: without image extraction it also marks
+    scanned pages as blank. Pages with no images are skipped later, in ocr_pages().
+    """
+    sparse = []
+    for page in pages:
+        text = (page.get("content") or "").strip()
+        if len(text) < OCR_MIN_PAGE_CONTENT_LENGTH or _garbled_ratio(text) > OCR_MAX_GARBLED_RATIO:
+            sparse.append(page["page_number"])
+    return sparse
+
+
+def recover_sparse_pages(
+    path: Path,
+    pages: list[dict],
+    *,
+    use_cache: bool = True,
+    settings: OcrSettings | None = None,
+) -> dict[int, str]:
+    """OCR a PDF's sparse pages, returning recovered text keyed by page number."""
+    from to_markdown.core.ocr_pool import large_pdf_workers
+
+    settings = settings or OcrSettings()
+    sparse = find_sparse_pages(pages)
+    if not sparse:
+        return {}
+    logger.warning(
+        "Sparse text layer on %d of %d page(s); running OCR on those pages",
+        len(sparse),
+        len(pages),
+    )
+    workers = large_pdf_workers(path, len(pages), requested=settings.workers)
+    return ocr_pages(path, pages, sparse, workers=workers, use_cache=use_cache, settings=settings)
+
+
+def ocr_pages(
+    path: Path,
+    pages: list[dict],
+    page_numbers: list[int],
+    *,
+    workers: int = 1,
+    use_cache: bool = True,
+    settings: OcrSettings | None = None,
+) -> dict[int, str]:
+    """OCR the given pages and return recovered text keyed by page number.
+
+    Each page's embedded images are OCR'd individually; pages without images are
+    genuinely blank and skipped. Pages whose images OCR cannot read fall back to a
+    whole-document OCR pass, from which only those pages are kept. Pages where OCR
+    produced no more text than the text layer are omitted.
+
+    Args:
+        workers: Worker processes for image OCR; page ranges run in parallel when > 1.
+        use_cache: If False, bypass the OCR cache (neither read nor write).
+        settings: OCR threads per worker and DPI (workers is already resolved).
+    """
+    from to_markdown.core.ocr_pool import ocr_page_images
+
+    images_by_page = {page["page_number"]: page.get("images") or [] for page in pages}
+    if not any(images_by_page.get(number) for number in page_numbers):
+        images_by_page = _load_page_images(path)
+    jobs = {number: images_by_page[number] for number in page_numbers if images_by_page.get(number)}
+    settings = settings or OcrSettings()
+    ocr_texts = ocr_page_images(jobs, workers=workers, use_cache=use_cache, settings=settings)
+
+    original = {page["page_number"]: (page.get("content") or "").strip() for page in pages}
+    recovered: dict[int, str] = {}
+    unreadable: list[int] = []
+    for number, texts in ocr_texts.items():
+        if all(text is None for text in texts):
+            unreadable.append(number)
+            continue
+        text = OCR_PAGE_SEPARATOR.join(t.strip() for t in texts if t and t.strip())
+        if len(text) > len(original.get(number, "")):
+            recovered[number] = text
+
+    if unreadable:
+        logger.info("No OCR-readable images on page(s) %s; running document OCR", unreadable)
+        for number, text in _ocr_document_pages(path, unreadable, settings).items():
+            if len(text) > len(original.get(number, "")):
+                recovered[number] = text
+    return recovered
+
+
+def merge_pages(pages: list[dict], replacements: dict[int, str]) -> str:
+    """Join page texts in page order, substituting OCR text for replaced pages."""
+    texts = (
+        replacements.get(page["page_number"], (page.get("content") or "").strip())
+        for page in sorted(pages, key=lambda p: p["page_number"])
+    )
+    return OCR_PAGE_SEPARATOR.join(text for text in texts if text)
+
+
+def ocr_image(
+    image: dict, *, use_cache: bool = True, settings: OcrSettings | None = None
+) -> str | None:
+    """OCR one embedded PDF image. Returns None if it cannot be OCR'd.
+
+    That covers unsupported encodings and OCR failing before any DPI tier produced
+    text; a failure after an earlier tier returns that tier's text. Text is served
+    from the OCR cache when the same image bytes were OCR'd before with the same
+    settings; failed OCR attempts are not cached.
+    """
+    if image.get("is_mask"):
+        return None
+    encoded = ocr_ready_bytes(image)
+    if encoded is None:
+        return None
+    data, mime_type = encoded
+    settings = settings or OcrSettings()
+    key = None
+    if use_cache:
+        from to_markdown.core.cache import CACHE_ERRORS, get_default_cache, warn_cache_unavailable
+        from to_markdown.core.cache_keys import ocr_cache_key
+
+        key = ocr_cache_key(
+            data, mime_type=mime_type, output_format="markdown", **settings.cache_settings()
+        )
+        try:
+            cached = get_default_cache().get_ocr_text(key)
+        except CACHE_ERRORS as exc:
+            warn_cache_unavailable(exc)
+            key = cached = None
+        if cached is not None:
+            return cached
+    text = ""
+    for dpi in settings.dpi_tiers():
+        if text:
+            logger.info(
+                "Low-quality OCR on page %s; retrying at %d DPI", image.get("page_number"), dpi
+            )
+        config = ExtractionConfig(
+            output_format="markdown",
+            force_ocr=True,
+            enable_quality_processing=True,
+            ocr=replace(settings, dpi=dpi).kreuzberg_config(),
+        )
+        try:
+            result = extract_bytes_sync(data, mime_type, config=config)
+        except KreuzbergError as exc:
+            logger.warning("OCR failed for image on page %s: %s", image.get("page_number"), exc)
+            return text or None
+        text = _better(text, result.content)
+        if not _is_poor_ocr(result.content, _extraction_quality(result)):
+            break
+    if key is not None:
+        try:
+            get_default_cache().put_ocr_text(key, text)
+        except CACHE_ERRORS as exc:
+            warn_cache_unavailable(exc)
+    return text
+
+
+def _load_page_images(path: Path) -> dict[int, list[dict]]:
+    """Re-extract the PDF with image extraction on, returning images per page."""
+    config = ExtractionConfig(
+        pages=PageConfig(extract_pages=True),
+        images=ImageExtractionConfig(),
+    )
+    try:
+        result = extract_file_sync(str(path), config=config)
+    except KreuzbergError as exc:
+        logger.warning("Page image extraction failed: %s", exc)
+        return {}
+    return {page["page_number"]: page.get("images") or [] for page in result.pages or []}
+
+
+def _ocr_document_pages(
+    path: Path, page_numbers: list[int], settings: OcrSettings
+) -> dict[int, str]:
+    """OCR the whole document and keep only the requested pages' text.
+
+    Each DPI tier re-OCRs the document only while a requested page's text is poor.
+    """
+    texts: dict[int, str] = {}
+    pending = set(page_numbers)
+    for dpi in settings.dpi_tiers():
+        config = ExtractionConfig(
+            output_format="markdown",
+            force_ocr=True,
+            enable_quality_processing=True,
+            ocr=replace(settings, dpi=dpi).kreuzberg_config(),
+            pages=PageConfig(extract_pages=True),
+        )
+        try:
+            result = extract_file_sync(str(path), config=config)
+        except KreuzbergError as exc:
+            logger.warning("OCR retry failed: %s", exc)
+            break
+        quality = _extraction_quality(result)
+        for page in result.pages or []:
+            number = page["page_number"]
+            if number in pending:
+                text = (page.get("content") or "").strip()
+                texts[number] = _better(texts.get(number, ""), text)
+                if not _is_poor_ocr(text, quality):
+                    pending.discard(number)
+        if not pending:
+            break
+    return texts
+
+
+def _is_poor_ocr(text: str, quality: float) -> bool:
+    """True if OCR output is worth redoing at a higher DPI."""
+    return quality < OCR_QUALITY_THRESHOLD or len(text.strip()) < OCR_MIN_PAGE_CONTENT_LENGTH
+
+
+def _better(current: str, candidate: str) -> str:
+    """The OCR text with the higher character yield (ties keep the current one)."""
+    return candidate if len(candidate.strip()) > len(current.strip()) else current
+
+
+def _garbled_ratio(text: str) -> float:
+    """Fraction of characters that are replacement, private-use, or control glyphs.
+
+    PDFs with broken font encodings extract as these instead of readable text.
+    """
+    if not text:
+        return 0.0
+    garbled = sum(
+        ch == "\ufffd" or unicodedata.category(ch) in _GARBLED_CATEGORIES
+        for ch in text
+        if not ch.isspace()
+    )
+    return garbled / len(text)
@@ -0,0 +1,60 @@
+"""Prepare embedded PDF page images for OCR (raw pixel data is re-encoded as PNG)."""
+
+import struct
+import zlib
+
+from to_markdown.core.constants import (
+    OCR_IMAGE_MIME_TYPES,
+    OCR_PNG_COLOR_TYPES,
+    OCR_RAW_IMAGE_FORMAT,
+)
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def encode_png(raw: bytes, width: int, height: int, colorspace: str) -> bytes | None:
+    """Encode raw 8-bit PDF pixel data as a PNG, or None if the layout is unsupported.
+
+    Accepts both plain scanlines and scanlines already carrying PNG predictor bytes.
+    """
+    if colorspace not in OCR_PNG_COLOR_TYPES:
+        return None
+    color_type, channels = OCR_PNG_COLOR_TYPES[colorspace]
+    stride = width * channels
+    if len(raw) == height * (stride + 1):
+        scanlines = raw
+    elif len(raw) == height * stride:
+        scanlines = b"".join(
+            b"\x00" + raw[row * stride : (row + 1) * stride] for row in range(height)
+        )
+    else:
+        return None
+    header = struct.pack(">IIBBBBB", width, height, 8, color_type, 0, 0, 0)
+    return (
+        _PNG_SIGNATURE
+        + _png_chunk(b"IHDR", header)
+        + _png_chunk(b"IDAT", zlib.compress(scanlines))
+        + _png_chunk(b"IEND", b"")
+    )
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def ocr_ready_bytes(image: dict) -> tuple[bytes, str] | None:
+    """Return (bytes, mime type) OCR can read for an embedded image, or None."""
+    image_format = image.get("format", "")
+    data = image.get("data") or b""
+    if image_format in OCR_IMAGE_MIME_TYPES:
+        return data, OCR_IMAGE_MIME_TYPES[image_format]
+    if image_format != OCR_RAW_IMAGE_FORMAT or image.get("bits_per_component") != 8:
+        return None
+    try:
+        raw = zlib.decompress(data)
+    except zlib.error:
+        return None
+    png = encode_png(
+        raw, image.get("width") or 0, image.get("height") or 0, image.get("colorspace")
+    )
+    return (png, "image/png") if png is not None else None
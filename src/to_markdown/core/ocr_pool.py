@@ -0,0 +1,141 @@
+"""Parallel OCR for large PDFs: contiguous page ranges fanned out across processes."""
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from to_markdown.core.cache_lookups import counting_lookups, merge_lookups
+from to_markdown.core.constants import (
+    BATCH_PROCESS_START_METHOD,
+    LARGE_PDF_BYTES_ENV,
+    LARGE_PDF_MIN_BYTES,
+    LARGE_PDF_MIN_PAGES,
+    LARGE_PDF_MIN_RANGE_PAGES,
+    LARGE_PDF_PAGES_ENV,
+)
+from to_markdown.core.ocr import ocr_image
+from to_markdown.core.ocr_settings import apply_ocr_threads
+
+if TYPE_CHECKING:
+    from to_markdown.core.ocr_settings import OcrSettings
+
+logger = logging.getLogger(__name__)
+
+_warned_in_worker = False  # Warned that --ocr-workers is ignored in this process
+
+
+def large_pdf_workers(path: Path, page_count: int, *, requested: int | None = None) -> int:
+    """Number of OCR worker processes to use for a PDF (1 = OCR in-process).
+
+    An explicit ``requested`` count (--ocr-workers) wins. Otherwise PDFs at or above
+    the page-count or file-size threshold get one worker per CPU core. Thresholds are
+    overridable via TO_MARKDOWN_LARGE_PDF_PAGES and TO_MARKDOWN_LARGE_PDF_BYTES. Code
+    already running inside a worker process (``--jobs`` batch conversion, or the
+    --timeout watchdog child) always OCRs in-process to avoid oversubscription; such
+    processes are daemonic and cannot start workers of their own anyway.
+    """
+    global _warned_in_worker
+    if multiprocessing.parent_process() is not None:
+        if requested is not None and requested > 1 and not _warned_in_worker:
+            _warned_in_worker = True
+            logger.warning("--ocr-workers is ignored with --jobs or --timeout: OCR runs in-process")
+        return 1
+    if requested is not None:
+        return requested
+    min_pages = _int_env(LARGE_PDF_PAGES_ENV, LARGE_PDF_MIN_PAGES)
+    min_bytes = _int_env(LARGE_PDF_BYTES_ENV, LARGE_PDF_MIN_BYTES)
+    if page_count < min_pages and path.stat().st_size < min_bytes:
+        return 1
+    return os.cpu_count() or 1
+
+
+def split_page_ranges(page_numbers: list[int], workers: int) -> list[list[int]]:
+    """Split sorted page numbers into at most ``workers`` contiguous, ordered ranges."""
+    if not page_numbers:
+        return []
+    count = max(1, min(workers, len(page_numbers) // LARGE_PDF_MIN_RANGE_PAGES))
+    size, extra = divmod(len(page_numbers), count)
+    ranges, start = [], 0
+    for index in range(count):
+        end = start + size + (1 if index < extra else 0)
+        ranges.append(page_numbers[start:end])
+        start = end
+    return ranges
+
+
+def ocr_page_images(
+    images_by_page: dict[int, list[dict]],
+    *,
+    workers: int = 1,
+    use_cache: bool = True,
+    settings: "OcrSettings | None" = None,
+) -> dict[int, list[str | None]]:
+    """OCR each page's images, returning per-image text keyed by page number.
+
+    With more than one worker, pages are split into contiguous ranges that are
+    OCR'd in parallel worker processes (each capped at settings.threads OCR
+    threads) and reassembled in page order.
+    """
+    ranges = split_page_ranges(sorted(images_by_page), workers)
+    if len(ranges) <= 1:
+        return _ocr_range(images_by_page, use_cache, settings)
+
+    logger.info("OCR'ing %d page(s) in %d parallel range(s)", len(images_by_page), len(ranges))
+    context = multiprocessing.get_context(BATCH_PROCESS_START_METHOD)
+    threads = settings.threads if settings is not None else None
+    with ProcessPoolExecutor(
+        max_workers=len(ranges),
+        mp_context=context,
+        initializer=apply_ocr_threads,
+        initargs=(threads,),
+    ) as executor:
+        futures = [
+            executor.submit(
+                _ocr_range_counted,
+                {number: images_by_page[number] for number in page_range},
+                use_cache,
+                settings,
+            )
+            for page_range in ranges
+        ]
+        results: dict[int, list[str | None]] = {}
+        for future in futures:
+            texts, lookups = future.result()
+            merge_lookups(lookups)
+            results.update(texts)
+    return results
+
+
+def _ocr_range(
+    images_by_page: dict[int, list[dict]],
+    use_cache: bool = True,
+    settings: "OcrSettings | None" = None,
+) -> dict[int, list[str | None]]:
+    """OCR a range of pages in the current process."""
+    return {
+        number: [ocr_image(image, use_cache=use_cache, settings=settings) for image in images]
+        for number, images in sorted(images_by_page.items())
+    }
+
+
+def _ocr_range_counted(
+    images_by_page: dict[int, list[dict]],
+    use_cache: bool,
+    settings: "OcrSettings | None",
+) -> tuple[dict[int, list[str | None]], dict[str, int]]:
+    """Worker: OCR a range of pages; also return the cache lookups it made."""
+    with counting_lookups() as lookups:
+        texts = _ocr_range(images_by_page, use_cache, settings)
+    return texts, dict(lookups)
+
+
+def _int_env(name: str, default: int) -> int:
+    """Read a positive integer from the environment, falling back to default."""
+    try:
+        value = int(os.environ.get(name, ""))
+    except ValueError:
+        return default
+    return value if value > 0 else default
@@ -0,0 +1,82 @@
+"""OCR tuning knobs (workers, threads, DPI) shared by the CLI, MCP, and OCR code.
+
+Kept free of OCR machinery so entry points can validate settings cheaply.
+"""
+
+import os
+from dataclasses import dataclass
+
+from kreuzberg import ImagePreprocessingConfig, OcrConfig, TesseractConfig
+
+from to_markdown.core.constants import (
+    OCR_ADAPTIVE_DPI_TIERS,
+    OCR_MAX_DPI,
+    OCR_MIN_DPI,
+    OCR_THREADS_ENV,
+)
+
+
+@dataclass(frozen=True)
+class OcrSettings:
+    """OCR tuning; None keeps the automatic behavior.
+
+    Attributes:
+        workers: Processes for page-range OCR of one PDF. Default: one per CPU core
+            for large PDFs, in-process otherwise.
+        threads: Kreuzberg OCR threads per process. Applied to OCR worker processes
+            at startup; elsewhere only before the process first runs OCR.
+        dpi: Resolution page images are scaled to before Tesseract reads them.
+            Default: adaptive, escalating through OCR_ADAPTIVE_DPI_TIERS.
+    """
+
+    workers: int | None = None
+    threads: int | None = None
+    dpi: int | None = None
+
+    @classmethod
+    def from_options(
+        cls, workers: int | None = None, threads: int | None = None, dpi: int | None = None
+    ) -> "OcrSettings | None":
+        """Build settings from optional user options (None when all are defaults).
+
+        Raises:
+            ValueError: If a value is out of range.
+        """
+        if workers is None and threads is None and dpi is None:
+            return None
+        return cls(workers=workers, threads=threads, dpi=dpi)
+
+    def __post_init__(self) -> None:
+        for name in ("workers", "threads"):
+            value = getattr(self, name)
+            if value is not None and value < 1:
+                msg = f"OCR {name} must be at least 1 (got {value})"
+                raise ValueError(msg)
+        if self.dpi is not None and not OCR_MIN_DPI <= self.dpi <= OCR_MAX_DPI:
+            msg = f"OCR DPI must be between {OCR_MIN_DPI} and {OCR_MAX_DPI} (got {self.dpi})"
+            raise ValueError(msg)
+
+    def kreuzberg_config(self) -> OcrConfig | None:
+        """Kreuzberg OCR config for these settings (None = Kreuzberg defaults)."""
+        if self.dpi is None:
+            return None
+        preprocessing = ImagePreprocessingConfig(target_dpi=self.dpi)
+        return OcrConfig(tesseract_config=TesseractConfig(preprocessing=preprocessing))
+
+    def dpi_tiers(self) -> tuple[int, ...]:
+        """DPIs to try in order, cheapest first: the fixed dpi, or the adaptive tiers."""
+        return (self.dpi,) if self.dpi is not None else OCR_ADAPTIVE_DPI_TIERS
+
+    def cache_settings(self) -> dict[str, int]:
+        """Settings that change OCR output, for cache keys (empty = defaults)."""
+        return {"ocr_dpi": self.dpi} if self.dpi is not None else {}
+
+
+def apply_ocr_threads(threads: int | None) -> None:
+    """Cap Kreuzberg's OCR thread pool for this process and processes it spawns.
+
+    Kreuzberg reads the limit when its thread pool starts, so this takes effect only
+    if the process has not run OCR yet.
+    """
+    if threads is not None:
+        os.environ[OCR_THREADS_ENV] = str(threads)
@@ -0,0 +1,90 @@
+"""Process-pool batch conversion: fan files out across worker processes."""
+
+import logging
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from to_markdown.core.batch import BatchResult, _record_error, _resolve_batch_output
+from to_markdown.core.cache_lookups import counting_lookups, merge_lookups
+from to_markdown.core.constants import BATCH_PROCESS_START_METHOD
+from to_markdown.core.event_loop import install_process_loop
+from to_markdown.core.pipeline import convert_file
+from to_markdown.core.progress import _make_progress
+
+logger = logging.getLogger(__name__)
+
+
+def _init_pool_worker(log_level: int) -> None:
+    """Configure a freshly spawned pool worker: parent's log level, one event loop.
+
+    The worker converts many files; a persistent loop lets them share the LLM
+    client's keep-alive connections.
+    """
+    logging.basicConfig(level=log_level, format="%(levelname)s: %(message)s")
+    install_process_loop()
+
+
+def _convert_counted(file_path: Path, **options: object) -> tuple[Path, dict[str, int]]:
+    """Worker: convert one file; return its output path and the cache lookups it made."""
+    with counting_lookups() as lookups:
+        converted = convert_file(file_path, **options)
+    return converted, dict(lookups)
+
+
+def convert_batch_parallel(
+    files: list[Path],
+    output_dir: Path | None,
+    *,
+    batch_root: Path | None,
+    options: dict,
+    fail_fast: bool,
+    quiet: bool,
+    workers: int,
+) -> BatchResult:
+    """Fan convert_file() out across a process pool, collecting results as they finish.
+
+        Each worker runs the full per-file pipeline (extraction + LLM features + write),
+        so CPU-bound extraction scales with the number of cores. With fail_fast, pending
+        files are cancelled on the first failure; files already running are still recorded.
+    Workers hand back the cache lookups they made, so the run's reuse summary counts
+    only this batch.
+    """
+    result = BatchResult()
+    context = multiprocessing.get_context(BATCH_PROCESS_START_METHOD)
+
+    progress_ctx = _make_progress(quiet, len(files))
+    with (
+        progress_ctx as update_fn,
+        ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_pool_worker,
+            initargs=(logging.getLogger().getEffectiveLevel(),),
+        ) as executor,
+    ):
+        futures: dict[Future, Path] = {}
+        for file_path in files:
+            out = None
+            if output_dir is not None:
+                out = _resolve_batch_output(file_path, output_dir, batch_root)
+            future = executor.submit(_convert_counted, file_path, output_path=out, **options)
+            futures[future] = file_path
+
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            file_path = futures[future]
+            update_fn(file_path.name)
+            try:
+                converted, lookups = future.result()
+            except Exception as exc:
+                if _record_error(result, file_path, exc) and fail_fast:
+                    for pending in futures:
+                        pending.cancel()
+            else:
+                merge_lookups(lookups)
+                result.succeeded.append(converted)
+                logger.info("Converted: %s", file_path.name)
+
+    return result
@@ -2,10 +2,15 @@
 
 import logging
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from to_markdown.core.constants import DEFAULT_OUTPUT_EXTENSION
 from to_markdown.core.content_builder import build_content, build_content_async
 
+if TYPE_CHECKING:
+    from to_markdown.core.extraction import ExtractionResult
+    from to_markdown.core.ocr_settings import OcrSettings
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,6 +27,12 @@ def convert_file(
     summary: bool = False,
     images: bool = False,
     sanitize: bool = True,
+    use_cache: bool = True,
+    stream: bool = False,
+    extracted: "ExtractionResult | None" = None,
+    timeout: float | None = None,
+    ocr: "OcrSettings | None" = None,
+    deterministic: bool = False,
 ) -> Path:
     """Convert a file to Markdown with YAML frontmatter.
 
@@ -33,14 +44,27 @@ def convert_file(
         summary: If True, generate a summary section via LLM.
         images: If True, describe images via LLM vision.
         sanitize: If True, strip non-visible characters to prevent prompt injection.
+        use_cache: If False, bypass the on-disk extraction cache.
+        stream: If True, write the output chunk by chunk instead of assembling it in
+            memory. Cannot be combined with clean, summary, or images.
+        extracted: Pre-extracted result for input_path (e.g. from bulk extraction);
+            skips the extraction step.
+        timeout: Extraction deadline in seconds. Extraction then runs in a child
+            process that is killed when the deadline passes.
+        ocr: OCR workers, threads, and DPI for pages that need OCR.
+        deterministic: If True, omit the extraction timestamp and record the source
+            file hash, so an unchanged source converts to byte-identical output.
 
     Returns:
-        Path to the created .md file.
+        Path to the .md file. With force, an existing file whose content would not
+        change is left untouched rather than rewritten.
 
     Raises:
         FileNotFoundError: If the input file does not exist.
+        ValueError: If stream is combined with an LLM feature.
         OutputExistsError: If the output file exists and force is False.
         UnsupportedFormatError: If the file format is not supported.
+        ExtractionTimeoutError: If extraction exceeds the timeout.
         ExtractionError: If extraction fails.
     """
     input_path = Path(input_path).resolve()
@@ -50,9 +74,32 @@ def convert_file(
 
     resolved_output = _resolve_output_path(input_path, output_path)
 
-    if resolved_output.exists() and not force:
-        msg = f"Output file already exists: {resolved_output} (use --force to overwrite)"
-        raise OutputExistsError(msg)
+    check_output_available(resolved_output, force=force)
+
+    if stream and (clean or summary or images):
+        msg = "Streaming output cannot be combined with --clean, --summary, or --images"
+        raise ValueError(msg)
+
+    if timeout is not None and extracted is None:
+        from to_markdown.core.watchdog import extract_with_timeout
+
+        extracted = extract_with_timeout(
+            input_path, timeout=timeout, extract_images=images, use_cache=use_cache, ocr=ocr
+        )
+
+    if stream:
+        from to_markdown.core.streaming import write_streaming
+
+        return write_streaming(
+            input_path,
+            resolved_output,
+            force=force,
+            sanitize=sanitize,
+            use_cache=use_cache,
+            extracted=extracted,
+            ocr=ocr,
+            deterministic=deterministic,
+        )
 
     markdown = build_content(
         input_path,
@@ -60,22 +107,13 @@ def convert_file(
         summary=summary,
         images=images,
         sanitize=sanitize,
+        use_cache=use_cache,
+        extracted=extracted,
+        ocr=ocr,
+        deterministic=deterministic,
     )
 
-    resolved_output.parent.mkdir(parents=True, exist_ok=True)
-    if force:
-        resolved_output.write_text(markdown, encoding="utf-8")
-    else:
-        try:
-            with open(resolved_output, "x", encoding="utf-8") as f:
-                f.write(markdown)
-        except FileExistsError as exc:
-            msg = f"Output file already exists: {resolved_output} (use --force to overwrite)"
-            raise OutputExistsError(msg) from exc
-
-    logger.info("Wrote: %s", resolved_output)
-
-    return resolved_output
+    return write_output(resolved_output, markdown, force=force)
 
 
 def convert_to_string(
@@ -85,6 +123,8 @@ def convert_to_string(
     summary: bool = False,
     images: bool = False,
     sanitize: bool = True,
+    use_cache: bool = True,
+    ocr: "OcrSettings | None" = None,
 ) -> str:
     """Convert a file to Markdown and return the content as a string.
 
@@ -97,6 +137,8 @@ def convert_to_string(
         summary: If True, generate a summary section via LLM.
         images: If True, describe images via LLM vision.
         sanitize: If True, strip non-visible characters to prevent prompt injection.
+        use_cache: If False, bypass the on-disk extraction cache.
+        ocr: OCR workers, threads, and DPI for pages that need OCR.
 
     Returns:
         Assembled markdown string with frontmatter and content.
@@ -117,6 +159,8 @@ def convert_to_string(
         summary=summary,
         images=images,
         sanitize=sanitize,
+        use_cache=use_cache,
+        ocr=ocr,
     )
 
 
@@ -129,6 +173,9 @@ async def convert_file_async(
     summary: bool = False,
     images: bool = False,
     sanitize: bool = True,
+    use_cache: bool = True,
+    ocr: "OcrSettings | None" = None,
+    deterministic: bool = False,
 ) -> Path:
     """Async version of convert_file() for use inside a running event loop (e.g. MCP).
 
@@ -142,9 +189,7 @@ async def convert_file_async(
 
     resolved_output = _resolve_output_path(input_path, output_path)
 
-    if resolved_output.exists() and not force:
-        msg = f"Output file already exists: {resolved_output} (use --force to overwrite)"
-        raise OutputExistsError(msg)
+    check_output_available(resolved_output, force=force)
 
     markdown = await build_content_async(
         input_path,
@@ -152,22 +197,12 @@ async def convert_file_async(
         summary=summary,
         images=images,
         sanitize=sanitize,
+        use_cache=use_cache,
+        ocr=ocr,
+        deterministic=deterministic,
     )
 
-    resolved_output.parent.mkdir(parents=True, exist_ok=True)
-    if force:
-        resolved_output.write_text(markdown, encoding="utf-8")
-    else:
-        try:
-            with open(resolved_output, "x", encoding="utf-8") as f:
-                f.write(markdown)
-        except FileExistsError as exc:
-            msg = f"Output file already exists: {resolved_output} (use --force to overwrite)"
-            raise OutputExistsError(msg) from exc
-
-    logger.info("Wrote: %s", resolved_output)
-
-    return resolved_output
+    return write_output(resolved_output, markdown, force=force)
 
 
 async def convert_to_string_async(
@@ -177,6 +212,8 @@ async def convert_to_string_async(
     summary: bool = False,
     images: bool = False,
     sanitize: bool = True,
+    use_cache: bool = True,
+    ocr: "OcrSettings | None" = None,
 ) -> str:
     """Async version of convert_to_string() for use inside a running event loop (e.g. MCP).
 
@@ -194,9 +231,53 @@ async def convert_to_string_async(
         summary=summary,
         images=images,
         sanitize=sanitize,
+        use_cache=use_cache,
+        ocr=ocr,
     )
 
 
+def check_output_available(resolved_output: Path, *, force: bool) -> None:
+    """Raise OutputExistsError if resolved_output exists and force is False."""
+    if resolved_output.exists() and not force:
+        msg = f"Output file already exists: {resolved_output} (use --force to overwrite)"
+        raise OutputExistsError(msg)
+
+
+def write_output(resolved_output: Path, markdown: str, *, force: bool) -> Path:
+    """Atomically write assembled markdown, creating parent dirs; exclusive unless force.
+
+    With force, an existing file that already holds exactly this markdown is not
+    rewritten, so its mtime stays put for rsync, git, and re-indexing.
+    """
+    from to_markdown.core.atomic_write import atomic_output
+
+    resolved_output.parent.mkdir(parents=True, exist_ok=True)
+    if force and _unchanged(resolved_output, markdown):
+        logger.info("Unchanged: %s", resolved_output)
+        return resolved_output
+    try:
+        with atomic_output(resolved_output, overwrite=force) as f:
+            f.write(markdown)
+    except FileExistsError as exc:
+        msg = f"Output file already exists: {resolved_output} (use --force to overwrite)"
+        raise OutputExistsError(msg) from exc
+
+    logger.info("Wrote: %s", resolved_output)
+
+    return resolved_output
+
+
+def _unchanged(resolved_output: Path, markdown: str) -> bool:
+    """True if resolved_output exists with exactly this content (size checked first)."""
+    encoded = markdown.encode("utf-8")
+    try:
+        if resolved_output.stat().st_size != len(encoded):
+            return False
+        return resolved_output.read_bytes() == encoded
+    except OSError:
+        return False
+
+
 def _resolve_output_path(input_path: Path, output_path: Path | None) -> Path:
     """Resolve the output file path.
 
@@ -0,0 +1,48 @@
+"""Progress reporting for batch conversion (Rich progress bar or no-op)."""
+
+
+class _NoProgress:
+    """Null progress context for quiet mode."""
+
+    def __enter__(self):
+        return lambda _name: None
+
+    def __exit__(self, *_args):
+        pass
+
+
+class _RichProgress:
+    """Rich progress bar wrapper for batch conversion."""
+
+    def __init__(self, total: int) -> None:
+        self._total = total
+        self._progress = None
+        self._task_id = None
+
+    def __enter__(self):
+        from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn
+
+        self._progress = Progress(
+            TextColumn("[bold blue]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TextColumn("[dim]{task.fields[filename]}"),
+        )
+        self._progress.__enter__()
+        self._task_id = self._progress.add_task("Converting", total=self._total, filename="")
+        return self._update
+
+    def _update(self, filename: str) -> None:
+        if self._progress is not None and self._task_id is not None:
+            self._progress.update(self._task_id, advance=1, filename=filename)
+
+    def __exit__(self, *args):
+        if self._progress is not None:
+            self._progress.__exit__(*args)
+
+
+def _make_progress(quiet: bool, total: int) -> _NoProgress | _RichProgress:
+    """Create appropriate progress context based on quiet flag."""
+    if quiet:
+        return _NoProgress()
+    return _RichProgress(total)
@@ -0,0 +1,67 @@
+"""Format sniffing: skip files Kreuzberg cannot convert before any extraction call.
+
+A file is convertible if the fast path handles its extension or Kreuzberg maps the
+extension to a supported MIME type, and its leading bytes are not the signature of
+an executable, bytecode, or database file. Decided per file from its first few bytes,
+so a repository full of build artifacts costs one small read per artifact.
+"""
+
+import logging
+from pathlib import Path
+
+from kreuzberg import detect_mime_type_from_path, validate_mime_type
+
+from to_markdown.core.constants import SNIFF_BINARY_SIGNATURES, SNIFF_HEAD_BYTES
+from to_markdown.core.text_extraction import is_fast_path
+
+logger = logging.getLogger(__name__)
+
+# Lowercased extension -> whether Kreuzberg supports its MIME type
+_supported_suffixes: dict[str, bool] = {}
+
+
+def sniff_file(path: Path) -> str | None:
+    """Return why path cannot be converted, or None if it looks convertible.
+
+    Unreadable files return None: conversion reports the real error for them.
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(SNIFF_HEAD_BYTES)
+    except OSError:
+        return None
+    if not is_fast_path(path) and not _kreuzberg_supports(path):
+        return f"Unsupported format: {path.suffix or path.name}"
+    for signature, kind in SNIFF_BINARY_SIGNATURES.items():
+        if head.startswith(signature):
+            return f"Unsupported format: {kind} ({path.suffix})"
+    return None
+
+
+def partition_convertible(files: list[Path]) -> tuple[list[Path], list[tuple[Path, str]]]:
+    """Split files into (convertible, skipped) where skipped pairs carry the reason."""
+    convertible: list[Path] = []
+    skipped: list[tuple[Path, str]] = []
+    for path in files:
+        reason = sniff_file(path)
+        if reason is None:
+            convertible.append(path)
+        else:
+            skipped.append((path, reason))
+            logger.debug("Skipped (%s): %s", reason, path.name)
+    if skipped:
+        logger.info("Skipping %d unsupported file(s) before extraction", len(skipped))
+    return convertible, skipped
+
+
+def _kreuzberg_supports(path: Path) -> bool:
+    """Check path's extension against Kreuzberg's supported MIME types (cached per suffix)."""
+    suffix = path.suffix.lower()
+    if suffix not in _supported_suffixes:
+        try:
+            validate_mime_type(detect_mime_type_from_path(path))
+        except RuntimeError:
+            _supported_suffixes[suffix] = False
+        else:
+            _supported_suffixes[suffix] = True
+    return _supported_suffixes[suffix]
@@ -0,0 +1,176 @@
+"""Streaming output: write frontmatter, then sanitized content chunk by chunk.
+
+Avoids the full-document copies the buffered pipeline makes (sanitized copy,
+assembled markdown string), so peak memory beyond the extraction result itself is
+bounded by the chunk size. LLM features need the whole document and are not
+supported in this mode.
+
+The frontmatter (word count, sanitized flag) precedes the body but depends on all
+of it. Content needing sanitization is sanitized once, chunk by chunk, into a spool
+file beside the output while words are counted, then copied in after the
+frontmatter. Other content is simply read twice.
+
+As in the buffered pipeline, a forced rewrite with identical bytes leaves the
+existing output untouched. The body is hashed during the word-count pass and
+compared with the existing file before anything is written.
+"""
+
+import contextlib
+import hashlib
+import logging
+import shutil
+import tempfile
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, TextIO
+
+from to_markdown.core.atomic_write import atomic_output
+from to_markdown.core.constants import STREAM_CHUNK_CHARS
+from to_markdown.core.extraction import ExtractionResult, extract_file
+from to_markdown.core.frontmatter import compose_frontmatter, source_digest
+
+if TYPE_CHECKING:
+    from to_markdown.core.ocr_settings import OcrSettings
+
+logger = logging.getLogger(__name__)
+
+
+def iter_chunks(content: str, chunk_chars: int = STREAM_CHUNK_CHARS) -> Iterator[str]:
+    """Yield consecutive slices of content, ending each on a line break when possible."""
+    start, length = 0, len(content)
+    while start < length:
+        end = min(start + chunk_chars, length)
+        if end < length:
+            newline = content.rfind("\n", start, end)
+            if newline > start:
+                end = newline + 1
+        yield content[start:end]
+        start = end
+
+
+def write_streaming(
+    input_path: Path,
+    resolved_output: Path,
+    *,
+    force: bool,
+    sanitize: bool = True,
+    use_cache: bool = True,
+    chunk_chars: int = STREAM_CHUNK_CHARS,
+    extracted: ExtractionResult | None = None,
+    ocr: "OcrSettings | None" = None,
+    deterministic: bool = False,
+) -> Path:
+    """Extract input_path and stream the markdown to resolved_output.
+
+    Args:
+        input_path: Resolved path to the source file.
+        resolved_output: Output file path.
+        force: If True, overwrite an existing output file.
+        sanitize: If True, strip non-visible characters from each chunk.
+        use_cache: If False, bypass the on-disk extraction cache.
+        chunk_chars: Maximum characters sanitized and written per chunk.
+        extracted: Pre-extracted result for input_path; skips the extraction step.
+        ocr: OCR workers, threads, and DPI for pages that need OCR.
+        deterministic: If True, record the source hash instead of a timestamp.
+
+    Returns:
+        Path to the written .md file.
+
+    Raises:
+        OutputExistsError: If the output file exists and force is False.
+    """
+    from to_markdown.core.pipeline import OutputExistsError
+    from to_markdown.core.sanitize import contains_invisible
+
+    exists_msg = f"Output file already exists: {resolved_output} (use --force to overwrite)"
+    if not force and resolved_output.exists():
+        raise OutputExistsError(exists_msg)
+    result = extracted
+    if result is None:
+        logger.info("Extracting: %s", input_path.name)
+        result = extract_file(input_path, use_cache=use_cache, ocr=ocr)
+
+    sanitized = sanitize and contains_invisible(result.content)
+    resolved_output.parent.mkdir(parents=True, exist_ok=True)
+    with contextlib.ExitStack() as stack:
+        chunks: Iterable[str] = _body_chunks(result.content, chunk_chars, sanitized=sanitized)
+        spool = None
+        if sanitized:
+            spool = stack.enter_context(
+                tempfile.TemporaryFile(
+                    "w+", encoding="utf-8", newline="", dir=resolved_output.parent
+                )
+            )
+            chunks = _spooled(chunks, spool)
+        body = hashlib.sha256() if force else None
+        frontmatter = compose_frontmatter(
+            result.metadata,
+            input_path,
+            sanitized=sanitized,
+            words=_count_words(chunks, digest=body),
+            source_sha256=source_digest(input_path) if deterministic else None,
+        )
+        if body is not None and _unchanged(resolved_output, frontmatter + "\n", body.digest()):
+            logger.info("Unchanged: %s", resolved_output)
+            return resolved_output
+        try:
+            with atomic_output(resolved_output, overwrite=force) as f:
+                f.write(frontmatter + "\n")
+                if spool is not None:
+                    spool.seek(0)
+                    shutil.copyfileobj(spool, f, chunk_chars)
+                else:
+                    f.writelines(iter_chunks(result.content, chunk_chars))
+        except FileExistsError as exc:
+            raise OutputExistsError(exists_msg) from exc
+
+    logger.info("Wrote: %s", resolved_output)
+    return resolved_output
+
+
+def _body_chunks(content: str, chunk_chars: int, *, sanitized: bool) -> Iterator[str]:
+    """The body as written, chunk by chunk, skipping chunks sanitized away entirely."""
+    from to_markdown.core.sanitize import sanitize_content
+
+    for chunk in iter_chunks(content, chunk_chars):
+        if sanitized:
+            chunk = sanitize_content(chunk).content
+            if not chunk:
+                continue
+        yield chunk
+
+
+def _spooled(chunks: Iterable[str], spool: TextIO) -> Iterator[str]:
+    """Pass chunks through, writing each to spool as well."""
+    for chunk in chunks:
+        spool.write(chunk)
+        yield chunk
+
+
+def _count_words(chunks: Iterable[str], *, digest: "hashlib._Hash | None" = None) -> int:
+    """Count words chunk by chunk (no whole-document word list), as the buffered path does.
+
+    If digest is given, it is also fed the UTF-8 body.
+    """
+    words, joined = 0, False
+    for chunk in chunks:
+        if digest is not None:
+            digest.update(chunk.encode("utf-8"))
+        words += len(chunk.split())
+        # A chunk cut mid-line may also cut a word in two
+        if joined and not chunk[0].isspace():
+            words -= 1
+        joined = not chunk[-1].isspace()
+    return words
+
+
+def _unchanged(resolved_output: Path, header: str, body_digest: bytes) -> bool:
+    """True if resolved_output is header followed by a body with this SHA-256 digest."""
+    encoded = header.encode("utf-8")
+    try:
+        with resolved_output.open("rb") as f:
+            if f.read(len(encoded)) != encoded:
+                return False
+            return hashlib.file_digest(f, "sha256").digest() == body_digest
+    except OSError:
+        return False
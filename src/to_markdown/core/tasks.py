@@ -9,6 +9,7 @@ from enum import Enum
 from pathlib import Path
 
 from to_markdown.core.constants import (
+    DATA_DIR_ENV,
     TASK_DB_FILENAME,
     TASK_ID_LENGTH,
     TASK_LIST_MAX_RESULTS,
@@ -309,7 +310,7 @@ def get_default_store() -> TaskStore:
     """Get or create the default TaskStore singleton."""
     global _default_store
     if _default_store is None:
-        data_dir = os.environ.get("TO_MARKDOWN_DATA_DIR")
+        data_dir = os.environ.get(DATA_DIR_ENV)
         if data_dir:
             db_path = Path(data_dir) / TASK_DB_FILENAME
         else:
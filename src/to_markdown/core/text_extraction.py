@@ -0,0 +1,154 @@
+"""Native fast path for plain-text, Markdown, source, and data files (no Kreuzberg).
+
+These formats need no parsing, so Kreuzberg's per-call overhead dominates their
+extraction time. Files are decoded block by block (BOM, then UTF-8, then a legacy
+fallback), source and data files are wrapped in a code fence, and huge files such
+as logs are truncated at a line or byte cap.
+"""
+
+import codecs
+import logging
+import re
+from pathlib import Path
+from typing import BinaryIO
+
+from to_markdown.core.constants import (
+    BYTES_PER_MEBIBYTE,
+    FAST_PATH_BLOCK_SIZE,
+    FAST_PATH_CODE_LANGUAGES,
+    FAST_PATH_FALLBACK_ENCODING,
+    FAST_PATH_MARKDOWN_EXTENSIONS,
+    FAST_PATH_MAX_BYTES,
+    FAST_PATH_MAX_LINES,
+    FAST_PATH_TEXT_EXTENSIONS,
+    FAST_PATH_TRUNCATION_NOTICE,
+)
+from to_markdown.core.extraction import ExtractionResult
+
+logger = logging.getLogger(__name__)
+
+# Longest BOMs first: the UTF-32-LE BOM begins with the UTF-16-LE one
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+_HEADING_RE = re.compile(r"^#[ \t]+(.+?)[ \t#]*$", re.MULTILINE)
+_BACKTICK_RUN_RE = re.compile(r"`{3,}")
+
+
+def is_fast_path(path: Path) -> bool:
+    """Return True if path's extension is handled without Kreuzberg."""
+    suffix = path.suffix.lower()
+    return (
+        suffix in FAST_PATH_TEXT_EXTENSIONS
+        or suffix in FAST_PATH_MARKDOWN_EXTENSIONS
+        or suffix in FAST_PATH_CODE_LANGUAGES
+    )
+
+
+def extract_text_file(
+    path: Path,
+    *,
+    max_bytes: int = FAST_PATH_MAX_BYTES,
+    max_lines: int = FAST_PATH_MAX_LINES,
+) -> ExtractionResult | None:
+    """Extract a plain-text, Markdown, source, or data file without Kreuzberg.
+
+    Metadata mirrors what Kreuzberg reports for the same file: the first heading as
+    ``title`` for Markdown, character/line/word counts for everything else.
+
+    Returns:
+        ExtractionResult, or None if the file looks binary (left to Kreuzberg).
+    """
+    with open(path, "rb") as f:
+        encoding = _detect_encoding(f.read(FAST_PATH_BLOCK_SIZE))
+        if encoding is None:
+            return None
+        f.seek(0)
+        try:
+            text, limit = _decode(f, encoding, "strict", max_bytes, max_lines)
+        except UnicodeDecodeError:
+            logger.debug(
+                "%s is not valid %s; using %s", path.name, encoding, FAST_PATH_FALLBACK_ENCODING
+            )
+            f.seek(0)
+            text, limit = _decode(f, FAST_PATH_FALLBACK_ENCODING, "replace", max_bytes, max_lines)
+
+    text = text.lstrip("\r\n").rstrip()
+    suffix = path.suffix.lower()
+    metadata: dict = {"output_format": "markdown", "quality_score": 1.0}
+    if suffix in FAST_PATH_MARKDOWN_EXTENSIONS:
+        heading = _HEADING_RE.search(text)
+        if heading:
+            metadata["title"] = heading.group(1)
+    else:
+        metadata.update(
+            format_type="text",
+            character_count=len(text),
+            line_count=text.count("\n") + 1 if text else 0,
+            word_count=len(text.split()),
+        )
+
+    content = text
+    if suffix in FAST_PATH_CODE_LANGUAGES:
+        content = fence(text, FAST_PATH_CODE_LANGUAGES[suffix])
+    if limit is not None:
+        logger.warning("Truncated %s at the %s limit", path.name, limit)
+        metadata["truncated"] = True
+        content += FAST_PATH_TRUNCATION_NOTICE.format(name=path.name, limit=limit)
+    return ExtractionResult(content=content, metadata=metadata)
+
+
+def fence(text: str, language: str) -> str:
+    """Wrap text in a code fence longer than any backtick run inside it."""
+    longest = max((len(run) for run in _BACKTICK_RUN_RE.findall(text)), default=2)
+    ticks = "`" * (longest + 1)
+    return f"{ticks}{language}\n{text}\n{ticks}"
+
+
+def _detect_encoding(head: bytes) -> str | None:
+    """Pick a decoder from the byte-order mark; None if BOM-less data contains NULs."""
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding
+    return None if b"\x00" in head else "utf-8"
+
+
+def _decode(
+    f: BinaryIO, encoding: str, errors: str, max_bytes: int, max_lines: int
+) -> tuple[str, str | None]:
+    """Decode a file block by block, stopping at max_bytes or max_lines.
+
+    Returns:
+        (text, limit): limit describes the cap that truncated the text, or None.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors=errors)
+    parts: list[str] = []
+    lines = consumed = 0
+    while block := f.read(min(FAST_PATH_BLOCK_SIZE, max_bytes - consumed)):
+        consumed += len(block)
+        text = decoder.decode(block)
+        if lines + text.count("\n") > max_lines:
+            # Keep text up to (not including) the newline ending line max_lines
+            kept = text.split("\n", max_lines - lines)[:-1]
+            parts.append("\n".join(kept))
+            return "".join(parts), f"{max_lines:,}-line"
+        lines += text.count("\n")
+        parts.append(text)
+        if consumed >= max_bytes and f.read(1):
+            # Drop the partial last line so truncated output ends cleanly
+            joined = "".join(parts)
+            cut = joined.rfind("\n")
+            return joined[: cut + 1] if cut >= 0 else joined, _size_label(max_bytes)
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts), None
+
+
+def _size_label(max_bytes: int) -> str:
+    if max_bytes >= BYTES_PER_MEBIBYTE:
+        return f"{max_bytes // BYTES_PER_MEBIBYTE} MiB"
+    return f"{max_bytes:,}-byte"
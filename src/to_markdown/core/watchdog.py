@@ -0,0 +1,151 @@
+"""Per-file extraction deadline: extraction runs in a child process killed on timeout.
+
+A pathological document (e.g. a malformed PDF that makes the extractor spin) costs
+only its own deadline; the child is restarted and later files are unaffected.
+"""
+
+import contextlib
+import logging
+import multiprocessing
+from collections.abc import Callable
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from to_markdown.core.cache_lookups import counting_lookups, merge_lookups
+from to_markdown.core.constants import BATCH_PROCESS_START_METHOD, WATCHDOG_KILL_GRACE_SECONDS
+from to_markdown.core.extraction import ExtractionError, ExtractionResult, extract_file
+
+if TYPE_CHECKING:
+    from to_markdown.core.ocr_settings import OcrSettings
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionTimeoutError(ExtractionError):
+    """Raised when extracting a file exceeds the per-file deadline."""
+
+
+class ExtractionWatchdog:
+    """Extract files in a reusable child process, killing it past a per-file deadline.
+
+    The child is started on first use and restarted after a kill or crash. Not
+    thread-safe: use one watchdog per concurrent extraction.
+
+    Args:
+        timeout: Seconds each file may take before its extraction is killed.
+        target: Picklable extraction function run in the child (extract_file()).
+    """
+
+    def __init__(
+        self, timeout: float, *, target: Callable[..., ExtractionResult] = extract_file
+    ) -> None:
+        self.timeout = timeout
+        self._target = target
+        self._process: multiprocessing.Process | None = None
+        self._conn: Connection | None = None
+
+    def extract(
+        self,
+        path: Path,
+        *,
+        extract_images: bool = False,
+        use_cache: bool = True,
+        ocr: "OcrSettings | None" = None,
+    ) -> ExtractionResult:
+        """Extract path in the child process.
+
+        Raises:
+            ExtractionTimeoutError: If extraction did not finish within the deadline.
+            ExtractionError: If the child process died mid-extraction.
+            Any exception extract_file() raises for the file.
+        """
+        conn = self._ensure_child()
+        conn.send((path, {"extract_images": extract_images, "use_cache": use_cache, "ocr": ocr}))
+        if not conn.poll(self.timeout):
+            self._kill()
+            msg = f"Extraction timed out after {self.timeout:g}s: {path.name}"
+            raise ExtractionTimeoutError(msg)
+        try:
+            ok, payload, lookups = conn.recv()
+        except EOFError as exc:
+            self._kill()
+            msg = f"Extraction process died while extracting {path.name}"
+            raise ExtractionError(msg) from exc
+        merge_lookups(lookups)
+        if not ok:
+            raise payload
+        return payload
+
+    def close(self) -> None:
+        """Stop the child process (gracefully if idle)."""
+        if self._conn is not None and self._process is not None:
+            with contextlib.suppress(OSError):
+                self._conn.send(None)
+            self._process.join(WATCHDOG_KILL_GRACE_SECONDS)
+        self._kill()
+
+    def __enter__(self) -> "ExtractionWatchdog":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def _ensure_child(self) -> Connection:
+        if self._process is None or not self._process.is_alive():
+            self._kill()
+            context = multiprocessing.get_context(BATCH_PROCESS_START_METHOD)
+            self._conn, child_conn = context.Pipe()
+            level = logging.getLogger().getEffectiveLevel()
+            self._process = context.Process(
+                target=_serve, args=(child_conn, self._target, level), daemon=True
+            )
+            self._process.start()
+            child_conn.close()
+        return self._conn
+
+    def _kill(self) -> None:
+        if self._process is not None:
+            if self._process.is_alive():
+                logger.debug("Killing extraction process %s", self._process.pid)
+                self._process.kill()
+            self._process.join(WATCHDOG_KILL_GRACE_SECONDS)
+            self._process = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def extract_with_timeout(
+    path: Path,
+    *,
+    timeout: float,
+    extract_images: bool = False,
+    use_cache: bool = True,
+    ocr: "OcrSettings | None" = None,
+) -> ExtractionResult:
+    """Extract one file in a one-shot child process with a deadline."""
+    with ExtractionWatchdog(timeout) as watchdog:
+        return watchdog.extract(path, extract_images=extract_images, use_cache=use_cache, ocr=ocr)
+
+
+def _serve(conn: Connection, target: Callable[..., ExtractionResult], log_level: int) -> None:
+    """Child process loop: extract requested files until told to stop."""
+    logging.basicConfig(level=log_level, format="%(levelname)s: %(message)s")
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:  # parent went away
+            return
+        if request is None:
+            return
+        path, options = request
+        with counting_lookups() as lookups:
+            try:
+                ok, payload = True, target(path, **options)
+            except Exception as exc:
+                ok, payload = False, exc
+        try:
+            conn.send((ok, payload, dict(lookups)))
+        except Exception:  # unpicklable exception: send its message instead
+            conn.send((False, ExtractionError(str(payload)), dict(lookups)))
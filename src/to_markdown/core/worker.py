@@ -6,14 +6,21 @@ import os
 import signal
 import subprocess
 import sys
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from to_markdown.core.constants import (
+    DATA_DIR_ENV,
+    DEFAULT_BATCH_JOBS,
     EXIT_ERROR,
     WORKER_FLAG,
 )
 from to_markdown.core.tasks import TaskStatus, TaskStore, _now_iso
 
+if TYPE_CHECKING:
+    from to_markdown.core.ocr_settings import OcrSettings
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,7 +41,7 @@ def spawn_worker(task_id: str, store: TaskStore) -> int:
         cmd = [sys.executable, "-m", "to_markdown.cli", WORKER_FLAG, task_id]
 
         env = os.environ.copy()
-        env["TO_MARKDOWN_DATA_DIR"] = str(store.db_path.parent)
+        env[DATA_DIR_ENV] = str(store.db_path.parent)
 
         process = subprocess.Popen(
             cmd,
@@ -91,6 +98,7 @@ def run_worker(task_id: str, store: TaskStore) -> None:
     try:
         is_batch = args.get("is_batch", False)
         input_path = args.get("input_path", task.input_path)
+        ocr = _ocr_settings(args)
 
         if is_batch:
             from to_markdown.core.batch import convert_batch, discover_files, resolve_glob
@@ -98,17 +106,24 @@ def run_worker(task_id: str, store: TaskStore) -> None:
             source = Path(input_path)
             is_glob = args.get("is_glob", False)
             recursive = args.get("recursive", True)
+            filters = {key: args[key] for key in ("include", "exclude") if args.get(key)}
 
             if is_glob:
-                files = resolve_glob(input_path)
+                files = resolve_glob(input_path, **filters)
                 if not files:
                     raise ValueError(f"No files matched glob pattern: {input_path}")
                 batch_root = None  # No root for globs
             else:
-                files = discover_files(source, recursive=recursive)
+                files = discover_files(source, recursive=recursive, **filters)
                 batch_root = source
 
-            result = convert_batch(
+            convert = convert_batch
+            if args.get("incremental"):
+                from to_markdown.core.incremental import convert_incremental
+
+                convert = partial(convert_incremental, prune=args.get("prune", False))
+
+            result = convert(
                 files,
                 output_dir=Path(args["output_path"]) if args.get("output_path") else None,
                 batch_root=batch_root,
@@ -118,13 +133,23 @@ def run_worker(task_id: str, store: TaskStore) -> None:
                 images=args.get("images", False),
                 sanitize=args.get("sanitize", True),
                 quiet=True,
+                jobs=args.get("jobs", DEFAULT_BATCH_JOBS),
+                use_cache=args.get("use_cache", True),
+                stream=args.get("stream", False),
+                timeout=args.get("timeout"),
+                ocr=ocr,
+                deterministic=args.get("deterministic", False),
             )
             output_str = f"{len(result.succeeded)} succeeded, {len(result.failed)} failed"
+            if result.timed_out:
+                output_str += f", {len(result.timed_out)} timed out"
             status = TaskStatus.COMPLETED.value
             error = None
-            if result.failed:
+            if result.failed or result.timed_out:
                 status = TaskStatus.FAILED.value
-                error = "\n".join([f"{path.name}: {err}" for path, err in result.failed])
+                error = "\n".join(
+                    f"{path.name}: {err}" for path, err in [*result.failed, *result.timed_out]
+                )
 
             store.update(
                 task_id,
@@ -144,6 +169,11 @@ def run_worker(task_id: str, store: TaskStore) -> None:
                 summary=args.get("summary", False),
                 images=args.get("images", False),
                 sanitize=args.get("sanitize", True),
+                use_cache=args.get("use_cache", True),
+                stream=args.get("stream", False),
+                timeout=args.get("timeout"),
+                ocr=ocr,
+                deterministic=args.get("deterministic", False),
             )
             store.update(
                 task_id,
@@ -161,3 +191,14 @@ def run_worker(task_id: str, store: TaskStore) -> None:
             error=str(exc),
             completed_at=_now_iso(),
         )
+
+
+def _ocr_settings(args: dict) -> "OcrSettings | None":
+    """Rebuild the task's OCR settings and apply its thread cap to this process."""
+    from to_markdown.core.ocr_settings import OcrSettings, apply_ocr_threads
+
+    ocr = OcrSettings.from_options(
+        args.get("ocr_workers"), args.get("ocr_threads"), args.get("ocr_dpi")
+    )
+    apply_ocr_threads(ocr.threads if ocr else None)
+    return ocr
@@ -44,6 +44,21 @@ async def convert_file(
         bool,
         Field(description="Strip non-visible characters to prevent prompt injection"),
     ] = True,
+    ocr_workers: Annotated[
+        int | None, Field(description="OCR worker processes per scanned PDF (default: auto)")
+    ] = None,
+    ocr_threads: Annotated[
+        int | None, Field(description="OCR threads per worker process (default: all cores)")
+    ] = None,
+    ocr_dpi: Annotated[
+        int | None,
+        Field(
+            description=(
+                "Fixed resolution page images are OCR'd at. Default: adaptive, 150 DPI "
+                "first and 300 only for pages with poor OCR; a fixed value disables this"
+            )
+        ),
+    ] = None,
 ) -> str:
     """Convert a single file to LLM-optimized Markdown with YAML frontmatter.
 
@@ -58,6 +73,9 @@ async def convert_file(
             summary=summary,
             images=images,
             sanitize=sanitize,
+            ocr_workers=ocr_workers,
+            ocr_threads=ocr_threads,
+            ocr_dpi=ocr_dpi,
         )
     except ValueError as exc:
         raise ToolError(str(exc)) from exc
@@ -87,6 +105,29 @@ async def convert_batch(
         bool,
         Field(description="Strip non-visible characters to prevent prompt injection"),
     ] = True,
+    include: Annotated[
+        list[str] | None,
+        Field(description="Only convert files matching these glob patterns (e.g. '*.pdf')"),
+    ] = None,
+    exclude: Annotated[
+        list[str] | None,
+        Field(description="Skip files matching these glob patterns (e.g. 'drafts/*')"),
+    ] = None,
+    ocr_workers: Annotated[
+        int | None, Field(description="OCR worker processes per scanned PDF (default: auto)")
+    ] = None,
+    ocr_threads: Annotated[
+        int | None, Field(description="OCR threads per worker process (default: all cores)")
+    ] = None,
+    ocr_dpi: Annotated[
+        int | None,
+        Field(
+            description=(
+                "Fixed resolution page images are OCR'd at. Default: adaptive, 150 DPI "
+                "first and 300 only for pages with poor OCR; a fixed value disables this"
+            )
+        ),
+    ] = None,
 ) -> str:
     """Convert all supported files in a directory to Markdown.
 
@@ -101,6 +142,11 @@ async def convert_batch(
             summary=summary,
             images=images,
             sanitize=sanitize,
+            include=include,
+            exclude=exclude,
+            ocr_workers=ocr_workers,
+            ocr_threads=ocr_threads,
+            ocr_dpi=ocr_dpi,
         )
     except ValueError as exc:
         raise ToolError(str(exc)) from exc
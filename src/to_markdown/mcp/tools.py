@@ -31,6 +31,9 @@ async def handle_convert_file(
     summary: bool = False,
     images: bool = False,
     sanitize: bool = True,
+    ocr_workers: int | None = None,
+    ocr_threads: int | None = None,
+    ocr_dpi: int | None = None,
 ) -> str:
     """Convert a single file and return structured response with markdown content."""
     path = Path(file_path)
@@ -47,10 +50,14 @@ async def handle_convert_file(
 
     _validate_llm_flags(summary=summary, images=images)
 
+    from to_markdown.core.ocr_settings import OcrSettings, apply_ocr_threads
     from to_markdown.core.pipeline import convert_to_string_async
 
+    ocr = OcrSettings.from_options(ocr_workers, ocr_threads, ocr_dpi)
+    apply_ocr_threads(ocr.threads if ocr else None)
+
     content = await convert_to_string_async(
-        path, clean=clean, summary=summary, images=images, sanitize=sanitize
+        path, clean=clean, summary=summary, images=images, sanitize=sanitize, ocr=ocr
     )
 
     # Build structured response envelope
@@ -88,6 +95,11 @@ async def handle_convert_batch(
     summary: bool = False,
     images: bool = False,
     sanitize: bool = True,
+    include: list[str] | None = None,
+    exclude: list[str] | None = None,
+    ocr_workers: int | None = None,
+    ocr_threads: int | None = None,
+    ocr_dpi: int | None = None,
 ) -> str:
     """Convert all files in a directory and return structured results."""
     path = Path(directory_path)
@@ -105,8 +117,12 @@ async def handle_convert_batch(
     _validate_llm_flags(summary=summary, images=images)
 
     from to_markdown.core.batch import convert_batch_async, discover_files
+    from to_markdown.core.ocr_settings import OcrSettings, apply_ocr_threads
+
+    ocr = OcrSettings.from_options(ocr_workers, ocr_threads, ocr_dpi)
+    apply_ocr_threads(ocr.threads if ocr else None)
 
-    files = discover_files(path, recursive=recursive)
+    files = discover_files(path, recursive=recursive, include=include, exclude=exclude)
     if not files:
         msg = f"No supported files found in: {directory_path}"
         raise ValueError(msg)
@@ -119,6 +135,7 @@ async def handle_convert_batch(
         summary=summary,
         images=images,
         sanitize=sanitize,
+        ocr=ocr,
     )
 
     # Build structured response
@@ -146,6 +163,11 @@ async def handle_convert_batch(
         for p, reason in result.skipped:
             lines.append(f"- {p.name}: {reason}")
 
+    if result.pipeline_stats is not None:
+        lines.append("\n### Pipeline")
+        for line in result.pipeline_stats.summary_lines():
+            lines.append(f"- {line}")
+
     return "\n".join(lines)
 
 
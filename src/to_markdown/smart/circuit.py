@@ -0,0 +1,206 @@
+"""Circuit breaker and retry budget that stop a Gemini outage from stalling a batch.
+
+Without them, every chunk and image of every file retries LLM_RETRY_MAX_ATTEMPTS
+times with backoff of up to a minute before falling back to the original text.
+
+The circuit breaker opens after LLM_CIRCUIT_FAILURE_THRESHOLD consecutive server
+errors. While it is open, LLM calls fail at once and callers fall back to
+non-LLM output. After a cooldown one probe call is let through. A success closes
+the circuit; a failure reopens it with a doubled cooldown.
+
+The retry budget caps the total backoff time spent on retries. It starts at
+TO_MARKDOWN_LLM_RETRY_BUDGET seconds and refills over an hour, so a long-running
+process (the MCP server) gets its budget back. Once it is spent, failed calls
+are not retried.
+
+Both are per process: each --jobs pool worker opens its own circuit.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from tenacity import RetryCallState
+
+from to_markdown.core.constants import (
+    LLM_CIRCUIT_COOLDOWN_SECONDS,
+    LLM_CIRCUIT_FAILURE_THRESHOLD,
+    LLM_CIRCUIT_MAX_COOLDOWN_SECONDS,
+    LLM_DEFAULT_RETRY_BUDGET_SECONDS,
+    LLM_RETRY_BUDGET_ENV,
+    LLM_RETRY_BUDGET_REFILL_SECONDS,
+)
+from to_markdown.smart.rate_limit import env_int
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the API while the circuit is open."""
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker over consecutive call failures.
+
+    Safe to use from several threads and from coroutines on any event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = LLM_CIRCUIT_FAILURE_THRESHOLD,
+        cooldown: float = LLM_CIRCUIT_COOLDOWN_SECONDS,
+        max_cooldown: float = LLM_CIRCUIT_MAX_COOLDOWN_SECONDS,
+    ) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.base_cooldown = cooldown
+        self.max_cooldown = max(cooldown, max_cooldown)
+        self._lock = threading.Lock()
+        self._failures = 0  # Consecutive
+        self._cooldown = cooldown
+        self._opened_at: float | None = None
+        self._probing = False  # A half-open probe call is in flight
+
+    @property
+    def is_open(self) -> bool:
+        """True while calls are being short-circuited (open, or half-open with a probe out)."""
+        with self._lock:
+            return self._opened_at is not None and (self._probing or self._cooling())
+
+    @contextmanager
+    def guard(self, is_failure: Callable[[BaseException], bool]) -> Iterator[None]:
+        """Run one call through the breaker.
+
+        Raises CircuitOpenError without running the call while the circuit is
+        open. A success closes the circuit; an exception for which is_failure is
+        true counts towards opening it. Other exceptions leave it unchanged.
+        """
+        probe = self._admit()
+        try:
+            yield
+        except BaseException as exc:
+            failed = isinstance(exc, Exception) and is_failure(exc)
+            with self._lock:
+                if probe:
+                    self._probing = False
+                if failed:
+                    self._record_failure(probe)
+            raise
+        with self._lock:
+            self._record_success()
+
+    def _admit(self) -> bool:
+        """Let a call through (returning True if it is the half-open probe) or raise."""
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            if self._probing or self._cooling():
+                remaining = self._opened_at + self._cooldown - time.monotonic()
+                msg = f"Gemini circuit open after repeated failures (probing in {remaining:.0f}s)"
+                raise CircuitOpenError(msg)
+            self._probing = True
+            return True
+
+    def _cooling(self) -> bool:
+        return time.monotonic() < self._opened_at + self._cooldown
+
+    def _record_success(self) -> None:
+        if self._opened_at is not None:
+            logger.info("Gemini is responding again: LLM calls resumed")
+        self._failures = 0
+        self._cooldown = self.base_cooldown
+        self._opened_at = None
+        self._probing = False
+
+    def _record_failure(self, probe: bool) -> None:
+        self._failures += 1
+        if probe:
+            self._cooldown = min(self._cooldown * 2, self.max_cooldown)
+            self._opened_at = time.monotonic()
+            logger.warning("Gemini still failing: next probe in %.0fs", self._cooldown)
+        elif self._opened_at is None and self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+            logger.warning(
+                "Gemini failed %d times in a row: skipping LLM calls for %.0fs",
+                self._failures,
+                self._cooldown,
+            )
+
+
+class RetryBudget:
+    """Seconds of retry backoff a process may spend, refilled over time.
+
+    A budget of 0 disables the cap.
+    """
+
+    def __init__(self, seconds: float, *, refill_seconds: float = LLM_RETRY_BUDGET_REFILL_SECONDS):
+        self.seconds = seconds
+        self.refill_seconds = refill_seconds
+        self._lock = threading.Lock()
+        self._level = seconds
+        self._updated = time.monotonic()
+        self._exhausted = False  # Warned about the current exhaustion
+
+    @property
+    def remaining(self) -> float:
+        """Seconds of backoff currently available."""
+        with self._lock:
+            self._refill()
+            return self._level
+
+    def try_spend(self, seconds: float) -> bool:
+        """Take seconds of backoff from the budget; False (nothing taken) if it is short."""
+        if not self.seconds:
+            return True
+        with self._lock:
+            self._refill()
+            if self._level >= seconds:
+                self._level -= seconds
+                self._exhausted = False
+                return True
+            if not self._exhausted:
+                self._exhausted = True
+                logger.warning("LLM retry budget spent: failed calls are no longer retried")
+            return False
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        rate = self.seconds / self.refill_seconds
+        self._level = min(self.seconds, self._level + (now - self._updated) * rate)
+        self._updated = now
+
+
+_breaker: CircuitBreaker | None = None
+_budget: RetryBudget | None = None
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """Get or create the process-wide circuit breaker."""
+    global _breaker
+    if _breaker is None:
+        _breaker = CircuitBreaker()
+    return _breaker
+
+
+def get_retry_budget() -> RetryBudget:
+    """Get or create the process-wide retry budget (TO_MARKDOWN_LLM_RETRY_BUDGET seconds)."""
+    global _budget
+    if _budget is None:
+        _budget = RetryBudget(env_int(LLM_RETRY_BUDGET_ENV, LLM_DEFAULT_RETRY_BUDGET_SECONDS))
+    return _budget
+
+
+def stop_early(retry_state: RetryCallState) -> bool:
+    """Tenacity stop: give up once the circuit is open or the budget can't cover the wait."""
+    if get_circuit_breaker().is_open:
+        return True
+    return not get_retry_budget().try_spend(retry_state.upcoming_sleep)
+
+
+def reset_circuit() -> None:
+    """Forget the process-wide circuit breaker and retry budget (for testing)."""
+    global _breaker, _budget
+    _breaker = None
+    _budget = None
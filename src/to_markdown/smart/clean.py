@@ -1,17 +1,21 @@
-"""LLM-powered content cleanup: fix extraction artifacts without altering content."""
+"""LLM-powered content cleanup: fix extraction artifacts without altering content.
+
+Content is cleaned in structure-aware chunks of at most CLEAN_CHUNK_TOKENS (see
+core/chunking.py), so each response stays well within the output budget and
+the async path can clean many chunks in parallel.
+"""
 
 import asyncio
 import logging
+from typing import TYPE_CHECKING
 
-from to_markdown.core.constants import (
-    CHARS_PER_TOKEN_ESTIMATE,
-    CLEAN_PROMPT,
-    CLEAN_TEMPERATURE,
-    MAX_CLEAN_TOKENS,
-    PARALLEL_LLM_MAX_CONCURRENCY,
-)
+from to_markdown.core.chunking import Chunk, chunk_markdown, join_chunks
+from to_markdown.core.constants import CLEAN_CHUNK_TOKENS, CLEAN_PROMPT, CLEAN_TEMPERATURE
 from to_markdown.smart.llm import LLMError, generate, generate_async
 
+if TYPE_CHECKING:
+    from to_markdown.core.content_analysis import ContentAnalysis
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,48 +34,20 @@ def clean_content(content: str, format_type: str) -> str:
         return content
 
     try:
-        chunks = _chunk_content(content, MAX_CLEAN_TOKENS * CHARS_PER_TOKEN_ESTIMATE)
-        cleaned_chunks = []
-        for chunk in chunks:
-            prompt = _build_clean_prompt(chunk, format_type)
-            cleaned = generate(prompt, temperature=CLEAN_TEMPERATURE)
-            cleaned_chunks.append(cleaned)
-        return "\n\n".join(cleaned_chunks)
+        chunks = chunk_markdown(content, CLEAN_CHUNK_TOKENS)
+        cleaned_chunks = [_clean_single_chunk(content, chunk, format_type) for chunk in chunks]
+        return join_chunks(content, chunks, cleaned_chunks)
     except LLMError:
         logger.warning("LLM clean failed, using original content")
         return content
 
 
-def _chunk_content(content: str, max_chars: int) -> list[str]:
-    """Split content at paragraph boundaries (double newline).
-
-    Each chunk will be under max_chars. If a single paragraph exceeds max_chars,
-    it becomes its own chunk.
-    """
-    if len(content) <= max_chars:
-        return [content]
-
-    paragraphs = content.split("\n\n")
-    chunks: list[str] = []
-    current_chunk: list[str] = []
-    current_size = 0
-
-    for paragraph in paragraphs:
-        paragraph_size = len(paragraph)
-        separator_size = 2 if current_chunk else 0
-
-        if current_size + separator_size + paragraph_size > max_chars and current_chunk:
-            chunks.append("\n\n".join(current_chunk))
-            current_chunk = [paragraph]
-            current_size = paragraph_size
-        else:
-            current_chunk.append(paragraph)
-            current_size += separator_size + paragraph_size
-
-    if current_chunk:
-        chunks.append("\n\n".join(current_chunk))
-
-    return chunks
+def _clean_single_chunk(content: str, chunk: Chunk, format_type: str) -> str:
+    """Clean one chunk of content via LLM (verbatim and blank chunks are returned as is)."""
+    text = content[chunk.start : chunk.end]
+    if chunk.verbatim or not text.strip():
+        return text
+    return generate(_build_clean_prompt(text, format_type), temperature=CLEAN_TEMPERATURE)
 
 
 def _build_clean_prompt(chunk: str, format_type: str) -> str:
@@ -84,41 +60,39 @@ def _build_clean_prompt(chunk: str, format_type: str) -> str:
     return f"{prefix}{chunk}{suffix}"
 
 
-async def _clean_single_chunk_async(
-    chunk: str,
-    format_type: str,
-    semaphore: asyncio.Semaphore,
-) -> str:
-    """Clean a single content chunk via async LLM call."""
-    async with semaphore:
-        prompt = _build_clean_prompt(chunk, format_type)
-        return await generate_async(prompt, temperature=CLEAN_TEMPERATURE)
+async def _clean_single_chunk_async(content: str, chunk: Chunk, format_type: str) -> str:
+    """Clean one chunk of content via async LLM call (see _clean_single_chunk)."""
+    text = content[chunk.start : chunk.end]
+    if chunk.verbatim or not text.strip():
+        return text
+    prompt = _build_clean_prompt(text, format_type)
+    return await generate_async(prompt, temperature=CLEAN_TEMPERATURE)
 
 
-async def clean_content_async(content: str, format_type: str) -> str:
+async def clean_content_async(
+    content: str, format_type: str, *, analysis: "ContentAnalysis | None" = None
+) -> str:
     """Clean extraction artifacts from content via async parallel LLM calls.
 
     Args:
         content: The extracted document content (without frontmatter).
         format_type: The source document format (e.g. "pdf", "docx").
+        analysis: Precomputed statistics for content; reused instead of rescanning.
 
     Returns:
         Cleaned content, or original content if LLM fails.
     """
-    if not content.strip():
+    if analysis.is_blank if analysis is not None else not content.strip():
         logger.info("Skipping clean: empty content")
         return content
 
+    breaks = analysis.paragraph_breaks if analysis is not None else None
     try:
-        chunks = _chunk_content(content, MAX_CLEAN_TOKENS * CHARS_PER_TOKEN_ESTIMATE)
-        if len(chunks) == 1:
-            prompt = _build_clean_prompt(chunks[0], format_type)
-            return await generate_async(prompt, temperature=CLEAN_TEMPERATURE)
-
-        semaphore = asyncio.Semaphore(PARALLEL_LLM_MAX_CONCURRENCY)
-        tasks = [_clean_single_chunk_async(chunk, format_type, semaphore) for chunk in chunks]
+        chunks = chunk_markdown(content, CLEAN_CHUNK_TOKENS, breaks)
+        # In-flight calls are bounded process-wide by the AIMD window in llm.py
+        tasks = [_clean_single_chunk_async(content, chunk, format_type) for chunk in chunks]
         cleaned_chunks = await asyncio.gather(*tasks)
-        return "\n\n".join(cleaned_chunks)
+        return join_chunks(content, chunks, cleaned_chunks)
     except LLMError:
         logger.warning("LLM clean failed, using original content")
         return content
@@ -0,0 +1,102 @@
+"""AIMD (additive-increase, multiplicative-decrease) limit on in-flight LLM requests.
+
+The window starts at PARALLEL_LLM_MAX_CONCURRENCY. It grows by about one slot
+per window of successful calls and halves on an overload response (429 or 503),
+always staying between the configured minimum and maximum. A large quota is used
+fully, and a degraded API is backed off from quickly. Only one cut is made per
+congestion event: calls that started before the last cut do not cut again.
+Window changes are logged, and limit / in_flight can be read as metrics.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+
+from to_markdown.core.constants import LLM_CONCURRENCY_DECREASE_FACTOR
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveConcurrency:
+    """AIMD concurrency window shared by every async LLM call in the process.
+
+    Waiters are admitted in arrival order. All callers must run on one thread at
+    a time (successive event loops are fine, as with asyncio.run() per file).
+    """
+
+    def __init__(self, initial: int, minimum: int, maximum: int) -> None:
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.window = float(min(max(initial, self.minimum), self.maximum))
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._epoch = 0  # Incremented on every cut
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed in flight."""
+        return int(self.window)
+
+    @property
+    def in_flight(self) -> int:
+        """Calls currently holding a slot."""
+        return self._in_flight
+
+    @asynccontextmanager
+    async def slot(self, is_overload: Callable[[BaseException], bool]) -> AsyncIterator[None]:
+        """Hold a slot for one call.
+
+        Success widens the window. An exception for which is_overload is true
+        narrows it. Other errors leave it unchanged.
+        """
+        await self._acquire()
+        epoch = self._epoch
+        try:
+            yield
+        except Exception as exc:
+            if is_overload(exc):
+                self._decrease(epoch)
+            raise
+        else:
+            self._increase()
+        finally:
+            self._in_flight -= 1
+            self._admit()
+
+    async def _acquire(self) -> None:
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter  # _admit() counts the slot before waking us
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Admitted, then cancelled before resuming: pass the slot on
+                self._in_flight -= 1
+                self._admit()
+            raise
+
+    def _admit(self) -> None:
+        """Wake waiters, in order, into free slots."""
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    def _increase(self) -> None:
+        before = self.limit
+        self.window = min(float(self.maximum), self.window + 1 / self.window)
+        if self.limit != before:
+            logger.debug("LLM concurrency window raised to %d", self.limit)
+
+    def _decrease(self, epoch: int) -> None:
+        if epoch != self._epoch:
+            return  # This congestion event already cut the window
+        self._epoch += 1
+        self.window = max(float(self.minimum), self.window * LLM_CONCURRENCY_DECREASE_FACTOR)
+        logger.info("LLM overloaded: concurrency window cut to %d", self.limit)
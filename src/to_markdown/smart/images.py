@@ -9,7 +9,6 @@ from to_markdown.core.constants import (
     IMAGE_DESCRIPTION_PROMPT,
     IMAGE_DESCRIPTION_TEMPERATURE,
     IMAGE_SECTION_HEADING,
-    PARALLEL_LLM_MAX_CONCURRENCY,
 )
 from to_markdown.smart.llm import LLMError, generate, generate_async
 
@@ -106,23 +105,19 @@ def _image_mime_type(format_str: str) -> str:
     return _MIME_TYPE_MAP.get(format_str.lower(), f"image/{format_str.lower()}")
 
 
-async def _describe_single_image_async(
-    image: dict,
-    semaphore: asyncio.Semaphore,
-) -> str | None:
+async def _describe_single_image_async(image: dict) -> str | None:
     """Send a single image to Gemini vision async for description."""
-    async with semaphore:
-        mime_type = _image_mime_type(image.get("format", "png"))
-        image_part = types.Part.from_bytes(data=image["data"], mime_type=mime_type)
-
-        try:
-            return await generate_async(
-                [IMAGE_DESCRIPTION_PROMPT, image_part],
-                temperature=IMAGE_DESCRIPTION_TEMPERATURE,
-            )
-        except LLMError as exc:
-            logger.debug("Image description failed: %s", exc)
-            return None
+    mime_type = _image_mime_type(image.get("format", "png"))
+    image_part = types.Part.from_bytes(data=image["data"], mime_type=mime_type)
+
+    try:
+        return await generate_async(
+            [IMAGE_DESCRIPTION_PROMPT, image_part],
+            temperature=IMAGE_DESCRIPTION_TEMPERATURE,
+        )
+    except LLMError as exc:
+        logger.debug("Image description failed: %s", exc)
+        return None
 
 
 async def describe_images_async(images: list[dict]) -> str | None:
@@ -139,8 +134,8 @@ async def describe_images_async(images: list[dict]) -> str | None:
         logger.info("No images to describe")
         return None
 
-    semaphore = asyncio.Semaphore(PARALLEL_LLM_MAX_CONCURRENCY)
-    tasks = [_describe_single_image_async(img, semaphore) for img in images]
+    # In-flight calls are bounded process-wide by the AIMD window in llm.py
+    tasks = [_describe_single_image_async(img) for img in images]
     results = await asyncio.gather(*tasks)
 
     descriptions: list[dict] = []
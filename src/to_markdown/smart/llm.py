@@ -1,8 +1,14 @@
-"""Gemini client wrapper with retry logic for smart features."""
+"""Gemini client wrapper with retry logic for smart features.
 
+Every API attempt passes through the process-wide circuit breaker, and retries
+stop once the circuit opens or the retry budget is spent (see smart/circuit.py).
+"""
+
+import asyncio
 import logging
 import os
 
+import httpx
 from google import genai
 from google.genai import errors as genai_errors
 from tenacity import (
@@ -17,14 +23,35 @@ from to_markdown.core.constants import (
     GEMINI_DEFAULT_MODEL,
     GEMINI_MODEL_ENV,
     HTTP_STATUS_RATE_LIMIT,
+    HTTP_STATUS_SERVICE_UNAVAILABLE,
+    LLM_DEFAULT_MAX_CONCURRENCY,
+    LLM_DEFAULT_MIN_CONCURRENCY,
+    LLM_MAX_CONCURRENCY_ENV,
+    LLM_MIN_CONCURRENCY_ENV,
     LLM_RETRY_MAX_ATTEMPTS,
     LLM_RETRY_MAX_WAIT_SECONDS,
     LLM_RETRY_MIN_WAIT_SECONDS,
+    PARALLEL_LLM_MAX_CONCURRENCY,
+)
+from to_markdown.smart.circuit import (
+    CircuitOpenError,
+    get_circuit_breaker,
+    reset_circuit,
+    stop_early,
 )
+from to_markdown.smart.concurrency import AdaptiveConcurrency
+from to_markdown.smart.rate_limit import (
+    bucket_key,
+    env_int,
+    estimate_request_tokens,
+    get_rate_limiter,
+)
+from to_markdown.smart.response_cache import lookup_response, store_response
 
 logger = logging.getLogger(__name__)
 
 _client: genai.Client | None = None
+_concurrency: AdaptiveConcurrency | None = None
 
 
 class LLMError(Exception):
@@ -44,9 +71,26 @@ def get_client() -> genai.Client:
 
 
 def reset_client() -> None:
-    """Reset the cached client (for testing)."""
-    global _client
+    """Reset the cached client, concurrency window, and circuit breaker (for testing)."""
+    global _client, _concurrency
     _client = None
+    _concurrency = None
+    reset_circuit()
+
+
+def get_concurrency() -> AdaptiveConcurrency:
+    """Get or create the AIMD window bounding in-flight async LLM calls.
+
+    Bounds come from TO_MARKDOWN_LLM_MIN_CONCURRENCY / TO_MARKDOWN_LLM_MAX_CONCURRENCY.
+    """
+    global _concurrency
+    if _concurrency is None:
+        _concurrency = AdaptiveConcurrency(
+            PARALLEL_LLM_MAX_CONCURRENCY,
+            env_int(LLM_MIN_CONCURRENCY_ENV, LLM_DEFAULT_MIN_CONCURRENCY),
+            env_int(LLM_MAX_CONCURRENCY_ENV, LLM_DEFAULT_MAX_CONCURRENCY),
+        )
+    return _concurrency
 
 
 def _is_retryable(exc: BaseException) -> bool:
@@ -59,15 +103,52 @@ def _is_retryable(exc: BaseException) -> bool:
     )
 
 
-@retry(
+def _is_overload(exc: BaseException) -> bool:
+    """Return True for responses that mean "slow down" (429, 503)."""
+    return isinstance(exc, genai_errors.APIError) and getattr(exc, "code", None) in (
+        HTTP_STATUS_RATE_LIMIT,
+        HTTP_STATUS_SERVICE_UNAVAILABLE,
+    )
+
+
+# Network failures: the API could not be reached or did not answer in time
+_TRANSPORT_ERRORS = (httpx.TransportError, TimeoutError)
+
+
+def _is_outage(exc: BaseException) -> bool:
+    """Return True for server and network errors, which count towards opening the circuit."""
+    return isinstance(exc, (genai_errors.ServerError, *_TRANSPORT_ERRORS))
+
+
+def _bucket(model: str) -> str:
+    """Rate-limit bucket for model and the configured API key."""
+    return bucket_key(model, os.environ.get(GEMINI_API_KEY_ENV, ""))
+
+
+def _config(
+    max_output_tokens: int | None, temperature: float | None
+) -> genai.types.GenerateContentConfig | None:
+    """Generation config for the given settings (None when both are unset)."""
+    config_kwargs: dict = {}
+    if max_output_tokens is not None:
+        config_kwargs["max_output_tokens"] = max_output_tokens
+    if temperature is not None:
+        config_kwargs["temperature"] = temperature
+    return genai.types.GenerateContentConfig(**config_kwargs) if config_kwargs else None
+
+
+_retrying = retry(
     retry=retry_if_exception(_is_retryable),
     wait=wait_exponential(
         min=LLM_RETRY_MIN_WAIT_SECONDS,
         max=LLM_RETRY_MAX_WAIT_SECONDS,
     ),
-    stop=stop_after_attempt(LLM_RETRY_MAX_ATTEMPTS),
+    stop=stop_after_attempt(LLM_RETRY_MAX_ATTEMPTS) | stop_early,
     reraise=True,
 )
+
+
+@_retrying
 def _generate_with_retry(
     client: genai.Client,
     *,
@@ -76,20 +157,16 @@ def _generate_with_retry(
     max_output_tokens: int | None = None,
     temperature: float | None = None,
 ) -> str:
-    """Call Gemini with retry logic. Raises on failure."""
-    config_kwargs: dict = {}
-    if max_output_tokens is not None:
-        config_kwargs["max_output_tokens"] = max_output_tokens
-    if temperature is not None:
-        config_kwargs["temperature"] = temperature
-
-    config = genai.types.GenerateContentConfig(**config_kwargs) if config_kwargs else None
-
-    response = client.models.generate_content(
-        model=model,
-        contents=contents,
-        config=config,
-    )
+    """Call Gemini with retry logic (each attempt rate limited). Raises on failure."""
+    with get_circuit_breaker().guard(_is_outage):
+        get_rate_limiter().acquire_sync(
+            _bucket(model), estimate_request_tokens(contents, max_output_tokens)
+        )
+        response = client.models.generate_content(
+            model=model,
+            contents=contents,
+            config=_config(max_output_tokens, temperature),
+        )
     text = response.text
     if not text:
         msg = "Gemini returned empty response"
@@ -105,6 +182,9 @@ def generate(
 ) -> str:
     """Generate content via Gemini with retry logic.
 
+    Responses are served from and stored in the on-disk LLM response cache
+    (see smart/response_cache.py) unless TO_MARKDOWN_LLM_CACHE=0.
+
     Args:
         contents: Text or multimodal content to send to the model.
         max_output_tokens: Maximum tokens in the response.
@@ -114,33 +194,32 @@ def generate(
         The generated text response.
 
     Raises:
-        LLMError: If the LLM call fails after retries.
+        LLMError: If the LLM call fails after retries, or the circuit is open.
     """
-    client = get_client()
     model = os.environ.get(GEMINI_MODEL_ENV, GEMINI_DEFAULT_MODEL)
+    key, cached = lookup_response(
+        model, contents, temperature=temperature, max_output_tokens=max_output_tokens
+    )
+    if cached is not None:
+        return cached
+    client = get_client()
 
     try:
-        return _generate_with_retry(
+        text = _generate_with_retry(
             client,
             model=model,
             contents=contents,
             max_output_tokens=max_output_tokens,
             temperature=temperature,
         )
-    except (genai_errors.ClientError, genai_errors.ServerError, genai_errors.APIError) as exc:
+    except (genai_errors.APIError, CircuitOpenError, *_TRANSPORT_ERRORS) as exc:
         msg = f"LLM call failed: {exc}"
         raise LLMError(msg) from exc
+    store_response(key, text)
+    return text
 
 
-@retry(
-    retry=retry_if_exception(_is_retryable),
-    wait=wait_exponential(
-        min=LLM_RETRY_MIN_WAIT_SECONDS,
-        max=LLM_RETRY_MAX_WAIT_SECONDS,
-    ),
-    stop=stop_after_attempt(LLM_RETRY_MAX_ATTEMPTS),
-    reraise=True,
-)
+@_retrying
 async def _generate_with_retry_async(
     client: genai.Client,
     *,
@@ -149,20 +228,21 @@ async def _generate_with_retry_async(
     max_output_tokens: int | None = None,
     temperature: float | None = None,
 ) -> str:
-    """Call Gemini async with retry logic. Raises on failure."""
-    config_kwargs: dict = {}
-    if max_output_tokens is not None:
-        config_kwargs["max_output_tokens"] = max_output_tokens
-    if temperature is not None:
-        config_kwargs["temperature"] = temperature
+    """Call Gemini async with retry logic. Raises on failure.
 
-    config = genai.types.GenerateContentConfig(**config_kwargs) if config_kwargs else None
-
-    response = await client.aio.models.generate_content(
-        model=model,
-        contents=contents,
-        config=config,
-    )
+    Each attempt passes the circuit breaker, holds a slot in the AIMD window,
+    and is rate limited; backoff between attempts happens outside the slot.
+    """
+    with get_circuit_breaker().guard(_is_outage):
+        async with get_concurrency().slot(_is_overload):
+            await get_rate_limiter().acquire(
+                _bucket(model), estimate_request_tokens(contents, max_output_tokens)
+            )
+            response = await client.aio.models.generate_content(
+                model=model,
+                contents=contents,
+                config=_config(max_output_tokens, temperature),
+            )
     text = response.text
     if not text:
         msg = "Gemini returned empty response"
@@ -178,6 +258,9 @@ async def generate_async(
 ) -> str:
     """Generate content via Gemini async with retry logic.
 
+    Responses are served from and stored in the on-disk LLM response cache
+    (see smart/response_cache.py) unless TO_MARKDOWN_LLM_CACHE=0.
+
     Args:
         contents: Text or multimodal content to send to the model.
         max_output_tokens: Maximum tokens in the response.
@@ -187,19 +270,30 @@ async def generate_async(
         The generated text response.
 
     Raises:
-        LLMError: If the LLM call fails after retries.
+        LLMError: If the LLM call fails after retries, or the circuit is open.
     """
-    client = get_client()
     model = os.environ.get(GEMINI_MODEL_ENV, GEMINI_DEFAULT_MODEL)
+    key, cached = await asyncio.to_thread(
+        lookup_response,
+        model,
+        contents,
+        temperature=temperature,
+        max_output_tokens=max_output_tokens,
+    )
+    if cached is not None:
+        return cached
+    client = get_client()
 
     try:
-        return await _generate_with_retry_async(
+        text = await _generate_with_retry_async(
             client,
             model=model,
             contents=contents,
             max_output_tokens=max_output_tokens,
             temperature=temperature,
         )
-    except (genai_errors.ClientError, genai_errors.ServerError, genai_errors.APIError) as exc:
+    except (genai_errors.APIError, CircuitOpenError, *_TRANSPORT_ERRORS) as exc:
         msg = f"LLM call failed: {exc}"
         raise LLMError(msg) from exc
+    await asyncio.to_thread(store_response, key, text)
+    return text
@@ -0,0 +1,258 @@
+"""Token-bucket rate limiter for Gemini calls, shared across coroutines and processes.
+
+Each bucket (one per model and API key) holds a request budget and a token budget
+that refill continuously at TO_MARKDOWN_LLM_RPM and TO_MARKDOWN_LLM_TPM per minute,
+up to LLM_RATE_BURST_SECONDS worth of budget. Bucket state lives in a SQLite
+database in the data directory, so CLI batches, --jobs pool workers, background
+tasks, and the MCP server all draw from the same budget.
+
+A call reserves its cost up front, which may take a bucket negative, then waits
+until the deficit has refilled. Waiters are therefore served in arrival order and
+never poll. If the database cannot be opened, the limiter falls back to
+per-process buckets; if one reservation fails (e.g. the database stays locked
+past the busy timeout), only that call is limited per process.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from to_markdown.core.constants import (
+    CACHE_BUSY_TIMEOUT_SECONDS,
+    DATA_DIR_ENV,
+    LLM_DEFAULT_RPM,
+    LLM_DEFAULT_TPM,
+    LLM_IMAGE_TOKEN_ESTIMATE,
+    LLM_RATE_BURST_SECONDS,
+    LLM_RPM_ENV,
+    LLM_TPM_ENV,
+    RATE_LIMIT_DB_FILENAME,
+    TASK_STORE_DIR,
+)
+from to_markdown.core.content_analysis import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+_CREATE_TABLE_SQL = """\
+CREATE TABLE IF NOT EXISTS buckets (
+    key TEXT PRIMARY KEY,
+    requests REAL NOT NULL,
+    tokens REAL NOT NULL,
+    updated REAL NOT NULL
+)"""
+
+_SECONDS_PER_MINUTE = 60.0
+
+# (requests, tokens, updated): bucket levels at a wall-clock time
+type _Levels = tuple[float, float, float]
+
+
+class RateLimiter:
+    """Request and token budgets per bucket key, stored in a SQLite database.
+
+    The database is opened on first use. Wall-clock time is used because it is
+    shared by every process on the machine.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        requests_per_minute: int = LLM_DEFAULT_RPM,
+        tokens_per_minute: int = LLM_DEFAULT_TPM,
+    ) -> None:
+        self.db_path = db_path
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._local: dict[str, _Levels] = {}  # Per-process fallback buckets
+        self._shared = True  # False once the database could not be opened
+
+    @classmethod
+    def from_env(cls, db_path: Path) -> "RateLimiter":
+        """Limiter with budgets from TO_MARKDOWN_LLM_RPM and TO_MARKDOWN_LLM_TPM."""
+        return cls(
+            db_path,
+            requests_per_minute=env_int(LLM_RPM_ENV, LLM_DEFAULT_RPM),
+            tokens_per_minute=env_int(LLM_TPM_ENV, LLM_DEFAULT_TPM),
+        )
+
+    def reserve(self, key: str, tokens: int) -> float:
+        """Take one request and tokens from key's bucket; return seconds to wait first."""
+        if not self.requests_per_minute and not self.tokens_per_minute:
+            return 0.0
+        with self._lock:
+            levels = self._reserve_shared(key, tokens) if self._shared else None
+            requests, budget = levels or self._reserve_local(key, tokens)
+        return max(
+            _deficit_seconds(requests, self.requests_per_minute),
+            _deficit_seconds(budget, self.tokens_per_minute),
+        )
+
+    async def acquire(self, key: str, tokens: int) -> None:
+        """Wait (without blocking the event loop) until a call of tokens may start."""
+        delay = await asyncio.to_thread(self.reserve, key, tokens)  # SQLite may wait on a lock
+        if delay > 0:
+            logger.debug("Rate limit: waiting %.2fs before LLM call", delay)
+            await asyncio.sleep(delay)
+
+    def acquire_sync(self, key: str, tokens: int) -> None:
+        """Block until a call of tokens may start."""
+        delay = self.reserve(key, tokens)
+        if delay > 0:
+            logger.debug("Rate limit: waiting %.2fs before LLM call", delay)
+            time.sleep(delay)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _reserve_shared(self, key: str, tokens: int) -> tuple[float, float] | None:
+        """Reserve in the database, serialized against other processes (None on failure)."""
+        try:
+            conn = self._connect()
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning("Rate limiter database unusable, limiting per process: %s", exc)
+            self._shared = False
+            return None
+        try:
+            return self._transact(conn, key, tokens)
+        except sqlite3.Error as exc:
+            logger.warning("Rate limiter database busy, limiting this call per process: %s", exc)
+            return None
+
+    def _transact(self, conn: sqlite3.Connection, key: str, tokens: int) -> tuple[float, float]:
+        """Refill and take from key's bucket in one write transaction."""
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT requests, tokens, updated FROM buckets WHERE key = ?", (key,)
+            ).fetchone()
+            now = time.time()
+            requests, budget = self._take(row, tokens, now)
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets VALUES (?, ?, ?, ?)", (key, requests, budget, now)
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return requests, budget
+
+    def _reserve_local(self, key: str, tokens: int) -> tuple[float, float]:
+        """Reserve in this process's fallback buckets."""
+        now = time.time()
+        requests, budget = self._take(self._local.get(key), tokens, now)
+        self._local[key] = (requests, budget, now)
+        return requests, budget
+
+    def _take(self, levels: _Levels | None, tokens: int, now: float) -> tuple[float, float]:
+        """Refill levels up to now, then subtract one request and tokens."""
+        if levels is None:
+            requests, budget, updated = 0.0, 0.0, float("-inf")  # Refills to full
+        else:
+            requests, budget, updated = levels
+        elapsed = max(0.0, now - updated)  # Clocks can step backwards
+        requests = _refill(requests, elapsed, self.requests_per_minute)
+        budget = _refill(budget, elapsed, self.tokens_per_minute)
+        return requests - 1, budget - tokens
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.db_path),
+                timeout=CACHE_BUSY_TIMEOUT_SECONDS,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(_CREATE_TABLE_SQL)
+            except sqlite3.Error:
+                conn.close()
+                raise
+            self._conn = conn
+        return self._conn
+
+
+def bucket_key(model: str, api_key: str) -> str:
+    """Bucket for a model and API key (quotas are per model and project)."""
+    return f"{model}:{hashlib.sha256(api_key.encode()).hexdigest()[:16]}"
+
+
+def estimate_request_tokens(contents: list | str, max_output_tokens: int | None) -> int:
+    """Estimate the tokens a call counts against the quota (prompt plus output cap)."""
+    parts = [contents] if isinstance(contents, str) else contents
+    prompt = sum(
+        estimate_tokens(part) if isinstance(part, str) else LLM_IMAGE_TOKEN_ESTIMATE
+        for part in parts
+    )
+    return prompt + (max_output_tokens or 0)
+
+
+def _refill(level: float, elapsed: float, per_minute: int) -> float:
+    """Level after elapsed seconds, capped at LLM_RATE_BURST_SECONDS of budget.
+
+    The cap is at least one call, so a small budget still admits one request.
+    A disabled budget (0) stays full.
+    """
+    capacity = max(1.0, per_minute * LLM_RATE_BURST_SECONDS / _SECONDS_PER_MINUTE)
+    if not per_minute:
+        return capacity
+    return min(capacity, level + elapsed * per_minute / _SECONDS_PER_MINUTE)
+
+
+def _deficit_seconds(level: float, per_minute: int) -> float:
+    """Seconds until a negative level refills to zero (0 for a disabled budget)."""
+    if level >= 0 or not per_minute:
+        return 0.0
+    return -level * _SECONDS_PER_MINUTE / per_minute
+
+
+def env_int(name: str, default: int) -> int:
+    """A non-negative integer from the environment; invalid values fall back to default."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        budget = int(value)
+    except ValueError:
+        budget = -1
+    if budget < 0:
+        logger.warning("Ignoring %s=%r (expected a non-negative integer)", name, value)
+        return default
+    return budget
+
+
+def _default_limiter_path() -> Path:
+    data_dir = os.environ.get(DATA_DIR_ENV)
+    base = Path(data_dir) if data_dir else Path(TASK_STORE_DIR).expanduser()
+    return base / RATE_LIMIT_DB_FILENAME
+
+
+_limiter: RateLimiter | None = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get or create the process-wide limiter (database in the data directory)."""
+    global _limiter
+    if _limiter is None:
+        _limiter = RateLimiter.from_env(_default_limiter_path())
+    return _limiter
+
+
+def reset_rate_limiter() -> None:
+    """Close and forget the process-wide limiter (for testing)."""
+    global _limiter
+    if _limiter is not None:
+        _limiter.close()
+    _limiter = None
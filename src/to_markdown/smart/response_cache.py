@@ -0,0 +1,86 @@
+"""On-disk cache of Gemini responses, so re-running an unchanged document is free.
+
+Responses live in the extraction cache database (same size bound, LRU eviction,
+and cross-process safety) and expire after LLM_CACHE_TTL_SECONDS. A key covers
+everything that shapes the response: model, temperature, output cap, and the
+prompt text plus the bytes and MIME type of every image part. Set
+TO_MARKDOWN_LLM_CACHE=0 (what --no-llm-cache does) to bypass it.
+"""
+
+import hashlib
+import logging
+import os
+
+from to_markdown.core.cache import CACHE_ERRORS, get_default_cache, warn_cache_unavailable
+from to_markdown.core.constants import (
+    LLM_CACHE_DISABLED,
+    LLM_CACHE_ENV,
+    LLM_CACHE_SCHEMA_VERSION,
+    LLM_CACHE_TTL_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def llm_cache_enabled() -> bool:
+    """True unless TO_MARKDOWN_LLM_CACHE=0."""
+    return os.environ.get(LLM_CACHE_ENV) != LLM_CACHE_DISABLED
+
+
+def response_cache_key(
+    model: str,
+    contents: list | str,
+    *,
+    temperature: float | None,
+    max_output_tokens: int | None,
+) -> str | None:
+    """Cache key for a Gemini call; None if a content part cannot be hashed."""
+    digest = hashlib.sha256(
+        f"llm-v{LLM_CACHE_SCHEMA_VERSION}|{model}|{temperature}|{max_output_tokens}".encode()
+    )
+    for part in [contents] if isinstance(contents, str) else contents:
+        if isinstance(part, str):
+            data, kind = part.encode("utf-8", "surrogatepass"), "text"
+        else:
+            blob = getattr(part, "inline_data", None)
+            data, kind = getattr(blob, "data", None), getattr(blob, "mime_type", None)
+            if not isinstance(data, bytes) or not isinstance(kind, str):
+                return None
+        # Length-prefixed, so part boundaries cannot collide
+        digest.update(f"|{kind}:{len(data)}|".encode())
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def lookup_response(
+    model: str,
+    contents: list | str,
+    *,
+    temperature: float | None,
+    max_output_tokens: int | None,
+) -> tuple[str | None, str | None]:
+    """Return (cache key, cached response or None); the key is None when not caching."""
+    if not llm_cache_enabled():
+        return None, None
+    key = response_cache_key(
+        model, contents, temperature=temperature, max_output_tokens=max_output_tokens
+    )
+    if key is None:
+        return None, None
+    try:
+        cached = get_default_cache().get_llm_response(key, max_age=LLM_CACHE_TTL_SECONDS)
+    except CACHE_ERRORS as exc:
+        warn_cache_unavailable(exc)
+        return None, None
+    if cached is not None:
+        logger.debug("LLM cache hit: %s", key[:12])
+    return key, cached
+
+
+def store_response(key: str | None, text: str) -> None:
+    """Cache a response under a key from lookup_response() (no-op for None)."""
+    if key is not None:
+        try:
+            get_default_cache().put_llm_response(key, text)
+        except CACHE_ERRORS as exc:
+            warn_cache_unavailable(exc)
@@ -1,6 +1,7 @@
 """LLM-powered document summarization via Gemini."""
 
 import logging
+from typing import TYPE_CHECKING
 
 from to_markdown.core.constants import (
     MAX_SUMMARY_TOKENS,
@@ -10,6 +11,9 @@ from to_markdown.core.constants import (
 )
 from to_markdown.smart.llm import LLMError, generate, generate_async
 
+if TYPE_CHECKING:
+    from to_markdown.core.content_analysis import ContentAnalysis
+
 logger = logging.getLogger(__name__)
 
 
@@ -56,17 +60,20 @@ def format_summary_section(summary: str) -> str:
     return f"{SUMMARY_SECTION_HEADING}\n\n{summary}\n"
 
 
-async def summarize_content_async(content: str, format_type: str) -> str | None:
+async def summarize_content_async(
+    content: str, format_type: str, *, analysis: "ContentAnalysis | None" = None
+) -> str | None:
     """Generate a summary of the document content via async LLM.
 
     Args:
         content: The document content to summarize.
         format_type: The source document format (e.g. "pdf", "docx").
+        analysis: Precomputed statistics for content; reused instead of rescanning.
 
     Returns:
         Summary text, or None if LLM fails or content is empty.
     """
-    if not content.strip():
+    if analysis.is_blank if analysis is not None else not content.strip():
         logger.info("Skipping summary: empty content")
         return None
 
@@ -6,6 +6,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from to_markdown.core.constants import RATE_LIMIT_DB_FILENAME
+
 # Pattern matching the dynamic extracted_at timestamp in frontmatter
 _TIMESTAMP_PATTERN = re.compile(
     r"extracted_at: '[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}Z'"
@@ -19,6 +21,24 @@ def normalize_markdown(content: str) -> str:
     return _TIMESTAMP_PATTERN.sub(_TIMESTAMP_REPLACEMENT, content)
 
 
+@pytest.fixture(autouse=True)
+def isolated_data_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Point the data directory (extraction cache, rate limiter) at a per-test temp dir."""
+    import to_markdown.core.cache as cache_module
+    import to_markdown.smart.rate_limit as rate_limit_module
+
+    data_dir = tmp_path / "data"
+    monkeypatch.setenv("TO_MARKDOWN_DATA_DIR", str(data_dir))
+    # Created up front: some tests clear the environment before the first LLM call
+    limiter = rate_limit_module.RateLimiter(data_dir / RATE_LIMIT_DB_FILENAME)
+    monkeypatch.setattr(rate_limit_module, "_limiter", limiter)
+    yield data_dir
+    limiter.close()
+    if cache_module._default_cache is not None:
+        cache_module._default_cache.close()
+        cache_module._default_cache = None
+
+
 @pytest.fixture
 def sample_text_file(tmp_path: Path) -> Path:
     """Create a simple text file for testing."""
@@ -27,6 +47,14 @@ def sample_text_file(tmp_path: Path) -> Path:
     return file
 
 
+@pytest.fixture
+def sample_html_file(tmp_path: Path) -> Path:
+    """Create a simple HTML file (extracted by Kreuzberg, unlike plain text)."""
+    file = tmp_path / "sample.html"
+    file.write_text("<html><body><h1>Sample</h1><p>An HTML test document.</p></body></html>\n")
+    return file
+
+
 @pytest.fixture
 def sample_text_content() -> str:
     """The expected content from sample_text_file."""
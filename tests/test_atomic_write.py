@@ -0,0 +1,149 @@
+"""Tests for atomic output writes (core/atomic_write.py)."""
+
+import logging
+import os
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from to_markdown.core.atomic_write import atomic_output, fsync_mode, sync_batch_outputs
+from to_markdown.core.constants import OUTPUT_FSYNC_ENV
+
+
+def _leftovers(directory: Path) -> list[str]:
+    return [path.name for path in directory.iterdir() if path.name.startswith(".")]
+
+
+class TestAtomicOutput:
+    """Tests for atomic_output()."""
+
+    def test_writes_content_without_leftovers(self, tmp_path: Path):
+        target = tmp_path / "out.md"
+        with atomic_output(target, overwrite=False) as f:
+            f.write("hello")
+        assert target.read_text() == "hello"
+        assert _leftovers(tmp_path) == []
+
+    def test_interrupted_write_leaves_target_untouched(self, tmp_path: Path):
+        target = tmp_path / "out.md"
+        target.write_text("previous")
+        with pytest.raises(KeyboardInterrupt), atomic_output(target, overwrite=True) as f:
+            f.write("partial")
+            raise KeyboardInterrupt
+        assert target.read_text() == "previous"
+        assert _leftovers(tmp_path) == []
+
+    def test_interrupted_create_leaves_no_file(self, tmp_path: Path):
+        target = tmp_path / "out.md"
+        with pytest.raises(SystemExit), atomic_output(target, overwrite=False) as f:
+            f.write("partial")
+            raise SystemExit(1)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_exclusive_create_refuses_existing(self, tmp_path: Path):
+        target = tmp_path / "out.md"
+        target.write_text("mine")
+        with pytest.raises(FileExistsError), atomic_output(target, overwrite=False) as f:
+            f.write("theirs")
+        assert target.read_text() == "mine"
+        assert _leftovers(tmp_path) == []
+
+    def test_overwrite_replaces(self, tmp_path: Path):
+        target = tmp_path / "out.md"
+        target.write_text("old")
+        with atomic_output(target, overwrite=True) as f:
+            f.write("new")
+        assert target.read_text() == "new"
+
+    def test_without_hard_links_still_exclusive(self, tmp_path: Path):
+        target = tmp_path / "out.md"
+        with patch("to_markdown.core.atomic_write.os.link", side_effect=PermissionError):
+            with atomic_output(target, overwrite=False) as f:
+                f.write("first")
+            with pytest.raises(FileExistsError), atomic_output(target, overwrite=False) as f:
+                f.write("second")
+        assert target.read_text() == "first"
+        assert _leftovers(tmp_path) == []
+
+    def test_without_hard_links_no_empty_placeholder(self, tmp_path: Path):
+        target = tmp_path / "out.md"
+        seen: list[bool] = []
+        real_replace = os.replace
+
+        def replace(src, dst):
+            seen.append(Path(dst).exists())
+            real_replace(src, dst)
+
+        with (
+            patch("to_markdown.core.atomic_write.os.link", side_effect=PermissionError),
+            patch("to_markdown.core.atomic_write.os.replace", side_effect=replace),
+            atomic_output(target, overwrite=False) as f,
+        ):
+            f.write("first")
+        assert seen == [False]
+        assert target.read_text() == "first"
+
+    def test_concurrent_exclusive_writers_one_wins(self, tmp_path: Path):
+        target = tmp_path / "out.md"
+        winners: list[str] = []
+        barrier = threading.Barrier(8)
+
+        def write(name: str) -> None:
+            try:
+                with atomic_output(target, overwrite=False) as f:
+                    f.write(name * 1000)
+                    barrier.wait()
+                winners.append(name)
+            except FileExistsError:
+                pass
+
+        threads = [threading.Thread(target=write, args=(str(i),)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(winners) == 1
+        assert target.read_text() == winners[0] * 1000
+        assert _leftovers(tmp_path) == []
+
+
+class TestFsyncModes:
+    """Tests for TO_MARKDOWN_FSYNC handling."""
+
+    def test_off_by_default(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.delenv(OUTPUT_FSYNC_ENV, raising=False)
+        with patch("to_markdown.core.atomic_write.os.fsync") as mock_fsync:
+            with atomic_output(tmp_path / "out.md", overwrite=False) as f:
+                f.write("x")
+            sync_batch_outputs([tmp_path / "out.md"])
+        mock_fsync.assert_not_called()
+
+    def test_always_syncs_file_and_directory(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv(OUTPUT_FSYNC_ENV, "always")
+        with (
+            patch("to_markdown.core.atomic_write.os.fsync") as mock_fsync,
+            atomic_output(tmp_path / "out.md", overwrite=False) as f,
+        ):
+            f.write("x")
+        assert mock_fsync.call_count == 2
+
+    def test_batch_syncs_once_at_the_end(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv(OUTPUT_FSYNC_ENV, "batch")
+        outputs = [tmp_path / "a.md", tmp_path / "b.md"]
+        with patch("to_markdown.core.atomic_write.os.fsync") as mock_fsync:
+            for output in outputs:
+                with atomic_output(output, overwrite=False) as f:
+                    f.write("x")
+            assert mock_fsync.call_count == 0
+            sync_batch_outputs(outputs)
+        assert mock_fsync.call_count == 3  # two files, one directory
+
+    def test_unknown_mode_warns_and_disables(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ):
+        monkeypatch.setenv(OUTPUT_FSYNC_ENV, "sometimes")
+        with caplog.at_level(logging.WARNING):
+            assert fsync_mode() == "off"
+        assert OUTPUT_FSYNC_ENV in caplog.text
@@ -1,10 +1,24 @@
 """Tests for batch processing module."""
 
+import asyncio
 from pathlib import Path
 from unittest.mock import patch
 
-from to_markdown.core.batch import BatchResult, convert_batch, discover_files, resolve_glob
-from to_markdown.core.constants import EXIT_ERROR, EXIT_PARTIAL, EXIT_SUCCESS
+import pytest
+
+from to_markdown.core.batch import (
+    BatchResult,
+    convert_batch,
+    discover_files,
+    resolve_glob,
+    resolve_jobs,
+)
+from to_markdown.core.constants import (
+    EXIT_ERROR,
+    EXIT_PARTIAL,
+    EXIT_SUCCESS,
+    MANIFEST_UNCHANGED_REASON,
+)
 
 
 class TestDiscoverFiles:
@@ -60,6 +74,30 @@ class TestDiscoverFiles:
         assert "doc.txt" in names
 
 
+class TestDiscoveryFilters:
+    """Tests for include/exclude glob filters in discovery."""
+
+    def test_include_is_an_allowlist(self, batch_dir: Path) -> None:
+        files = discover_files(batch_dir, include=["*.html"])
+        assert [f.name for f in files] == ["readme.html"]
+
+    def test_exclude_is_a_denylist(self, batch_dir: Path) -> None:
+        files = discover_files(batch_dir, exclude=["sub/*", "notes.*"])
+        assert {f.name for f in files} == {"report.txt", "readme.html"}
+
+    def test_patterns_are_case_insensitive(self, batch_dir: Path) -> None:
+        files = discover_files(batch_dir, include=["*.HTML"])
+        assert [f.name for f in files] == ["readme.html"]
+
+    def test_exclude_wins_over_include(self, batch_dir: Path) -> None:
+        files = discover_files(batch_dir, include=["*.txt"], exclude=["deep.txt"])
+        assert {f.name for f in files} == {"report.txt", "notes.txt"}
+
+    def test_glob_matches_filtered(self, batch_dir: Path) -> None:
+        files = resolve_glob(str(batch_dir / "*.txt"), exclude=["report.*"])
+        assert [f.name for f in files] == ["notes.txt"]
+
+
 class TestResolveGlob:
     """Tests for resolve_glob() - glob pattern resolution."""
 
@@ -133,6 +171,95 @@ class TestBatchResult:
         )
         assert result.exit_code == EXIT_ERROR
 
+    def test_exit_code_all_unchanged(self) -> None:
+        skipped = [(Path("a.pdf"), MANIFEST_UNCHANGED_REASON), (Path("c.py"), "unsupported")]
+        assert BatchResult(skipped=skipped).exit_code == EXIT_SUCCESS
+
+    def test_exit_code_unchanged_with_existing_output(self) -> None:
+        skipped = [
+            (Path("a.pdf"), MANIFEST_UNCHANGED_REASON),
+            (Path("b.pdf"), "Output exists: b.md"),
+        ]
+        assert BatchResult(skipped=skipped).exit_code == EXIT_ERROR
+
+    def test_exit_code_unchanged_with_failure(self) -> None:
+        result = BatchResult(
+            failed=[(Path("b.pdf"), "error")], skipped=[(Path("a.pdf"), MANIFEST_UNCHANGED_REASON)]
+        )
+        assert result.exit_code == EXIT_ERROR
+
+
+class TestOcrCacheStats:
+    """Tests for OCR cache hit-rate reporting on batch results."""
+
+    def test_hit_rate(self) -> None:
+        result = BatchResult(ocr_cache_hits=3, ocr_cache_misses=1)
+        assert result.ocr_cache_hit_rate == 0.75
+        assert BatchResult().ocr_cache_hit_rate == 0.0
+
+    @patch("to_markdown.core.batch.convert_file")
+    def test_batch_records_lookups_made_during_run(self, mock_convert, batch_dir: Path) -> None:
+        from to_markdown.core.cache import get_default_cache
+
+        cache = get_default_cache()
+        cache.get_ocr_text("before-run")  # earlier misses are not attributed to the batch
+
+        def convert(path, **_kwargs):
+            cache.put_ocr_text("cover", "Cover sheet")
+            cache.get_ocr_text("cover")
+            return path.with_suffix(".md")
+
+        mock_convert.side_effect = convert
+        result = convert_batch([batch_dir / "report.txt", batch_dir / "notes.txt"], quiet=True)
+        assert (result.ocr_cache_hits, result.ocr_cache_misses) == (2, 0)
+
+    @patch("to_markdown.core.batch.convert_file")
+    def test_concurrent_lookups_outside_run_not_counted(
+        self, mock_convert, batch_dir: Path
+    ) -> None:
+        import threading
+
+        from to_markdown.core.cache import get_default_cache
+
+        cache = get_default_cache()
+
+        def convert(path, **_kwargs):
+            # Another process or server using the cache meanwhile (a plain thread
+            # does not inherit the run's counter)
+            other = threading.Thread(target=cache.get_ocr_text, args=("elsewhere",))
+            other.start()
+            other.join()
+            cache.get_ocr_text(path.name)
+            return path.with_suffix(".md")
+
+        mock_convert.side_effect = convert
+        result = convert_batch([batch_dir / "report.txt", batch_dir / "notes.txt"], quiet=True)
+        assert (result.ocr_cache_hits, result.ocr_cache_misses) == (0, 2)
+
+    @patch("to_markdown.core.batch.convert_file")
+    def test_batch_records_llm_cache_lookups(self, mock_convert, batch_dir: Path) -> None:
+        from to_markdown.core.cache import get_default_cache
+
+        cache = get_default_cache()
+
+        def convert(path, **_kwargs):
+            cache.get_llm_response(path.name, max_age=60)
+            cache.put_llm_response(path.name, "summary")
+            cache.get_llm_response(path.name, max_age=60)
+            return path.with_suffix(".md")
+
+        mock_convert.side_effect = convert
+        files = [batch_dir / "report.txt", batch_dir / "notes.txt"]
+        result = convert_batch(files, quiet=True, use_cache=False)
+        assert (result.llm_cache_hits, result.llm_cache_misses) == (2, 2)
+        assert result.llm_cache_hit_rate == 0.5
+
+    @patch("to_markdown.core.batch.convert_file")
+    def test_no_cache_reports_nothing(self, mock_convert, batch_dir: Path) -> None:
+        mock_convert.return_value = batch_dir / "report.md"
+        result = convert_batch([batch_dir / "report.txt"], quiet=True, use_cache=False)
+        assert (result.ocr_cache_hits, result.ocr_cache_misses) == (0, 0)
+
 
 class TestConvertBatch:
     """Tests for convert_batch() - batch conversion loop."""
@@ -149,6 +276,15 @@ class TestConvertBatch:
         assert len(result.failed) == 0
         assert result.exit_code == EXIT_SUCCESS
 
+    def test_batch_fsync_mode_syncs_outputs_once(
+        self, batch_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("TO_MARKDOWN_FSYNC", "batch")
+        files = [batch_dir / "report.txt", batch_dir / "notes.txt"]
+        with patch("to_markdown.core.atomic_write.sync_batch_outputs") as mock_sync:
+            result = convert_batch(files, tmp_path / "out", quiet=True)
+        mock_sync.assert_called_once_with(result.succeeded)
+
     @patch("to_markdown.core.batch.convert_file")
     def test_mixed_results(self, mock_convert, batch_dir: Path) -> None:
         from to_markdown.core.extraction import UnsupportedFormatError
@@ -265,6 +401,22 @@ class TestConvertBatch:
         # Output should preserve the relative path: sub/deep.md
         assert "sub" in str(output_path)
 
+    def test_serial_batch_shares_one_event_loop(self, batch_dir: Path, tmp_path: Path) -> None:
+        """Every file in a serial batch runs on the same event loop."""
+        from to_markdown.core.content_builder import build_content_async
+
+        loops: set[int] = set()
+
+        async def record_loop(*args, **kwargs):
+            loops.add(id(asyncio.get_running_loop()))
+            return await build_content_async(*args, **kwargs)
+
+        files = discover_files(batch_dir)
+        with patch("to_markdown.core.content_builder.build_content_async", record_loop):
+            result = convert_batch(files, output_dir=tmp_path / "out", quiet=True, jobs=1)
+        assert len(result.succeeded) == len(files) > 1
+        assert len(loops) == 1
+
 
 class TestEdgeCases:
     """Tests for batch edge cases."""
@@ -318,6 +470,20 @@ class TestEdgeCases:
         assert len(result.succeeded) == 1
         assert mock_convert.call_args[1]["force"] is True
 
+    @patch("to_markdown.core.batch.convert_file")
+    def test_unsupported_files_skipped_without_conversion(
+        self, mock_convert, batch_dir: Path
+    ) -> None:
+        """Files sniffed as unsupported never reach convert_file()."""
+        binary = batch_dir / "module.so"
+        binary.write_bytes(b"\x7fELF\x02\x01\x01\x00")
+        files = [batch_dir / "report.txt", binary]
+        mock_convert.return_value = files[0].with_suffix(".md")
+        result = convert_batch(files, quiet=True)
+        assert mock_convert.call_count == 1
+        assert result.skipped == [(binary, "Unsupported format: .so")]
+        assert result.exit_code == EXIT_SUCCESS
+
     def test_symlink_directory(self, batch_dir: Path, tmp_path: Path) -> None:
         """Symlinks to directories are followed."""
         link = tmp_path / "link_to_docs"
@@ -356,3 +522,69 @@ class TestProgressReporting:
         # Run with quiet=False to exercise the rich progress path
         result = convert_batch(files, quiet=False)
         assert len(result.succeeded) == 2
+
+
+class TestParallelBatch:
+    """Tests for convert_batch(jobs=N) - process pool execution."""
+
+    def test_resolve_jobs_explicit(self) -> None:
+        assert resolve_jobs(4) == 4
+
+    def test_resolve_jobs_auto_uses_cpu_count(self) -> None:
+        with patch("to_markdown.core.batch.os.cpu_count", return_value=8):
+            assert resolve_jobs(0) == 8
+
+    @patch("to_markdown.core.parallel.convert_batch_parallel")
+    @patch("to_markdown.core.batch.convert_file")
+    def test_single_job_stays_in_process(self, mock_convert, mock_parallel, batch_dir) -> None:
+        files = [batch_dir / "report.txt", batch_dir / "notes.txt"]
+        mock_convert.side_effect = [f.with_suffix(".md") for f in files]
+        convert_batch(files, quiet=True, jobs=1)
+        mock_parallel.assert_not_called()
+        assert mock_convert.call_count == 2
+
+    @patch("to_markdown.core.batch.convert_file")
+    def test_serial_batch_passes_bulk_extracted(self, mock_convert, batch_dir: Path) -> None:
+        from to_markdown.core.extraction import ExtractionResult
+
+        files = [batch_dir / "report.txt", batch_dir / "notes.txt"]
+        (batch_dir / "notes.md").write_text("existing")
+        mock_convert.side_effect = [f.with_suffix(".md") for f in files]
+        convert_batch(files, quiet=True)
+        first, second = (c.kwargs["extracted"] for c in mock_convert.call_args_list)
+        assert isinstance(first, ExtractionResult)
+        assert "Report content" in first.content
+        assert second is None  # output exists: not extracted, convert_file skips it
+
+    @patch("to_markdown.core.parallel.convert_batch_parallel")
+    def test_multiple_jobs_use_pool(self, mock_parallel, batch_dir: Path) -> None:
+        files = [batch_dir / "report.txt", batch_dir / "notes.txt"]
+        mock_parallel.return_value = BatchResult()
+        convert_batch(files, quiet=True, jobs=4, force=True)
+        kwargs = mock_parallel.call_args.kwargs
+        assert kwargs["workers"] == 2  # capped at the number of files
+        assert kwargs["options"]["force"] is True
+
+    def test_parallel_converts_real_files(self, batch_dir: Path, tmp_path: Path) -> None:
+        files = discover_files(batch_dir)
+        out_dir = tmp_path / "out"
+        result = convert_batch(files, output_dir=out_dir, batch_root=batch_dir, quiet=True, jobs=2)
+        assert len(result.succeeded) == len(files)
+        assert (out_dir / "sub" / "deep.md").exists()
+        assert result.exit_code == EXIT_SUCCESS
+
+    def test_parallel_records_skips_and_failures(self, batch_dir: Path, tmp_path: Path) -> None:
+        unsupported = batch_dir / "data.xyz"
+        unsupported.write_text("random content")
+        missing = batch_dir / "missing.txt"
+        files = [batch_dir / "report.txt", unsupported, missing]
+        result = convert_batch(files, output_dir=tmp_path / "out", quiet=True, jobs=3)
+        assert [p.name for p in result.succeeded] == ["report.md"]
+        assert [p for p, _ in result.skipped] == [unsupported]
+        assert [p for p, _ in result.failed] == [missing]
+        assert result.exit_code == EXIT_PARTIAL
+
+    def test_parallel_with_progress(self, batch_dir: Path, tmp_path: Path) -> None:
+        files = [batch_dir / "report.txt", batch_dir / "notes.txt"]
+        result = convert_batch(files, output_dir=tmp_path / "out", quiet=False, jobs=2)
+        assert len(result.succeeded) == 2
@@ -0,0 +1,124 @@
+"""Tests for the staged async batch engine (core/batch_stages.py)."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import patch
+
+from to_markdown.core.batch import convert_batch_async
+from to_markdown.core.batch_stages import PipelineStats, StageStats
+from to_markdown.core.content_builder import ExtractedContent
+from to_markdown.core.extraction import ExtractionError, UnsupportedFormatError
+
+
+def _extracted(name: str) -> ExtractedContent:
+    return ExtractedContent(content=f"{name} body", format_type="txt", frontmatter="---\n---\n")
+
+
+class TestStageStats:
+    """Tests for StageStats / PipelineStats reporting."""
+
+    def test_utilization(self) -> None:
+        stats = StageStats(name="extract", workers=2, queue_capacity=4, busy_seconds=5.0)
+        assert stats.utilization(5.0) == 0.5
+
+    def test_utilization_zero_wall_time(self) -> None:
+        stats = StageStats(name="extract", workers=2, queue_capacity=4)
+        assert stats.utilization(0.0) == 0.0
+
+    def test_summary_lines(self) -> None:
+        stage = StageStats(name="llm", workers=1, queue_capacity=2, items=3, max_queue_depth=2)
+        lines = PipelineStats(stages=[stage], wall_seconds=1.0).summary_lines()
+        assert lines == ["llm: 3 item(s), 1 worker(s), 0% busy, queue peak 2/2"]
+
+
+class TestStagedBatch:
+    """Tests for convert_batch_async() running through the staged pipeline."""
+
+    async def test_converts_real_files(self, batch_dir: Path, tmp_path: Path) -> None:
+        files = [batch_dir / "report.txt", batch_dir / "notes.txt", batch_dir / "sub" / "deep.txt"]
+        out_dir = tmp_path / "out"
+        result = await convert_batch_async(files, out_dir, batch_root=batch_dir)
+        assert len(result.succeeded) == 3
+        assert "Deep file content" in (out_dir / "sub" / "deep.md").read_text()
+
+    async def test_reports_pipeline_stats(self, batch_dir: Path, tmp_path: Path) -> None:
+        files = [batch_dir / "report.txt", batch_dir / "notes.txt"]
+        result = await convert_batch_async(
+            files, tmp_path / "out", extract_workers=2, llm_workers=3
+        )
+        stats = result.pipeline_stats
+        assert stats is not None
+        assert [s.name for s in stats.stages] == ["extract", "llm", "write"]
+        assert [s.workers for s in stats.stages] == [2, 3, 1]
+        assert all(s.items == 2 for s in stats.stages)
+        assert stats.wall_seconds > 0
+
+    async def test_extraction_overlaps_llm_stage(self, batch_dir: Path, tmp_path: Path) -> None:
+        """File 2 is extracted while file 1 is still waiting on the LLM stage."""
+        events: list[str] = []
+        llm_release = asyncio.Event()
+
+        async def fake_extract(path: Path, **_kwargs) -> ExtractedContent:
+            events.append(f"extract:{path.name}")
+            if len(events) >= 2:
+                llm_release.set()
+            return _extracted(path.name)
+
+        async def fake_enrich(extracted: ExtractedContent, **_kwargs) -> str:
+            await llm_release.wait()
+            events.append(f"enrich:{extracted.content}")
+            return extracted.frontmatter + extracted.content
+
+        files = [batch_dir / "report.txt", batch_dir / "notes.txt"]
+        with (
+            patch("to_markdown.core.batch_stages.extract_content_async", fake_extract),
+            patch("to_markdown.core.batch_stages.enrich_content_async", fake_enrich),
+        ):
+            result = await convert_batch_async(
+                files, tmp_path / "out", extract_workers=1, llm_workers=1
+            )
+
+        assert len(result.succeeded) == 2
+        assert events.index("extract:notes.txt") < events.index("enrich:report.txt body")
+
+    async def test_existing_output_skipped_before_extraction(
+        self, batch_dir: Path, tmp_path: Path
+    ) -> None:
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+        (out_dir / "report.md").write_text("existing")
+        with patch("to_markdown.core.batch_stages.extract_content_async") as mock_extract:
+            result = await convert_batch_async([batch_dir / "report.txt"], out_dir)
+        mock_extract.assert_not_called()
+        assert len(result.skipped) == 1
+        assert "Output exists" in result.skipped[0][1]
+
+    async def test_unsupported_and_failed_recorded(self, batch_dir: Path, tmp_path: Path) -> None:
+        async def fake_extract(path: Path, **_kwargs) -> ExtractedContent:
+            if path.name == "report.txt":
+                raise UnsupportedFormatError("unsupported")
+            if path.name == "notes.txt":
+                raise ExtractionError("broken")
+            return _extracted(path.name)
+
+        files = [batch_dir / "report.txt", batch_dir / "notes.txt", batch_dir / "readme.html"]
+        with patch("to_markdown.core.batch_stages.extract_content_async", fake_extract):
+            result = await convert_batch_async(files, tmp_path / "out")
+        assert [p.name for p, _ in result.skipped] == ["report.txt"]
+        assert [p.name for p, _ in result.failed] == ["notes.txt"]
+        assert [p.name for p in result.succeeded] == ["readme.md"]
+
+    async def test_fail_fast_stops_processing(self, batch_dir: Path, tmp_path: Path) -> None:
+        calls: list[str] = []
+
+        async def fake_extract(path: Path, **_kwargs) -> ExtractedContent:
+            calls.append(path.name)
+            raise ExtractionError("broken")
+
+        files = [batch_dir / "report.txt", batch_dir / "notes.txt", batch_dir / "readme.html"]
+        with patch("to_markdown.core.batch_stages.extract_content_async", fake_extract):
+            result = await convert_batch_async(
+                files, tmp_path / "out", fail_fast=True, extract_workers=1
+            )
+        assert len(result.failed) == 1
+        assert calls == ["report.txt"]
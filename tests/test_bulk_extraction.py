@@ -0,0 +1,80 @@
+"""Tests for bulk extraction via Kreuzberg's batch API (core/bulk_extraction.py)."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from to_markdown.core.batch import convert_batch
+from to_markdown.core.bulk_extraction import extract_files, prefetch_extractions
+from to_markdown.core.extraction import extract_file
+
+
+class TestExtractFiles:
+    """Tests for extract_files() ordering, fallbacks, and caching."""
+
+    def test_results_match_per_file_extraction(self, batch_dir: Path) -> None:
+        files = sorted(batch_dir.rglob("*.*"))
+        results = extract_files(files, use_cache=False)
+        assert results == [extract_file(f, use_cache=False) for f in files]
+
+    def test_failed_files_are_none(self, tmp_path: Path, sample_text_file: Path) -> None:
+        unsupported = tmp_path / "data.xyzq"
+        unsupported.write_text("x")
+        missing = tmp_path / "missing.txt"
+        results = extract_files([unsupported, sample_text_file, missing])
+        assert results[0] is None
+        assert results[2] is None
+        assert "test document" in results[1].content
+
+    def test_shares_extraction_cache(self, sample_text_file: Path) -> None:
+        first = extract_file(sample_text_file)
+        with patch("to_markdown.core.bulk_extraction.batch_extract_files_sync") as mock_batch:
+            results = extract_files([sample_text_file])
+        mock_batch.assert_not_called()
+        assert results == [first]
+
+    def test_empty(self) -> None:
+        assert extract_files([]) == []
+
+
+class TestPrefetchExtractions:
+    """Tests for prefetch_extractions() windows in the serial batch loop."""
+
+    def _prefetch(self, files: list[Path], **options) -> list:
+        outputs = [None] * len(files)
+        return list(
+            prefetch_extractions(
+                files, outputs, images=False, use_cache=False, force=True, **options
+            )
+        )
+
+    def test_window_capped_by_source_bytes(self, tmp_path: Path) -> None:
+        files = []
+        for name in "abcde":
+            path = tmp_path / f"{name}.html"
+            path.write_text("<p>" + "x" * 40 + "</p>")
+            files.append(path)
+        with (
+            patch("to_markdown.core.bulk_extraction.BULK_EXTRACTION_WINDOW_BYTES", 100),
+            patch(
+                "to_markdown.core.bulk_extraction.extract_files",
+                side_effect=lambda paths, **_: [None] * len(paths),
+            ) as mock_extract,
+        ):
+            assert self._prefetch(files) == [None] * 5
+        assert [len(call.args[0]) for call in mock_extract.call_args_list] == [2, 2, 1]
+
+    def test_no_bulk_extracts_nothing_ahead(self, batch_dir: Path) -> None:
+        files = sorted(batch_dir.rglob("*.*"))
+        with patch("to_markdown.core.bulk_extraction.extract_files") as mock_extract:
+            assert self._prefetch(files, bulk=False) == [None] * len(files)
+        mock_extract.assert_not_called()
+
+    @pytest.mark.parametrize("option", ["stream", "fail_fast"])
+    def test_serial_batch_skips_bulk_prefetch(self, batch_dir: Path, option: str) -> None:
+        files = sorted(batch_dir.rglob("*.*"))
+        with patch("to_markdown.core.bulk_extraction.extract_files") as mock_extract:
+            result = convert_batch(files, batch_dir, quiet=True, force=True, **{option: True})
+        mock_extract.assert_not_called()
+        assert len(result.succeeded) == len(files)
@@ -0,0 +1,71 @@
+"""Tests for the content-addressed extraction cache (core/cache.py)."""
+
+import logging
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from to_markdown.core.cache import ExtractionCache, get_default_cache
+from to_markdown.core.extraction import ExtractionResult, extract_file
+
+
+def _result(content: str = "hello", **kwargs) -> ExtractionResult:
+    return ExtractionResult(content=content, metadata={"format_type": "text"}, **kwargs)
+
+
+class TestExtractFileCaching:
+    """Tests for extract_file() integration with the default cache."""
+
+    def test_second_extraction_served_from_cache(self, sample_html_file: Path) -> None:
+        first = extract_file(sample_html_file)
+        with patch("to_markdown.core.extraction._extract_uncached") as mock_extract:
+            second = extract_file(sample_html_file)
+        mock_extract.assert_not_called()
+        assert second == first
+        assert get_default_cache().stats().hits == 1
+
+    def test_use_cache_false_bypasses(self, sample_html_file: Path) -> None:
+        extract_file(sample_html_file)
+        with patch(
+            "to_markdown.core.extraction._extract_uncached", return_value=_result("fresh")
+        ) as mock_extract:
+            result = extract_file(sample_html_file, use_cache=False)
+        mock_extract.assert_called_once()
+        assert result.content == "fresh"
+
+    def test_default_cache_uses_data_dir(self, isolated_data_dir: Path) -> None:
+        assert get_default_cache().db_path.parent == isolated_data_dir
+
+
+class TestUnusableCache:
+    """Tests for running uncached when the cache database cannot be used."""
+
+    @pytest.fixture(autouse=True)
+    def _warn_again(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("to_markdown.core.cache._warned_unavailable", False)
+
+    def test_bad_data_dir_extracts_uncached(
+        self, sample_html_file: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog
+    ) -> None:
+        data_dir = tmp_path / "not-a-directory"
+        data_dir.write_text("")
+        monkeypatch.setenv("TO_MARKDOWN_DATA_DIR", str(data_dir))
+        with caplog.at_level(logging.WARNING, logger="to_markdown.core.cache"):
+            first = extract_file(sample_html_file)
+            assert extract_file(sample_html_file) == first
+        assert caplog.text.count("Cache unavailable") == 1
+
+    def test_locked_database_extracts_uncached(self, sample_html_file: Path) -> None:
+        locked = sqlite3.OperationalError("database is locked")
+        with (
+            patch.object(ExtractionCache, "_lookup", side_effect=locked),
+            patch.object(ExtractionCache, "_store", side_effect=locked) as mock_store,
+        ):
+            assert "Sample" in extract_file(sample_html_file).content
+        mock_store.assert_not_called()
+
+    def test_failed_store_still_returns_result(self, sample_html_file: Path) -> None:
+        with patch.object(ExtractionCache, "_store", side_effect=OSError("read-only")):
+            assert "Sample" in extract_file(sample_html_file).content
@@ -0,0 +1,141 @@
+"""Tests for the SQLite cache store (core/cache_db.py)."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from to_markdown.core.cache_db import ExtractionCache
+from to_markdown.core.extraction import ExtractionResult
+
+
+def _result(content: str = "hello", **kwargs) -> ExtractionResult:
+    return ExtractionResult(content=content, metadata={"format_type": "text"}, **kwargs)
+
+
+class TestExtractionCache:
+    """Tests for ExtractionCache storage, stats, and eviction."""
+
+    def test_miss_then_hit(self, tmp_path: Path) -> None:
+        cache = ExtractionCache(tmp_path / "cache.db")
+        assert cache.get("k") is None
+        cache.put("k", _result())
+        assert cache.get("k") == _result()
+        stats = cache.stats()
+        assert (stats.entries, stats.hits, stats.misses) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_image_bytes_round_trip(self, tmp_path: Path) -> None:
+        cache = ExtractionCache(tmp_path / "cache.db")
+        image = {"data": b"\x89PNG\x00", "format": "png", "page_number": 1}
+        cache.put("k", _result(images=[image]))
+        assert cache.get("k").images[0]["data"] == b"\x89PNG\x00"
+
+    def test_clear(self, tmp_path: Path) -> None:
+        cache = ExtractionCache(tmp_path / "cache.db")
+        cache.put("a", _result())
+        cache.put("b", _result())
+        cache.get("a")
+        assert cache.clear() == 2
+        stats = cache.stats()
+        assert (stats.entries, stats.size_bytes, stats.hits) == (0, 0, 0)
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        entry_size = len(b'{"content": "') + 200
+        cache = ExtractionCache(tmp_path / "cache.db", max_bytes=entry_size * 3)
+        for key in ("a", "b", "c"):
+            cache.put(key, _result("x" * 100))
+        cache.get("a")  # a becomes most recently used
+        cache.put("d", _result("x" * 100))
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("d") is not None
+        assert cache.stats().size_bytes <= cache.max_bytes
+
+    def test_oversized_entry_not_stored(self, tmp_path: Path) -> None:
+        cache = ExtractionCache(tmp_path / "cache.db", max_bytes=10)
+        cache.put("k", _result("x" * 100))
+        assert cache.stats().entries == 0
+
+    def test_running_total_follows_replace_and_eviction(self, tmp_path: Path) -> None:
+        cache = ExtractionCache(tmp_path / "cache.db", max_bytes=1_000)
+        cache.put_ocr_text("a", "x" * 300)
+        cache.put_ocr_text("a", "x" * 100)
+        for key in ("b", "c", "d", "e"):
+            cache.put_ocr_text(key, "x" * 250)
+        (actual,) = cache._conn.execute("SELECT SUM(size) FROM entries").fetchone()
+        assert cache.stats().size_bytes == actual <= 1_000
+
+    def test_total_seeded_from_older_cache(self, tmp_path: Path) -> None:
+        cache = ExtractionCache(tmp_path / "cache.db")
+        cache.put_ocr_text("a", "x" * 40)
+        cache._conn.execute("DELETE FROM counters")
+        cache._conn.commit()
+        cache.close()
+        assert ExtractionCache(tmp_path / "cache.db").stats().size_bytes == 40
+
+    def test_put_and_hit_do_not_scan_or_write(self, tmp_path: Path) -> None:
+        cache = ExtractionCache(tmp_path / "cache.db")
+        cache.put_ocr_text("a", "text")
+        statements: list[str] = []
+        cache._conn.set_trace_callback(statements.append)
+        cache.put_ocr_text("b", "more")
+        assert not [sql for sql in statements if "SUM(" in sql]
+        statements.clear()
+        assert cache.get_ocr_text("a") == "text"
+        assert [sql for sql in statements if not sql.startswith("SELECT")] == []
+        assert cache.stats().ocr_hits == 1  # Written when stats are read
+
+    def test_queued_hits_refresh_lru_position(self, tmp_path: Path) -> None:
+        cache = ExtractionCache(tmp_path / "cache.db")
+        cache.put_ocr_text("a", "text")
+        with patch("to_markdown.core.cache_db.time.time", return_value=4_000_000_000.0):
+            cache.get_ocr_text("a")
+        cache.put_ocr_text("b", "more")  # A put writes queued refreshes first
+        (accessed,) = cache._conn.execute(
+            "SELECT last_access FROM entries WHERE key = 'a'"
+        ).fetchone()
+        assert accessed == 4_000_000_000.0
+
+    def test_shared_across_instances(self, tmp_path: Path) -> None:
+        db = tmp_path / "cache.db"
+        ExtractionCache(db).put("k", _result())
+        assert ExtractionCache(db).get("k") == _result()
+
+
+class TestOcrTextCache:
+    """Tests for page-image OCR text entries."""
+
+    def test_miss_then_hit_counted_separately(self, tmp_path: Path) -> None:
+        cache = ExtractionCache(tmp_path / "cache.db")
+        assert cache.get_ocr_text("img") is None
+        cache.put_ocr_text("img", "Letterhead text \u00e9")
+        assert cache.get_ocr_text("img") == "Letterhead text \u00e9"
+        stats = cache.stats()
+        assert (stats.ocr_hits, stats.ocr_misses, stats.hits, stats.misses) == (1, 1, 0, 0)
+        assert stats.ocr_hit_rate == 0.5
+
+    def test_empty_text_is_a_hit(self, tmp_path: Path) -> None:
+        cache = ExtractionCache(tmp_path / "cache.db")
+        cache.put_ocr_text("blank", "")
+        assert cache.get_ocr_text("blank") == ""
+
+
+class TestLlmResponseCache:
+    """Tests for LLM response entries."""
+
+    def test_miss_then_hit_counted_separately(self, tmp_path: Path) -> None:
+        cache = ExtractionCache(tmp_path / "cache.db")
+        assert cache.get_llm_response("prompt", max_age=60) is None
+        cache.put_llm_response("prompt", "Cleaned text")
+        assert cache.get_llm_response("prompt", max_age=60) == "Cleaned text"
+        stats = cache.stats()
+        assert (stats.llm_hits, stats.llm_misses, stats.ocr_hits, stats.hits) == (1, 1, 0, 0)
+        assert stats.llm_hit_rate == 0.5
+
+    def test_expired_response_is_a_miss_and_deleted(self, tmp_path: Path) -> None:
+        cache = ExtractionCache(tmp_path / "cache.db")
+        with patch("to_markdown.core.cache_db.time.time", return_value=1_000.0):
+            cache.put_llm_response("prompt", "stale")
+        with patch("to_markdown.core.cache_db.time.time", return_value=1_061.0):
+            assert cache.get_llm_response("prompt", max_age=60) is None
+        assert cache.stats().entries == 0
+        assert cache.stats().llm_misses == 1
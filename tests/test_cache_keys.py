@@ -0,0 +1,38 @@
+"""Tests for cache key composition (core/cache_keys.py)."""
+
+from pathlib import Path
+
+from to_markdown.core.cache_keys import cache_key, ocr_cache_key
+
+
+class TestCacheKey:
+    """Tests for cache_key() composition."""
+
+    def test_same_content_same_key(self, tmp_path: Path) -> None:
+        a = tmp_path / "a.txt"
+        b = tmp_path / "b.txt"
+        a.write_text("same")
+        b.write_text("same")
+        assert cache_key(a, extract_images=False) == cache_key(b, extract_images=False)
+
+    def test_content_change_changes_key(self, tmp_path: Path) -> None:
+        f = tmp_path / "a.txt"
+        f.write_text("one")
+        before = cache_key(f)
+        f.write_text("two")
+        assert cache_key(f) != before
+
+    def test_settings_change_key(self, tmp_path: Path) -> None:
+        f = tmp_path / "a.txt"
+        f.write_text("one")
+        assert cache_key(f, extract_images=True) != cache_key(f, extract_images=False)
+
+
+class TestOcrCacheKey:
+    """Tests for ocr_cache_key() composition."""
+
+    def test_key_depends_on_bytes_and_settings(self) -> None:
+        key = ocr_cache_key(b"png-bytes", mime_type="image/png")
+        assert key == ocr_cache_key(b"png-bytes", mime_type="image/png")
+        assert key != ocr_cache_key(b"other-bytes", mime_type="image/png")
+        assert key != ocr_cache_key(b"png-bytes", mime_type="image/jpeg")
@@ -0,0 +1,42 @@
+"""Tests for per-run cache lookup counting (core/cache_lookups.py)."""
+
+import asyncio
+
+from to_markdown.core.cache_lookups import counting_lookups, merge_lookups, record_lookup
+
+
+class TestCountingLookups:
+    """Tests for counting_lookups(), record_lookup() and merge_lookups()."""
+
+    def test_counts_only_inside_block(self) -> None:
+        record_lookup("ocr_hits")
+        with counting_lookups() as lookups:
+            record_lookup("ocr_hits")
+            record_lookup("llm_misses")
+        record_lookup("ocr_hits")
+        assert lookups == {"ocr_hits": 1, "llm_misses": 1}
+
+    def test_threads_and_tasks_share_the_run(self) -> None:
+        async def run() -> None:
+            await asyncio.gather(
+                asyncio.to_thread(record_lookup, "hits"),
+                asyncio.to_thread(record_lookup, "hits"),
+            )
+
+        with counting_lookups() as lookups:
+            asyncio.run(run())
+        assert lookups == {"hits": 2}
+
+    def test_merge_child_counts(self) -> None:
+        merge_lookups({"ocr_hits": 5})  # no run counting: dropped
+        with counting_lookups() as lookups:
+            merge_lookups({"ocr_hits": 2, "ocr_misses": 1})
+            merge_lookups({})
+        assert lookups == {"ocr_hits": 2, "ocr_misses": 1}
+
+    def test_nested_runs_count_separately(self) -> None:
+        with counting_lookups() as outer:
+            record_lookup("hits")
+            with counting_lookups() as inner:
+                record_lookup("misses")
+        assert (outer, inner) == ({"hits": 1}, {"misses": 1})
@@ -0,0 +1,114 @@
+"""Tests for structure-aware Markdown chunking (core/chunking.py)."""
+
+from to_markdown.core.chunking import Chunk, chunk_markdown, join_chunks
+from to_markdown.core.constants import CHARS_PER_TOKEN_ESTIMATE
+from to_markdown.core.content_analysis import find_paragraph_breaks
+
+# 10-token budget: 40 characters per chunk
+BUDGET = 10
+MAX_CHARS = BUDGET * CHARS_PER_TOKEN_ESTIMATE
+
+
+def _texts(content: str, chunks: list[Chunk]) -> list[str]:
+    return [content[chunk.start : chunk.end] for chunk in chunks]
+
+
+def _roundtrip(content: str, chunks: list[Chunk]) -> str:
+    return join_chunks(content, chunks, _texts(content, chunks))
+
+
+class TestChunkMarkdown:
+    """Tests for chunk_markdown()."""
+
+    def test_small_content_is_one_chunk(self):
+        assert chunk_markdown("  small text\n", BUDGET) == [Chunk(0, 13)]
+
+    def test_packs_paragraphs_within_budget(self):
+        content = "para one\n\npara two\n\npara three\n\npara four\n\npara five"
+        chunks = chunk_markdown(content, BUDGET)
+        assert _texts(content, chunks) == [
+            "para one\n\npara two\n\npara three",
+            "para four\n\npara five",
+        ]
+        assert all(chunk.end - chunk.start <= MAX_CHARS for chunk in chunks)
+
+    def test_roundtrip_keeps_extra_blank_lines(self):
+        content = "\n\npara one\n\n\npara two\n\n\n\n" + "para three " * 5 + "\n\n  \n\nend\n"
+        chunks = chunk_markdown(content, BUDGET)
+        assert len(chunks) > 1
+        assert _roundtrip(content, chunks) == content
+
+    def test_precomputed_breaks_give_same_chunks(self):
+        content = "para one\n\n\npara two\n\npara three\n\n\n\npara four" * 3
+        breaks = find_paragraph_breaks(content)
+        assert chunk_markdown(content, BUDGET, breaks) == chunk_markdown(content, BUDGET)
+
+    def test_heading_moves_to_next_chunk_with_its_section(self):
+        content = "x" * 30 + "\n\n# Next\n\n" + "y" * 30
+        assert _texts(content, chunk_markdown(content, BUDGET)) == [
+            "x" * 30,
+            "# Next\n\n" + "y" * 30,
+        ]
+
+    def test_half_full_chunk_breaks_at_heading(self):
+        content = "x" * 20 + "\n\n## Part\n\nshort\n\n" + "z" * 30
+        assert _texts(content, chunk_markdown(content, BUDGET)) == [
+            "x" * 20,
+            "## Part\n\nshort",
+            "z" * 30,
+        ]
+
+    def test_code_fence_with_blank_lines_stays_whole(self):
+        code = "```\na = 1\n\n\nb = 2\n```"
+        content = "intro text here\n\n" + code + "\n\nafter"
+        assert _texts(content, chunk_markdown(content, BUDGET)) == [
+            "intro text here\n\n" + code,
+            "after",
+        ]
+
+    def test_oversized_code_block_is_verbatim(self):
+        code = "~~~python\n" + "x = 1\n\n" * 20 + "~~~"
+        content = "intro\n\n" + code + "\n\noutro"
+        chunks = chunk_markdown(content, BUDGET)
+        assert [chunk.verbatim for chunk in chunks] == [False, True, False]
+        assert _texts(content, chunks)[1] == code
+
+    def test_unclosed_fence_is_not_a_fence(self):
+        content = "```\n" + "\n\n".join(["para"] * 20)
+        chunks = chunk_markdown(content, BUDGET)
+        assert not any(chunk.verbatim for chunk in chunks)
+        assert all(chunk.end - chunk.start <= MAX_CHARS for chunk in chunks)
+
+    def test_oversized_table_split_between_rows(self):
+        rows = [f"| row {i} | value |" for i in range(10)]
+        content = "\n".join(rows)
+        texts = _texts(content, chunk_markdown(content, BUDGET))
+        assert len(texts) > 1
+        assert all(line in rows for text in texts for line in text.split("\n"))
+        assert "\n".join(texts) == content
+
+    def test_oversized_line_split_at_spaces(self):
+        content = " ".join(["word"] * 40)
+        chunks = chunk_markdown(content, BUDGET)
+        assert all(chunk.end - chunk.start <= MAX_CHARS for chunk in chunks)
+        assert all(text.split() == ["word"] * len(text.split()) for text in _texts(content, chunks))
+        assert _roundtrip(content, chunks) == content
+
+    def test_separator_just_before_end_leaves_no_empty_chunk(self):
+        content = "y" * MAX_CHARS + " "  # The only cut is at end - 1
+        chunks = chunk_markdown(content, BUDGET)
+        assert chunks == [Chunk(0, MAX_CHARS)]
+        assert _roundtrip(content, chunks) == content
+
+    def test_unbroken_text_cut_at_budget(self):
+        content = "z" * 100
+        assert _texts(content, chunk_markdown(content, BUDGET)) == ["z" * 40, "z" * 40, "z" * 20]
+
+
+class TestJoinChunks:
+    """Tests for join_chunks()."""
+
+    def test_replaces_chunks_keeping_gaps(self):
+        content = "\nalpha\n\n\nbeta gamma\n"
+        chunks = [Chunk(1, 6), Chunk(9, 13), Chunk(14, 19)]
+        assert join_chunks(content, chunks, ["A", "B", "G"]) == "\nA\n\n\nB G\n"
@@ -1,10 +1,12 @@
 """Tests for the Typer CLI (cli.py)."""
 
 import json
+import os
 import re
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
+import pytest
 from typer.testing import CliRunner
 
 from to_markdown.cli import app
@@ -14,6 +16,8 @@ from to_markdown.core.constants import (
     EXIT_ERROR,
     EXIT_PARTIAL,
     EXIT_SUCCESS,
+    LLM_CACHE_DISABLED,
+    LLM_CACHE_ENV,
     TASK_DB_FILENAME,
     TASK_LOG_DIR,
 )
@@ -347,6 +351,189 @@ class TestBatchFailFast:
         assert mock_convert.call_count == 1
 
 
+class TestBatchJobs:
+    """Tests for --jobs flag."""
+
+    @patch("to_markdown.cli.run_batch")
+    def test_jobs_passed_to_run_batch(self, mock_run_batch, batch_dir: Path):
+        runner.invoke(app, [str(batch_dir), "--jobs", "4", "--quiet"])
+        assert mock_run_batch.call_args.kwargs["jobs"] == 4
+
+    @patch("to_markdown.cli.run_batch")
+    def test_jobs_defaults_to_serial(self, mock_run_batch, batch_dir: Path):
+        runner.invoke(app, [str(batch_dir), "--quiet"])
+        assert mock_run_batch.call_args.kwargs["jobs"] == 1
+
+    def test_negative_jobs_rejected(self, batch_dir: Path):
+        result = runner.invoke(app, [str(batch_dir), "--jobs", "-1"])
+        assert result.exit_code != EXIT_SUCCESS
+
+    def test_jobs_converts_directory(self, batch_dir: Path, tmp_path: Path):
+        out_dir = tmp_path / "output"
+        result = runner.invoke(app, [str(batch_dir), "-o", str(out_dir), "-j", "2", "--quiet"])
+        assert result.exit_code == EXIT_SUCCESS
+        assert (out_dir / "report.md").exists()
+
+
+class TestCacheFlags:
+    """Tests for --no-cache, --clear-cache, and --cache-stats flags."""
+
+    @patch("to_markdown.cli.convert_file")
+    def test_no_cache_passed_to_convert(self, mock_convert, sample_text_file: Path):
+        mock_convert.return_value = sample_text_file.with_suffix(".md")
+        runner.invoke(app, [str(sample_text_file), "--no-cache", "--quiet"])
+        assert mock_convert.call_args.kwargs["use_cache"] is False
+
+    @patch("to_markdown.cli.run_batch")
+    def test_cache_enabled_by_default(self, mock_run_batch, batch_dir: Path):
+        runner.invoke(app, [str(batch_dir), "--quiet"])
+        assert mock_run_batch.call_args.kwargs["use_cache"] is True
+
+    def test_cache_stats_without_input(self, sample_html_file: Path, tmp_path: Path):
+        runner.invoke(app, [str(sample_html_file), "-o", str(tmp_path / "a.md")])
+        runner.invoke(app, [str(sample_html_file), "-o", str(tmp_path / "b.md")])
+        result = runner.invoke(app, ["--cache-stats"])
+        assert result.exit_code == EXIT_SUCCESS
+        assert "Entries:  1" in result.output
+        assert "Hit rate: 50.0%" in result.output
+
+    @patch("to_markdown.core.batch.convert_batch")
+    def test_batch_summary_shows_ocr_cache_hit_rate(self, mock_batch, batch_dir: Path):
+        from to_markdown.core.batch import BatchResult
+
+        mock_batch.return_value = BatchResult(
+            succeeded=[batch_dir / "report.md"], ocr_cache_hits=3, ocr_cache_misses=1
+        )
+        result = runner.invoke(app, [str(batch_dir)])
+        assert "OCR cache: 3 of 4 page image(s) reused (75%)" in result.output
+
+    @patch("to_markdown.core.batch.convert_batch")
+    def test_batch_summary_shows_llm_cache_hit_rate(self, mock_batch, batch_dir: Path):
+        from to_markdown.core.batch import BatchResult
+
+        mock_batch.return_value = BatchResult(
+            succeeded=[batch_dir / "report.md"], llm_cache_hits=9, llm_cache_misses=1
+        )
+        result = runner.invoke(app, [str(batch_dir)])
+        assert "LLM cache: 9 of 10 response(s) reused (90%)" in result.output
+
+    @patch("to_markdown.cli.convert_file")
+    def test_no_llm_cache_disables_for_process_and_workers(
+        self, mock_convert, sample_text_file: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setenv(LLM_CACHE_ENV, "")  # Restored after the test
+        monkeypatch.delenv(LLM_CACHE_ENV)
+        mock_convert.return_value = sample_text_file.with_suffix(".md")
+        runner.invoke(app, [str(sample_text_file), "--no-llm-cache", "--quiet"])
+        assert os.environ[LLM_CACHE_ENV] == LLM_CACHE_DISABLED
+
+    def test_clear_cache(self, sample_html_file: Path, tmp_path: Path):
+        runner.invoke(app, [str(sample_html_file), "-o", str(tmp_path / "a.md")])
+        result = runner.invoke(app, ["--clear-cache"])
+        assert result.exit_code == EXIT_SUCCESS
+        assert "Cleared 1 cached extraction(s)." in result.output
+
+
+class TestDiscoveryFilterFlags:
+    """Tests for the --include/--exclude flags."""
+
+    @patch("to_markdown.cli.run_batch")
+    def test_patterns_passed_to_run_batch(self, mock_run_batch, batch_dir: Path):
+        args = [str(batch_dir), "--include", "*.pdf", "--include", "*.docx", "--exclude", "old/*"]
+        runner.invoke(app, args)
+        assert mock_run_batch.call_args.kwargs["include"] == ["*.pdf", "*.docx"]
+        assert mock_run_batch.call_args.kwargs["exclude"] == ["old/*"]
+
+    def test_batch_applies_filters(self, batch_dir: Path):
+        result = runner.invoke(app, [str(batch_dir), "--include", "*.html", "--quiet"])
+        assert result.exit_code == EXIT_SUCCESS
+        assert (batch_dir / "readme.md").exists()
+        assert not (batch_dir / "report.md").exists()
+
+
+class TestTimeoutFlag:
+    """Tests for the --timeout flag."""
+
+    @patch("to_markdown.cli.convert_file")
+    def test_timeout_passed_to_convert(self, mock_convert, sample_text_file: Path):
+        mock_convert.return_value = sample_text_file.with_suffix(".md")
+        runner.invoke(app, [str(sample_text_file), "--timeout", "30", "--quiet"])
+        assert mock_convert.call_args.kwargs["timeout"] == 30
+
+    def test_timeout_below_minimum_rejected(self, sample_text_file: Path):
+        result = runner.invoke(app, [str(sample_text_file), "--timeout", "0"])
+        assert result.exit_code == EXIT_ERROR
+
+
+class TestOcrFlags:
+    """Tests for the --ocr-workers, --ocr-threads, and --ocr-dpi flags."""
+
+    @patch("to_markdown.cli.convert_file")
+    def test_settings_passed_to_convert(
+        self, mock_convert, sample_text_file: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.delenv("RAYON_NUM_THREADS", raising=False)
+        mock_convert.return_value = sample_text_file.with_suffix(".md")
+        args = ["--ocr-workers", "2", "--ocr-threads", "3", "--ocr-dpi", "200", "--quiet"]
+        runner.invoke(app, [str(sample_text_file), *args])
+        ocr = mock_convert.call_args.kwargs["ocr"]
+        assert (ocr.workers, ocr.threads, ocr.dpi) == (2, 3, 200)
+        assert os.environ["RAYON_NUM_THREADS"] == "3"
+
+    @patch("to_markdown.cli.convert_file")
+    def test_no_flags_pass_none(self, mock_convert, sample_text_file: Path):
+        mock_convert.return_value = sample_text_file.with_suffix(".md")
+        runner.invoke(app, [str(sample_text_file), "--quiet"])
+        assert mock_convert.call_args.kwargs["ocr"] is None
+
+    @pytest.mark.parametrize("flag", ["--ocr-workers=0", "--ocr-threads=0", "--ocr-dpi=5000"])
+    def test_out_of_range_rejected(self, flag: str, sample_text_file: Path):
+        result = runner.invoke(app, [str(sample_text_file), flag])
+        assert result.exit_code == EXIT_ERROR
+
+
+class TestDeterministicFlag:
+    """Tests for the --deterministic flag."""
+
+    @patch("to_markdown.cli.convert_file")
+    def test_passed_to_convert(self, mock_convert, sample_text_file: Path):
+        mock_convert.return_value = sample_text_file.with_suffix(".md")
+        runner.invoke(app, [str(sample_text_file), "--deterministic", "--quiet"])
+        assert mock_convert.call_args.kwargs["deterministic"] is True
+
+    @patch("to_markdown.cli.run_batch")
+    def test_passed_to_batch(self, mock_run_batch, batch_dir: Path):
+        runner.invoke(app, [str(batch_dir), "--deterministic", "--quiet"])
+        assert mock_run_batch.call_args.kwargs["deterministic"] is True
+
+
+class TestIncrementalFlags:
+    """Tests for the --incremental and --prune flags."""
+
+    @patch("to_markdown.cli.run_batch")
+    def test_prune_implies_incremental(self, mock_run_batch, batch_dir: Path):
+        runner.invoke(app, [str(batch_dir), "--prune", "--quiet"])
+        kwargs = mock_run_batch.call_args.kwargs
+        assert (kwargs["incremental"], kwargs["prune"]) == (True, True)
+
+    def test_second_run_skips_unchanged(self, batch_dir: Path, tmp_path: Path):
+        out = tmp_path / "out"
+        args = [str(batch_dir), "-o", str(out), "--incremental"]
+        assert runner.invoke(app, args).exit_code == EXIT_SUCCESS
+        result = runner.invoke(app, args)
+        assert "Converted 0 file(s), 4 skipped" in result.output
+        assert result.exit_code == EXIT_SUCCESS
+
+    def test_rerun_with_existing_outputs_still_an_error(self, batch_dir: Path, tmp_path: Path):
+        args = [str(batch_dir), "-o", str(tmp_path / "out")]
+        runner.invoke(app, args)
+        assert runner.invoke(app, args).exit_code == EXIT_ERROR
+
+    def test_glob_without_output_rejected(self, batch_dir: Path):
+        result = runner.invoke(app, [str(batch_dir / "*.txt"), "--incremental"])
+        assert result.exit_code == EXIT_ERROR
+
+
 class TestBatchExitCodes:
     """Tests for batch exit codes."""
 
@@ -813,3 +1000,26 @@ class TestCleanByDefault:
         _, kwargs = mock_convert.call_args
         assert kwargs["summary"] is False
         assert kwargs["images"] is False
+
+
+class TestStreamFlag:
+    """Tests for --stream flag."""
+
+    @patch("to_markdown.cli.convert_file")
+    def test_stream_passed_and_clean_disabled(self, mock_convert, sample_text_file: Path):
+        mock_convert.return_value = sample_text_file.with_suffix(".md")
+        with patch("to_markdown.cli._is_llm_available", return_value=True):
+            runner.invoke(app, [str(sample_text_file), "--stream", "--quiet"])
+        kwargs = mock_convert.call_args.kwargs
+        assert kwargs["stream"] is True
+        assert kwargs["clean"] is False
+
+    def test_stream_with_summary_rejected(self, sample_text_file: Path):
+        result = runner.invoke(app, [str(sample_text_file), "--stream", "--summary"])
+        assert result.exit_code == EXIT_ERROR
+
+    def test_stream_converts_file(self, sample_text_file: Path, tmp_path: Path):
+        out = tmp_path / "out.md"
+        result = runner.invoke(app, [str(sample_text_file), "--stream", "-o", str(out)])
+        assert result.exit_code == EXIT_SUCCESS
+        assert "multiple paragraphs" in out.read_text()
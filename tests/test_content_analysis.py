@@ -0,0 +1,71 @@
+"""Tests for one-shot content analysis."""
+
+import hashlib
+
+import pytest
+
+from to_markdown.core.constants import CHARS_PER_TOKEN_ESTIMATE, PARAGRAPH_SEPARATOR
+from to_markdown.core.content_analysis import (
+    analyze_content,
+    estimate_tokens,
+    find_paragraph_breaks,
+)
+
+
+class TestAnalyzeContent:
+    """Tests for analyze_content()."""
+
+    def test_statistics_match_separate_passes(self):
+        content = "Quarterly report\n\nRevenue grew 4%.\n\n\n\nMargins held steady."
+        analysis = analyze_content(content)
+        assert analysis.content == content
+        assert analysis.sha256 == hashlib.sha256(content.encode()).hexdigest()
+        assert analysis.words == len(content.split())
+        assert analysis.tokens == estimate_tokens(content)
+        assert analysis.sanitized is False
+        assert analysis.removed_by_category == {}
+
+    def test_statistics_describe_sanitized_content(self):
+        analysis = analyze_content("Hello\u200b world\x07")
+        assert analysis.content == "Hello world"
+        assert analysis.sanitized is True
+        assert analysis.removed_by_category == {"zero_width": 1, "control": 1}
+        assert analysis.sha256 == hashlib.sha256(b"Hello world").hexdigest()
+        assert analysis.words == 2
+
+    def test_sanitize_disabled_keeps_content(self):
+        analysis = analyze_content("Hello\u200b world", sanitize=False)
+        assert analysis.content == "Hello\u200b world"
+        assert analysis.sanitized is False
+
+    @pytest.mark.parametrize("content", ["", "   \n\n\t "])
+    def test_blank_content(self, content: str):
+        analysis = analyze_content(content)
+        assert analysis.is_blank
+
+    def test_equal_content_hashes_equal(self):
+        assert analyze_content("same text").sha256 == analyze_content("same\u200b text").sha256
+
+
+class TestEstimateTokens:
+    """Tests for estimate_tokens()."""
+
+    def test_rounds_up(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("x") == 1
+        assert estimate_tokens("x" * CHARS_PER_TOKEN_ESTIMATE * 3 + "x") == 4
+
+
+class TestFindParagraphBreaks:
+    """Tests for find_paragraph_breaks()."""
+
+    @pytest.mark.parametrize(
+        "content",
+        ["one", "one\n\ntwo", "\n\none\n\n", "a\n\n\nb", "a\n\n\n\nb", "\n\n\n\n\n"],
+    )
+    def test_offsets_match_str_split(self, content: str):
+        breaks = find_paragraph_breaks(content)
+        starts = [0, *(b + len(PARAGRAPH_SEPARATOR) for b in breaks)]
+        ends = [*breaks, len(content)]
+        pieces = [content[s:e] for s, e in zip(starts, ends, strict=True)]
+        assert pieces == content.split(PARAGRAPH_SEPARATOR)
@@ -0,0 +1,73 @@
+"""Tests for the sync-to-async boundary (core/event_loop.py)."""
+
+import asyncio
+import threading
+
+from to_markdown.core.event_loop import install_process_loop, persistent_loop, run_sync
+
+
+async def _loop_id() -> int:
+    return id(asyncio.get_running_loop())
+
+
+class TestRunSync:
+    """Tests for run_sync() and persistent_loop()."""
+
+    def test_fresh_loop_per_call_by_default(self):
+        assert run_sync(asyncio.sleep(0, result="done")) == "done"
+        with_loop = []
+
+        async def keep_loop():
+            with_loop.append(asyncio.get_running_loop())
+
+        run_sync(keep_loop())
+        run_sync(keep_loop())
+        assert with_loop[0] is not with_loop[1]
+        assert with_loop[0].is_closed()
+
+    def test_persistent_loop_shared_by_calls(self):
+        with persistent_loop():
+            first = run_sync(_loop_id())
+            second = run_sync(_loop_id())
+        assert first == second
+
+    def test_nested_blocks_reuse_outer_loop(self):
+        with persistent_loop():
+            outer = run_sync(_loop_id())
+            with persistent_loop():
+                inner = run_sync(_loop_id())
+            after = run_sync(_loop_id())
+        assert outer == inner == after
+
+    def test_loop_closed_after_block(self):
+        loops = []
+
+        async def keep_loop():
+            loops.append(asyncio.get_running_loop())
+
+        with persistent_loop():
+            run_sync(keep_loop())
+            assert not loops[0].is_closed()
+        assert loops[0].is_closed()
+
+    def test_other_threads_keep_their_own_loops(self):
+        seen: list[int] = []
+        with persistent_loop():
+            ours = run_sync(_loop_id())
+            thread = threading.Thread(target=lambda: seen.append(run_sync(_loop_id())))
+            thread.start()
+            thread.join()
+        assert seen and seen[0] != ours
+
+    def test_install_process_loop_persists(self):
+        result: list[int] = []
+
+        def worker():
+            install_process_loop()
+            install_process_loop()
+            result.extend([run_sync(_loop_id()), run_sync(_loop_id())])
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        assert result[0] == result[1]
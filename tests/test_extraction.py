@@ -1,8 +1,9 @@
 """Tests for the Kreuzberg adapter (core/extraction.py)."""
 
+import asyncio
 from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -13,6 +14,7 @@ from to_markdown.core.extraction import (
     _extraction_quality,
     _is_sparse_pdf_extraction,
     extract_file,
+    extract_file_async,
 )
 
 
@@ -121,7 +123,7 @@ class TestIsSparseExtractionDetection:
 
 
 class TestOcrFallback:
-    """Tests for OCR fallback retry logic in extract_file."""
+    """Tests for whole-document OCR retry when no per-page breakdown is available."""
 
     def test_ocr_fallback_produces_better_content(self, tmp_path: Path):
         """When standard extraction is sparse, OCR retry should produce better content."""
@@ -135,7 +137,7 @@ class TestOcrFallback:
             images=[],
         )
         ocr_result = SimpleNamespace(
-            content="Full dashboard content with lots of useful data",
+            content="Full dashboard content with lots of useful data and charts",
             metadata={"quality_score": 1.0, "format_type": "pdf"},
             tables=[],
             images=[],
@@ -147,8 +149,8 @@ class TestOcrFallback:
         ):
             result = extract_file(pdf_file)
 
-        assert result.content == "Full dashboard content with lots of useful data"
-        assert result.metadata.get("ocr_fallback") is True
+        assert result.content == "Full dashboard content with lots of useful data and charts"
+        assert result.metadata.get("ocr_pages") == [1]
 
     def test_ocr_fallback_not_triggered_for_good_extraction(self, tmp_path: Path):
         """Standard extraction with good quality should not trigger OCR retry."""
@@ -169,7 +171,7 @@ class TestOcrFallback:
             result = extract_file(pdf_file)
 
         assert "well-extracted" in result.content
-        assert result.metadata.get("ocr_fallback") is None
+        assert result.metadata.get("ocr_pages") is None
 
     def test_ocr_fallback_keeps_original_if_retry_worse(self, tmp_path: Path):
         """If OCR retry produces less content, keep the original."""
@@ -191,9 +193,83 @@ class TestOcrFallback:
 
         with patch(
             "to_markdown.core.extraction.extract_file_sync",
-            side_effect=[sparse_result, worse_result],
+            side_effect=[sparse_result, worse_result, worse_result],
         ):
             result = extract_file(pdf_file)
 
         assert result.content == "AB"
-        assert result.metadata.get("ocr_fallback") is None
+        assert result.metadata.get("ocr_pages") is None
+
+    def test_ocr_retry_escalates_dpi_while_sparse(self, tmp_path: Path):
+        """A sparse low-DPI OCR pass is redone at the next DPI tier."""
+        pdf_file = tmp_path / "faint.pdf"
+        pdf_file.write_bytes(b"%PDF-1.4 fake content")
+
+        sparse_result = SimpleNamespace(content="E", metadata={"quality_score": 0.1})
+        low_dpi = SimpleNamespace(content="Faint scan", metadata={"quality_score": 0.2})
+        high_dpi = SimpleNamespace(
+            content="Faint scan read properly once OCR ran at a higher resolution",
+            metadata={"quality_score": 0.9},
+        )
+
+        with patch(
+            "to_markdown.core.extraction.extract_file_sync",
+            side_effect=[sparse_result, low_dpi, high_dpi],
+        ) as mock:
+            result = extract_file(pdf_file)
+
+        dpis = [
+            call.kwargs["config"].ocr.tesseract_config.preprocessing.target_dpi
+            for call in mock.call_args_list[1:]
+        ]
+        assert dpis == [150, 300]
+        assert result.content == high_dpi.content
+
+
+class TestExtractFileAsync:
+    """Tests for extract_file_async() thread and native-async paths."""
+
+    def test_default_matches_sync(self, sample_text_file: Path) -> None:
+        with patch("to_markdown.core.extraction.kreuzberg.extract_file") as mock_native:
+            result = asyncio.run(extract_file_async(sample_text_file, use_cache=False))
+        mock_native.assert_not_called()
+        assert result == extract_file(sample_text_file, use_cache=False)
+
+    def test_native_async_opt_in(
+        self, sample_html_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("TO_MARKDOWN_KREUZBERG_ASYNC", "1")
+        raw = SimpleNamespace(content="native", metadata={"format_type": "text"})
+        with patch(
+            "to_markdown.core.extraction.kreuzberg.extract_file",
+            new_callable=AsyncMock,
+            return_value=raw,
+        ) as mock_native:
+            first = asyncio.run(extract_file_async(sample_html_file))
+            second = asyncio.run(extract_file_async(sample_html_file))
+        mock_native.assert_awaited_once()  # second call served from the cache
+        assert first.content == second.content == "native"
+
+    def test_native_async_maps_errors(
+        self, sample_html_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from kreuzberg.exceptions import ValidationError
+
+        monkeypatch.setenv("TO_MARKDOWN_KREUZBERG_ASYNC", "1")
+        with (
+            patch(
+                "to_markdown.core.extraction.kreuzberg.extract_file",
+                new_callable=AsyncMock,
+                side_effect=ValidationError("bad"),
+            ),
+            pytest.raises(UnsupportedFormatError),
+        ):
+            asyncio.run(extract_file_async(sample_html_file, use_cache=False))
+
+    def test_config_reused_across_calls(self, sample_html_file: Path) -> None:
+        with patch("to_markdown.core.extraction.extract_file_sync") as mock_extract:
+            mock_extract.return_value = SimpleNamespace(content="x" * 60, metadata={})
+            extract_file(sample_html_file, use_cache=False)
+            extract_file(sample_html_file, use_cache=False)
+        first, second = (c.kwargs["config"] for c in mock_extract.call_args_list)
+        assert first is second
@@ -1,7 +1,9 @@
 """Tests for YAML frontmatter composition (core/frontmatter.py)."""
 
+import random
 from pathlib import Path
 
+import pytest
 import yaml
 
 from to_markdown.core.frontmatter import compose_frontmatter
@@ -102,6 +104,35 @@ class TestSanitizedField:
         assert "sanitized" not in parsed
 
 
+class TestOcrPagesField:
+    """Tests for the ocr_pages field in frontmatter."""
+
+    def test_ocr_pages_listed(self, tmp_path: Path):
+        metadata = {"format_type": "pdf", "ocr_pages": [2, 5]}
+        parsed = _parse_frontmatter(compose_frontmatter(metadata, tmp_path / "test.pdf"))
+        assert parsed["ocr_pages"] == [2, 5]
+
+    def test_ocr_pages_absent_without_ocr(self, tmp_path: Path):
+        metadata = {"format_type": "pdf"}
+        parsed = _parse_frontmatter(compose_frontmatter(metadata, tmp_path / "test.pdf"))
+        assert "ocr_pages" not in parsed
+
+
+class TestSourceHashField:
+    """Tests for deterministic frontmatter (source_sha256 instead of extracted_at)."""
+
+    def test_source_hash_replaces_timestamp(self, tmp_path: Path):
+        result = compose_frontmatter({}, tmp_path / "test.pdf", source_sha256="ab" * 32)
+        parsed = _parse_frontmatter(result)
+        assert parsed["source_sha256"] == "ab" * 32
+        assert "extracted_at" not in parsed
+
+    def test_timestamp_by_default(self, tmp_path: Path):
+        parsed = _parse_frontmatter(compose_frontmatter({}, tmp_path / "test.pdf"))
+        assert "extracted_at" in parsed
+        assert "source_sha256" not in parsed
+
+
 class TestDelimiters:
     """Tests for YAML frontmatter delimiter format."""
 
@@ -130,3 +161,72 @@ def _parse_frontmatter(frontmatter: str) -> dict:
     assert content.endswith("---")
     yaml_body = content.removeprefix("---").removesuffix("---").strip()
     return yaml.safe_load(yaml_body)
+
+
+class TestTruncatedField:
+    """Tests for the truncated frontmatter field set by the plain-text fast path."""
+
+    def test_truncated_included(self) -> None:
+        fm = compose_frontmatter({"truncated": True}, Path("app.log"))
+        assert "truncated: true" in fm
+
+    def test_truncated_omitted_by_default(self) -> None:
+        assert "truncated" not in compose_frontmatter({}, Path("app.log"))
+
+
+_TRICKY_STRINGS = [
+    "yes", "No", "TRUE", "off", "null", "~", "", "123", "-1", "1.5", "0x1F", "1_000", "1:20",
+    ".inf", "NaN", "2026-01-15", "2026-01-15T10:00:00Z", "key: value", "a #b", "# comment",
+    "- item", "[a]", "{a: b}", "'quoted'", '"double"', "O'Brien", "trailing ", "  leading",
+    "tab\there", "line\nbreak", "cr\rlf", "caf\u00e9", "\u65e5\u672c\u8a9e", "emoji \U0001f600",
+    "\u2028", "\x85", "\ufeff", "nb\u00a0sp", "a & b", "@at", "`tick`", "%pct", "!bang",
+    "*star", "&anchor", "|pipe", ">gt", "?q", ":colon", "=", "<<", "back\\slash", "a,b",
+]  # fmt: skip
+
+
+def _round_trip(key: str, value: object) -> object:
+    frontmatter = compose_frontmatter({key: value}, Path("doc.pdf"))
+    return yaml.safe_load(frontmatter.removeprefix("---\n").removesuffix("---\n"))
+
+
+class TestFastEmitter:
+    """The direct emitter must load back (yaml.safe_load) exactly as composed."""
+
+    @pytest.mark.parametrize("value", _TRICKY_STRINGS)
+    def test_tricky_strings_round_trip(self, value: str):
+        assert _round_trip("format_type", value)["format"] == value
+
+    def test_random_strings_round_trip(self):
+        alphabet = "aZ09 .,:#-'\"\\&*!|>%@`?[]{}\t\n\u00e9\u00a0\u200b\u2028\U0001f600"
+        rng = random.Random(16)
+        for _ in range(2000):
+            value = "".join(rng.choices(alphabet, k=rng.randint(1, 12)))
+            assert _round_trip("format_type", value)["format"] == value
+
+    @pytest.mark.parametrize(
+        ("key", "value"),
+        [("page_count", 42), ("page_count", -3), ("truncated", True), ("ocr_pages", [1, 7])],
+    )
+    def test_non_string_values_round_trip(self, key: str, value: object):
+        parsed = _round_trip(key, value)
+        assert value in parsed.values()
+
+    def test_unusual_values_fall_back_to_pyyaml(self):
+        assert _round_trip("title", 1.5)["title"] == 1.5
+        assert _round_trip("ocr_pages", [])["format"] == "pdf"
+
+    def test_matches_yaml_dump_for_common_values(self):
+        metadata = {
+            "title": "Quarterly Report (Draft), v2.1",
+            "authors": ["Alice", "Bob O'Neil"],
+            "creation_date": "2026-01-15",
+            "page_count": 12,
+            "word_count": 3400,
+            "format_type": "pdf",
+            "ocr_pages": [2, 3],
+            "truncated": True,
+        }
+        emitted = compose_frontmatter(metadata, Path("report.pdf"), sanitized=True)
+        parsed = yaml.safe_load(emitted.removeprefix("---\n").removesuffix("---\n"))
+        expected = yaml.dump(parsed, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        assert emitted == f"---\n{expected}---\n"
@@ -0,0 +1,140 @@
+"""Tests for incremental batch conversion (core/incremental.py)."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from to_markdown.core.batch import BatchResult, discover_files
+from to_markdown.core.constants import (
+    MANIFEST_FILENAME,
+    MANIFEST_SOURCE_IS_OUTPUT_REASON,
+    MANIFEST_UNCHANGED_REASON,
+    OUTPUT_EXISTS_REASON,
+)
+from to_markdown.core.incremental import convert_incremental
+
+
+def _run(batch_dir: Path, out: Path, **options) -> BatchResult:
+    files = discover_files(batch_dir)
+    return convert_incremental(files, out, batch_root=batch_dir, quiet=True, **options)
+
+
+def _unchanged(result: BatchResult) -> set[str]:
+    return {path.name for path, reason in result.skipped if reason == MANIFEST_UNCHANGED_REASON}
+
+
+class TestConvertIncremental:
+    """Tests for convert_incremental()."""
+
+    def test_first_run_converts_all_and_writes_manifest(self, batch_dir: Path, tmp_path: Path):
+        out = tmp_path / "out"
+        result = _run(batch_dir, out)
+        assert len(result.succeeded) == 4
+        manifest = json.loads((out / MANIFEST_FILENAME).read_text())
+        assert set(manifest["sources"]) == {
+            "notes.txt",
+            "readme.html",
+            "report.txt",
+            "sub/deep.txt",
+        }
+        assert manifest["sources"]["sub/deep.txt"]["output"] == "sub/deep.md"
+        assert manifest["settings"]["sanitize"] is True
+
+    def test_unchanged_sources_skipped_with_reason(self, batch_dir: Path, tmp_path: Path):
+        out = tmp_path / "out"
+        _run(batch_dir, out)
+        with patch("to_markdown.core.batch.convert_batch") as mock_batch:
+            result = _run(batch_dir, out)
+        mock_batch.assert_not_called()
+        assert _unchanged(result) == {"notes.txt", "readme.html", "report.txt", "deep.txt"}
+
+    def test_only_changed_source_reconverted(self, batch_dir: Path, tmp_path: Path):
+        out = tmp_path / "out"
+        _run(batch_dir, out)
+        (batch_dir / "notes.txt").write_text("Edited notes, now longer.\n")
+        result = _run(batch_dir, out, use_cache=False)
+        assert [path.name for path in result.succeeded] == ["notes.md"]
+        assert "Edited notes" in (out / "notes.md").read_text()
+        assert len(_unchanged(result)) == 3
+
+    def test_touched_but_identical_source_unchanged(self, batch_dir: Path, tmp_path: Path):
+        out = tmp_path / "out"
+        _run(batch_dir, out)
+        os.utime(batch_dir / "report.txt", ns=(1_000_000_000, 1_000_000_000))
+        result = _run(batch_dir, out)
+        assert "report.txt" in _unchanged(result)
+        manifest = json.loads((out / MANIFEST_FILENAME).read_text())
+        assert manifest["sources"]["report.txt"]["mtime_ns"] == 1_000_000_000
+
+    def test_missing_output_reconverted(self, batch_dir: Path, tmp_path: Path):
+        out = tmp_path / "out"
+        _run(batch_dir, out)
+        (out / "report.md").unlink()
+        result = _run(batch_dir, out)
+        assert [path.name for path in result.succeeded] == ["report.md"]
+
+    def test_changed_settings_reconvert_all(self, batch_dir: Path, tmp_path: Path):
+        out = tmp_path / "out"
+        _run(batch_dir, out)
+        assert len(_run(batch_dir, out, sanitize=False).succeeded) == 4
+        assert len(_unchanged(_run(batch_dir, out, sanitize=False))) == 4
+
+    def test_force_reconverts_all(self, batch_dir: Path, tmp_path: Path):
+        out = tmp_path / "out"
+        _run(batch_dir, out)
+        assert len(_run(batch_dir, out, force=True).succeeded) == 4
+
+    def test_failed_conversion_retried_next_run(self, batch_dir: Path, tmp_path: Path):
+        out = tmp_path / "out"
+        failed = BatchResult(failed=[(batch_dir / "notes.txt", "boom")])
+        with patch("to_markdown.core.batch.convert_batch", return_value=failed):
+            _run(batch_dir, out)
+        manifest = json.loads((out / MANIFEST_FILENAME).read_text())
+        assert manifest["sources"] == {}
+
+    def test_prune_removes_outputs_of_deleted_sources(self, batch_dir: Path, tmp_path: Path):
+        out = tmp_path / "out"
+        _run(batch_dir, out)
+        (batch_dir / "notes.txt").unlink()
+        kept = _run(batch_dir, out)
+        assert kept.removed == []
+        assert (out / "notes.md").exists()
+
+        pruned = _run(batch_dir, out, prune=True)
+        assert pruned.removed == [out / "notes.md"]
+        assert not (out / "notes.md").exists()
+        manifest = json.loads((out / MANIFEST_FILENAME).read_text())
+        assert "notes.txt" not in manifest["sources"]
+
+    def test_unreadable_manifest_ignored(self, batch_dir: Path, tmp_path: Path):
+        out = tmp_path / "out"
+        out.mkdir()
+        (out / MANIFEST_FILENAME).write_text("{not json")
+        assert len(_run(batch_dir, out).succeeded) == 4
+
+    def test_outputs_beside_sources_keep_manifest_in_root(self, batch_dir: Path):
+        files = discover_files(batch_dir)
+        convert_incremental(files, batch_root=batch_dir, quiet=True)
+        assert (batch_dir / MANIFEST_FILENAME).exists()
+        again = convert_incremental(files, batch_root=batch_dir, quiet=True)
+        assert len(_unchanged(again)) == 4
+
+    def test_beside_sources_keeps_foreign_outputs_and_md_sources(self, batch_dir: Path):
+        (batch_dir / "notes.md").write_text("Written by hand.\n")
+        (batch_dir / "guide.md").write_text("# Guide\n")
+        files = discover_files(batch_dir)
+        for _ in range(2):
+            result = convert_incremental(files, batch_root=batch_dir, quiet=True)
+            reasons = {path.name: reason for path, reason in result.skipped}
+            assert reasons["notes.txt"].startswith(OUTPUT_EXISTS_REASON)
+            assert reasons["guide.md"] == MANIFEST_SOURCE_IS_OUTPUT_REASON
+        assert (batch_dir / "notes.md").read_text() == "Written by hand.\n"
+        assert (batch_dir / "guide.md").read_text() == "# Guide\n"
+        assert len(_unchanged(result)) == 3
+
+    def test_requires_manifest_location(self, sample_text_file: Path):
+        with pytest.raises(ValueError, match="output directory"):
+            convert_incremental([sample_text_file])
@@ -1,5 +1,6 @@
 """Tests for MCP tool handlers (mcp/tools.py)."""
 
+import os
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
@@ -123,6 +124,36 @@ class TestHandleConvertFile:
             _args, kwargs = mock_convert.call_args
             assert kwargs["clean"] is True
 
+    async def test_ocr_settings_passed_through(self, sample_text_file: Path):
+        from to_markdown.core.ocr_settings import OcrSettings
+
+        with patch(
+            "to_markdown.core.pipeline.convert_to_string_async",
+            new_callable=AsyncMock,
+            return_value="---\ncontent\n",
+        ) as mock_convert:
+            await handle_convert_file(str(sample_text_file), ocr_workers=2, ocr_dpi=200)
+            _args, kwargs = mock_convert.call_args
+            assert kwargs["ocr"] == OcrSettings(workers=2, dpi=200)
+
+    async def test_ocr_threads_capped_in_process(
+        self, sample_text_file: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        from to_markdown.core.constants import OCR_THREADS_ENV
+
+        monkeypatch.setenv(OCR_THREADS_ENV, "")  # Restored after the test
+        with patch(
+            "to_markdown.core.pipeline.convert_to_string_async",
+            new_callable=AsyncMock,
+            return_value="---\ncontent\n",
+        ):
+            await handle_convert_file(str(sample_text_file), ocr_threads=3)
+        assert os.environ[OCR_THREADS_ENV] == "3"
+
+    async def test_invalid_ocr_dpi_raises(self, sample_text_file: Path):
+        with pytest.raises(ValueError, match="DPI"):
+            await handle_convert_file(str(sample_text_file), clean=False, ocr_dpi=1)
+
     async def test_summary_still_raises_without_sdk(self, sample_text_file: Path):
         """summary=True still raises when SDK not installed (only clean auto-disables)."""
         with (
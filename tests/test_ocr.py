@@ -0,0 +1,311 @@
+"""Tests for page-level OCR of sparse PDF pages (core/ocr.py)."""
+
+import io
+import os
+import sqlite3
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from to_markdown.core.cache import ExtractionCache
+from to_markdown.core.extraction import extract_file
+from to_markdown.core.ocr import find_sparse_pages, merge_pages, ocr_image, ocr_pages
+from to_markdown.core.ocr_images import encode_png
+from to_markdown.core.ocr_settings import OcrSettings, apply_ocr_threads
+
+_TEXT_PAGE = "This page has a perfectly good text layer with plenty of words on it."
+_CLEAN_SCAN = "Scanned page text that reads cleanly"
+
+
+def _ocr_result(content: str, quality: float = 1.0) -> SimpleNamespace:
+    """A Kreuzberg OCR result as extract_bytes_sync() returns it."""
+    return SimpleNamespace(content=content, metadata={"quality_score": quality})
+
+
+def _page(number: int, content: str, **extra) -> dict:
+    return {"page_number": number, "content": content, "images": [], "is_blank": False, **extra}
+
+
+@pytest.fixture
+def mixed_pdf(tmp_path: Path) -> Path:
+    """A 3-page PDF whose middle page is a scanned image with no text layer."""
+    from fpdf import FPDF
+    from PIL import Image, ImageDraw
+
+    scan = tmp_path / "scan.png"
+    image = Image.new("L", (200, 60), color=255)
+    ImageDraw.Draw(image).text((10, 20), "Scanned", fill=0)
+    image.save(scan)
+    pdf = FPDF()
+    pdf.set_font("Helvetica", size=12)
+    pdf.add_page()
+    pdf.multi_cell(0, 10, _TEXT_PAGE)
+    pdf.add_page()
+    pdf.image(str(scan), x=10, y=10, w=190)
+    pdf.add_page()
+    pdf.multi_cell(0, 10, "Closing page text layer, also long enough to skip OCR entirely.")
+    path = tmp_path / "mixed.pdf"
+    pdf.output(str(path))
+    return path
+
+
+class TestFindSparsePages:
+    """Tests for find_sparse_pages() detection."""
+
+    def test_empty_and_short_pages_flagged(self) -> None:
+        pages = [_page(1, _TEXT_PAGE), _page(2, ""), _page(3, "p. 3")]
+        assert find_sparse_pages(pages) == [2, 3]
+
+    def test_blank_flag_ignored(self) -> None:
+        """Kreuzberg flags image-only pages as blank unless images are extracted."""
+        assert find_sparse_pages([_page(1, "", is_blank=True)]) == [1]
+
+    def test_garbled_text_layer_flagged(self) -> None:
+        garbled = " �� " * 10
+        assert find_sparse_pages([_page(1, garbled)]) == [1]
+
+    def test_markdown_tables_not_flagged(self) -> None:
+        table = "| Name | Value |\n|------|-------|\n| a | 1 |\n| b | 2 |"
+        assert find_sparse_pages([_page(1, table)]) == []
+
+
+class TestMergePages:
+    """Tests for merge_pages() ordering and substitution."""
+
+    def test_replacements_merged_in_page_order(self) -> None:
+        pages = [_page(2, ""), _page(1, "first"), _page(3, "third")]
+        assert merge_pages(pages, {2: "second"}) == "first\n\nsecond\n\nthird"
+
+
+class TestEncodePng:
+    """Tests for encode_png() re-encoding of raw PDF pixel data."""
+
+    def test_plain_scanlines(self) -> None:
+        from PIL import Image
+
+        png = encode_png(bytes([0, 128, 255, 64]), 2, 2, "DeviceGray")
+        image = Image.open(io.BytesIO(png))
+        assert image.size == (2, 2)
+        assert image.tobytes() == bytes([0, 128, 255, 64])
+
+    def test_predictor_scanlines(self) -> None:
+        from PIL import Image
+
+        png = encode_png(bytes([0, 10, 20, 30, 0, 40, 50, 60]), 1, 2, "DeviceRGB")
+        assert Image.open(io.BytesIO(png)).tobytes() == bytes([10, 20, 30, 40, 50, 60])
+
+    def test_unsupported_layout(self) -> None:
+        assert encode_png(b"\x00" * 5, 2, 2, "DeviceGray") is None
+        assert encode_png(b"\x00" * 4, 2, 2, "DeviceCMYK") is None
+
+
+class TestOcrPages:
+    """Tests for ocr_pages() on a real mixed text/scanned PDF."""
+
+    def test_only_scanned_page_is_ocrd(self, mixed_pdf: Path) -> None:
+        ocr_result = _ocr_result("Recovered appendix text from the scan")
+        with patch("to_markdown.core.ocr.extract_bytes_sync", return_value=ocr_result) as mock:
+            result = extract_file(mixed_pdf)
+
+        mock.assert_called_once()
+        assert mock.call_args.args[1] == "image/png"
+        assert result.metadata["ocr_pages"] == [2]
+        assert result.content.index("good text layer") < result.content.index("Recovered")
+        assert result.content.index("Recovered") < result.content.index("Closing page")
+
+    def test_no_ocr_for_text_pdf(self, tmp_path: Path) -> None:
+        from fpdf import FPDF
+
+        pdf = FPDF()
+        pdf.set_font("Helvetica", size=12)
+        pdf.add_page()
+        pdf.multi_cell(0, 10, _TEXT_PAGE)
+        path = tmp_path / "text.pdf"
+        pdf.output(str(path))
+        with patch("to_markdown.core.ocr.extract_bytes_sync") as mock:
+            result = extract_file(path)
+        mock.assert_not_called()
+        assert "ocr_pages" not in result.metadata
+
+    def test_empty_ocr_keeps_text_layer(self, mixed_pdf: Path) -> None:
+        with patch("to_markdown.core.ocr.extract_bytes_sync", return_value=_ocr_result("")):
+            result = extract_file(mixed_pdf)
+        assert "ocr_pages" not in result.metadata
+        assert "good text layer" in result.content
+
+    def test_unreadable_images_fall_back_to_document_ocr(self, tmp_path: Path) -> None:
+        """Imageless pages are blank; unreadable image encodings need document OCR."""
+        pages = [_page(1, _TEXT_PAGE), _page(2, "")]
+        ocr_doc = SimpleNamespace(
+            metadata={}, pages=[_page(1, "ocr one"), _page(2, "ocr two, recovered")]
+        )
+        with (
+            patch("to_markdown.core.ocr._load_page_images", return_value={}),
+            patch("to_markdown.core.ocr.extract_file_sync", return_value=ocr_doc) as mock,
+        ):
+            recovered = ocr_pages(tmp_path / "doc.pdf", pages, [2])
+        assert recovered == {}
+
+        unreadable = {"format": "CCITTFaxDecode", "data": b"", "page_number": 2}
+        with (
+            patch("to_markdown.core.ocr._load_page_images", return_value={2: [unreadable]}),
+            patch("to_markdown.core.ocr.extract_file_sync", return_value=ocr_doc) as mock,
+        ):
+            recovered = ocr_pages(tmp_path / "doc.pdf", pages, [2])
+        assert mock.call_args.kwargs["config"].force_ocr is True
+        assert recovered == {2: "ocr two, recovered"}
+
+    def test_failed_image_ocr_falls_back_to_document_ocr(self, tmp_path: Path) -> None:
+        from kreuzberg.exceptions import KreuzbergError
+
+        pages = [_page(1, _TEXT_PAGE), _page(2, "")]
+        ocr_doc = SimpleNamespace(metadata={}, pages=[_page(2, "ocr two, recovered")])
+        scan = {"format": "png", "data": b"\x89PNG scan", "page_number": 2}
+        with (
+            patch("to_markdown.core.ocr._load_page_images", return_value={2: [scan]}),
+            patch("to_markdown.core.ocr.extract_bytes_sync", side_effect=KreuzbergError("boom")),
+            patch("to_markdown.core.ocr.extract_file_sync", return_value=ocr_doc) as mock,
+        ):
+            recovered = ocr_pages(tmp_path / "doc.pdf", pages, [2], use_cache=False)
+        assert mock.called
+        assert recovered == {2: "ocr two, recovered"}
+
+
+_LETTERHEAD = {"format": "png", "data": b"\x89PNG letterhead", "page_number": 1}
+
+
+class TestOcrCache:
+    """Tests for the per-image OCR text cache in ocr_image()."""
+
+    def test_identical_images_ocrd_once(self) -> None:
+        ocr = _ocr_result("ACME Corp letterhead")
+        with patch("to_markdown.core.ocr.extract_bytes_sync", return_value=ocr) as mock:
+            first = ocr_image(_LETTERHEAD)
+            second = ocr_image({**_LETTERHEAD, "page_number": 7})
+        assert first == second == "ACME Corp letterhead"
+        assert mock.call_count == 1
+
+    def test_use_cache_false_bypasses(self) -> None:
+        ocr = _ocr_result(_CLEAN_SCAN)
+        with patch("to_markdown.core.ocr.extract_bytes_sync", return_value=ocr) as mock:
+            ocr_image(_LETTERHEAD, use_cache=False)
+            ocr_image(_LETTERHEAD, use_cache=False)
+        assert mock.call_count == 2
+
+    def test_failures_not_cached(self) -> None:
+        from kreuzberg.exceptions import KreuzbergError
+
+        ocr = _ocr_result(_CLEAN_SCAN)
+        with patch(
+            "to_markdown.core.ocr.extract_bytes_sync", side_effect=[KreuzbergError("boom"), ocr]
+        ):
+            assert ocr_image(_LETTERHEAD) is None
+            assert ocr_image(_LETTERHEAD) == _CLEAN_SCAN
+
+    def test_unusable_cache_runs_uncached(self) -> None:
+        locked = sqlite3.OperationalError("database is locked")
+        ocr = _ocr_result(_CLEAN_SCAN)
+        with (
+            patch("to_markdown.core.ocr.extract_bytes_sync", return_value=ocr),
+            patch.object(ExtractionCache, "get_ocr_text", side_effect=locked),
+            patch.object(ExtractionCache, "put_ocr_text", side_effect=locked),
+        ):
+            assert ocr_image(_LETTERHEAD) == _CLEAN_SCAN
+
+    def test_dpi_is_part_of_the_cache_key(self) -> None:
+        ocr = _ocr_result(_CLEAN_SCAN)
+        with patch("to_markdown.core.ocr.extract_bytes_sync", return_value=ocr) as mock:
+            ocr_image(_LETTERHEAD)
+            ocr_image(_LETTERHEAD, settings=OcrSettings(dpi=150))
+            ocr_image(_LETTERHEAD, settings=OcrSettings(dpi=150))
+        assert mock.call_count == 2
+
+
+class TestAdaptiveDpi:
+    """Tests for low-DPI-first OCR that escalates only on poor output."""
+
+    @staticmethod
+    def _dpis(mock) -> list[int]:
+        return [
+            call.kwargs["config"].ocr.tesseract_config.preprocessing.target_dpi
+            for call in mock.call_args_list
+        ]
+
+    def test_clean_scan_stays_at_low_dpi(self) -> None:
+        with patch(
+            "to_markdown.core.ocr.extract_bytes_sync", return_value=_ocr_result(_CLEAN_SCAN)
+        ) as mock:
+            assert ocr_image(_LETTERHEAD, use_cache=False) == _CLEAN_SCAN
+        assert self._dpis(mock) == [150]
+
+    @pytest.mark.parametrize(
+        "low", [_ocr_result(_CLEAN_SCAN, quality=0.1), _ocr_result("~ ,")], ids=["quality", "yield"]
+    )
+    def test_poor_output_escalates(self, low: SimpleNamespace) -> None:
+        high = _ocr_result("Scanned page text that reads cleanly at 300 DPI")
+        with patch("to_markdown.core.ocr.extract_bytes_sync", side_effect=[low, high]) as mock:
+            assert ocr_image(_LETTERHEAD, use_cache=False) == high.content
+        assert self._dpis(mock) == [150, 300]
+
+    def test_failed_escalation_keeps_the_first_tier(self) -> None:
+        from kreuzberg.exceptions import KreuzbergError
+
+        low = _ocr_result(_CLEAN_SCAN, quality=0.1)
+        with patch(
+            "to_markdown.core.ocr.extract_bytes_sync", side_effect=[low, KreuzbergError("boom")]
+        ):
+            assert ocr_image(_LETTERHEAD, use_cache=False) == _CLEAN_SCAN
+
+    def test_escalation_keeps_the_better_text(self) -> None:
+        low = _ocr_result(_CLEAN_SCAN, quality=0.1)
+        with patch("to_markdown.core.ocr.extract_bytes_sync", side_effect=[low, _ocr_result("")]):
+            assert ocr_image(_LETTERHEAD, use_cache=False) == _CLEAN_SCAN
+
+    def test_fixed_dpi_never_escalates(self) -> None:
+        with patch("to_markdown.core.ocr.extract_bytes_sync", return_value=_ocr_result("")) as mock:
+            ocr_image(_LETTERHEAD, use_cache=False, settings=OcrSettings(dpi=200))
+        assert self._dpis(mock) == [200]
+
+    def test_document_ocr_escalates_only_while_pages_are_poor(self, tmp_path: Path) -> None:
+        unreadable = {"format": "CCITTFaxDecode", "data": b"", "page_number": 2}
+        low = SimpleNamespace(metadata={}, pages=[_page(2, "~")])
+        high = SimpleNamespace(metadata={}, pages=[_page(2, "Appendix recovered at 300 DPI")])
+        with (
+            patch("to_markdown.core.ocr._load_page_images", return_value={2: [unreadable]}),
+            patch("to_markdown.core.ocr.extract_file_sync", side_effect=[low, high]) as mock,
+        ):
+            recovered = ocr_pages(tmp_path / "doc.pdf", [_page(2, "")], [2])
+        assert mock.call_count == 2
+        assert recovered == {2: "Appendix recovered at 300 DPI"}
+
+
+class TestOcrSettings:
+    """Tests for OcrSettings validation and Kreuzberg config mapping."""
+
+    def test_defaults_build_nothing(self) -> None:
+        assert OcrSettings.from_options() is None
+        assert OcrSettings().kreuzberg_config() is None
+        assert OcrSettings().cache_settings() == {}
+
+    def test_dpi_maps_to_tesseract_preprocessing(self) -> None:
+        settings = OcrSettings.from_options(dpi=200)
+        config = settings.kreuzberg_config()
+        assert config.tesseract_config.preprocessing.target_dpi == 200
+        assert settings.cache_settings() == {"ocr_dpi": 200}
+
+    @pytest.mark.parametrize(
+        ("options", "message"),
+        [({"workers": 0}, "workers"), ({"threads": -1}, "threads"), ({"dpi": 10}, "DPI")],
+    )
+    def test_out_of_range_rejected(self, options: dict, message: str) -> None:
+        with pytest.raises(ValueError, match=message):
+            OcrSettings.from_options(**options)
+
+    def test_threads_applied_to_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("RAYON_NUM_THREADS", raising=False)
+        apply_ocr_threads(None)
+        assert "RAYON_NUM_THREADS" not in os.environ
+        apply_ocr_threads(2)
+        assert os.environ["RAYON_NUM_THREADS"] == "2"
@@ -0,0 +1,108 @@
+"""Tests for parallel page-range OCR of large PDFs (core/ocr_pool.py)."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from to_markdown.core.ocr_pool import large_pdf_workers, ocr_page_images, split_page_ranges
+
+# An encoding OCR cannot read: ocr_image() returns None without calling Kreuzberg
+_UNREADABLE = {"format": "CCITTFaxDecode", "data": b""}
+
+
+class TestSplitPageRanges:
+    """Tests for split_page_ranges()."""
+
+    def test_contiguous_ordered_ranges(self) -> None:
+        pages = list(range(1, 21))
+        ranges = split_page_ranges(pages, 3)
+        assert ranges == [pages[0:7], pages[7:14], pages[14:20]]
+
+    def test_small_documents_not_split(self) -> None:
+        assert split_page_ranges([1, 2, 3], 8) == [[1, 2, 3]]
+
+    def test_empty(self) -> None:
+        assert split_page_ranges([], 4) == []
+
+
+class TestLargePdfWorkers:
+    """Tests for large_pdf_workers() threshold checks."""
+
+    @pytest.fixture
+    def small_pdf(self, tmp_path: Path) -> Path:
+        path = tmp_path / "doc.pdf"
+        path.write_bytes(b"%PDF-1.4 small")
+        return path
+
+    def test_small_pdf_in_process(self, small_pdf: Path) -> None:
+        assert large_pdf_workers(small_pdf, page_count=10) == 1
+
+    def test_page_threshold(self, small_pdf: Path) -> None:
+        with patch("to_markdown.core.ocr_pool.os.cpu_count", return_value=6):
+            assert large_pdf_workers(small_pdf, page_count=100) == 6
+
+    def test_byte_threshold_from_env(
+        self, small_pdf: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("TO_MARKDOWN_LARGE_PDF_BYTES", "8")
+        with patch("to_markdown.core.ocr_pool.os.cpu_count", return_value=4):
+            assert large_pdf_workers(small_pdf, page_count=1) == 4
+
+    def test_invalid_env_uses_default(
+        self, small_pdf: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("TO_MARKDOWN_LARGE_PDF_PAGES", "lots")
+        assert large_pdf_workers(small_pdf, page_count=10) == 1
+
+    def test_in_process_inside_worker(
+        self, small_pdf: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        with (
+            patch("to_markdown.core.ocr_pool.multiprocessing.parent_process", return_value=1),
+            patch("to_markdown.core.ocr_pool._warned_in_worker", False),
+        ):
+            assert large_pdf_workers(small_pdf, page_count=5000) == 1
+            assert "ignored" not in caplog.text
+            assert large_pdf_workers(small_pdf, page_count=5000, requested=4) == 1
+            assert large_pdf_workers(small_pdf, page_count=5000, requested=4) == 1
+        assert caplog.text.count("--ocr-workers is ignored") == 1
+
+    def test_requested_count_overrides_thresholds(self, small_pdf: Path) -> None:
+        assert large_pdf_workers(small_pdf, page_count=1, requested=3) == 3
+        assert large_pdf_workers(small_pdf, page_count=5000, requested=1) == 1
+
+
+class TestOcrPageImages:
+    """Tests for ocr_page_images() serial and process-pool paths."""
+
+    def test_serial(self) -> None:
+        with patch("to_markdown.core.ocr_pool.ocr_image", return_value="text") as mock:
+            result = ocr_page_images({2: [_UNREADABLE], 1: [_UNREADABLE, _UNREADABLE]})
+        assert result == {1: ["text", "text"], 2: ["text"]}
+        assert mock.call_count == 3
+
+    def test_parallel_ranges_reassembled_in_order(self) -> None:
+        images_by_page = {number: [_UNREADABLE] for number in range(16, 0, -1)}
+        result = ocr_page_images(images_by_page, workers=2)
+        assert list(result) == list(range(1, 17))
+        assert all(texts == [None] for texts in result.values())
+
+    def test_parallel_workers_report_cache_lookups(self) -> None:
+        from to_markdown.core.cache import get_default_cache
+        from to_markdown.core.cache_keys import ocr_cache_key
+        from to_markdown.core.cache_lookups import counting_lookups
+        from to_markdown.core.ocr_settings import OcrSettings
+
+        image = {"format": "jpeg", "data": b"scanned page"}
+        key = ocr_cache_key(
+            image["data"],
+            mime_type="image/jpeg",
+            output_format="markdown",
+            **OcrSettings().cache_settings(),
+        )
+        get_default_cache().put_ocr_text(key, "Cached page")
+        with counting_lookups() as lookups:
+            result = ocr_page_images({number: [image] for number in range(1, 17)}, workers=2)
+        assert all(texts == ["Cached page"] for texts in result.values())
+        assert lookups == {"ocr_hits": 16}
@@ -1,6 +1,8 @@
 """Tests for the conversion pipeline (core/pipeline.py)."""
 
 import asyncio
+import hashlib
+import os
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -83,11 +85,53 @@ class TestOverwriteProtection:
         assert "old content" not in content
         assert "Hello" in content
 
+    def test_failed_overwrite_keeps_previous_output(self, sample_text_file: Path):
+        output = sample_text_file.with_suffix(".md")
+        output.write_text("previous conversion")
+        with (
+            patch("to_markdown.core.atomic_write.os.replace", side_effect=OSError("disk full")),
+            pytest.raises(OSError, match="disk full"),
+        ):
+            convert_file(sample_text_file, force=True)
+        assert output.read_text() == "previous conversion"
+        assert sorted(p.name for p in output.parent.iterdir()) == ["sample.md", "sample.txt"]
+
     def test_no_error_when_output_does_not_exist(self, sample_text_file: Path):
         result = convert_file(sample_text_file)
         assert result.exists()
 
 
+class TestDeterministicOutput:
+    """Tests for deterministic mode and skipping identical rewrites."""
+
+    def test_reconversion_is_byte_identical(self, sample_text_file: Path):
+        first = convert_file(sample_text_file, deterministic=True).read_bytes()
+        second = convert_file(sample_text_file, force=True, deterministic=True).read_bytes()
+        assert first == second
+        assert b"extracted_at" not in first
+        digest = hashlib.sha256(sample_text_file.read_bytes()).hexdigest()
+        assert f"source_sha256: '{digest}'".encode() in first
+
+    def test_identical_output_not_rewritten(self, sample_text_file: Path):
+        output = convert_file(sample_text_file, deterministic=True)
+        os.utime(output, ns=(1_000_000_000, 1_000_000_000))
+        assert convert_file(sample_text_file, force=True, deterministic=True) == output
+        assert output.stat().st_mtime_ns == 1_000_000_000
+
+    def test_changed_source_rewritten(self, sample_text_file: Path):
+        output = convert_file(sample_text_file, deterministic=True)
+        sample_text_file.write_text("Different content entirely.")
+        convert_file(sample_text_file, force=True, deterministic=True, use_cache=False)
+        assert "Different content" in output.read_text()
+
+    def test_streaming_matches_buffered(self, sample_text_file: Path, tmp_path: Path):
+        buffered = convert_file(sample_text_file, tmp_path / "a.md", deterministic=True)
+        streamed = convert_file(
+            sample_text_file, tmp_path / "b.md", stream=True, deterministic=True
+        )
+        assert buffered.read_bytes() == streamed.read_bytes()
+
+
 class TestErrorHandling:
     """Tests for pipeline error handling."""
 
@@ -155,7 +199,7 @@ class TestSmartFeatures:
 
         mock_describe = AsyncMock(return_value="## Image Descriptions\n\n### Image 1\n\nA photo.\n")
         with (
-            patch("to_markdown.core.content_builder.extract_file", return_value=mock_result),
+            patch("to_markdown.core.content_builder.extract_file_async", return_value=mock_result),
             patch("to_markdown.smart.images.describe_images_async", mock_describe),
         ):
             result = convert_file(sample_text_file, images=True)
@@ -176,7 +220,7 @@ class TestSmartFeatures:
         mock_describe = AsyncMock(return_value="## Image Descriptions\n\nimage desc\n")
 
         with (
-            patch("to_markdown.core.content_builder.extract_file", return_value=mock_result),
+            patch("to_markdown.core.content_builder.extract_file_async", return_value=mock_result),
             patch("to_markdown.smart.clean.clean_content_async", mock_clean),
             patch("to_markdown.smart.images.describe_images_async", mock_describe),
         ):
@@ -191,11 +235,11 @@ class TestSmartFeatures:
         """Summary depends on cleaned content, so it runs after clean finishes."""
         call_order = []
 
-        async def mock_clean(content, fmt):
+        async def mock_clean(content, fmt, *, analysis=None):
             call_order.append("clean")
             return "cleaned content"
 
-        async def mock_summarize(content, fmt):
+        async def mock_summarize(content, fmt, *, analysis=None):
             call_order.append("summary")
             # Summary should receive cleaned content
             assert content == "cleaned content"
@@ -208,7 +252,7 @@ class TestSmartFeatures:
         mock_result.images = []
 
         with (
-            patch("to_markdown.core.content_builder.extract_file", return_value=mock_result),
+            patch("to_markdown.core.content_builder.extract_file_async", return_value=mock_result),
             patch("to_markdown.smart.clean.clean_content_async", side_effect=mock_clean),
             patch(
                 "to_markdown.smart.summary.summarize_content_async",
@@ -223,7 +267,7 @@ class TestSmartFeatures:
             assert call_order == ["clean", "summary"]
 
     def test_clean_failure_doesnt_block_summary(self, sample_text_file: Path):
-        mock_clean = AsyncMock(side_effect=lambda c, f: c)
+        mock_clean = AsyncMock(side_effect=lambda c, f, **_: c)
         mock_summarize = AsyncMock(return_value="Summary works.")
         with (
             patch("to_markdown.smart.clean.clean_content_async", mock_clean),
@@ -237,6 +281,20 @@ class TestSmartFeatures:
             content = result.read_text()
             assert "## Summary" in content
 
+    def test_llm_stages_reuse_content_analysis(self, sample_text_file: Path):
+        """Clean gets the extraction analysis; summary only while content is unchanged."""
+        mock_clean = AsyncMock(return_value="Rewritten by clean.")
+        mock_summarize = AsyncMock(return_value=None)
+        with (
+            patch("to_markdown.smart.clean.clean_content_async", mock_clean),
+            patch("to_markdown.smart.summary.summarize_content_async", mock_summarize),
+        ):
+            convert_file(sample_text_file, clean=True, summary=True)
+        analysis = mock_clean.call_args.kwargs["analysis"]
+        assert analysis.content == mock_clean.call_args.args[0]
+        assert analysis.words > 0
+        assert mock_summarize.call_args.kwargs["analysis"] is None
+
 
 class TestSanitize:
     """Tests for sanitize parameter in the pipeline."""
@@ -269,7 +327,7 @@ class TestSanitize:
         mock_result.tables = []
         mock_result.images = []
 
-        with patch("to_markdown.core.content_builder.extract_file", return_value=mock_result):
+        with patch("to_markdown.core.content_builder.extract_file_async", return_value=mock_result):
             result = convert_file(sample_text_file)
             output = result.read_text()
             assert "\u200b" not in output
@@ -284,7 +342,7 @@ class TestSanitize:
         mock_result.tables = []
         mock_result.images = []
 
-        with patch("to_markdown.core.content_builder.extract_file", return_value=mock_result):
+        with patch("to_markdown.core.content_builder.extract_file_async", return_value=mock_result):
             result = convert_file(sample_text_file)
             output = result.read_text()
             assert "sanitized: true" in output
@@ -305,7 +363,7 @@ class TestSanitize:
             call_order.append("sanitize")
             return SanitizeResult(content=content, chars_removed=0, was_modified=False)
 
-        async def mock_clean(content, fmt):
+        async def mock_clean(content, fmt, *, analysis=None):
             call_order.append("clean")
             return content
 
@@ -325,7 +383,7 @@ class TestSanitize:
         mock_result.tables = []
         mock_result.images = []
 
-        with patch("to_markdown.core.content_builder.extract_file", return_value=mock_result):
+        with patch("to_markdown.core.content_builder.extract_file_async", return_value=mock_result):
             result = convert_to_string(sample_text_file, sanitize=True)
             assert "\u200b" not in result
             assert "sanitized: true" in result
@@ -440,7 +498,7 @@ class TestBuildContentAsync:
         mock_describe = AsyncMock(return_value="## Image Descriptions\n\nimage\n")
 
         with (
-            patch("to_markdown.core.content_builder.extract_file", return_value=mock_result),
+            patch("to_markdown.core.content_builder.extract_file_async", return_value=mock_result),
             patch("to_markdown.smart.clean.clean_content_async", mock_clean),
             patch("to_markdown.smart.images.describe_images_async", mock_describe),
             patch(
@@ -462,7 +520,7 @@ class TestAsyncPipeline:
         test_file = tmp_path / "test.txt"
         test_file.write_text("Simple content")
 
-        with patch("to_markdown.core.content_builder.extract_file") as mock_extract:
+        with patch("to_markdown.core.content_builder.extract_file_async") as mock_extract:
             mock_result = MagicMock()
             mock_result.content = "Extracted content"
             mock_result.metadata = {"format_type": "txt"}
@@ -488,7 +546,7 @@ class TestAsyncPipeline:
             return "## Image Descriptions\n\n### Image 1\n\nA photo\n"
 
         with (
-            patch("to_markdown.core.content_builder.extract_file") as mock_extract,
+            patch("to_markdown.core.content_builder.extract_file_async") as mock_extract,
             patch("to_markdown.core.sanitize.sanitize_content") as mock_sanitize,
             patch("to_markdown.smart.clean.clean_content_async", side_effect=mock_clean),
             patch(
@@ -517,12 +575,12 @@ class TestAsyncPipeline:
 
         captured_summary_input = []
 
-        async def mock_summarize(content, format_type):
+        async def mock_summarize(content, format_type, *, analysis=None):
             captured_summary_input.append(content)
             return "A summary"
 
         with (
-            patch("to_markdown.core.content_builder.extract_file") as mock_extract,
+            patch("to_markdown.core.content_builder.extract_file_async") as mock_extract,
             patch("to_markdown.core.sanitize.sanitize_content") as mock_sanitize,
             patch(
                 "to_markdown.smart.clean.clean_content_async",
@@ -558,7 +616,7 @@ class TestAsyncPipeline:
         test_file = tmp_path / "test.txt"
         test_file.write_text("content")
 
-        with patch("to_markdown.core.content_builder.extract_file") as mock_extract:
+        with patch("to_markdown.core.content_builder.extract_file_async") as mock_extract:
             mock_result = MagicMock()
             mock_result.content = "Content with \u200b zero-width"
             mock_result.metadata = {"format_type": "txt"}
@@ -574,7 +632,7 @@ class TestAsyncPipeline:
         test_file = tmp_path / "test.txt"
         test_file.write_text("content")
 
-        with patch("to_markdown.core.content_builder.extract_file") as mock_extract:
+        with patch("to_markdown.core.content_builder.extract_file_async") as mock_extract:
             mock_result = MagicMock()
             mock_result.content = "Hello\u200bWorld"
             mock_result.metadata = {"format_type": "txt"}
@@ -592,7 +650,7 @@ class TestAsyncPipeline:
         test_file.write_text("content")
 
         with (
-            patch("to_markdown.core.content_builder.extract_file") as mock_extract,
+            patch("to_markdown.core.content_builder.extract_file_async") as mock_extract,
             patch(
                 "to_markdown.smart.clean.clean_content_async",
                 new_callable=AsyncMock,
@@ -639,7 +697,7 @@ class TestAsyncPipeline:
         test_file.write_text("content")
 
         with (
-            patch("to_markdown.core.content_builder.extract_file") as mock_extract,
+            patch("to_markdown.core.content_builder.extract_file_async") as mock_extract,
             patch("to_markdown.smart.clean.clean_content_async") as mock_clean,
         ):
             mock_result = MagicMock()
@@ -709,14 +767,23 @@ class TestAsyncPipelineWrappers:
 
     async def test_async_wrappers_parity_with_sync(self, sample_text_file: Path, tmp_path: Path):
         """Ensure async wrappers pass all flags down to build_content_async."""
+        from to_markdown.core.ocr_settings import OcrSettings
+
+        ocr = OcrSettings(workers=2, dpi=200)
         mock_build = AsyncMock(return_value="mocked")
         with patch("to_markdown.core.pipeline.build_content_async", mock_build):
             # Test convert_to_string_async flags
             await convert_to_string_async(
-                sample_text_file, clean=True, summary=True, images=True, sanitize=False
+                sample_text_file, clean=True, summary=True, images=True, sanitize=False, ocr=ocr
             )
             mock_build.assert_called_with(
-                sample_text_file.resolve(), clean=True, summary=True, images=True, sanitize=False
+                sample_text_file.resolve(),
+                clean=True,
+                summary=True,
+                images=True,
+                sanitize=False,
+                use_cache=True,
+                ocr=ocr,
             )
 
             # Test convert_file_async flags
@@ -729,7 +796,16 @@ class TestAsyncPipelineWrappers:
                 summary=True,
                 images=True,
                 sanitize=False,
+                ocr=ocr,
+                deterministic=True,
             )
             mock_build.assert_called_with(
-                sample_text_file.resolve(), clean=True, summary=True, images=True, sanitize=False
+                sample_text_file.resolve(),
+                clean=True,
+                summary=True,
+                images=True,
+                sanitize=False,
+                use_cache=True,
+                ocr=ocr,
+                deterministic=True,
             )
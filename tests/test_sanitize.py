@@ -1,8 +1,18 @@
 """Tests for content sanitization."""
 
 import logging
+import random
 
-from to_markdown.core.sanitize import SanitizeResult, sanitize_content
+import pytest
+
+from to_markdown.core.constants import (
+    SANITIZE_CONTROL_CHARS,
+    SANITIZE_DIRECTIONAL_CHARS,
+    SANITIZE_ZERO_WIDTH_CHARS,
+)
+from to_markdown.core.sanitize import SanitizeResult, contains_invisible, sanitize_content
+
+_INVISIBLE = sorted(SANITIZE_ZERO_WIDTH_CHARS | SANITIZE_CONTROL_CHARS | SANITIZE_DIRECTIONAL_CHARS)
 
 
 class TestSanitizeContent:
@@ -157,3 +167,57 @@ class TestSanitizeContent:
         with caplog.at_level(logging.INFO):
             sanitize_content("clean text")
         assert "Sanitized" not in caplog.text
+
+
+class TestContainsInvisible:
+    """Tests for contains_invisible() pre-scan."""
+
+    def test_agrees_with_sanitize_content(self):
+        samples = ["plain text\n\ttabs", "zero​width", "bidi‮override", "nul\x00", ""]
+        for sample in samples:
+            assert contains_invisible(sample) == sanitize_content(sample).was_modified
+
+
+class TestRemovalCategories:
+    """Tests for per-category counts across the ASCII, Latin-1, and wide-text paths."""
+
+    def test_ascii_controls(self):
+        result = sanitize_content("a\x00b\x1bc\x7f")
+        assert result.content == "abc"
+        assert result.removed_by_category == {"control": 3}
+
+    def test_latin1_soft_hyphen_and_controls(self):
+        result = sanitize_content("caf\u00e9 hy\u00adphen\x01")
+        assert result.content == "caf\u00e9 hyphen"
+        assert result.removed_by_category == {"zero_width": 1, "control": 1}
+
+    def test_wide_text_all_categories(self):
+        result = sanitize_content("\u65e5\u200b\u672c\u202e\u8a9e\x00\u00ad")
+        assert result.content == "\u65e5\u672c\u8a9e"
+        assert result.removed_by_category == {"zero_width": 2, "directional": 1, "control": 1}
+        assert result.chars_removed == 4
+
+    @pytest.mark.parametrize("text", ["plain ascii\n", "caf\u00e9", "\u65e5\u672c \u2014"])
+    def test_clean_content_not_copied(self, text: str):
+        result = sanitize_content(text)
+        assert result.content is text
+        assert result.removed_by_category == {}
+
+    @pytest.mark.parametrize("alphabet", ["ascii", "latin1", "wide"])
+    def test_matches_character_by_character_filter(self, alphabet: str):
+        visible = {
+            "ascii": "ab \t\n\r\x0b\x0c",
+            "latin1": "ab \n\u00e9\u00ff\u00a0",
+            "wide": "ab \n\u00e9\u2014\u65e5\U0001f30d",
+        }[alphabet]
+        invisible = [c for c in _INVISIBLE if alphabet != "ascii" or c.isascii()]
+        if alphabet == "latin1":
+            invisible = [c for c in invisible if ord(c) < 0x100]
+        rng = random.Random(alphabet)
+        for _ in range(50):
+            text = "".join(rng.choice(visible + "".join(invisible)) for _ in range(200))
+            expected = "".join(c for c in text if c not in _INVISIBLE)
+            result = sanitize_content(text)
+            assert result.content == expected
+            assert result.chars_removed == len(text) - len(expected)
+            assert sum(result.removed_by_category.values()) == result.chars_removed
@@ -0,0 +1,199 @@
+"""Tests for the LLM circuit breaker and retry budget (smart/circuit.py)."""
+
+import logging
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from google.genai import errors as genai_errors
+
+from to_markdown.core.constants import LLM_CACHE_DISABLED, LLM_CACHE_ENV, LLM_RETRY_BUDGET_ENV
+from to_markdown.smart.circuit import CircuitBreaker, CircuitOpenError, RetryBudget
+from to_markdown.smart.clean import clean_content_async
+from to_markdown.smart.llm import LLMError, generate, generate_async, reset_client
+
+
+class OutageError(Exception):
+    pass
+
+
+def _is_outage(exc: BaseException) -> bool:
+    return isinstance(exc, OutageError)
+
+
+def _call(breaker: CircuitBreaker, *, fail: Exception | None = None) -> None:
+    with breaker.guard(_is_outage):
+        if fail is not None:
+            raise fail
+
+
+def _fail(breaker: CircuitBreaker, exc: Exception | None = None) -> None:
+    with pytest.raises(type(exc or OutageError())):
+        _call(breaker, fail=exc or OutageError())
+
+
+@pytest.fixture
+def clock():
+    """Controllable time.monotonic() for the circuit module."""
+    now = MagicMock(return_value=1_000.0)
+    with patch("to_markdown.smart.circuit.time.monotonic", now):
+        yield now
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions."""
+
+    def test_opens_after_consecutive_failures(self, clock: MagicMock):
+        breaker = CircuitBreaker(failure_threshold=3, cooldown=30)
+        for _ in range(3):
+            _fail(breaker)
+        assert breaker.is_open
+        ran = MagicMock()
+        with pytest.raises(CircuitOpenError), breaker.guard(_is_outage):
+            ran()
+        ran.assert_not_called()
+
+    def test_success_resets_the_count(self, clock: MagicMock):
+        breaker = CircuitBreaker(failure_threshold=3)
+        _fail(breaker)
+        _fail(breaker)
+        _call(breaker)
+        _fail(breaker)
+        _fail(breaker)
+        assert not breaker.is_open
+
+    def test_other_errors_do_not_count(self, clock: MagicMock):
+        breaker = CircuitBreaker(failure_threshold=2)
+        for _ in range(3):
+            _fail(breaker, ValueError("bad request"))
+        assert not breaker.is_open
+
+    def test_probe_after_cooldown_closes_on_success(self, clock: MagicMock):
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=30)
+        _fail(breaker)
+        clock.return_value += 31
+        assert not breaker.is_open
+        with breaker.guard(_is_outage), pytest.raises(CircuitOpenError):
+            _call(breaker)  # Only one probe at a time
+        assert not breaker.is_open
+        _fail(breaker)
+        assert breaker.is_open  # Closed again, so one failure reopens it
+
+    def test_failed_probe_doubles_cooldown(self, clock: MagicMock):
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=30, max_cooldown=50)
+        _fail(breaker)
+        clock.return_value += 31
+        _fail(breaker)
+        clock.return_value += 31
+        assert breaker.is_open
+        clock.return_value += 20
+        _fail(breaker)  # Second probe fails: cooldown capped at 50
+        clock.return_value += 51
+        _call(breaker)
+        assert not breaker.is_open
+
+    def test_interrupted_probe_frees_the_next_one(self, clock: MagicMock):
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=30)
+        _fail(breaker)
+        clock.return_value += 31
+        _fail(breaker, ValueError("bad request"))
+        _call(breaker)
+        assert not breaker.is_open
+
+    def test_open_and_close_are_logged(self, clock: MagicMock, caplog: pytest.LogCaptureFixture):
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=30)
+        with caplog.at_level(logging.INFO, logger="to_markdown.smart.circuit"):
+            _fail(breaker)
+            clock.return_value += 31
+            _call(breaker)
+        assert "skipping LLM calls for 30s" in caplog.text
+        assert "LLM calls resumed" in caplog.text
+
+
+class TestRetryBudget:
+    """Tests for RetryBudget."""
+
+    def test_spends_until_short(self, clock: MagicMock):
+        budget = RetryBudget(10)
+        assert budget.try_spend(4)
+        assert budget.try_spend(4)
+        assert not budget.try_spend(4)
+        assert budget.remaining == 2
+
+    def test_refills_over_time(self, clock: MagicMock):
+        budget = RetryBudget(60, refill_seconds=600)
+        assert budget.try_spend(60)
+        clock.return_value += 300
+        assert budget.remaining == 30
+        clock.return_value += 10_000
+        assert budget.remaining == 60
+
+    def test_zero_disables_the_cap(self):
+        assert RetryBudget(0).try_spend(1_000_000)
+
+
+class TestLlmIntegration:
+    """Tests for the breaker and budget under generate()."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_state(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv(LLM_CACHE_ENV, LLM_CACHE_DISABLED)
+        reset_client()
+        yield
+        reset_client()
+
+    def _client(self, error: Exception) -> MagicMock:
+        client = MagicMock()
+        client.models.generate_content.side_effect = error
+        client.aio.models.generate_content = AsyncMock(side_effect=error)
+        return client
+
+    def test_outage_short_circuits_later_calls(self):
+        client = self._client(genai_errors.ServerError(500, {"error": {"message": "Down"}}))
+        with (
+            patch("to_markdown.smart.llm.get_client", return_value=client),
+            patch("to_markdown.smart.llm._generate_with_retry.retry.sleep") as mock_sleep,
+        ):
+            with pytest.raises(LLMError, match="Down"):
+                generate("first")
+            with pytest.raises(LLMError, match="circuit open"):
+                generate("second")
+        # The fifth consecutive failure opens the circuit; no wait after it
+        assert client.models.generate_content.call_count == 5
+        assert mock_sleep.call_count == 4
+
+    async def test_clean_falls_back_without_calling_api(self):
+        client = self._client(genai_errors.ServerError(503, {"error": {"message": "Down"}}))
+        with (
+            patch("to_markdown.smart.llm.get_client", return_value=client),
+            patch("to_markdown.smart.llm._generate_with_retry_async.retry.sleep", AsyncMock()),
+        ):
+            assert await clean_content_async("First doc", "pdf") == "First doc"
+            calls = client.aio.models.generate_content.call_count
+            assert await clean_content_async("Second doc", "pdf") == "Second doc"
+        assert client.aio.models.generate_content.call_count == calls
+
+    async def test_network_errors_raise_llm_error_and_open_circuit(self):
+        client = self._client(httpx.ConnectError("Name or service not known"))
+        with patch("to_markdown.smart.llm.get_client", return_value=client):
+            for _ in range(5):
+                with pytest.raises(LLMError, match="Name or service"):
+                    generate("doc")
+            with pytest.raises(LLMError, match="circuit open"):
+                await generate_async("doc")
+        assert client.models.generate_content.call_count == 5
+        client.aio.models.generate_content.assert_not_called()
+
+    def test_spent_budget_stops_retries(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv(LLM_RETRY_BUDGET_ENV, "3")
+        client = self._client(genai_errors.ClientError(429, {"error": {"message": "Quota"}}))
+        with (
+            patch("to_markdown.smart.llm.get_client", return_value=client),
+            patch("to_markdown.smart.llm._generate_with_retry.retry.sleep"),
+        ):
+            with pytest.raises(LLMError):
+                generate("first")  # Waits 1s and 2s, then cannot afford 4s
+            assert client.models.generate_content.call_count == 3
+            with pytest.raises(LLMError):
+                generate("second")  # No retries left
+        assert client.models.generate_content.call_count == 4
@@ -5,10 +5,11 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from to_markdown.core.constants import CHARS_PER_TOKEN_ESTIMATE, MAX_CLEAN_TOKENS
+from to_markdown.core.chunking import Chunk, chunk_markdown
+from to_markdown.core.constants import CHARS_PER_TOKEN_ESTIMATE, CLEAN_CHUNK_TOKENS
+from to_markdown.core.content_analysis import analyze_content
 from to_markdown.smart.clean import (
     _build_clean_prompt,
-    _chunk_content,
     clean_content,
     clean_content_async,
 )
@@ -53,41 +54,35 @@ class TestCleanContent:
             assert mock_gen.call_args.kwargs["temperature"] == 0.1
 
 
-class TestChunkContent:
-    """Tests for content chunking."""
+class TestCleanChunks:
+    """Tests for cleaning structure-aware chunks."""
 
-    def test_small_content_returns_single_chunk(self):
-        result = _chunk_content("small text", 1000)
-        assert result == ["small text"]
+    def test_chunks_cleaned_in_place_keeping_gaps(self):
+        section = "x" * (CLEAN_CHUNK_TOKENS * CHARS_PER_TOKEN_ESTIMATE // 2)
+        content = f"# One\n\n{section}\n\n\n# Two\n\n{section}"
+        with patch("to_markdown.smart.clean.generate", side_effect=["A", "B"]) as mock_gen:
+            result = clean_content(content, "pdf")
+        assert result == "A\n\n\nB"
+        assert "# One" in mock_gen.call_args_list[0].args[0]
+        assert "# Two" in mock_gen.call_args_list[1].args[0]
 
-    def test_splits_at_paragraph_boundaries(self):
-        content = "paragraph one\n\nparagraph two\n\nparagraph three"
-        result = _chunk_content(content, 30)
-        assert len(result) >= 2
-        for chunk in result:
-            assert "\n\n" not in chunk or chunk.count("\n\n") < content.count("\n\n")
-
-    def test_reassembled_chunks_preserve_content(self):
-        content = "para one\n\npara two\n\npara three\n\npara four"
-        result = _chunk_content(content, 25)
-        reassembled = "\n\n".join(result)
-        assert reassembled == content
-
-    def test_large_paragraph_becomes_own_chunk(self):
-        content = "a" * 100 + "\n\n" + "b" * 10
-        result = _chunk_content(content, 50)
-        assert len(result) == 2
-        assert result[0] == "a" * 100
-        assert result[1] == "b" * 10
+    def test_oversized_code_block_passed_through(self):
+        code = "```\n" + "print()\n\n" * CLEAN_CHUNK_TOKENS + "```"
+        content = f"Intro\n\n{code}\n\nOutro"
+        with patch("to_markdown.smart.clean.generate", return_value="ok") as mock_gen:
+            result = clean_content(content, "pdf")
+        assert result == f"ok\n\n{code}\n\nok"
+        assert mock_gen.call_count == 2
 
-    def test_multi_chunk_processing(self):
-        max_chars = MAX_CLEAN_TOKENS * CHARS_PER_TOKEN_ESTIMATE
-        paragraphs = ["x" * 1000 for _ in range(500)]
-        content = "\n\n".join(paragraphs)
-        result = _chunk_content(content, max_chars)
-        assert len(result) >= 2
-        reassembled = "\n\n".join(result)
-        assert reassembled == content
+    def test_empty_chunk_not_sent(self):
+        with (
+            patch(
+                "to_markdown.smart.clean.chunk_markdown", return_value=[Chunk(0, 4), Chunk(6, 6)]
+            ),
+            patch("to_markdown.smart.clean.generate", return_value="ok") as mock_gen,
+        ):
+            assert clean_content("text\n\n", "pdf") == "ok\n\n"
+        mock_gen.assert_called_once()
 
 
 class TestBuildCleanPrompt:
@@ -120,15 +115,16 @@ class TestCleanContentAsync:
 
     @pytest.mark.asyncio
     async def test_multi_chunk_all_processed_concurrently(self):
-        max_chars = MAX_CLEAN_TOKENS * CHARS_PER_TOKEN_ESTIMATE
         paragraphs = ["x" * 1000 for _ in range(500)]
         content = "\n\n".join(paragraphs)
-        chunks = _chunk_content(content, max_chars)
+        chunks = chunk_markdown(content, CLEAN_CHUNK_TOKENS)
         assert len(chunks) >= 2
 
         mock_gen = AsyncMock(return_value="cleaned chunk")
         with patch("to_markdown.smart.clean.generate_async", mock_gen):
-            result = await clean_content_async(content, "pdf")
+            result = await clean_content_async(
+                content, "pdf", analysis=analyze_content(content, sanitize=False)
+            )
             assert mock_gen.await_count == len(chunks)
             assert result == "\n\n".join(["cleaned chunk"] * len(chunks))
 
@@ -183,8 +179,8 @@ class TestCleanContentAsyncRun:
 
     def test_multi_chunk_concurrent(self):
         """Large content splits into chunks processed concurrently."""
-        chunk1 = "A" * 300_000
-        chunk2 = "B" * 300_000
+        chunk1 = "A" * (CLEAN_CHUNK_TOKENS * CHARS_PER_TOKEN_ESTIMATE)
+        chunk2 = "B" * (CLEAN_CHUNK_TOKENS * CHARS_PER_TOKEN_ESTIMATE)
         large_content = chunk1 + "\n\n" + chunk2
 
         with patch(
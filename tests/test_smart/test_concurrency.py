@@ -0,0 +1,137 @@
+"""Tests for the AIMD LLM concurrency window (smart/concurrency.py)."""
+
+import asyncio
+import logging
+
+import pytest
+
+from to_markdown.smart.concurrency import AdaptiveConcurrency
+
+
+class OverloadedError(Exception):
+    pass
+
+
+def _is_overload(exc: BaseException) -> bool:
+    return isinstance(exc, OverloadedError)
+
+
+async def _call(window: AdaptiveConcurrency, *, fail: Exception | None = None) -> None:
+    async with window.slot(_is_overload):
+        if fail is not None:
+            raise fail
+
+
+class TestWindow:
+    """Tests for AIMD window adjustment."""
+
+    def test_initial_window_clamped_to_bounds(self):
+        assert AdaptiveConcurrency(5, 1, 32).limit == 5
+        assert AdaptiveConcurrency(50, 1, 32).limit == 32
+        assert AdaptiveConcurrency(5, 8, 32).limit == 8
+        assert AdaptiveConcurrency(5, 0, 0).limit == 1
+
+    async def test_successes_grow_window_by_one_per_window(self):
+        window = AdaptiveConcurrency(4, 1, 32)
+        for _ in range(4):
+            await _call(window)
+        assert window.limit == 4  # 4 + 1/4 + 1/4.25 + ... just under 5
+        await _call(window)
+        assert window.limit == 5
+
+    async def test_growth_capped_at_maximum(self):
+        window = AdaptiveConcurrency(2, 1, 3)
+        for _ in range(50):
+            await _call(window)
+        assert window.limit == 3
+
+    async def test_overload_halves_window_down_to_minimum(self, caplog: pytest.LogCaptureFixture):
+        window = AdaptiveConcurrency(8, 2, 32)
+        with caplog.at_level(logging.INFO), pytest.raises(OverloadedError):
+            await _call(window, fail=OverloadedError())
+        assert window.limit == 4
+        assert "window cut to 4" in caplog.text
+        for _ in range(3):
+            with pytest.raises(OverloadedError):
+                await _call(window, fail=OverloadedError())
+        assert window.limit == 2
+
+    async def test_other_errors_leave_window_unchanged(self):
+        window = AdaptiveConcurrency(8, 1, 32)
+        with pytest.raises(ValueError):
+            await _call(window, fail=ValueError("bad request"))
+        assert window.window == 8.0
+
+    async def test_one_cut_per_congestion_event(self):
+        """Calls already in flight when the window is cut do not cut it again."""
+        window = AdaptiveConcurrency(8, 1, 32)
+        release = asyncio.Event()
+
+        async def overloaded_call():
+            async with window.slot(_is_overload):
+                await release.wait()
+                raise OverloadedError
+
+        tasks = [asyncio.create_task(overloaded_call()) for _ in range(8)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(result, OverloadedError) for result in results)
+        assert window.limit == 4
+
+
+class TestSlots:
+    """Tests for admission into the window."""
+
+    async def test_in_flight_bounded_by_window(self):
+        window = AdaptiveConcurrency(3, 3, 3)
+        peak = 0
+
+        async def call():
+            nonlocal peak
+            async with window.slot(_is_overload):
+                peak = max(peak, window.in_flight)
+                await asyncio.sleep(0.001)
+
+        await asyncio.gather(*(call() for _ in range(20)))
+        assert peak == 3
+        assert window.in_flight == 0
+
+    async def test_waiters_admitted_in_order(self):
+        window = AdaptiveConcurrency(1, 1, 1)
+        order: list[int] = []
+
+        async def call(index: int):
+            async with window.slot(_is_overload):
+                order.append(index)
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*(call(index) for index in range(5)))
+        assert order == [0, 1, 2, 3, 4]
+
+    async def test_cancelled_waiter_releases_nothing_it_does_not_hold(self):
+        window = AdaptiveConcurrency(1, 1, 1)
+        hold = asyncio.Event()
+
+        async def holder():
+            async with window.slot(_is_overload):
+                await hold.wait()
+
+        first = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(_call(window))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        hold.set()
+        await first
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert window.in_flight == 0
+        await _call(window)
+        assert window.in_flight == 0
+
+    def test_window_usable_across_event_loops(self):
+        window = AdaptiveConcurrency(1, 1, 1)
+        asyncio.run(_call(window))
+        asyncio.run(_call(window))
+        assert window.in_flight == 0
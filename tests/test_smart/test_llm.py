@@ -5,11 +5,18 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from google.genai import errors as genai_errors
 
+from to_markdown.core.constants import (
+    LLM_CACHE_DISABLED,
+    LLM_CACHE_ENV,
+    LLM_IMAGE_TOKEN_ESTIMATE,
+    PARALLEL_LLM_MAX_CONCURRENCY,
+)
 from to_markdown.smart.llm import (
     LLMError,
     generate,
     generate_async,
     get_client,
+    get_concurrency,
     reset_client,
 )
 
@@ -80,7 +87,7 @@ class TestGenerate:
 
         with (
             patch("to_markdown.smart.llm.get_client", return_value=mock_client),
-            patch.dict("os.environ", {}, clear=True),
+            patch.dict("os.environ", {LLM_CACHE_ENV: LLM_CACHE_DISABLED}, clear=True),
         ):
             generate("Hello")
             call_kwargs = mock_client.models.generate_content.call_args
@@ -169,7 +176,7 @@ class TestGenerateAsync:
 
         with (
             patch("to_markdown.smart.llm.get_client", return_value=mock_client),
-            patch.dict("os.environ", {}, clear=True),
+            patch.dict("os.environ", {LLM_CACHE_ENV: LLM_CACHE_DISABLED}, clear=True),
         ):
             await generate_async("Hello")
             call_kwargs = mock_client.aio.models.generate_content.call_args
@@ -256,3 +263,46 @@ class TestGenerateAsync:
             await generate_async("Hello")
             mock_client.aio.models.generate_content.assert_called_once()
             mock_client.models.generate_content.assert_not_called()
+
+    async def test_each_call_reserves_rate_limit_budget(self):
+        """Every call draws one request plus its estimated tokens from the limiter."""
+        mock_client = MagicMock()
+        mock_response = MagicMock()
+        mock_response.text = "ok"
+        mock_client.aio.models.generate_content = AsyncMock(return_value=mock_response)
+        mock_limiter = MagicMock()
+        mock_limiter.acquire = AsyncMock()
+
+        with (
+            patch("to_markdown.smart.llm.get_client", return_value=mock_client),
+            patch("to_markdown.smart.llm.get_rate_limiter", return_value=mock_limiter),
+            patch.dict("os.environ", {"GEMINI_MODEL": "test-model"}),
+        ):
+            await generate_async(["x" * 400, MagicMock()], max_output_tokens=50)
+        key, tokens = mock_limiter.acquire.call_args.args
+        assert key.startswith("test-model:")
+        assert tokens == 100 + LLM_IMAGE_TOKEN_ESTIMATE + 50
+
+    async def test_overload_narrows_concurrency_window(self):
+        """A 503 halves the shared in-flight window; the retry then succeeds."""
+        mock_client = MagicMock()
+        mock_response = MagicMock()
+        mock_response.text = "ok"
+        overloaded = genai_errors.ServerError(503, {"error": {"message": "Overloaded"}})
+        mock_client.aio.models.generate_content = AsyncMock(side_effect=[overloaded, mock_response])
+
+        with (
+            patch("to_markdown.smart.llm.get_client", return_value=mock_client),
+            patch("to_markdown.smart.llm._generate_with_retry_async.retry.sleep", AsyncMock()),
+        ):
+            window = get_concurrency()
+            assert await generate_async("Hello") == "ok"
+        assert window.limit == PARALLEL_LLM_MAX_CONCURRENCY // 2
+
+    def test_concurrency_bounds_from_env(self):
+        with patch.dict(
+            "os.environ",
+            {"TO_MARKDOWN_LLM_MIN_CONCURRENCY": "8", "TO_MARKDOWN_LLM_MAX_CONCURRENCY": "64"},
+        ):
+            window = get_concurrency()
+        assert (window.minimum, window.maximum, window.limit) == (8, 64, 8)
@@ -0,0 +1,132 @@
+"""Tests for the shared LLM rate limiter (smart/rate_limit.py)."""
+
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from to_markdown.core.constants import LLM_RPM_ENV, LLM_TPM_ENV
+from to_markdown.smart.rate_limit import RateLimiter, bucket_key
+
+_NOW = 1_000_000.0
+
+
+def _limiter(tmp_path: Path, rpm: int = 60, tpm: int = 60_000) -> RateLimiter:
+    return RateLimiter(tmp_path / "ratelimit.db", requests_per_minute=rpm, tokens_per_minute=tpm)
+
+
+@pytest.fixture
+def clock():
+    """Freeze the limiter's wall clock; advance it by assigning clock.now."""
+
+    class Clock:
+        now = _NOW
+
+    with patch("to_markdown.smart.rate_limit.time.time", side_effect=lambda: Clock.now):
+        yield Clock
+
+
+class TestReserve:
+    """Tests for RateLimiter.reserve()."""
+
+    def test_burst_within_capacity_does_not_wait(self, tmp_path: Path, clock):
+        limiter = _limiter(tmp_path)  # 60 rpm: 6 requests of burst
+        assert [limiter.reserve("k", 10) for _ in range(6)] == [0.0] * 6
+
+    def test_requests_over_capacity_wait_in_order(self, tmp_path: Path, clock):
+        limiter = _limiter(tmp_path)
+        for _ in range(6):
+            limiter.reserve("k", 10)
+        assert limiter.reserve("k", 10) == pytest.approx(1.0)
+        assert limiter.reserve("k", 10) == pytest.approx(2.0)
+
+    def test_token_budget_limits_large_calls(self, tmp_path: Path, clock):
+        limiter = _limiter(tmp_path, rpm=0, tpm=60_000)  # 6,000 tokens of burst
+        assert limiter.reserve("k", 6_000) == 0.0
+        assert limiter.reserve("k", 1_000) == pytest.approx(1.0)
+
+    def test_budget_refills_over_time(self, tmp_path: Path, clock):
+        limiter = _limiter(tmp_path)
+        for _ in range(6):
+            limiter.reserve("k", 10)
+        clock.now += 2
+        assert limiter.reserve("k", 10) == 0.0
+        assert limiter.reserve("k", 10) == 0.0
+        assert limiter.reserve("k", 10) > 0
+
+    def test_disabled_budgets_never_wait(self, tmp_path: Path, clock):
+        limiter = _limiter(tmp_path, rpm=0, tpm=0)
+        assert all(limiter.reserve("k", 10**9) == 0.0 for _ in range(100))
+        assert not (tmp_path / "ratelimit.db").exists()
+
+    def test_buckets_are_independent(self, tmp_path: Path, clock):
+        limiter = _limiter(tmp_path, rpm=10)  # one request of burst
+        assert limiter.reserve(bucket_key("flash", "key-a"), 1) == 0.0
+        assert limiter.reserve(bucket_key("flash", "key-b"), 1) == 0.0
+        assert limiter.reserve(bucket_key("flash", "key-a"), 1) > 0
+
+    def test_budget_shared_through_database(self, tmp_path: Path, clock):
+        """Two limiters on one database (e.g. two processes) draw from one budget."""
+        first, second = _limiter(tmp_path, rpm=10), _limiter(tmp_path, rpm=10)
+        assert first.reserve("k", 1) == 0.0
+        assert second.reserve("k", 1) == pytest.approx(6.0)
+
+    def test_unusable_database_limits_per_process(
+        self, tmp_path: Path, clock, caplog: pytest.LogCaptureFixture
+    ):
+        limiter = _limiter(tmp_path, rpm=10)
+        with (
+            patch.object(
+                limiter, "_connect", side_effect=sqlite3.OperationalError("unable to open")
+            ),
+            caplog.at_level(logging.WARNING),
+        ):
+            assert limiter.reserve("k", 1) == 0.0
+            assert limiter.reserve("k", 1) == pytest.approx(6.0)
+        assert "per process" in caplog.text
+
+    def test_busy_database_falls_back_for_one_call_only(
+        self, tmp_path: Path, clock, caplog: pytest.LogCaptureFixture
+    ):
+        limiter, other = _limiter(tmp_path, rpm=10), _limiter(tmp_path, rpm=10)
+        busy = sqlite3.OperationalError("database is locked")
+        with patch.object(limiter, "_transact", side_effect=busy), caplog.at_level(logging.WARNING):
+            assert limiter.reserve("k", 1) == 0.0
+        assert "limiting this call per process" in caplog.text
+        assert limiter.reserve("k", 1) == 0.0  # Back on the shared bucket
+        assert other.reserve("k", 1) == pytest.approx(6.0)
+
+
+class TestAcquire:
+    """Tests for acquire() and configuration."""
+
+    async def test_acquire_sleeps_for_the_deficit(self, tmp_path: Path):
+        limiter = _limiter(tmp_path)
+        with (
+            patch.object(limiter, "reserve", return_value=1.5),
+            patch("to_markdown.smart.rate_limit.asyncio.sleep") as mock_sleep,
+        ):
+            await limiter.acquire("k", 1)
+        mock_sleep.assert_awaited_once_with(1.5)
+
+    async def test_acquire_reserves_off_the_event_loop(self, tmp_path: Path):
+        limiter = _limiter(tmp_path)
+        threads: list[threading.Thread] = []
+        with patch.object(
+            limiter,
+            "reserve",
+            side_effect=lambda *_: threads.append(threading.current_thread()) or 0.0,
+        ):
+            await limiter.acquire("k", 1)
+        assert len(threads) == 1
+        assert threads[0] is not threading.main_thread()
+
+    def test_from_env_reads_budgets(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv(LLM_RPM_ENV, "10")
+        monkeypatch.setenv(LLM_TPM_ENV, "nonsense")
+        limiter = RateLimiter.from_env(tmp_path / "ratelimit.db")
+        assert limiter.requests_per_minute == 10
+        assert limiter.tokens_per_minute > 0
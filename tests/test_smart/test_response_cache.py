@@ -0,0 +1,136 @@
+"""Tests for the on-disk LLM response cache (smart/response_cache.py)."""
+
+import sqlite3
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from google.genai import types
+
+from to_markdown.core.cache import ExtractionCache, get_default_cache
+from to_markdown.core.constants import LLM_CACHE_DISABLED, LLM_CACHE_ENV
+from to_markdown.smart import llm
+from to_markdown.smart.llm import generate, generate_async, reset_client
+from to_markdown.smart.response_cache import response_cache_key
+
+
+def _key(contents, model="flash", temperature=0.1, max_output_tokens=None):
+    return response_cache_key(
+        model, contents, temperature=temperature, max_output_tokens=max_output_tokens
+    )
+
+
+def _image(data: bytes, mime_type: str = "image/png") -> types.Part:
+    return types.Part.from_bytes(data=data, mime_type=mime_type)
+
+
+class TestResponseCacheKey:
+    """Tests for response_cache_key()."""
+
+    def test_same_inputs_same_key(self):
+        assert _key(["Describe", _image(b"png")]) == _key(["Describe", _image(b"png")])
+        assert _key("Clean this") == _key(["Clean this"])
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            {"model": "pro"},
+            {"temperature": 0.2},
+            {"max_output_tokens": 100},
+            {"contents": ["Describe", _image(b"jpg")]},
+            {"contents": ["Describe", _image(b"png", "image/jpeg")]},
+            {"contents": ["Describe!", _image(b"png")]},
+        ],
+    )
+    def test_every_input_changes_key(self, changed: dict):
+        base = {"contents": ["Describe", _image(b"png")]}
+        assert _key(**{**base, **changed}) != _key(**base)
+
+    def test_part_boundaries_matter(self):
+        assert _key(["ab", "c"]) != _key(["a", "bc"])
+
+    def test_unhashable_part_is_not_cached(self):
+        assert _key(["Describe", MagicMock(inline_data=None)]) is None
+
+
+class TestCachedGenerate:
+    """Tests for the cache layer under generate() / generate_async()."""
+
+    def setup_method(self):
+        reset_client()
+
+    def teardown_method(self):
+        reset_client()
+
+    def _client(self, text: str = "Cleaned") -> MagicMock:
+        client = MagicMock()
+        client.models.generate_content.return_value = MagicMock(text=text)
+        client.aio.models.generate_content = AsyncMock(return_value=MagicMock(text=text))
+        return client
+
+    def test_repeat_call_served_from_cache(self):
+        client = self._client()
+        with patch("to_markdown.smart.llm.get_client", return_value=client):
+            assert generate("Clean this", temperature=0.1) == "Cleaned"
+            assert generate("Clean this", temperature=0.1) == "Cleaned"
+            generate("Clean that", temperature=0.1)
+        assert client.models.generate_content.call_count == 2
+        stats = get_default_cache().stats()
+        assert (stats.llm_hits, stats.llm_misses) == (1, 2)
+
+    async def test_async_shares_entries_with_sync(self):
+        client = self._client()
+        with patch("to_markdown.smart.llm.get_client", return_value=client):
+            generate("Summarize", temperature=0.3)
+            assert await generate_async("Summarize", temperature=0.3) == "Cleaned"
+        client.aio.models.generate_content.assert_not_called()
+
+    async def test_async_cache_access_off_event_loop(self):
+        threads: list[threading.Thread] = []
+
+        def record(real):
+            def wrapper(*args, **kwargs):
+                threads.append(threading.current_thread())
+                return real(*args, **kwargs)
+
+            return wrapper
+
+        with (
+            patch("to_markdown.smart.llm.get_client", return_value=self._client()),
+            patch.object(llm, "lookup_response", record(llm.lookup_response)),
+            patch.object(llm, "store_response", record(llm.store_response)),
+        ):
+            await generate_async("Summarize", temperature=0.3)
+        assert len(threads) == 2
+        assert threading.main_thread() not in threads
+
+    def test_unusable_cache_calls_api(self):
+        client = self._client()
+        with (
+            patch("to_markdown.smart.llm.get_client", return_value=client),
+            patch.object(
+                ExtractionCache, "_lookup", side_effect=sqlite3.OperationalError("locked")
+            ),
+            patch.object(ExtractionCache, "_store", side_effect=OSError("read-only")),
+        ):
+            assert generate("Clean this") == "Cleaned"
+            assert generate("Clean this") == "Cleaned"
+        assert client.models.generate_content.call_count == 2
+
+    def test_disabled_by_environment(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv(LLM_CACHE_ENV, LLM_CACHE_DISABLED)
+        client = self._client()
+        with patch("to_markdown.smart.llm.get_client", return_value=client):
+            generate("Clean this")
+            generate("Clean this")
+        assert client.models.generate_content.call_count == 2
+        assert get_default_cache().stats().llm_misses == 0
+
+    def test_failed_call_not_cached(self):
+        client = self._client(text="")
+        with (
+            patch("to_markdown.smart.llm.get_client", return_value=client),
+            pytest.raises(Exception, match="empty response"),
+        ):
+            generate("Clean this")
+        assert get_default_cache().stats().entries == 0
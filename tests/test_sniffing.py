@@ -0,0 +1,68 @@
+"""Tests for up-front format sniffing (core/sniffing.py)."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from to_markdown.core import sniffing
+from to_markdown.core.sniffing import partition_convertible, sniff_file
+
+ELF_HEADER = b"\x7fELF\x02\x01\x01\x00" + b"\x00" * 8
+
+
+class TestSniffFile:
+    """Tests for sniff_file() classification."""
+
+    @pytest.mark.parametrize("name", ["report.txt", "notes.md", "app.py", "page.html"])
+    def test_supported_extensions_pass(self, tmp_path: Path, name: str) -> None:
+        path = tmp_path / name
+        path.write_text("content\n")
+        assert sniff_file(path) is None
+
+    @pytest.mark.parametrize("name", ["blob.bin", "uv.lock", "module.pyc", "lib.so"])
+    def test_unsupported_extensions_skipped(self, tmp_path: Path, name: str) -> None:
+        path = tmp_path / name
+        path.write_bytes(b"\x00\x01\x02\x03")
+        assert sniff_file(path) == f"Unsupported format: {path.suffix}"
+
+    def test_binary_signature_overrides_extension(self, tmp_path: Path) -> None:
+        path = tmp_path / "disguised.pdf"
+        path.write_bytes(ELF_HEADER)
+        assert sniff_file(path) == "Unsupported format: ELF binary (.pdf)"
+
+    def test_sqlite_database_skipped(self, tmp_path: Path) -> None:
+        path = tmp_path / "data.txt"
+        path.write_bytes(b"SQLite format 3\x00" + b"\x00" * 64)
+        assert "SQLite database" in sniff_file(path)
+
+    def test_missing_file_left_to_conversion(self, tmp_path: Path) -> None:
+        assert sniff_file(tmp_path / "gone.bin") is None
+
+    def test_extension_support_cached_per_suffix(self, tmp_path: Path) -> None:
+        first, second = tmp_path / "a.docx", tmp_path / "b.DOCX"
+        first.write_bytes(b"PK\x03\x04")
+        second.write_bytes(b"PK\x03\x04")
+        sniffing._supported_suffixes.pop(".docx", None)
+        with patch.object(
+            sniffing, "detect_mime_type_from_path", wraps=sniffing.detect_mime_type_from_path
+        ) as detect:
+            assert sniff_file(first) is None
+            assert sniff_file(second) is None
+        assert detect.call_count == 1
+
+
+class TestPartitionConvertible:
+    """Tests for partition_convertible()."""
+
+    def test_splits_and_keeps_order(self, tmp_path: Path) -> None:
+        names = ["b.txt", "a.bin", "c.html", "d.lock"]
+        paths = [tmp_path / name for name in names]
+        for path in paths:
+            path.write_text("content\n")
+        convertible, skipped = partition_convertible(paths)
+        assert [p.name for p in convertible] == ["b.txt", "c.html"]
+        assert [(p.name, reason) for p, reason in skipped] == [
+            ("a.bin", "Unsupported format: .bin"),
+            ("d.lock", "Unsupported format: .lock"),
+        ]
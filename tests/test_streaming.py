@@ -0,0 +1,105 @@
+"""Tests for streaming chunked output (core/streaming.py)."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from tests.conftest import normalize_markdown
+from to_markdown.core.pipeline import OutputExistsError, convert_file
+from to_markdown.core.streaming import iter_chunks, write_streaming
+
+
+class TestIterChunks:
+    """Tests for iter_chunks() slicing."""
+
+    def test_chunks_reassemble_exactly(self) -> None:
+        content = "".join(f"line {i}\n" for i in range(500))
+        chunks = list(iter_chunks(content, 64))
+        assert "".join(chunks) == content
+        assert all(len(chunk) <= 64 for chunk in chunks)
+
+    def test_chunks_end_on_line_breaks(self) -> None:
+        content = "alpha\nbravo\ncharlie\ndelta\n"
+        assert list(iter_chunks(content, 14)) == ["alpha\nbravo\n", "charlie\ndelta\n"]
+
+    def test_long_line_split_at_chunk_size(self) -> None:
+        assert list(iter_chunks("x" * 10, 4)) == ["xxxx", "xxxx", "xx"]
+
+    def test_empty(self) -> None:
+        assert list(iter_chunks("")) == []
+
+
+class TestWriteStreaming:
+    """Tests for write_streaming() and convert_file(stream=True)."""
+
+    def test_matches_buffered_output(self, sample_text_file: Path, tmp_path: Path) -> None:
+        buffered = convert_file(sample_text_file, tmp_path / "buffered.md")
+        streamed = convert_file(sample_text_file, tmp_path / "streamed.md", stream=True)
+        assert normalize_markdown(streamed.read_text()) == normalize_markdown(buffered.read_text())
+
+    def test_sanitizes_each_chunk(self, tmp_path: Path) -> None:
+        source = tmp_path / "hidden.txt"
+        source.write_text("visible\u200b text\n" * 50)
+        out = write_streaming(source, tmp_path / "out.md", force=False, chunk_chars=32)
+        text = out.read_text()
+        assert "\u200b" not in text
+        assert "sanitized: true" in text
+        assert text.count("visible text") == 50
+
+    def test_each_chunk_sanitized_once(self, tmp_path: Path) -> None:
+        from to_markdown.core import sanitize
+
+        source = tmp_path / "hidden.txt"
+        source.write_text("visible\u200b text\n" * 50)
+        content = source.read_text()
+        with patch.object(
+            sanitize, "sanitize_content", wraps=sanitize.sanitize_content
+        ) as mock_sanitize:
+            out = write_streaming(source, tmp_path / "out.md", force=True, chunk_chars=32)
+        assert mock_sanitize.call_count == len(list(iter_chunks(content, 32)))
+        assert out.read_text().count("visible text") == 50
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["hidden.txt", "out.md"]
+
+    def test_word_count_matches_across_chunks(self, tmp_path: Path) -> None:
+        source = tmp_path / "long-line.txt"
+        source.write_text("alpha\u200b bravo charlie " * 20)
+        out = write_streaming(source, tmp_path / "out.md", force=False, chunk_chars=7)
+        assert "words: 60" in out.read_text()
+
+    def test_no_sanitize_keeps_content(self, tmp_path: Path) -> None:
+        source = tmp_path / "hidden.txt"
+        source.write_text("visible\u200b text\n")
+        out = write_streaming(source, tmp_path / "out.md", force=False, sanitize=False)
+        text = out.read_text()
+        assert "\u200b" in text
+        assert "sanitized" not in text
+
+    def test_existing_output_rejected(self, sample_text_file: Path, tmp_path: Path) -> None:
+        out = tmp_path / "out.md"
+        out.write_text("existing")
+        with pytest.raises(OutputExistsError):
+            write_streaming(sample_text_file, out, force=False)
+        assert write_streaming(sample_text_file, out, force=True) == out
+
+    def test_identical_output_not_rewritten(self, tmp_path: Path) -> None:
+        source = tmp_path / "hidden.txt"
+        source.write_text("visible\u200b text\n" * 50)
+        out = write_streaming(source, tmp_path / "out.md", force=False, deterministic=True)
+        os.utime(out, ns=(1_000_000_000, 1_000_000_000))
+        write_streaming(source, out, force=True, chunk_chars=32, deterministic=True)
+        assert out.stat().st_mtime_ns == 1_000_000_000
+
+    def test_changed_body_rewritten(self, sample_text_file: Path, tmp_path: Path) -> None:
+        out = write_streaming(
+            sample_text_file, tmp_path / "out.md", force=False, deterministic=True
+        )
+        header, _, _ = out.read_text().rpartition("---\n")
+        out.write_text(header + "---\nEdited by hand.\n")
+        write_streaming(sample_text_file, out, force=True, deterministic=True)
+        assert "Edited by hand" not in out.read_text()
+
+    def test_llm_features_rejected(self, sample_text_file: Path, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="Streaming"):
+            convert_file(sample_text_file, tmp_path / "out.md", clean=True, stream=True)
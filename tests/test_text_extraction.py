@@ -0,0 +1,101 @@
+"""Tests for the plain-text fast path (core/text_extraction.py)."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from to_markdown.core.extraction import extract_file
+from to_markdown.core.text_extraction import extract_text_file, fence, is_fast_path
+
+
+class TestIsFastPath:
+    """Tests for is_fast_path() extension routing."""
+
+    def test_text_markdown_and_source_files(self) -> None:
+        for name in ("a.txt", "b.LOG", "c.md", "d.py", "e.csv", "f.json"):
+            assert is_fast_path(Path(name)), name
+
+    def test_documents_go_to_kreuzberg(self) -> None:
+        for name in ("a.pdf", "b.docx", "c.html", "d"):
+            assert not is_fast_path(Path(name)), name
+
+
+class TestExtractTextFile:
+    """Tests for extract_text_file() content and metadata."""
+
+    def test_text_metadata_matches_kreuzberg_fields(self, tmp_path: Path) -> None:
+        path = tmp_path / "notes.txt"
+        path.write_text("hello world\nline two\n")
+        result = extract_text_file(path)
+        assert result.content == "hello world\nline two"
+        assert result.metadata["format_type"] == "text"
+        assert result.metadata["word_count"] == 4
+        assert result.metadata["line_count"] == 2
+        assert result.metadata["character_count"] == 20
+
+    def test_markdown_passed_through_with_title(self, tmp_path: Path) -> None:
+        path = tmp_path / "doc.md"
+        path.write_text("# Release Notes #\n\nSome *emphasis* kept.\n")
+        result = extract_text_file(path)
+        assert result.content == "# Release Notes #\n\nSome *emphasis* kept."
+        assert result.metadata["title"] == "Release Notes"
+        assert "format_type" not in result.metadata
+
+    def test_source_fenced_with_language(self, tmp_path: Path) -> None:
+        path = tmp_path / "main.py"
+        path.write_text("def f():\n    return 1\n")
+        assert extract_text_file(path).content == "```python\ndef f():\n    return 1\n```"
+
+    def test_fence_outgrows_inner_backticks(self) -> None:
+        assert fence("````\nx\n````", "md").startswith("`````md\n")
+
+    def test_bom_encodings(self, tmp_path: Path) -> None:
+        path = tmp_path / "wide.txt"
+        path.write_text("café naïve", encoding="utf-16")
+        assert extract_text_file(path).content == "café naïve"
+
+    def test_legacy_encoding_fallback(self, tmp_path: Path) -> None:
+        path = tmp_path / "legacy.txt"
+        path.write_bytes("price: 5€".encode("cp1252"))
+        assert extract_text_file(path).content == "price: 5€"
+
+    def test_binary_left_to_kreuzberg(self, tmp_path: Path) -> None:
+        path = tmp_path / "blob.txt"
+        path.write_bytes(b"PK\x03\x04\x00\x00binary")
+        assert extract_text_file(path) is None
+
+    def test_line_cap(self, tmp_path: Path) -> None:
+        path = tmp_path / "app.log"
+        path.write_text("".join(f"line {n}\n" for n in range(100)))
+        result = extract_text_file(path, max_lines=10)
+        assert result.content.startswith("line 0\n")
+        assert "line 9\n\n[Truncated: app.log exceeds the 10-line limit]" in result.content
+        assert "line 10" not in result.content
+        assert result.metadata["truncated"] is True
+
+    def test_byte_cap_ends_on_line_boundary(self, tmp_path: Path) -> None:
+        path = tmp_path / "app.log"
+        path.write_text("aaaa\nbbbb\ncccc\n")
+        result = extract_text_file(path, max_bytes=12)
+        assert result.content == "aaaa\nbbbb\n\n[Truncated: app.log exceeds the 12-byte limit]"
+
+    def test_file_at_cap_not_truncated(self, tmp_path: Path) -> None:
+        path = tmp_path / "app.log"
+        path.write_text("aaaa\nbbbb\n")
+        result = extract_text_file(path, max_bytes=10, max_lines=2)
+        assert "truncated" not in result.metadata
+
+
+class TestExtractFileFastPath:
+    """Tests for extract_file() routing text-like files around Kreuzberg."""
+
+    def test_kreuzberg_and_cache_bypassed(self, tmp_path: Path) -> None:
+        path = tmp_path / "script.sh"
+        path.write_text("echo hi\n")
+        with (
+            patch("to_markdown.core.extraction.extract_file_sync") as mock_extract,
+            patch("to_markdown.core.cache.lookup_extraction") as mock_cache,
+        ):
+            result = extract_file(path)
+        mock_extract.assert_not_called()
+        mock_cache.assert_not_called()
+        assert result.content == "```bash\necho hi\n```"
@@ -0,0 +1,105 @@
+"""Tests for the per-file extraction deadline (core/watchdog.py)."""
+
+import functools
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from to_markdown.core.batch import convert_batch
+from to_markdown.core.constants import EXIT_PARTIAL
+from to_markdown.core.extraction import ExtractionResult, UnsupportedFormatError
+from to_markdown.core.ocr_pool import large_pdf_workers, ocr_page_images
+from to_markdown.core.watchdog import (
+    ExtractionTimeoutError,
+    ExtractionWatchdog,
+    extract_with_timeout,
+)
+
+
+def _stub_extract(
+    path: Path, *, extract_images: bool, use_cache: bool, ocr: object = None
+) -> ExtractionResult:
+    """Child-process target: hangs on 'slow' files, rejects '.bad' files."""
+    if path.stem.startswith("slow"):
+        time.sleep(60)
+    if path.suffix == ".bad":
+        raise UnsupportedFormatError(f"Unsupported format: {path.suffix}")
+    return ExtractionResult(content=f"extracted {path.name}", metadata={"format_type": "text"})
+
+
+def _ocr_extract(path: Path, **_options: object) -> ExtractionResult:
+    """Child-process target: OCRs 12 pages with --ocr-workers 3, as a large PDF would."""
+    # An encoding OCR cannot read: ocr_image() returns None without calling Kreuzberg
+    pages = {number: [{"format": "CCITTFaxDecode", "data": b""}] for number in range(1, 13)}
+    workers = large_pdf_workers(path, page_count=len(pages), requested=3)
+    texts = ocr_page_images(pages, workers=workers, use_cache=False)
+    return ExtractionResult(content=f"{len(texts)} pages", metadata={"format_type": "text"})
+
+
+def _cached_extract(path: Path, **_options: object) -> ExtractionResult:
+    """Child-process target: one OCR cache hit, then fails on '.bad' files."""
+    from to_markdown.core.cache_lookups import record_lookup
+
+    record_lookup("ocr_hits")
+    if path.suffix == ".bad":
+        raise UnsupportedFormatError(f"Unsupported format: {path.suffix}")
+    return ExtractionResult(content=path.name, metadata={"format_type": "text"})
+
+
+class TestExtractionWatchdog:
+    """Tests for ExtractionWatchdog kill-and-restart behavior."""
+
+    def test_timeout_kills_and_next_file_recovers(self, tmp_path: Path) -> None:
+        with ExtractionWatchdog(1, target=_stub_extract) as watchdog:
+            started = time.monotonic()
+            with pytest.raises(ExtractionTimeoutError, match=r"timed out after 1s: slow\.pdf"):
+                watchdog.extract(tmp_path / "slow.pdf")
+            assert time.monotonic() - started < 30
+            assert watchdog.extract(tmp_path / "fine.pdf").content == "extracted fine.pdf"
+
+    def test_errors_keep_their_type(self, tmp_path: Path) -> None:
+        with (
+            ExtractionWatchdog(30, target=_stub_extract) as watchdog,
+            pytest.raises(UnsupportedFormatError),
+        ):
+            watchdog.extract(tmp_path / "data.bad")
+
+    def test_child_cache_lookups_reach_parent(self, tmp_path: Path) -> None:
+        from to_markdown.core.cache_lookups import counting_lookups
+
+        with (
+            ExtractionWatchdog(30, target=_cached_extract) as watchdog,
+            counting_lookups() as lookups,
+        ):
+            watchdog.extract(tmp_path / "fine.pdf")
+            with pytest.raises(UnsupportedFormatError):
+                watchdog.extract(tmp_path / "data.bad")
+        assert lookups == {"ocr_hits": 2}
+
+    def test_ocr_workers_request_runs_in_child(self, tmp_path: Path) -> None:
+        with ExtractionWatchdog(30, target=_ocr_extract) as watchdog:
+            assert watchdog.extract(tmp_path / "scan.pdf").content == "12 pages"
+
+    def test_real_extraction_in_child(self, sample_text_file: Path) -> None:
+        result = extract_with_timeout(sample_text_file, timeout=60)
+        assert "test document" in result.content
+
+
+class TestBatchTimeouts:
+    """Tests for timed-out files in batch results."""
+
+    def test_timed_out_file_recorded_and_batch_continues(self, tmp_path: Path) -> None:
+        files = [tmp_path / "slow.txt", tmp_path / "fine.txt"]
+        for path in files:
+            path.write_text("content")
+        stub_watchdog = functools.partial(ExtractionWatchdog, target=_stub_extract)
+        with patch("to_markdown.core.watchdog.ExtractionWatchdog", stub_watchdog):
+            result = convert_batch(files, quiet=True, timeout=1)
+        assert [path.name for path, _ in result.timed_out] == ["slow.txt"]
+        assert "timed out" in result.timed_out[0][1]
+        assert result.succeeded == [(tmp_path / "fine.md").resolve()]
+        assert "extracted fine.txt" in (tmp_path / "fine.md").read_text()
+        assert result.failed == []
+        assert result.exit_code == EXIT_PARTIAL
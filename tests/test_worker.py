@@ -352,6 +352,82 @@ class TestRunWorkerBatch:
         assert "0 succeeded, 1 failed" in fetched.output_path
         assert "a.pdf: extraction failed" in fetched.error
 
+    @patch("to_markdown.core.batch.convert_batch")
+    @patch("to_markdown.core.batch.discover_files")
+    def test_batch_timeouts_stored_as_task_error(
+        self, mock_discover, mock_batch, store, store_dir: Path
+    ):
+        from to_markdown.core.batch import BatchResult
+        from to_markdown.core.tasks import TaskStatus
+        from to_markdown.core.worker import run_worker
+
+        mock_discover.return_value = [Path("a.pdf")]
+        mock_batch.return_value = BatchResult(
+            succeeded=[Path("b.md")],
+            timed_out=[(Path("a.pdf"), "Extraction timed out after 30s: a.pdf")],
+        )
+        task = store.create(
+            "dir",
+            command_args=json.dumps({"input_path": "dir", "is_batch": True, "timeout": 30}),
+        )
+
+        run_worker(task.id, store)
+
+        assert mock_batch.call_args.kwargs["timeout"] == 30
+        fetched = store.get(task.id)
+        assert fetched.status == TaskStatus.FAILED
+        assert "1 timed out" in fetched.output_path
+        assert "a.pdf: Extraction timed out after 30s" in fetched.error
+
+    @patch("to_markdown.core.batch.convert_batch")
+    @patch("to_markdown.core.batch.discover_files")
+    def test_batch_ocr_settings_rebuilt(
+        self, mock_discover, mock_batch, store, store_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        from to_markdown.core.batch import BatchResult
+        from to_markdown.core.ocr_settings import OcrSettings
+        from to_markdown.core.worker import run_worker
+
+        monkeypatch.delenv("RAYON_NUM_THREADS", raising=False)
+        mock_discover.return_value = [Path("a.pdf")]
+        mock_batch.return_value = BatchResult(succeeded=[Path("a.md")])
+        args = {"input_path": "dir", "is_batch": True, "ocr_threads": 2, "ocr_dpi": 150}
+        task = store.create("dir", command_args=json.dumps(args))
+
+        run_worker(task.id, store)
+
+        assert mock_batch.call_args.kwargs["ocr"] == OcrSettings(threads=2, dpi=150)
+        assert os.environ["RAYON_NUM_THREADS"] == "2"
+
+    @patch("to_markdown.core.incremental.convert_incremental")
+    @patch("to_markdown.core.batch.discover_files")
+    def test_incremental_batch_uses_manifest(
+        self, mock_discover, mock_incremental, store, store_dir: Path
+    ):
+        from to_markdown.core.batch import BatchResult
+        from to_markdown.core.worker import run_worker
+
+        mock_discover.return_value = [Path("a.pdf")]
+        mock_incremental.return_value = BatchResult(succeeded=[Path("a.md")])
+        args = {"input_path": "dir", "is_batch": True, "incremental": True, "prune": True}
+        task = store.create("dir", command_args=json.dumps(args))
+
+        run_worker(task.id, store)
+
+        assert mock_incremental.call_args.kwargs["prune"] is True
+
+    @patch("to_markdown.core.pipeline.convert_file")
+    def test_deterministic_passed_through(self, mock_convert, store, store_dir: Path):
+        from to_markdown.core.worker import run_worker
+
+        mock_convert.return_value = Path("out.md")
+        args = {"input_path": "a.pdf", "deterministic": True}
+        task = store.create("a.pdf", command_args=json.dumps(args))
+
+        run_worker(task.id, store)
+
+        assert mock_convert.call_args.kwargs["deterministic"] is True
+
 
 # ---- T021: no_sanitize in background processing ----
 